@@ -0,0 +1,160 @@
+"""Per-host circuit breaker for HTTP clients."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class HostUnreachableError(Exception):
+    """Raised instead of a request while the circuit of its host is open."""
+    
+    def __init__(self, host: str, retry_in: float):
+        """
+        Args:
+            host: Host whose circuit is open
+            retry_in: Seconds until the next probe request is allowed
+        """
+        super().__init__(f"Host nicht erreichbar: {host} (nächster Versuch in {retry_in:.0f} s)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+@dataclass
+class _HostState:
+    """Failure bookkeeping of one host."""
+    failures: int = 0
+    opened_at: Optional[float] = None
+    probing: bool = False
+
+
+class HostCircuitBreaker:
+    """
+    Thread-safe circuit breaker keyed by host.
+    
+    - closed: requests pass; consecutive connect/timeout failures are counted.
+    - open: after failure_threshold consecutive failures every request to the
+      host fails immediately with HostUnreachableError instead of waiting for
+      its timeout.
+    - half-open: once reset_timeout seconds have passed, a single probe
+      request is let through. Success closes the circuit, failure opens it
+      again for another reset_timeout.
+    
+    Only failures to reach the host count (connection errors, timeouts);
+    any HTTP response - including 4xx/5xx - proves the host is reachable.
+    
+    One instance is meant to be shared by all threads talking to the hosts.
+    
+    Usage:
+        breaker.before_request(host)   # raises HostUnreachableError when open
+        try:
+            response = session.get(url)
+        except (requests.ConnectionError, requests.Timeout):
+            breaker.record_failure(host)
+            raise
+        breaker.record_success(host)
+    """
+    
+    DEFAULT_FAILURE_THRESHOLD = 5  # Consecutive failures that open the circuit
+    DEFAULT_RESET_TIMEOUT = 30.0  # Seconds before a probe request is allowed
+    
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the circuit breaker.
+        
+        Args:
+            failure_threshold: Consecutive failures after which a host is considered unreachable
+            reset_timeout: Seconds to fail fast before probing the host again
+            clock: Monotonic clock function (injectable for tests)
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = max(0.0, reset_timeout)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, _HostState] = {}
+    
+    def before_request(self, host: str):
+        """
+        Check whether a request to the host may be sent.
+        
+        Args:
+            host: Host key (e.g. from url_host())
+        
+        Raises:
+            HostUnreachableError: If the circuit is open, or half-open with a
+                probe already in flight
+        """
+        with self._lock:
+            error = self._unreachable_error(host)
+            if error is not None:
+                raise error
+            
+            state = self._hosts.get(host)
+            if state is None or state.opened_at is None:
+                return
+            
+            # Half-open: this request is the probe
+            state.probing = True
+            logger.info(f"Probing host {host} after {self.reset_timeout:g}s")
+    
+    def record_success(self, host: str):
+        """Record that the host answered; closes its circuit."""
+        with self._lock:
+            state = self._hosts.pop(host, None)
+        if state is not None and state.opened_at is not None:
+            logger.info(f"Host {host} reachable again, circuit closed")
+    
+    def record_failure(self, host: str):
+        """Record a connection error or timeout; may open the host's circuit."""
+        with self._lock:
+            state = self._hosts.setdefault(host, _HostState())
+            state.failures += 1
+            was_open = state.opened_at is not None
+            if was_open or state.failures >= self.failure_threshold:
+                state.opened_at = self._clock()
+                state.probing = False
+        
+        if not was_open and state.opened_at is not None:
+            logger.warning(
+                f"Host {host} unreachable after {state.failures} consecutive failures, "
+                f"failing requests fast for {self.reset_timeout:g}s"
+            )
+    
+    def unreachable_error(self, host: str) -> Optional[HostUnreachableError]:
+        """
+        Check without side effects whether requests to the host would fail fast.
+        
+        Args:
+            host: Host key
+        
+        Returns:
+            HostUnreachableError if the circuit is open and no probe is due
+            (or one is already in flight), otherwise None
+        """
+        with self._lock:
+            return self._unreachable_error(host)
+    
+    def _unreachable_error(self, host: str) -> Optional[HostUnreachableError]:
+        """unreachable_error() without locking (caller holds the lock)."""
+        state = self._hosts.get(host)
+        if state is None or state.opened_at is None:
+            return None
+        retry_in = state.opened_at + self.reset_timeout - self._clock()
+        if retry_in > 0 or state.probing:
+            return HostUnreachableError(host, max(retry_in, 0.0))
+        return None
+    
+    def is_open(self, host: str) -> bool:
+        """Return True if requests to the host currently fail fast."""
+        with self._lock:
+            state = self._hosts.get(host)
+            return state is not None and state.opened_at is not None
@@ -0,0 +1,195 @@
+"""Adaptive concurrency limit for requests to a slow shared server."""
+
+import logging
+import math
+import threading
+from typing import Any, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of a non-empty list.
+    
+    Args:
+        values: Samples (any order)
+        fraction: Percentile as fraction, e.g. 0.9 for p90
+    
+    Returns:
+        Smallest sample that is greater than or equal to the given fraction of all samples
+    """
+    ordered = sorted(values)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Thread-safe semaphore whose size adapts to the server (AIMD).
+    
+    Every request holds one slot from acquire() to release(); release()
+    reports its latency and whether the server was overloaded (timeout,
+    429, 5xx). Samples are evaluated in windows of window_size requests:
+    
+    - More than error_rate_threshold overloaded requests halve the limit
+      immediately (multiplicative decrease), without waiting for the
+      window to fill.
+    - A p90 latency above latency_tolerance times the baseline means
+      requests queue up on the server: the limit shrinks by one.
+    - Otherwise the limit grows by one (additive increase), but only if
+      all slots were in use during the window - an idle limit says
+      nothing about the server.
+    
+    The baseline is the lowest p90 seen so far. It drifts upwards by
+    BASELINE_DRIFT per window, so a permanently slower server does not
+    pin the limit at min_limit.
+    """
+    
+    DEFAULT_WINDOW_SIZE = 20  # Requests per evaluation window
+    DEFAULT_LATENCY_TOLERANCE = 2.0  # p90 / baseline ratio that counts as saturated
+    DEFAULT_ERROR_RATE_THRESHOLD = 0.2  # Fraction of overloaded requests that halves the limit
+    DECREASE_FACTOR = 0.5  # Multiplicative decrease on overload
+    BASELINE_DRIFT = 0.05  # Relative upward drift of the latency baseline per window
+    
+    def __init__(
+        self,
+        max_limit: int,
+        initial_limit: Optional[int] = None,
+        min_limit: int = 1,
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+        error_rate_threshold: float = DEFAULT_ERROR_RATE_THRESHOLD
+    ):
+        """
+        Initialize the limiter.
+        
+        Args:
+            max_limit: Upper bound for concurrent requests
+            initial_limit: Limit to start with (default: half of max_limit)
+            min_limit: Lower bound for concurrent requests
+            window_size: Requests per evaluation window
+            latency_tolerance: p90 latency relative to the baseline above which the limit shrinks
+            error_rate_threshold: Fraction of overloaded requests above which the limit is halved
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        if initial_limit is None:
+            initial_limit = self.max_limit // 2
+        self.window_size = max(1, window_size)
+        self.latency_tolerance = latency_tolerance
+        self.error_rate_threshold = error_rate_threshold
+        
+        self._limit = min(max(initial_limit, self.min_limit), self.max_limit)
+        self._in_flight = 0
+        self._saturated = False  # All slots were taken at some point of the window
+        self._latencies: List[float] = []
+        self._overloaded = 0
+        self._baseline: Optional[float] = None
+        self._last_p50: Optional[float] = None
+        self._last_p90: Optional[float] = None
+        self._slot_freed = threading.Condition()
+    
+    @property
+    def limit(self) -> int:
+        """Current number of concurrent requests allowed."""
+        with self._slot_freed:
+            return self._limit
+    
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a free slot.
+        
+        Args:
+            timeout: Maximum seconds to wait (None: wait indefinitely)
+        
+        Returns:
+            True if a slot was taken, False on timeout
+        """
+        with self._slot_freed:
+            if not self._slot_freed.wait_for(lambda: self._in_flight < self._limit, timeout):
+                return False
+            self._in_flight += 1
+            if self._in_flight >= self._limit:
+                self._saturated = True
+            return True
+    
+    def release(self, latency: Optional[float] = None, overloaded: bool = False):
+        """
+        Free a slot and record the outcome of its request.
+        
+        Args:
+            latency: Duration of the request in seconds, or None if the request
+                     was not sent (it is then not counted)
+            overloaded: True if the server timed out or answered 429/5xx
+        """
+        with self._slot_freed:
+            self._in_flight -= 1
+            if latency is not None:
+                if overloaded:
+                    self._overloaded += 1
+                else:
+                    self._latencies.append(latency)
+                self._adjust()
+            self._slot_freed.notify_all()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Report the controller state.
+        
+        Returns:
+            Dictionary with limit, in_flight, baseline, p50 and p90 (seconds,
+            None until the first window was evaluated)
+        """
+        with self._slot_freed:
+            return {
+                "limit": self._limit,
+                "in_flight": self._in_flight,
+                "baseline": self._baseline,
+                "p50": self._last_p50,
+                "p90": self._last_p90
+            }
+    
+    def _adjust(self):
+        """Evaluate the current window. Caller must hold the lock."""
+        if self._overloaded > self.error_rate_threshold * self.window_size:
+            self._set_limit(
+                math.floor(self._limit * self.DECREASE_FACTOR),
+                f"{self._overloaded} overloaded requests"
+            )
+            self._reset_window()
+            return
+        
+        if len(self._latencies) + self._overloaded < self.window_size:
+            return
+        
+        if self._latencies:
+            p90 = percentile(self._latencies, 0.9)
+            self._last_p50 = percentile(self._latencies, 0.5)
+            self._last_p90 = p90
+            
+            if self._baseline is None:
+                self._baseline = p90
+            else:
+                self._baseline = min(p90, self._baseline * (1 + self.BASELINE_DRIFT))
+            
+            if p90 > self._baseline * self.latency_tolerance:
+                self._set_limit(self._limit - 1, f"p90 latency {p90:.1f}s (baseline {self._baseline:.1f}s)")
+            elif self._saturated:
+                self._set_limit(self._limit + 1, f"p90 latency {p90:.1f}s")
+        
+        self._reset_window()
+    
+    def _set_limit(self, limit: int, reason: str):
+        """Clamp and apply a new limit. Caller must hold the lock."""
+        limit = min(max(limit, self.min_limit), self.max_limit)
+        if limit != self._limit:
+            logger.info(f"Concurrency limit {self._limit} -> {limit} ({reason})")
+            self._limit = limit
+    
+    def _reset_window(self):
+        """Start a new evaluation window. Caller must hold the lock."""
+        self._latencies = []
+        self._overloaded = 0
+        self._saturated = self._in_flight >= self._limit
@@ -1,12 +1,20 @@
 """DataCite API Client for fetching DOIs and metadata."""
 
 import copy
+import itertools
 import logging
-from typing import List, Tuple, Dict, Any, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Tuple, Dict, Any, Optional, Callable, Iterator
 from urllib.parse import urlparse, urlunparse, quote, unquote
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
+from src.api.metadata_cache import MetadataCache, MetadataCacheError
+from src.api.rate_limiter import AdaptiveRateLimiter, RateLimitedSession
+from src.utils.contributor_classifier import CONTRIBUTOR_CLASSIFIER
 from src.utils.publisher_parser import parse_publisher_from_metadata
 
 
@@ -35,23 +43,206 @@ class DataCiteClient:
     TEST_ENDPOINT = "https://api.test.datacite.org"
     PAGE_SIZE = 100  # Maximum page size supported by DataCite API
     TIMEOUT = 30  # Request timeout in seconds
+    POOL_CONNECTIONS = 2  # Number of per-host connection pools to cache
+    POOL_MAXSIZE = 10  # Max. keep-alive connections per host (should cover worker threads)
+    USER_AGENT = "GROBI (GFZ Data Services)"
+    PREFETCH_WORKERS = 4  # Concurrent metadata requests in MetadataPrefetcher
+    MAX_REQUESTS_PER_SECOND = 10.0  # DataCite allows 3000 requests per 5 minutes
+    RATE_LIMIT_RETRIES = 3  # Transparent retries after HTTP 429
+    RATE_LIMIT_MAX_BACKOFF = 60.0  # Max. seconds to wait before a single retry
+    FULL_SYNC_INTERVAL_DAYS = 7  # Days after which a cache sync downloads all DOIs again
     
-    def __init__(self, username: str, password: str, use_test_api: bool = False):
+    # Facet name -> extractor method used by harvest_facets()
+    FACET_EXTRACTORS = {
+        "urls": "_extract_url_entries",
+        "creators": "_extract_creator_entries",
+        "contributors": "_extract_contributor_entries",
+        "publisher": "_extract_publisher_entries",
+        "rights": "_extract_rights_entries",
+    }
+    
+    # Facet name -> sparse fieldset (fields[dois]) with the attributes its extractor reads.
+    # The DOI itself is always returned as "id".
+    FACET_FIELDS = {
+        "urls": "url",
+        "creators": "creators",
+        "contributors": "contributors",
+        "publisher": "publisher",
+        "rights": "rightsList",
+    }
+    
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        use_test_api: bool = False,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        cache: Optional[MetadataCache] = None
+    ):
         """
         Initialize DataCite API client.
         
+        All requests of this client (page fetches, metadata GETs and update PUTs)
+        go through one pooled requests.Session, so TCP/TLS connections to the
+        DataCite API are kept alive and reused instead of being re-established
+        for every call. The session may be shared by several worker threads.
+        
         Args:
             username: DataCite username (client-id)
             password: DataCite password
             use_test_api: If True, use test API endpoint instead of production
+            pool_connections: Number of host pools to cache (default: POOL_CONNECTIONS)
+            pool_maxsize: Max. keep-alive connections per host (default: POOL_MAXSIZE)
+            cache: Optional local metadata cache. If set, the fetch_all_* and
+                   streaming methods sync it incrementally and serve from it,
+                   and get_doi_metadata() answers cached DOIs without a request.
         """
         self.username = username
         self.password = password
         self.base_url = self.TEST_ENDPOINT if use_test_api else self.PRODUCTION_ENDPOINT
         self.auth = HTTPBasicAuth(username, password)
+        self.pool_connections = pool_connections or self.POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize or self.POOL_MAXSIZE
+        self.rate_limiter = AdaptiveRateLimiter(self.MAX_REQUESTS_PER_SECOND)
+        self.cache = cache
+        self.session = self._create_session()
+        self._harvest_stats = {"pages": 0, "bytes_received": 0, "bytes_decoded": 0}
         
         logger.info(f"DataCite client initialized for {'TEST' if use_test_api else 'PRODUCTION'} API")
     
+    def _create_session(self) -> requests.Session:
+        """
+        Create the pooled HTTP session used for all API requests.
+        
+        All requests pass through the client's AdaptiveRateLimiter, and
+        HTTP 429 responses are retried after the Retry-After delay.
+        
+        Returns:
+            requests.Session with keep-alive connection pool, rate limiting,
+            Basic Auth and default JSON:API headers
+        """
+        session = RateLimitedSession(
+            self.rate_limiter,
+            max_retries=self.RATE_LIMIT_RETRIES,
+            max_backoff=self.RATE_LIMIT_MAX_BACKOFF
+        )
+        session.auth = self.auth
+        session.headers.update({
+            "Accept": "application/vnd.api+json",
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": self.USER_AGENT
+        })
+        
+        # Retries are handled by the session and the calling code, so disable urllib3 retries
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.hooks["response"].append(self._cache_updated_record)
+        return session
+    
+    def _cache_updated_record(self, response: requests.Response, *args, **kwargs):
+        """
+        Response hook: write successful DOI updates through to the metadata cache.
+        
+        DataCite answers a PUT with the complete updated record, so the cache
+        stays current for this client's own changes without another request.
+        """
+        if self.cache is None or response.request.method != "PUT" or response.status_code != 200:
+            return
+        try:
+            record = response.json().get("data") or {}
+            self.cache.store(self.base_url, self.username, [record])
+        except (ValueError, AttributeError, MetadataCacheError) as e:
+            # Drop the entry; the next sync fetches it again
+            logger.warning(f"Could not update metadata cache after PUT {response.url}: {e}")
+            doi = unquote(urlparse(response.url).path.split("/dois/", 1)[-1])
+            try:
+                self.cache.remove(self.base_url, self.username, [doi])
+            except Exception as remove_error:
+                logger.warning(f"Could not remove {doi} from metadata cache: {remove_error}")
+    
+    def get_connection_stats(self) -> Dict[str, int]:
+        """
+        Report how often pooled connections were reused.
+        
+        The numbers are collected from the urllib3 connection pools of the
+        session and cover all requests sent since the client was created.
+        
+        Returns:
+            Dictionary with:
+            - requests: Number of HTTP requests sent over the pool
+            - connections_opened: Number of new TCP/TLS connections
+            - connections_reused: Number of requests served by a kept-alive connection
+        """
+        total_requests = 0
+        connections_opened = 0
+        
+        for adapter in set(self.session.adapters.values()):
+            poolmanager = getattr(adapter, "poolmanager", None)
+            if poolmanager is None:
+                continue
+            for key in list(poolmanager.pools.keys()):
+                pool = poolmanager.pools.get(key)
+                if pool is None:
+                    continue
+                total_requests += getattr(pool, "num_requests", 0)
+                connections_opened += getattr(pool, "num_connections", 0)
+        
+        return {
+            "requests": total_requests,
+            "connections_opened": connections_opened,
+            "connections_reused": max(total_requests - connections_opened, 0)
+        }
+    
+    def get_harvest_stats(self) -> Dict[str, int]:
+        """
+        Report the transfer volume of the current or most recent pagination run.
+        
+        The counters are reset whenever a first page is requested, so after a
+        fetch_all_*, iter_facet_pages or harvest_facets call they describe that
+        harvest alone.
+        
+        Returns:
+            Dictionary with:
+            - pages: Number of pages received
+            - bytes_received: Bytes transferred over the network (compressed)
+            - bytes_decoded: Bytes of the decoded JSON payload
+        """
+        return dict(self._harvest_stats)
+    
+    def get_request_rate(self) -> float:
+        """
+        Get the current request rate allowed by the adaptive rate limiter.
+        
+        Returns:
+            Requests per second; lower than MAX_REQUESTS_PER_SECOND after the
+            API answered with HTTP 429 or reported a low remaining quota
+        """
+        return self.rate_limiter.current_rate
+    
+    def close(self):
+        """Close the HTTP session and release all pooled connections."""
+        stats = self.get_connection_stats()
+        if stats["requests"]:
+            logger.info(
+                f"Closing DataCite session: {stats['requests']} requests, "
+                f"{stats['connections_opened']} connections opened, "
+                f"{stats['connections_reused']} reused"
+            )
+        throttle_stats = self.rate_limiter.get_stats()
+        if throttle_stats["rate_limited"]:
+            logger.info(
+                f"Rate limiting: {throttle_stats['rate_limited']} x HTTP 429, "
+                f"{throttle_stats['waited_seconds']:.1f}s waited, "
+                f"final rate {throttle_stats['current_rate']:.2f} req/s"
+            )
+        self.session.close()
+    
     def fetch_all_dois(self) -> List[Tuple[str, str]]:
         """
         Fetch all DOIs registered by this client from DataCite API.
@@ -65,6 +256,9 @@ class DataCiteClient:
             NetworkError: If connection to API fails
             DataCiteAPIError: For other API errors
         """
+        if self.cache is not None:
+            return self._fetch_all_cached("urls")
+        
         all_dois = []
         next_url = None  # Start with None to use initial cursor
         page_count = 0
@@ -281,6 +475,9 @@ class DataCiteClient:
             NetworkError: If connection to API fails
             DataCiteAPIError: For other API errors
         """
+        if self.cache is not None:
+            return self._fetch_all_cached("creators")
+        
         all_creator_data = []
         next_url = None  # Start with None to use initial cursor
         page_count = 0
@@ -316,25 +513,339 @@ class DataCiteClient:
         logger.info(f"Successfully fetched {len(all_creator_data)} creator entries in total")
         return all_creator_data
     
-    def _fetch_page(self, next_url: Optional[str] = None) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+    def harvest_facets(
+        self,
+        extractors: Optional[Dict[str, Callable[[Dict[str, Any]], List[Tuple]]]] = None,
+        progress_callback: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, List[Tuple]]:
         """
-        Fetch a single page of DOIs from the API using cursor-based pagination.
+        Walk the cursor pagination once and run several extractors over each page.
+        
+        Exporting URLs, creators, contributors, publisher and rights separately
+        downloads every page five times. This method requests each page only once
+        and hands the parsed page to every extractor. For the built-in facets only
+        the attributes they read are requested (sparse fieldset).
+        
+        Collects all rows in memory; use iter_harvest_pages() to process them
+        page by page instead.
+        
+        Args:
+            extractors: Mapping of facet name to a callable that takes one parsed
+                        page (JSON dict) and returns a list of row tuples.
+                        Defaults to all built-in facets (see FACET_EXTRACTORS).
+            progress_callback: Optional callback function(message: str) called after each page
+            
+        Returns:
+            Dictionary mapping each facet name to its list of row tuples.
+            The rows have the same layout as the corresponding fetch_all_dois* method.
+            
+        Raises:
+            AuthenticationError: If credentials are invalid
+            NetworkError: If connection to API fails
+            DataCiteAPIError: For other API errors
+        """
+        results = {facet: [] for facet in (extractors or self.FACET_EXTRACTORS)}
+        for page in self.iter_harvest_pages(extractors, progress_callback):
+            for facet, rows in page.items():
+                results[facet].extend(rows)
+        
+        logger.info(
+            "Harvest complete: "
+            + ", ".join(f"{len(rows)} {facet} entries" for facet, rows in results.items())
+        )
+        return results
+    
+    def iter_harvest_pages(
+        self,
+        extractors: Optional[Dict[str, Callable[[Dict[str, Any]], List[Tuple]]]] = None,
+        progress_callback: Optional[Callable[[str], None]] = None
+    ) -> Iterator[Dict[str, List[Tuple]]]:
+        """
+        Walk the cursor pagination once and yield the rows of several facets per page.
+        
+        Streaming counterpart of harvest_facets(): the caller can write each page
+        of every facet (e.g. to one CSV file per facet) as soon as it arrives, so
+        memory usage stays constant regardless of the number of DOIs.
+        
+        Args:
+            extractors: Mapping of facet name to a callable that takes one parsed
+                        page (JSON dict) and returns a list of row tuples.
+                        Defaults to all built-in facets (see FACET_EXTRACTORS).
+            progress_callback: Optional callback function(message: str) called after each page
+            
+        Yields:
+            Dictionary mapping each facet name to the row tuples of one page,
+            with the same layout as the corresponding fetch_all_dois* method
+            
+        Raises:
+            AuthenticationError: If credentials are invalid
+            NetworkError: If connection to API fails
+            DataCiteAPIError: For other API errors
+        """
+        fields = None  # Custom extractors may read any attribute
+        if extractors is None:
+            extractors = {
+                facet: getattr(self, method_name)
+                for facet, method_name in self.FACET_EXTRACTORS.items()
+            }
+            fields = ",".join(self.FACET_FIELDS[facet] for facet in extractors)
+        
+        page_count = 0
+        
+        logger.info(
+            f"Starting one-pass harvest of facets {', '.join(extractors)} "
+            f"for client: {self.username} (using cursor pagination)"
+        )
+        
+        for data in self._iter_raw_pages(label="for harvest", fields=fields):
+            page_count += 1
+            page = {facet: extractor(data) for facet, extractor in extractors.items()}
+            
+            page_dois = len(data.get("data") or [])
+            logger.info(f"Harvested page {page_count}: {page_dois} DOIs")
+            if progress_callback:
+                progress_callback(f"Seite {page_count} verarbeitet ({page_dois} DOIs)")
+            
+            yield page
+        
+        logger.info(f"Harvest of {page_count} pages complete")
+    
+    def iter_facet_pages(self, facet: str) -> Iterator[List[Tuple]]:
+        """
+        Yield the rows of one facet page by page instead of collecting all of them.
+        
+        Streaming counterpart of the fetch_all_dois* methods: the caller can process
+        (e.g. write to CSV) each page as soon as it arrives, so memory usage stays
+        constant regardless of the number of DOIs.
+        
+        Args:
+            facet: One of the keys of FACET_EXTRACTORS
+                   ("urls", "creators", "contributors", "publisher", "rights")
+            
+        Yields:
+            List of row tuples of one page, with the same layout as the
+            corresponding fetch_all_dois* method
+            
+        Raises:
+            ValueError: If the facet is unknown
+            AuthenticationError: If credentials are invalid
+            NetworkError: If connection to API fails
+            DataCiteAPIError: For other API errors
+        """
+        if facet not in self.FACET_EXTRACTORS:
+            raise ValueError(f"Unknown facet: {facet}")
+        
+        extractor = getattr(self, self.FACET_EXTRACTORS[facet])
+        for data in self._iter_raw_pages(label=f"with {facet}", fields=self.FACET_FIELDS[facet]):
+            yield extractor(data)
+    
+    def sync_cache(
+        self,
+        full: bool = False,
+        progress_callback: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, int]:
+        """
+        Bring the metadata cache up to date with DataCite.
+        
+        The first sync downloads all DOIs of the client. Later syncs only request
+        DOIs whose `updated` timestamp is at or after the newest cached one, using
+        the `updated` range query of the /dois endpoint, so a repeated export
+        usually costs a single request.
+        
+        An incremental sync cannot notice DOIs that were deleted (drafts) or
+        transferred to another client; a full sync removes those from the cache.
+        A full sync therefore also runs automatically when the last one is more
+        than FULL_SYNC_INTERVAL_DAYS old.
+        
+        Args:
+            full: If True, download all DOIs and drop cached DOIs that no longer exist
+            progress_callback: Optional callback function(message: str) called after each page
+            
+        Returns:
+            Dictionary with downloaded (DOIs received), removed (DOIs dropped
+            from the cache) and total (DOIs cached afterwards)
+            
+        Raises:
+            ValueError: If the client has no cache
+            AuthenticationError: If credentials are invalid
+            NetworkError: If connection to API fails
+            DataCiteAPIError: For other API errors or if the cache cannot be written
+        """
+        if self.cache is None:
+            raise ValueError("DataCiteClient has no metadata cache")
+        
+        state = self.cache.get_sync_state(self.base_url, self.username)
+        full = full or state is None or self._full_sync_due(state)
+        query = None
+        if not full and state["last_updated"]:
+            query = f"updated:[{state['last_updated']} TO *]"
+        
+        logger.info(
+            f"Syncing metadata cache for client {self.username} "
+            f"({'full' if full else 'incremental since ' + str(state['last_updated'])})"
+        )
+        
+        downloaded = 0
+        seen_dois = set()
+        page_count = 0
+        try:
+            for data in self._iter_api_pages(label="for cache sync", query=query):
+                page_count += 1
+                records = data.get("data") or []
+                downloaded += self.cache.store(self.base_url, self.username, records)
+                if full:
+                    seen_dois.update(record.get("id", "").lower() for record in records)
+                if progress_callback:
+                    progress_callback(f"Cache-Abgleich: Seite {page_count} ({downloaded} DOIs aktualisiert)")
+            
+            removed = 0
+            if full:
+                stale_dois = set(self.cache.cached_dois(self.base_url, self.username)) - seen_dois
+                removed = self.cache.remove(self.base_url, self.username, stale_dois)
+            
+            self.cache.mark_synced(self.base_url, self.username, full=full)
+        except MetadataCacheError as e:
+            logger.error(f"Metadata cache error: {e}")
+            raise DataCiteAPIError(str(e))
+        
+        total = self.cache.count(self.base_url, self.username)
+        logger.info(f"Metadata cache synced: {downloaded} downloaded, {removed} removed, {total} cached")
+        return {"downloaded": downloaded, "removed": removed, "total": total}
+    
+    def _full_sync_due(self, state: Dict[str, Optional[str]]) -> bool:
+        """Return True if the cache had no full sync within FULL_SYNC_INTERVAL_DAYS."""
+        if not state.get("full_synced_at"):
+            return True
+        try:
+            full_synced_at = datetime.fromisoformat(state["full_synced_at"])
+        except ValueError:
+            return True
+        return datetime.now(timezone.utc) - full_synced_at > timedelta(days=self.FULL_SYNC_INTERVAL_DAYS)
+    
+    def _fetch_all_cached(self, facet: str) -> List[Tuple]:
+        """
+        Sync the metadata cache and collect all rows of one facet from it.
+        
+        Args:
+            facet: One of the keys of FACET_EXTRACTORS
+            
+        Returns:
+            List of row tuples with the same layout as the fetch_all_dois* methods
+        """
+        rows = [row for page in self.iter_facet_pages(facet) for row in page]
+        logger.info(f"Fetched {len(rows)} {facet} entries from metadata cache")
+        return rows
+    
+    def _iter_raw_pages(self, label: str = "", fields: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the parsed JSON of each page of the client's DOIs.
+        
+        With a metadata cache, the cache is synced incrementally first and the
+        pages are then served from it; otherwise the API is paginated directly.
+        
+        Args:
+            label: Optional description for debug logging
+            fields: Optional sparse fieldset for API requests (ignored when
+                    serving from the cache, which needs complete records)
+            
+        Yields:
+            Parsed JSON response of one page
+            
+        Raises:
+            AuthenticationError: If credentials are invalid
+            NetworkError: If connection to API fails
+            DataCiteAPIError: For other API errors
+        """
+        if self.cache is None:
+            yield from self._iter_api_pages(label=label, fields=fields)
+            return
+        
+        self.sync_cache()
+        logger.info(f"Serving DOIs{' ' + label if label else ''} from metadata cache")
+        yield from self.cache.iter_pages(self.base_url, self.username, self.PAGE_SIZE)
+    
+    def _iter_api_pages(
+        self,
+        label: str = "",
+        query: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Walk the cursor pagination of the API and yield the parsed JSON of each page.
+        
+        Args:
+            label: Optional description for debug logging
+            query: Optional DataCite search query for the first page (e.g. an `updated` range)
+            fields: Optional sparse fieldset (comma-separated attribute names)
+            
+        Yields:
+            Parsed JSON response of one page
+            
+        Raises:
+            AuthenticationError: If credentials are invalid
+            NetworkError: If connection to API fails
+            DataCiteAPIError: For other API errors
+        """
+        next_url = None  # Start with None to use initial cursor
+        page_count = 0
+        
+        while True:
+            try:
+                page_count += 1
+                data, next_url = self._request_page(next_url, label=label, query=query, fields=fields)
+                
+            except requests.exceptions.Timeout:
+                error_msg = "Die Anfrage hat zu lange gedauert. Bitte versuche es erneut."
+                logger.error(f"Timeout on page {page_count}")
+                raise DataCiteAPIError(error_msg)
+            
+            except requests.exceptions.ConnectionError as e:
+                error_msg = "Verbindung zur DataCite API fehlgeschlagen. Bitte überprüfe deine Internetverbindung."
+                logger.error(f"Connection error: {e}")
+                raise NetworkError(error_msg)
+            
+            except requests.exceptions.RequestException as e:
+                error_msg = f"Netzwerkfehler bei der Kommunikation mit DataCite: {str(e)}"
+                logger.error(f"Request exception: {e}")
+                raise NetworkError(error_msg)
+            
+            yield data
+            
+            if not next_url:
+                break
+    
+    def _request_page(
+        self,
+        next_url: Optional[str] = None,
+        label: str = "",
+        query: Optional[str] = None,
+        fields: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Request a single page of the /dois endpoint using cursor-based pagination.
         
         Args:
             next_url: Full URL for next page (from previous response), or None for first page
+            label: Optional description for debug logging (e.g. "with creators")
+            query: Optional DataCite search query for the first page; the next
+                   URLs returned by the API already carry it
+            fields: Optional sparse fieldset (comma-separated attribute names) so
+                    the API only returns the attributes the caller needs; like
+                    query, it is carried over into the next URLs by the API
             
         Returns:
-            Tuple of (list of DOI tuples, next_url for pagination or None if no more pages)
+            Tuple of (parsed JSON response, next_url for pagination or None if no more pages)
             
         Raises:
             AuthenticationError: If credentials are invalid
             DataCiteAPIError: For other API errors
         """
+        label = f" {label}" if label else ""
         if next_url:
             # Use the complete next URL from the API response
             url = next_url
             params = None
-            logger.debug(f"Requesting next page: {url}")
+            logger.debug(f"Requesting next page{label}: {url}")
         else:
             # First page: use cursor=1
             # Note: DataCite API explicitly requires page[cursor]=1 for the first page
@@ -345,11 +856,15 @@ class DataCiteClient:
                 "page[size]": self.PAGE_SIZE,
                 "page[cursor]": 1
             }
-            logger.debug(f"Requesting first page: {url} with params: {params}")
-        
-        response = requests.get(
+            if query:
+                params["query"] = query
+            if fields:
+                params["fields[dois]"] = fields
+            self._harvest_stats = {"pages": 0, "bytes_received": 0, "bytes_decoded": 0}
+            logger.debug(f"Requesting first page{label}: {url} with params: {params}")
+        
+        response = self.session.get(
             url,
-            auth=self.auth,
             params=params,
             timeout=self.TIMEOUT,
             headers={"Accept": "application/vnd.api+json"}
@@ -381,6 +896,76 @@ class DataCiteClient:
             logger.error(f"Invalid JSON response: {e}")
             raise DataCiteAPIError(error_msg)
         
+        # Extract next page URL from response
+        next_page_url = None
+        if "links" in data and "next" in data["links"]:
+            next_page_url = data["links"]["next"]
+            logger.debug(f"Next page URL: {next_page_url}")
+        
+        self._record_page_transfer(response)
+        if not next_page_url:
+            stats = self._harvest_stats
+            logger.info(
+                f"Harvest{label} transferred {stats['bytes_received'] / 1024:.1f} KB "
+                f"({stats['bytes_decoded'] / 1024:.1f} KB decoded) in {stats['pages']} pages"
+            )
+        
+        return data, next_page_url
+    
+    def _record_page_transfer(self, response: requests.Response):
+        """
+        Add the size of one page response to the harvest counters.
+        
+        The network size is read from the raw urllib3 stream, which counts the
+        compressed bytes; Content-Length or the decoded size serve as fallback.
+        """
+        content = response.content
+        decoded = len(content) if isinstance(content, (bytes, bytearray)) else 0
+        received = 0
+        try:
+            received = int(response.raw.tell())
+        except (AttributeError, TypeError, ValueError, OSError):
+            pass
+        if not received:
+            try:
+                received = int(response.headers.get("Content-Length", decoded))
+            except (AttributeError, TypeError, ValueError):
+                received = decoded
+        
+        self._harvest_stats["pages"] += 1
+        self._harvest_stats["bytes_received"] += received
+        self._harvest_stats["bytes_decoded"] += decoded
+    
+    def _fetch_page(self, next_url: Optional[str] = None) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+        """
+        Fetch a single page of DOIs from the API using cursor-based pagination.
+        
+        Args:
+            next_url: Full URL for next page (from previous response), or None for first page
+            
+        Returns:
+            Tuple of (list of DOI tuples, next_url for pagination or None if no more pages)
+            
+        Raises:
+            AuthenticationError: If credentials are invalid
+            DataCiteAPIError: For other API errors
+        """
+        data, next_page_url = self._request_page(
+            next_url, fields=self.FACET_FIELDS["urls"]
+        )
+        return self._extract_url_entries(data), next_page_url
+    
+    @staticmethod
+    def _extract_url_entries(data: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """
+        Extract URL entries from one parsed page of the /dois endpoint.
+        
+        Args:
+            data: Parsed JSON response of a single page
+            
+        Returns:
+            List of (DOI, Landing Page URL) tuples
+        """
         # Extract DOIs and URLs
         dois = []
         if "data" in data and isinstance(data["data"], list):
@@ -398,13 +983,36 @@ class DataCiteClient:
                     logger.warning(f"Error parsing DOI entry: {e}")
                     continue
         
-        # Extract next page URL from response
-        next_page_url = None
-        if "links" in data and "next" in data["links"]:
-            next_page_url = data["links"]["next"]
-            logger.debug(f"Next page URL: {next_page_url}")
+        return dois
+    
+    def _fetch_page_with_updated(self, next_url: Optional[str] = None) -> Tuple[List[Tuple[str, str, str]], Optional[str]]:
+        """
+        Fetch a single page of DOIs with their last modification timestamp.
         
-        return dois, next_page_url
+        Args:
+            next_url: Full URL for next page (from previous response), or None for first page
+            
+        Returns:
+            Tuple of (list of (DOI, Landing Page URL, updated) tuples, next_url
+            for pagination or None if no more pages)
+            
+        Raises:
+            AuthenticationError: If credentials are invalid
+            DataCiteAPIError: For other API errors
+        """
+        data, next_page_url = self._request_page(
+            next_url, label="with updated", fields="url,updated"
+        )
+        updated_by_doi = {
+            item.get("id"): (item.get("attributes") or {}).get("updated") or ""
+            for item in data.get("data") or []
+            if isinstance(item, dict)
+        }
+        entries = [
+            (doi, url, updated_by_doi.get(doi, ""))
+            for doi, url in self._extract_url_entries(data)
+        ]
+        return entries, next_page_url
     
     def _fetch_page_with_creators(self, next_url: Optional[str] = None) -> Tuple[List[Tuple[str, str, str, str, str, str, str, str]], Optional[str]]:
         """
@@ -422,57 +1030,22 @@ class DataCiteClient:
             AuthenticationError: If credentials are invalid
             DataCiteAPIError: For other API errors
         """
-        if next_url:
-            # Use the complete next URL from the API response
-            url = next_url
-            params = None
-            logger.debug(f"Requesting next page with creators: {url}")
-        else:
-            # First page: use cursor=1
-            # Note: DataCite API explicitly requires page[cursor]=1 for the first page
-            # See: https://support.datacite.org/docs/pagination (Method 2: Cursor)
-            url = f"{self.base_url}/dois"
-            params = {
-                "client-id": self.username,
-                "page[size]": self.PAGE_SIZE,
-                "page[cursor]": 1
-            }
-            logger.debug(f"Requesting first page with creators: {url} with params: {params}")
-        
-        response = requests.get(
-            url,
-            auth=self.auth,
-            params=params,
-            timeout=self.TIMEOUT,
-            headers={"Accept": "application/vnd.api+json"}
+        data, next_page_url = self._request_page(
+            next_url, label="with creators", fields=self.FACET_FIELDS["creators"]
         )
+        return self._extract_creator_entries(data), next_page_url
+    
+    @staticmethod
+    def _extract_creator_entries(data: Dict[str, Any]) -> List[Tuple[str, str, str, str, str, str, str, str]]:
+        """
+        Extract creator entries from one parsed page of the /dois endpoint.
         
-        # Handle authentication errors
-        if response.status_code == 401:
-            error_msg = "Anmeldung fehlgeschlagen. Bitte überprüfe deinen Benutzernamen und dein Passwort."
-            logger.error(f"Authentication failed for user: {self.username}")
-            raise AuthenticationError(error_msg)
-        
-        # Handle rate limiting
-        if response.status_code == 429:
-            error_msg = "Zu viele Anfragen. Bitte warte einen Moment und versuche es erneut."
-            logger.error("Rate limit exceeded")
-            raise DataCiteAPIError(error_msg)
-        
-        # Handle other HTTP errors
-        if response.status_code != 200:
-            error_msg = f"DataCite API Fehler (HTTP {response.status_code}): {response.text}"
-            logger.error(f"API error: {response.status_code} - {response.text}")
-            raise DataCiteAPIError(error_msg)
-        
-        # Parse JSON response
-        try:
-            data = response.json()
-        except ValueError as e:
-            error_msg = "Ungültige Antwort von der DataCite API (kein gültiges JSON)."
-            logger.error(f"Invalid JSON response: {e}")
-            raise DataCiteAPIError(error_msg)
-        
+        Args:
+            data: Parsed JSON response of a single page
+            
+        Returns:
+            List of creator tuples, see fetch_all_dois_with_creators()
+        """
         # Extract DOIs and creator information
         creator_entries = []
         if "data" in data and isinstance(data["data"], list):
@@ -529,13 +1102,7 @@ class DataCiteClient:
                     logger.warning(f"Error parsing creator data for DOI {item.get('id', 'unknown')}: {e}")
                     continue
         
-        # Extract next page URL from response
-        next_page_url = None
-        if "links" in data and "next" in data["links"]:
-            next_page_url = data["links"]["next"]
-            logger.debug(f"Next page URL: {next_page_url}")
-        
-        return creator_entries, next_page_url
+        return creator_entries
     
     def update_doi_url(self, doi: str, new_url: str) -> Tuple[bool, str]:
         """
@@ -606,9 +1173,8 @@ class DataCiteClient:
         
         try:
             # First attempt: simple URL update
-            response = requests.put(
+            response = self.session.put(
                 url,
-                auth=self.auth,
                 json=simple_payload,
                 timeout=self.TIMEOUT,
                 headers={
@@ -770,9 +1336,8 @@ class DataCiteClient:
             
             # Retry with upgraded metadata
             try:
-                response = requests.put(
+                response = self.session.put(
                     url,
-                    auth=self.auth,
                     json=upgraded_payload,
                     timeout=self.TIMEOUT,
                     headers={
@@ -822,9 +1387,8 @@ class DataCiteClient:
             # Fetch current metadata to identify missing fields
             url = f"{self.base_url}/dois/{doi}"
             try:
-                response = requests.get(
+                response = self.session.get(
                     url,
-                    auth=self.auth,
                     timeout=self.TIMEOUT,
                     headers={"Accept": "application/vnd.api+json"}
                 )
@@ -979,6 +1543,9 @@ class DataCiteClient:
         """
         Fetch complete metadata for a specific DOI.
         
+        If the client has a metadata cache, DOIs found there are answered from
+        it (attributes as of the last sync) without an API request.
+        
         Args:
             doi: The DOI identifier (e.g., "10.5880/GFZ.1.1.2021.001")
             
@@ -990,14 +1557,19 @@ class DataCiteClient:
             NetworkError: If connection to API fails
             DataCiteAPIError: For other API errors
         """
+        if self.cache is not None:
+            cached = self.cache.get(self.base_url, self.username, doi)
+            if cached is not None:
+                logger.debug(f"Metadata for DOI {doi} served from cache")
+                return cached
+        
         url = f"{self.base_url}/dois/{doi}"
         
         logger.info(f"Fetching metadata for DOI: {doi}")
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 url,
-                auth=self.auth,
                 timeout=self.TIMEOUT,
                 headers={"Accept": "application/vnd.api+json"}
             )
@@ -1046,7 +1618,12 @@ class DataCiteClient:
             logger.error(f"Request exception: {e}")
             raise NetworkError(error_msg)
     
-    def validate_creators_match(self, doi: str, csv_creators: List[Dict[str, Any]]) -> Tuple[bool, str]:
+    def validate_creators_match(
+        self,
+        doi: str,
+        csv_creators: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Tuple[bool, str]:
         """
         Validate that CSV creators match the current DataCite metadata exactly.
         
@@ -1059,6 +1636,7 @@ class DataCiteClient:
             doi: The DOI identifier
             csv_creators: List of creator dictionaries from CSV
                          (in the order they appear in the CSV)
+            metadata: Current metadata from get_doi_metadata(), if already fetched
             
         Returns:
             Tuple of (is_valid: bool, message: str)
@@ -1067,11 +1645,12 @@ class DataCiteClient:
         """
         logger.info(f"Validating creators for DOI {doi}")
         
-        # Fetch current metadata
-        try:
-            metadata = self.get_doi_metadata(doi)
-        except (AuthenticationError, NetworkError, DataCiteAPIError) as e:
-            return False, f"Fehler beim Abrufen der Metadaten: {str(e)}"
+        # Fetch current metadata (unless already fetched by the caller)
+        if metadata is None:
+            try:
+                metadata = self.get_doi_metadata(doi)
+            except (AuthenticationError, NetworkError, DataCiteAPIError) as e:
+                return False, f"Fehler beim Abrufen der Metadaten: {str(e)}"
         
         if metadata is None:
             return False, f"DOI {doi} nicht gefunden oder nicht erreichbar"
@@ -1195,9 +1774,8 @@ class DataCiteClient:
         
         # Send PUT request
         try:
-            response = requests.put(
+            response = self.session.put(
                 url,
-                auth=self.auth,
                 json=payload,
                 timeout=self.TIMEOUT,
                 headers={
@@ -1295,6 +1873,9 @@ class DataCiteClient:
             NetworkError: If connection to API fails
             DataCiteAPIError: For other API errors
         """
+        if self.cache is not None:
+            return self._fetch_all_cached("contributors")
+        
         all_contributor_data = []
         next_url = None  # Start with None to use initial cursor
         page_count = 0
@@ -1350,57 +1931,22 @@ class DataCiteClient:
             AuthenticationError: If credentials are invalid
             DataCiteAPIError: For other API errors
         """
-        if next_url:
-            # Use the complete next URL from the API response
-            url = next_url
-            params = None
-            logger.debug(f"Requesting next page with contributors: {url}")
-        else:
-            # First page: use cursor=1
-            # Note: DataCite API explicitly requires page[cursor]=1 for the first page
-            # See: https://support.datacite.org/docs/pagination (Method 2: Cursor)
-            url = f"{self.base_url}/dois"
-            params = {
-                "client-id": self.username,
-                "page[size]": self.PAGE_SIZE,
-                "page[cursor]": 1
-            }
-            logger.debug(f"Requesting first page with contributors: {url} with params: {params}")
-        
-        response = requests.get(
-            url,
-            auth=self.auth,
-            params=params,
-            timeout=self.TIMEOUT,
-            headers={"Accept": "application/vnd.api+json"}
+        data, next_page_url = self._request_page(
+            next_url, label="with contributors", fields=self.FACET_FIELDS["contributors"]
         )
+        return self._extract_contributor_entries(data), next_page_url
+    
+    @staticmethod
+    def _extract_contributor_entries(data: Dict[str, Any]) -> List[Tuple[str, str, str, str, str, str, str, str, str, str, str, str, str, str]]:
+        """
+        Extract contributor entries from one parsed page of the /dois endpoint.
         
-        # Handle authentication errors
-        if response.status_code == 401:
-            error_msg = "Anmeldung fehlgeschlagen. Bitte überprüfe deinen Benutzernamen und dein Passwort."
-            logger.error(f"Authentication failed for user: {self.username}")
-            raise AuthenticationError(error_msg)
-        
-        # Handle rate limiting
-        if response.status_code == 429:
-            error_msg = "Zu viele Anfragen. Bitte warte einen Moment und versuche es erneut."
-            logger.error("Rate limit exceeded")
-            raise DataCiteAPIError(error_msg)
-        
-        # Handle other HTTP errors
-        if response.status_code != 200:
-            error_msg = f"DataCite API Fehler (HTTP {response.status_code}): {response.text}"
-            logger.error(f"API error: {response.status_code} - {response.text}")
-            raise DataCiteAPIError(error_msg)
-        
-        # Parse JSON response
-        try:
-            data = response.json()
-        except ValueError as e:
-            error_msg = "Ungültige Antwort von der DataCite API (kein gültiges JSON)."
-            logger.error(f"Invalid JSON response: {e}")
-            raise DataCiteAPIError(error_msg)
-        
+        Args:
+            data: Parsed JSON response of a single page
+            
+        Returns:
+            List of 14-field contributor tuples, see fetch_all_dois_with_contributors()
+        """
         # Extract DOIs and contributor information
         contributor_entries = []
         seen_contributors = set()  # Track (DOI, name, contributorType) to avoid duplicates
@@ -1432,268 +1978,6 @@ class DataCiteClient:
                             contributor_type = "Other"
                             logger.debug(f"Using default contributorType 'Other' for '{contributor_name}'")
                         
-                        # ContributorTypes that are ALWAYS organizations (never persons)
-                        # Note: "Sponsor", "Funder", "ResearchGroup" are NOT here because they can be persons too!
-                        # (e.g., an individual person can be a sponsor or funder)
-                        ORGANIZATIONAL_CONTRIBUTOR_TYPES = {
-                            "HostingInstitution",
-                            "DistributionCenter",
-                            "RegistrationAgency",
-                            "RegistrationAuthority",
-                        }
-                        
-                        # ContributorTypes that are ALWAYS persons (never organizations)
-                        # Note: "Producer" is intentionally NOT here - it can be a person OR organization
-                        PERSONAL_CONTRIBUTOR_TYPES = {
-                            "ContactPerson",
-                            "DataCollector",
-                            "DataCurator",
-                            "DataManager",
-                            "Editor",
-                            "ProjectLeader",
-                            "ProjectManager",
-                            "ProjectMember",
-                            "Researcher",
-                            "RightsHolder",
-                            "Supervisor",
-                            "WorkPackageLeader",
-                        }
-                        
-                        # Keywords that indicate an organizational name (case-insensitive)
-                        # Used to detect when DataCite incorrectly splits an org name into given/family name
-                        # Two sets of keywords:
-                        # 1. SUBSTRING_ORG_KEYWORDS: Long, unique keywords that can be matched as substrings
-                        #    (safe for German compound words like "GeoForschungsZentrum")
-                        # 2. WORD_BOUNDARY_ORG_KEYWORDS: Shorter keywords that need word boundary matching
-                        #    (to avoid false positives like "Wagner" matching "ag")
-                        
-                        # Keywords long enough to safely match as substrings in compound words
-                        SUBSTRING_ORG_KEYWORDS = {
-                            # German compound-safe (6+ chars, unlikely in names)
-                            "universität", "université", "universidad", "universidade", "università", "university",
-                            "universite",  # ASCII transcription without accent (e.g., "Universite Grenoble Alpes")
-                            "institute", "institut", "instituto", "istituto",
-                            "zentrum", "center", "centre", "centro",
-                            "forschung",  # research (German) - catches "GeoForschungsZentrum"
-                            "laboratory", "laboratorium", "laboratorio", "laboratoire",
-                            "department", "abteilung", "departamento",
-                            "ministry", "ministerium", "ministère", "ministerio",
-                            "foundation", "stiftung", "fondation", "fundación",
-                            "gesellschaft", "association", "verband", "verein",
-                            "organisation", "organization",
-                            "corporation", "company",
-                            "consortium", "konsortium",
-                            "bibliothek", "library",
-                            "krankenhaus", "hospital",
-                            "geosurvey",  # catches "Iceland GeoSurvey"
-                            "helmholtz",  # German research org
-                            "fraunhofer",  # Fraunhofer Society
-                            # German government/geo agencies
-                            "landesamt",  # Landesamt für Geologie und Bergbau
-                            "regierungspräsidium",  # Regierungspräsidium Freiburg
-                            "geological survey",  # Geological Survey of Baden-Württemberg
-                            "geodynamics",  # European Center for Geodynamics
-                            "geophysik", "geophysics",  # Fachbereich Geophysik
-                            "geowissenschaften", "geosciences",  # Institut für Geowissenschaften
-                            "erdbebenstation",  # Erdbebenstation Bensberg
-                            "fachbereich",  # Fachbereich (academic department)
-                            # Observatories, research facilities
-                            "observatory",  # Goma Volcano Observatory, INGV-Osservatorio
-                            "osservatorio",  # Italian observatories
-                            "observatoire",  # French observatories
-                            "observatorium",  # German observatories
-                            "synchrotron",  # ESRF, PETRA III, etc.
-                            "röntgenstrahlungsquelle",  # X-ray source PETRA III
-                            "meteorolog",  # Meteorological services (catches Meteorologie, Meteorology, etc.)
-                            "klimatolog",  # Climatology services
-                            "hochschule",  # German universities of applied sciences
-                            "zentralanstalt",  # ZAMG - Zentralanstalt für Meteorologie und Geodynamik
-                            "géothermie", "geothermie",  # Geothermal companies (és-Géothermie)
-                            "geomanagement",  # ECW Geomanagement BV
-                            "transregio",  # CRC/Transregio 32
-                        }
-                        
-                        # Shorter keywords that need word boundary matching
-                        WORD_BOUNDARY_ORG_KEYWORDS = {
-                            "college", "school", "faculty", "fakultät",
-                            "agency", "agentur", "authority", "behörde",
-                            "office", "bureau", "service", "dienst",
-                            "commission", "kommission", "council", "board",
-                            "gremium", "committee", "ausschuss",
-                            "museum", "archive", "archiv",
-                            "klinik", "clinic", "division",
-                            "firma", "gmbh", "ltd",
-                            "group", "gruppe", "network", "netzwerk",
-                            "survey",  # catches geological surveys
-                            "pool",  # Geophysical Instrument Pool
-                            # Well-known research institution abbreviations (need word boundary)
-                            "eth",  # ETH Zürich
-                            "mit",  # Massachusetts Institute of Technology
-                            "cnrs",  # Centre national de la recherche scientifique
-                            "nasa",  # National Aeronautics and Space Administration
-                            "noaa",  # National Oceanic and Atmospheric Administration
-                            "usgs",  # United States Geological Survey
-                            "csic",  # Spanish National Research Council
-                            "csiro",  # Commonwealth Scientific and Industrial Research Organisation
-                            "rwth",  # RWTH Aachen
-                            "ipgp",  # Institut de Physique du Globe de Paris
-                            "gipp",  # Geophysical Instrument Pool Potsdam
-                            "gfz",  # GFZ German Research Centre for Geosciences
-                            "ucl",  # University College London
-                            # French research keywords
-                            "isterre",  # Institut des Sciences de la Terre
-                            "globe",  # Institut de physique du globe
-                            # Nordic/Scandinavian institutions
-                            "norsar",  # Norwegian Seismic Array
-                            "nve",  # Norges vassdrags- og energidirektorat (Norwegian Water Resources and Energy Directorate)
-                            "dmi",  # Danish Meteorological Institute
-                            "smhi",  # Swedish Meteorological and Hydrological Institute
-                            # Other research institutions
-                            "arditi",  # Agência Regional para o Desenvolvimento da Investigação, Tecnologia e Inovação
-                            "fccn",  # Fundação para Computação Científica Nacional
-                            "fct",  # Fundação para a Ciência e Tecnologia
-                            # Funding/grant keywords
-                            "fellowship",  # Marie Curie Fellowship, etc.
-                            "grant",  # Research grants
-                            "fund",  # Various funds
-                            "award",  # Awards
-                            # Team/staff/group identifiers (organizational entities)
-                            "staff",  # ISG Staff, Support Staff
-                            "team",  # WSM Team, DIGIS Team, Science Team
-                            "authorities",  # Ebro Water Authorities
-                            "isg",  # International Service of Geodynamics
-                            "platform",  # Spanish Geothermal Technology Platform
-                            # Additional institution abbreviations from validation
-                            "awi",  # Alfred Wegener Institut
-                            "bmkg",  # Badan Meteorologi, Klimatologi, dan Geofisika (Indonesian)
-                            "ingv",  # Istituto Nazionale di Geofisica e Vulcanologia
-                            "ipma",  # Instituto Português do Mar e da Atmosfera
-                            "hbo",  # Hochschule Bochum
-                            "zamg",  # Zentralanstalt für Meteorologie und Geodynamik
-                            "eseo",  # European Student Earth Orbiter
-                            "afad",  # Disaster and Emergency Management Presidency (Turkey)
-                            "desy",  # Deutsches Elektronen-Synchrotron
-                            "enbw",  # Energie Baden-Württemberg AG
-                            "ecw",  # ECW Geomanagement BV
-                            "esg",  # és-Géothermie
-                            "cnr",  # Consiglio Nazionale delle Ricerche (Italian)
-                            "esrf",  # European Synchrotron Radiation Facility
-                            "gvo",  # Goma Volcano Observatory
-                            "petra",  # PETRA III synchrotron
-                            "imaa",  # Institute of Methodologies for Environmental Analysis
-                            "crc",  # Collaborative Research Centre
-                            "radar",  # RADAR4KIT, radar facilities
-                            # Project/Program identifiers
-                            "project",  # X0-Deep Fault Drilling Project, MEET Project, etc.
-                            "programme",  # EU programmes
-                            "program",  # US spelling
-                            "sfb",  # Sonderforschungsbereich (German collaborative research centre)
-                            "minas",  # 5E-MINAS project
-                            # Institute acronyms (from validation)
-                            "caiag",  # Central-Asian Institute of Applied Geosciences
-                            "geopribor",  # Russian geophysical instrument manufacturer
-                            "dekorp",  # Deutsches Kontinentales Reflexionsseismisches Programm
-                            "ilge",  # Infrastructure for Large-scale Ground-based E-science
-                            "tna",  # Transnational Access (EU programs)
-                        }
-                        
-                        def _is_organization_name(name: str) -> bool:
-                            """Check if a name contains organizational keywords, URLs, or email addresses.
-                            
-                            IMPORTANT: This function should NOT match person names with affiliations!
-                            Examples that should return False (persons):
-                            - "Bindi, Dino (GFZ)" - person with affiliation
-                            - "Simone Cesca, cesca@gfz.de" - person with email
-                            - "Jari Kortström, jari.kortstrom@helsinki.fi" - person with email
-                            
-                            Examples that should return True (organizations):
-                            - "geofon@gfz.de" - email as contact (no person name)
-                            - "Deutsches GeoForschungsZentrum GFZ" - organization
-                            - "University of Potsdam, Germany" - organization with location
-                            """
-                            if not name:
-                                return False
-                            import re
-                            name_lower = name.lower()
-                            
-                            # First, detect "Person Name, email" or "Person Name (Affiliation)" patterns
-                            # These are persons with contact info, NOT organizations
-                            if ',' in name:
-                                parts = name.split(',', 1)
-                                first_part = parts[0].strip()
-                                second_part = parts[1].strip() if len(parts) > 1 else ""
-                                
-                                # Check if first part looks like a person name (1-3 words, starts with uppercase)
-                                first_words = first_part.split()
-                                if 1 <= len(first_words) <= 3:
-                                    all_name_like = all(
-                                        len(w) >= 1 and w[0].isupper() and 
-                                        not any(kw in w.lower() for kw in ['university', 'institut', 'center', 'centre'])
-                                        for w in first_words
-                                    )
-                                    if all_name_like:
-                                        # Second part is email? -> Person with contact
-                                        if '@' in second_part:
-                                            return False
-                                        # Second part is short (likely first name)? -> Person
-                                        second_words = second_part.split()
-                                        if len(second_words) == 1 and len(second_part) <= 20:
-                                            # Likely "Lastname, Firstname" pattern
-                                            return False
-                            
-                            # Check for "Name (Affiliation)" pattern - person with institutional affiliation
-                            if '(' in name and ')' in name:
-                                before_paren = name.split('(')[0].strip()
-                                # If what's before parenthesis looks like "Lastname, Firstname" -> person
-                                if ',' in before_paren:
-                                    parts = before_paren.split(',')
-                                    if len(parts) == 2:
-                                        p1, p2 = parts[0].strip(), parts[1].strip()
-                                        # Both parts are short name-like strings
-                                        if (1 <= len(p1.split()) <= 2 and 1 <= len(p2.split()) <= 2 and
-                                            len(p1) <= 30 and len(p2) <= 20):
-                                            return False
-                            
-                            # URLs are always organizational (websites, project pages, etc.)
-                            if name_lower.startswith(('http://', 'https://', 'www.')):
-                                return True
-                            
-                            # Email addresses ONLY when they ARE the name (not attached to person name)
-                            # "geofon@gfz.de" -> Org, but "Simone Cesca, cesca@gfz.de" -> Person (handled above)
-                            if '@' in name and '.' in name:
-                                # Check if the ENTIRE name is basically just an email
-                                if re.match(r'^[\w.-]+@[\w.-]+\.[a-z]{2,}$', name_lower.strip()):
-                                    return True
-                            
-                            # First check substring keywords (safe for compound words)
-                            for keyword in SUBSTRING_ORG_KEYWORDS:
-                                if keyword in name_lower:
-                                    return True
-                            
-                            # Then check word-boundary keywords (need exact word match)
-                            for keyword in WORD_BOUNDARY_ORG_KEYWORDS:
-                                pattern = r'\b' + re.escape(keyword) + r'\b'
-                                if re.search(pattern, name_lower):
-                                    return True
-                            
-                            return False
-                        
-                        def _looks_like_person_name(name: str) -> bool:
-                            """Check if a name looks like a person's name based on format heuristics."""
-                            if not name:
-                                return False
-                            # Format "Nachname, Vorname" - very likely a person
-                            if "," in name:
-                                parts = [p.strip() for p in name.split(",")]
-                                if len(parts) == 2 and all(len(p) > 0 for p in parts):
-                                    return True
-                            # Format "Vorname Nachname" or "Vorname M. Nachname" - 2-3 words without org keywords
-                            words = name.split()
-                            if 2 <= len(words) <= 4 and not _is_organization_name(name):
-                                # Check if words look like name parts (start with uppercase, reasonable length)
-                                return all(len(w) >= 1 and w[0].isupper() for w in words)
-                            return False
-                        
                         # Extract name identifier FIRST - needed for nameType determination
                         # ORCID is ONLY given to persons, so having an ORCID proves it's a person
                         # ROR is ONLY given to organizations, so having a ROR proves it's an organization
@@ -1729,84 +2013,20 @@ class DataCiteClient:
                                     scheme_uri = identifier.get("schemeUri", "")
                                     break
                         
-                        # Check if the contributor name looks like an organization
-                        # This catches cases where DataCite incorrectly splits org names into given/family
-                        name_looks_like_org = _is_organization_name(contributor_name)
-                        
-                        # Determine nameType with clear priority:
-                        # 1. ORCID present → ALWAYS Personal (ORCID is only for persons, this is a hard fact)
-                        # 2. ROR present → ALWAYS Organizational (ROR is only for organizations, this is a hard fact)
-                        # 3. Name contains org keywords → Organizational (override API nameType)
-                        # 4. API provides nameType → TRUST IT (don't override DataCite's data)
-                        # 5. Organizational contributor types (and no API nameType) → Organizational
-                        # 6. Personal contributor types (and no API nameType, name doesn't look like org) → Personal
-                        # 7. Fallback: infer from givenName/familyName presence
-                        
-                        if has_orcid:
-                            # ORCID is ONLY given to persons - this overrides everything including API data
-                            # because ORCID is a hard fact that cannot be wrong
-                            if name_type != "Personal":
-                                if name_type:
-                                    logger.warning(f"Overriding nameType '{name_type}' to 'Personal' for '{contributor_name}' (has ORCID)")
-                                name_type = "Personal"
-                        elif has_ror:
-                            # ROR is ONLY given to organizations - this overrides everything including API data
-                            # because ROR (Research Organization Registry) is a hard fact that cannot be wrong
-                            if name_type != "Organizational":
-                                if name_type:
-                                    logger.warning(f"Overriding nameType '{name_type}' to 'Organizational' for '{contributor_name}' (has ROR)")
-                                name_type = "Organizational"
-                            # Clear given/family name for organizations (they shouldn't have them)
-                            given_name = ""
-                            family_name = ""
-                        elif name_looks_like_org:
-                            # Name contains CLEAR organizational keywords (University, Institut, etc.)
-                            # This overrides even API nameType because DataCite often incorrectly
-                            # marks organizations as Personal when they have comma in name
-                            # (e.g., "University of Potsdam, Germany" → givenName: Germany, familyName: University of Potsdam)
-                            if name_type == "Personal":
-                                logger.warning(f"Overriding nameType 'Personal' to 'Organizational' for '{contributor_name}' (name contains org keywords)")
-                            name_type = "Organizational"
-                            # Clear given/family name for organizations (they shouldn't have them)
-                            given_name = ""
-                            family_name = ""
-                        elif name_type:
-                            # API provides nameType and name doesn't look like org - TRUST IT
-                            pass
-                        elif contributor_type in ORGANIZATIONAL_CONTRIBUTOR_TYPES:
-                            # These roles are ALWAYS organizations - set nameType
-                            name_type = "Organizational"
-                            logger.debug(f"Setting nameType 'Organizational' for '{contributor_name}' (contributorType={contributor_type})")
-                            # Clear given/family name for organizations (they shouldn't have them)
-                            given_name = ""
-                            family_name = ""
-                        elif contributor_type in PERSONAL_CONTRIBUTOR_TYPES and not name_looks_like_org:
-                            # These roles are ALWAYS persons - set nameType
-                            # BUT only if the name doesn't look like an organization
-                            name_type = "Personal"
-                            logger.debug(f"Setting nameType 'Personal' for '{contributor_name}' (contributorType={contributor_type})")
-                        elif name_looks_like_org:
-                            # Name contains organizational keywords - treat as organization
-                            name_type = "Organizational"
-                            logger.debug(f"Setting nameType 'Organizational' for '{contributor_name}' (name contains org keywords)")
-                            # Clear given/family name for organizations (they shouldn't have them)
+                        # Determine nameType (see ContributorClassifier.resolve_name_type for the
+                        # priorities). Name checks are memoized, so repeated names are a lookup.
+                        name_type, clear_name_parts = CONTRIBUTOR_CLASSIFIER.resolve_name_type(
+                            contributor_name,
+                            name_type,
+                            contributor_type,
+                            has_structured_name=bool(given_name or family_name),
+                            has_orcid=has_orcid,
+                            has_ror=has_ror
+                        )
+                        if clear_name_parts:
+                            # Organizations shouldn't have given/family names
                             given_name = ""
                             family_name = ""
-                        else:
-                            # For ambiguous contributorTypes (e.g., "Other", "RelatedPerson"), 
-                            # No API nameType and no clear signals - infer from multiple signals
-                            if given_name or family_name:
-                                # Has structured name parts - definitely a person
-                                name_type = "Personal"
-                                logger.debug(f"Inferred nameType 'Personal' for '{contributor_name}' (has given/family name)")
-                            elif _looks_like_person_name(contributor_name):
-                                # Name format looks like a person (e.g., "Blöcher Guido" or "Doe, John")
-                                name_type = "Personal"
-                                logger.debug(f"Inferred nameType 'Personal' for '{contributor_name}' (name format looks like person)")
-                            else:
-                                # Default to Organizational for other cases
-                                name_type = "Organizational"
-                                logger.debug(f"Inferred nameType 'Organizational' for '{contributor_name}' (no person indicators)")
                         
                         # Create a unique key for this contributor to detect duplicates
                         # Key: (DOI, contributor name, contributor type)
@@ -1840,13 +2060,7 @@ class DataCiteClient:
                     logger.warning(f"Error parsing contributor data for DOI {item.get('id', 'unknown')}: {e}")
                     continue
         
-        # Extract next page URL from response
-        next_page_url = None
-        if "links" in data and "next" in data["links"]:
-            next_page_url = data["links"]["next"]
-            logger.debug(f"Next page URL: {next_page_url}")
-        
-        return contributor_entries, next_page_url
+        return contributor_entries
     
     @staticmethod
     def enrich_contributors_with_db_data(
@@ -1860,6 +2074,10 @@ class DataCiteClient:
         from the SUMARIOPMD database. ContactInfo is linked to resourceagents regardless
         of their role, so we fetch all contactinfo and match by name.
         
+        The contactinfo of all DOIs is fetched with a few bulk queries
+        (SumarioPMDClient.iter_contactinfo_for_dois) and turned into per-DOI
+        name lookups in a single pass.
+        
         Args:
             contributor_data: List of 14-tuples from fetch_all_dois_with_contributors()
             db_client: Instance of SumariopmdClient (connected)
@@ -1871,7 +2089,7 @@ class DataCiteClient:
         
         enriched_data = []
         
-        # Group contributors by DOI for efficient DB lookups
+        # Group contributors by DOI
         from collections import defaultdict
         dois_to_process = defaultdict(list)
         for idx, row in enumerate(contributor_data):
@@ -1880,101 +2098,97 @@ class DataCiteClient:
         
         logger.info(f"Enriching {len(contributor_data)} contributors from {len(dois_to_process)} DOIs with DB data")
         
-        # Process each DOI
-        for doi, contributors in dois_to_process.items():
-            try:
-                # Get resource_id for this DOI
-                resource_id = db_client.get_resource_id_for_doi(doi)
+        # Build lookup maps with multiple key formats for flexible matching, per DOI
+        # DB may have: lastname+firstname separate OR only "name" in "Lastname, Firstname" format
+        contactinfo_lookups = defaultdict(dict)
+        try:
+            for db_entry in db_client.iter_contactinfo_for_dois(dois_to_process.keys()):
+                contactinfo_lookup = contactinfo_lookups[(db_entry.get("doi") or "").strip().lower()]
+                lastname = db_entry.get("lastname", "") or ""
+                firstname = db_entry.get("firstname", "") or ""
+                name = db_entry.get("name", "") or ""
                 
-                if resource_id is None:
-                    # DOI not found in DB, keep original data
-                    for idx, row in contributors:
-                        enriched_data.append((idx, row))
-                    continue
+                contactinfo_data = {
+                    "email": db_entry.get("email", "") or "",
+                    "website": db_entry.get("website", "") or "",
+                    "position": db_entry.get("position", "") or ""
+                }
                 
-                # Fetch ALL contactinfo from DB for this resource (regardless of role)
-                # ContactInfo is linked to resourceagent, not to a specific role
-                db_contactinfo = db_client.fetch_all_contactinfo_for_resource(resource_id)
+                # Key 1: If we have separate lastname/firstname, use those
+                if lastname:
+                    key = (lastname.lower().strip(), firstname.lower().strip())
+                    contactinfo_lookup[key] = contactinfo_data
                 
-                # Create lookup map with multiple key formats for flexible matching
-                # DB may have: lastname+firstname separate OR only "name" in "Lastname, Firstname" format
-                contactinfo_lookup = {}
-                for db_entry in db_contactinfo:
-                    lastname = db_entry.get("lastname", "") or ""
-                    firstname = db_entry.get("firstname", "") or ""
-                    name = db_entry.get("name", "") or ""
-                    
-                    contactinfo_data = {
-                        "email": db_entry.get("email", "") or "",
-                        "website": db_entry.get("website", "") or "",
-                        "position": db_entry.get("position", "") or ""
-                    }
-                    
-                    # Key 1: If we have separate lastname/firstname, use those
-                    if lastname:
-                        key = (lastname.lower().strip(), firstname.lower().strip())
-                        contactinfo_lookup[key] = contactinfo_data
+                # Key 2: If we have a "name" field, try to parse "Lastname, Firstname" format
+                if name:
+                    # Also store with full name as key (for organizational names)
+                    contactinfo_lookup[(name.lower().strip(), "")] = contactinfo_data
                     
-                    # Key 2: If we have a "name" field, try to parse "Lastname, Firstname" format
-                    if name:
-                        # Also store with full name as key (for organizational names)
-                        contactinfo_lookup[(name.lower().strip(), "")] = contactinfo_data
-                        
-                        # Try to parse "Lastname, Firstname" format
-                        if ", " in name:
-                            parts = name.split(", ", 1)
-                            if len(parts) == 2:
-                                parsed_lastname = parts[0].lower().strip()
-                                parsed_firstname = parts[1].lower().strip()
-                                contactinfo_lookup[(parsed_lastname, parsed_firstname)] = contactinfo_data
+                    # Try to parse "Lastname, Firstname" format
+                    if ", " in name:
+                        parts = name.split(", ", 1)
+                        if len(parts) == 2:
+                            parsed_lastname = parts[0].lower().strip()
+                            parsed_firstname = parts[1].lower().strip()
+                            contactinfo_lookup[(parsed_lastname, parsed_firstname)] = contactinfo_data
+        except Exception as e:
+            # Keep original data for DOIs whose contactinfo could not be loaded
+            # (failed chunks are skipped and logged by iter_contactinfo_for_dois)
+            missing = [doi for doi in dois_to_process if doi.strip().lower() not in contactinfo_lookups]
+            logger.warning(
+                f"Error loading contactinfo from DB, {len(missing)} DOIs are not enriched: {e} - "
+                f"DOIs: {', '.join(missing)}"
+            )
+        
+        # Enrich each contributor
+        for doi, contributors in dois_to_process.items():
+            contactinfo_lookup = contactinfo_lookups.get(doi.strip().lower())
+            
+            if not contactinfo_lookup:
+                # DOI not found in DB or no contactinfo, keep original data
+                enriched_data.extend(contributors)
+                continue
+            
+            for idx, row in contributors:
+                family_name = row[4] or ""  # Family Name
+                given_name = row[3] or ""   # Given Name
+                contributor_name = row[1] or ""  # Contributor Name
+                contributor_types = row[8] or ""  # Contributor Types
                 
-                # Enrich each contributor
-                for idx, row in contributors:
-                    family_name = row[4] or ""  # Family Name
-                    given_name = row[3] or ""   # Given Name
-                    contributor_name = row[1] or ""  # Contributor Name
-                    contributor_types = row[8] or ""  # Contributor Types
-                    
-                    # Try to find matching contactinfo with multiple key formats
-                    contactinfo = None
-                    
-                    # Try 1: exact match with family_name + given_name
-                    if family_name:
-                        key = (family_name.lower().strip(), given_name.lower().strip())
-                        contactinfo = contactinfo_lookup.get(key)
+                # Try to find matching contactinfo with multiple key formats
+                contactinfo = None
+                
+                # Try 1: exact match with family_name + given_name
+                if family_name:
+                    key = (family_name.lower().strip(), given_name.lower().strip())
+                    contactinfo = contactinfo_lookup.get(key)
+                
+                # Try 2: match with contributor_name (full name format)
+                if not contactinfo and contributor_name:
+                    key = (contributor_name.lower().strip(), "")
+                    contactinfo = contactinfo_lookup.get(key)
                     
-                    # Try 2: match with contributor_name (full name format)
-                    if not contactinfo and contributor_name:
-                        key = (contributor_name.lower().strip(), "")
-                        contactinfo = contactinfo_lookup.get(key)
-                        
-                        # Try 3: parse contributor_name if it's "Lastname, Firstname" format
-                        if not contactinfo and ", " in contributor_name:
-                            parts = contributor_name.split(", ", 1)
-                            if len(parts) == 2:
-                                key = (parts[0].lower().strip(), parts[1].lower().strip())
-                                contactinfo = contactinfo_lookup.get(key)
+                    # Try 3: parse contributor_name if it's "Lastname, Firstname" format
+                    if not contactinfo and ", " in contributor_name:
+                        parts = contributor_name.split(", ", 1)
+                        if len(parts) == 2:
+                            key = (parts[0].lower().strip(), parts[1].lower().strip())
+                            contactinfo = contactinfo_lookup.get(key)
+                
+                # Only add contactinfo if this is a ContactPerson and we found a match
+                if "ContactPerson" in contributor_types and contactinfo:
+                    email = contactinfo.get("email", "") or ""
+                    website = contactinfo.get("website", "") or ""
+                    position = contactinfo.get("position", "") or ""
                     
-                    # Only add contactinfo if this is a ContactPerson and we found a match
-                    if "ContactPerson" in contributor_types and contactinfo:
-                        email = contactinfo.get("email", "") or ""
-                        website = contactinfo.get("website", "") or ""
-                        position = contactinfo.get("position", "") or ""
-                        
-                        # Create enriched tuple
-                        enriched_row = (
-                            row[0], row[1], row[2], row[3], row[4],
-                            row[5], row[6], row[7], row[8], row[9], row[10],
-                            email, website, position
-                        )
-                        enriched_data.append((idx, enriched_row))
-                    else:
-                        enriched_data.append((idx, row))
-                        
-            except Exception as e:
-                logger.warning(f"Error enriching DOI {doi} with DB data: {e}")
-                # Keep original data on error
-                for idx, row in contributors:
+                    # Create enriched tuple
+                    enriched_row = (
+                        row[0], row[1], row[2], row[3], row[4],
+                        row[5], row[6], row[7], row[8], row[9], row[10],
+                        email, website, position
+                    )
+                    enriched_data.append((idx, enriched_row))
+                else:
                     enriched_data.append((idx, row))
         
         # Sort by original index to maintain order
@@ -1983,7 +2197,12 @@ class DataCiteClient:
         # Return just the tuples
         return [row for idx, row in enriched_data]
 
-    def validate_contributors_match(self, doi: str, csv_contributors: List[Dict[str, Any]]) -> Tuple[bool, str]:
+    def validate_contributors_match(
+        self,
+        doi: str,
+        csv_contributors: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Tuple[bool, str]:
         """
         Validate that CSV contributors can be matched to current DataCite metadata.
         
@@ -1995,6 +2214,7 @@ class DataCiteClient:
             doi: The DOI identifier
             csv_contributors: List of contributor dictionaries from CSV
                              (in the order they appear in the CSV)
+            metadata: Current metadata from get_doi_metadata(), if already fetched
             
         Returns:
             Tuple of (is_valid: bool, message: str)
@@ -2003,11 +2223,12 @@ class DataCiteClient:
         """
         logger.info(f"Validating contributors for DOI {doi}")
         
-        # Fetch current metadata
-        try:
-            metadata = self.get_doi_metadata(doi)
-        except (AuthenticationError, NetworkError, DataCiteAPIError) as e:
-            return False, f"Fehler beim Abrufen der Metadaten: {str(e)}"
+        # Fetch current metadata (unless already fetched by the caller)
+        if metadata is None:
+            try:
+                metadata = self.get_doi_metadata(doi)
+            except (AuthenticationError, NetworkError, DataCiteAPIError) as e:
+                return False, f"Fehler beim Abrufen der Metadaten: {str(e)}"
         
         if metadata is None:
             return False, f"DOI {doi} nicht gefunden oder nicht erreichbar"
@@ -2189,9 +2410,8 @@ class DataCiteClient:
         
         # Send PUT request
         try:
-            response = requests.put(
+            response = self.session.put(
                 url,
-                auth=self.auth,
                 json=payload,
                 timeout=self.TIMEOUT,
                 headers={
@@ -2340,6 +2560,9 @@ class DataCiteClient:
             NetworkError: If connection to API fails
             DataCiteAPIError: For other API errors
         """
+        if self.cache is not None:
+            return self._fetch_all_cached("publisher")
+        
         all_publisher_data = []
         next_url = None  # Start with None to use initial cursor
         page_count = 0
@@ -2391,57 +2614,22 @@ class DataCiteClient:
             AuthenticationError: If credentials are invalid
             DataCiteAPIError: For other API errors
         """
-        if next_url:
-            # Use the complete next URL from the API response
-            url = next_url
-            params = None
-            logger.debug(f"Requesting next page with publisher: {url}")
-        else:
-            # First page: use cursor=1
-            # Note: DataCite API explicitly requires page[cursor]=1 for the first page
-            # See: https://support.datacite.org/docs/pagination (Method 2: Cursor)
-            url = f"{self.base_url}/dois"
-            params = {
-                "client-id": self.username,
-                "page[size]": self.PAGE_SIZE,
-                "page[cursor]": 1
-            }
-            logger.debug(f"Requesting first page with publisher: {url} with params: {params}")
-        
-        response = requests.get(
-            url,
-            auth=self.auth,
-            params=params,
-            timeout=self.TIMEOUT,
-            headers={"Accept": "application/vnd.api+json"}
+        data, next_page_url = self._request_page(
+            next_url, label="with publisher", fields=self.FACET_FIELDS["publisher"]
         )
+        return self._extract_publisher_entries(data), next_page_url
+    
+    @staticmethod
+    def _extract_publisher_entries(data: Dict[str, Any]) -> List[Tuple[str, str, str, str, str, str]]:
+        """
+        Extract publisher entries from one parsed page of the /dois endpoint.
         
-        # Handle authentication errors
-        if response.status_code == 401:
-            error_msg = "Anmeldung fehlgeschlagen. Bitte überprüfe deinen Benutzernamen und dein Passwort."
-            logger.error(f"Authentication failed for user: {self.username}")
-            raise AuthenticationError(error_msg)
-        
-        # Handle rate limiting
-        if response.status_code == 429:
-            error_msg = "Zu viele Anfragen. Bitte warte einen Moment und versuche es erneut."
-            logger.error("Rate limit exceeded")
-            raise DataCiteAPIError(error_msg)
-        
-        # Handle other HTTP errors
-        if response.status_code != 200:
-            error_msg = f"DataCite API Fehler (HTTP {response.status_code}): {response.text}"
-            logger.error(f"API error: {response.status_code} - {response.text}")
-            raise DataCiteAPIError(error_msg)
-        
-        # Parse JSON response
-        try:
-            data = response.json()
-        except ValueError as e:
-            error_msg = "Ungültige Antwort von der DataCite API (kein gültiges JSON)."
-            logger.error(f"Invalid JSON response: {e}")
-            raise DataCiteAPIError(error_msg)
-        
+        Args:
+            data: Parsed JSON response of a single page
+            
+        Returns:
+            List of publisher tuples, see fetch_all_dois_with_publisher()
+        """
         # Extract DOIs and publisher information
         publisher_entries = []
         if "data" in data and isinstance(data["data"], list):
@@ -2483,13 +2671,7 @@ class DataCiteClient:
                     logger.warning(f"Error parsing publisher data for DOI {item.get('id', 'unknown')}: {e}")
                     continue
         
-        # Extract next page URL from response
-        next_page_url = None
-        if "links" in data and "next" in data["links"]:
-            next_page_url = data["links"]["next"]
-            logger.debug(f"Next page URL: {next_page_url}")
-        
-        return publisher_entries, next_page_url
+        return publisher_entries
     
     def update_doi_publisher(
         self, 
@@ -2572,9 +2754,8 @@ class DataCiteClient:
         
         # Send PUT request
         try:
-            response = requests.put(
+            response = self.session.put(
                 url,
-                auth=self.auth,
                 json=payload,
                 timeout=self.TIMEOUT,
                 headers={
@@ -2653,6 +2834,9 @@ class DataCiteClient:
             NetworkError: If connection to API fails
             DataCiteAPIError: For other API errors
         """
+        if self.cache is not None:
+            return self._fetch_all_cached("rights")
+        
         all_rights_data = []
         next_url = None  # Start with None to use initial cursor
         page_count = 0
@@ -2704,55 +2888,22 @@ class DataCiteClient:
             AuthenticationError: If credentials are invalid
             DataCiteAPIError: For other API errors
         """
-        if next_url:
-            # Use the complete next URL from the API response
-            url = next_url
-            params = None
-            logger.debug(f"Requesting next page with rights: {url}")
-        else:
-            # First page: use cursor=1
-            url = f"{self.base_url}/dois"
-            params = {
-                "client-id": self.username,
-                "page[size]": self.PAGE_SIZE,
-                "page[cursor]": 1
-            }
-            logger.debug(f"Requesting first page with rights: {url} with params: {params}")
-        
-        response = requests.get(
-            url,
-            auth=self.auth,
-            params=params,
-            timeout=self.TIMEOUT,
-            headers={"Accept": "application/vnd.api+json"}
+        data, next_page_url = self._request_page(
+            next_url, label="with rights", fields=self.FACET_FIELDS["rights"]
         )
+        return self._extract_rights_entries(data), next_page_url
+    
+    @staticmethod
+    def _extract_rights_entries(data: Dict[str, Any]) -> List[Tuple[str, str, str, str, str, str, str]]:
+        """
+        Extract rights entries from one parsed page of the /dois endpoint.
         
-        # Handle authentication errors
-        if response.status_code == 401:
-            error_msg = "Anmeldung fehlgeschlagen. Bitte überprüfe deinen Benutzernamen und dein Passwort."
-            logger.error(f"Authentication failed for user: {self.username}")
-            raise AuthenticationError(error_msg)
-        
-        # Handle rate limiting
-        if response.status_code == 429:
-            error_msg = "Zu viele Anfragen. Bitte warte einen Moment und versuche es erneut."
-            logger.error("Rate limit exceeded")
-            raise DataCiteAPIError(error_msg)
-        
-        # Handle other HTTP errors
-        if response.status_code != 200:
-            error_msg = f"DataCite API Fehler (HTTP {response.status_code}): {response.text}"
-            logger.error(f"API error: {response.status_code} - {response.text}")
-            raise DataCiteAPIError(error_msg)
-        
-        # Parse JSON response
-        try:
-            data = response.json()
-        except ValueError as e:
-            error_msg = "Ungültige Antwort von der DataCite API (kein gültiges JSON)."
-            logger.error(f"Invalid JSON response: {e}")
-            raise DataCiteAPIError(error_msg)
-        
+        Args:
+            data: Parsed JSON response of a single page
+            
+        Returns:
+            List of rights tuples, see fetch_all_dois_with_rights()
+        """
         # Extract DOIs and rights information
         rights_entries = []
         if "data" in data and isinstance(data["data"], list):
@@ -2798,14 +2949,8 @@ class DataCiteClient:
                     logger.warning(f"Error parsing rights data for DOI {item.get('id', 'unknown')}: {e}")
                     continue
         
-        # Extract next page URL from response
-        next_page_url = None
-        if "links" in data and "next" in data["links"]:
-            next_page_url = data["links"]["next"]
-            logger.debug(f"Next page URL: {next_page_url}")
-        
-        return rights_entries, next_page_url
-
+        return rights_entries
+    
     def update_doi_rights(self, doi: str, rights_list: List[Dict[str, str]]) -> Tuple[bool, str]:
         """
         Update the rights for a specific DOI via DataCite API.
@@ -2870,9 +3015,8 @@ class DataCiteClient:
         }
         
         try:
-            response = requests.put(
+            response = self.session.put(
                 url,
-                auth=self.auth,
                 json=payload,
                 timeout=self.TIMEOUT,
                 headers={
@@ -2930,4 +3074,112 @@ class DataCiteClient:
         except requests.exceptions.RequestException as e:
             error_msg = f"Netzwerkfehler bei DOI {doi}: {str(e)}"
             logger.error(f"Request exception during update: {e}")
-            raise NetworkError(error_msg)
\ No newline at end of file
+            raise NetworkError(error_msg)
+
+
+class MetadataPrefetcher:
+    """
+    Fetch DOI metadata concurrently while handing results out in input order.
+    
+    The update workers need the current metadata of every DOI in the CSV for
+    their change detection. Instead of one blocking get_doi_metadata() call
+    per loop iteration, the prefetcher keeps a bounded window of requests in
+    flight on a small thread pool (sharing the client's pooled session) and
+    yields the results in exactly the order of the given DOI list. Request
+    pacing is left to the client's rate limiter, which all threads share.
+    
+    Errors raised by get_doi_metadata() are not raised by the prefetcher but
+    returned with the result, so the caller can handle them at the same place
+    where it used to call get_doi_metadata() directly.
+    
+    Usage:
+        with MetadataPrefetcher(client, dois) as prefetcher:
+            for doi, metadata, error in prefetcher:
+                ...
+    """
+    
+    def __init__(
+        self,
+        client,
+        dois: List[str],
+        max_workers: Optional[int] = None
+    ):
+        """
+        Initialize the prefetcher.
+        
+        Args:
+            client: DataCiteClient (or compatible object) providing get_doi_metadata()
+            dois: DOIs to fetch, in the order results should be returned
+            max_workers: Number of concurrent requests (default: DataCiteClient.PREFETCH_WORKERS)
+        """
+        self.client = client
+        self.dois = list(dois)
+        self.max_workers = max(1, max_workers or DataCiteClient.PREFETCH_WORKERS)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._cancelled = False
+    
+    def __enter__(self) -> "MetadataPrefetcher":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    def __iter__(self):
+        """
+        Yield (doi, metadata, error) tuples in input order.
+        
+        metadata is the result of get_doi_metadata() (may be None), error is
+        the exception raised by get_doi_metadata() or None.
+        """
+        if not self.dois:
+            return
+        
+        # Keep at most twice as many requests in flight as there are threads,
+        # so results are ready when the consumer asks for them without
+        # fetching far ahead of a consumer that may be cancelled.
+        window = self.max_workers * 2
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="datacite-prefetch"
+        )
+        pending = deque()
+        doi_iter = iter(self.dois)
+        
+        try:
+            for doi in itertools.islice(doi_iter, window):
+                pending.append((doi, self._submit(doi)))
+            
+            while pending and not self._cancelled:
+                doi, future = pending.popleft()
+                try:
+                    metadata = future.result()
+                    error = None
+                except Exception as e:
+                    metadata = None
+                    error = e
+                
+                next_doi = next(doi_iter, None)
+                if next_doi is not None:
+                    pending.append((next_doi, self._submit(next_doi)))
+                
+                yield doi, metadata, error
+        finally:
+            self.close()
+    
+    def close(self):
+        """Stop fetching and discard requests that have not started yet."""
+        self._cancelled = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    def _submit(self, doi: str):
+        """Schedule the metadata request for one DOI."""
+        return self._executor.submit(self._fetch, doi)
+    
+    def _fetch(self, doi: str) -> Optional[Dict[str, Any]]:
+        """Fetch metadata for one DOI unless the prefetcher was closed meanwhile."""
+        if self._cancelled:
+            return None
+        return self.client.get_doi_metadata(doi)
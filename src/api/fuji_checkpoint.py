@@ -0,0 +1,167 @@
+"""Append-only checkpoint journal of a FAIR assessment run."""
+
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, TextIO, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class FujiCheckpointError(Exception):
+    """Raised when the checkpoint journal cannot be read or written."""
+    pass
+
+
+class FujiCheckpointJournal:
+    """
+    Journal of the DOIs a FAIR assessment run has completed.
+    
+    Every successful assessment is appended as one JSON line
+    (doi, score, timestamp) and flushed immediately, so an interrupted run
+    - closed, cancelled or crashed - can be resumed with only the DOIs that
+    are still missing. Failed assessments are not journaled; a resumed run
+    retries them.
+    
+    The journal is cleared when a run completes. Appends may come from
+    several threads.
+    """
+    
+    CHECKPOINT_DIR = "fuji_checkpoints"
+    FSYNC_INTERVAL = 50  # Entries between fsync calls (flush happens after every entry)
+    
+    def __init__(self, path: Path):
+        """
+        Initialize the journal (the file is created on the first append).
+        
+        Args:
+            path: Path to the journal file
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file: Optional[TextIO] = None
+        self._unsynced = 0
+    
+    @staticmethod
+    def default_path(run_key: str) -> Path:
+        """
+        Get path to the journal of a repository account in AppData/Roaming/GROBI.
+        
+        Args:
+            run_key: Identifies the assessed DOI set (e.g. DataCite username and API)
+        
+        Returns:
+            Path to fuji_checkpoints/<run_key>.jsonl
+        """
+        safe_key = re.sub(r"[^A-Za-z0-9_.-]", "_", run_key) or "default"
+        # Windows: %APPDATA%\GROBI
+        return (
+            Path.home() / "AppData" / "Roaming" / "GROBI"
+            / FujiCheckpointJournal.CHECKPOINT_DIR / f"{safe_key}.jsonl"
+        )
+    
+    @staticmethod
+    def _normalize_doi(doi: str) -> str:
+        """DOIs are case-insensitive; compare them lowercase."""
+        return doi.strip().lower()
+    
+    def load(self) -> Dict[str, float]:
+        """
+        Read the completed assessments.
+        
+        Lines that cannot be parsed (e.g. cut off by a crash) are skipped.
+        
+        Returns:
+            Dictionary mapping DOIs (as journaled) to their score; empty if
+            there is no journal
+        
+        Raises:
+            FujiCheckpointError: If the journal exists but cannot be read
+        """
+        entries: Dict[str, Tuple[str, float]] = {}  # Normalized DOI -> (DOI, score)
+        skipped = 0
+        
+        try:
+            with self._lock:
+                if self._file is not None:
+                    self._file.flush()
+                if not self.path.exists():
+                    return {}
+                with open(self.path, "r", encoding="utf-8") as journal:
+                    for line in journal:
+                        try:
+                            entry = json.loads(line)
+                            doi, score = str(entry["doi"]), float(entry["score"])
+                        except (ValueError, KeyError, TypeError):
+                            skipped += 1
+                            continue
+                        # Later entries of the same DOI replace earlier ones
+                        entries[self._normalize_doi(doi)] = (doi, score)
+        except OSError as e:
+            raise FujiCheckpointError(f"Checkpoint der FAIR-Bewertung konnte nicht gelesen werden: {e}") from e
+        
+        if skipped:
+            logger.warning(f"Skipped {skipped} unreadable lines in checkpoint journal {self.path}")
+        return dict(entries.values())
+    
+    def append(self, doi: str, score: float):
+        """
+        Record a completed assessment.
+        
+        Args:
+            doi: Assessed DOI
+            score: FAIR score in percent
+        
+        Raises:
+            FujiCheckpointError: If writing fails
+        """
+        line = json.dumps({
+            "doi": doi,
+            "score": score,
+            "at": datetime.now(timezone.utc).isoformat()
+        })
+        try:
+            with self._lock:
+                if self._file is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self.path, "a", encoding="utf-8")
+                self._file.write(line + "\n")
+                self._file.flush()
+                self._unsynced += 1
+                if self._unsynced >= self.FSYNC_INTERVAL:
+                    os.fsync(self._file.fileno())
+                    self._unsynced = 0
+        except OSError as e:
+            raise FujiCheckpointError(f"Checkpoint der FAIR-Bewertung konnte nicht geschrieben werden: {e}") from e
+    
+    def close(self):
+        """Close the journal file; it is kept for a later resume."""
+        with self._lock:
+            self._close_file()
+    
+    def clear(self):
+        """Delete the journal (run completed or a new run is started)."""
+        with self._lock:
+            self._close_file()
+            try:
+                self.path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Could not delete checkpoint journal {self.path}: {e}")
+    
+    def _close_file(self):
+        """Sync and close the open file. Caller must hold the lock."""
+        if self._file is None:
+            return
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+        except OSError as e:
+            logger.warning(f"Could not close checkpoint journal {self.path}: {e}")
+        self._file = None
+        self._unsynced = 0
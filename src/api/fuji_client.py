@@ -3,11 +3,15 @@
 import logging
 import os
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 import requests
 from requests.auth import HTTPBasicAuth
 
+from src.api.circuit_breaker import HostCircuitBreaker, HostUnreachableError
+from src.api.fuji_response_store import FujiResponseStore, FujiResponseStoreError
+from src.utils.link_checker import url_host
+
 
 logger = logging.getLogger(__name__)
 
@@ -27,21 +31,103 @@ class FujiConnectionError(FujiAPIError):
     pass
 
 
-@dataclass
+FAIR_PRINCIPLES = ("F", "A", "I", "R")
+
+# Metric identifier tuples shared by all results with the same metric set
+_metric_id_sets: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _intern_metric_ids(metric_ids: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return the shared instance of a metric identifier tuple."""
+    return _metric_id_sets.setdefault(metric_ids, metric_ids)
+
+
+def metric_identifier(entry: Dict[str, Any]) -> Optional[str]:
+    """Identifier of one entry of the "results" list of an F-UJI response."""
+    identifier = entry.get('metric_identifier') or entry.get('metric_id')
+    return str(identifier) if identifier else None
+
+
+def metric_passed(entry: Dict[str, Any]) -> bool:
+    """
+    Check whether one entry of the "results" list of an F-UJI response passed.
+    
+    Uses test_status if present, otherwise whether any score was earned.
+    """
+    status = entry.get('test_status')
+    if status is not None:
+        return status == 'pass'
+    score = entry.get('score', 0)
+    if isinstance(score, dict):
+        score = score.get('earned', 0)
+    try:
+        return float(score) > 0
+    except (TypeError, ValueError):
+        return False
+
+
+@dataclass(slots=True)
 class FujiResult:
-    """Result of a FAIR assessment."""
+    """
+    Compact result of a FAIR assessment.
+    
+    Only scores are kept: the FAIR total, the F/A/I/R breakdown and one bit
+    per metric. The full API response is not retained; FujiClient can spill
+    it to a FujiResponseStore for the detail view.
+    """
     doi: str
     score_percent: float
     score_earned: float
     score_total: float
     metrics_count: int
-    raw_response: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
+    host_unreachable: bool = False  # Not assessed because the F-UJI server is unreachable
+    server_busy: bool = False  # Timeout or 429/5xx response: the server could not keep up
+    principle_scores: Optional[Tuple[float, float, float, float]] = None  # F, A, I, R in percent
+    metric_ids: Tuple[str, ...] = ()  # Metric identifiers in response order (shared tuple)
+    metrics_passed: int = 0  # Bit i set: metric_ids[i] passed
     
     @property
     def is_success(self) -> bool:
         """Return True if assessment was successful."""
         return self.error is None and self.score_percent >= 0
+    
+    def principle_score(self, principle: str) -> Optional[float]:
+        """
+        Get the score of one FAIR principle.
+        
+        Args:
+            principle: "F", "A", "I" or "R"
+        
+        Returns:
+            Score in percent, or None if the response had no breakdown
+        """
+        if self.principle_scores is None or principle not in FAIR_PRINCIPLES:
+            return None
+        return self.principle_scores[FAIR_PRINCIPLES.index(principle)]
+    
+    def metric_passed(self, metric_id: str) -> Optional[bool]:
+        """
+        Check whether a metric passed.
+        
+        Args:
+            metric_id: Metric identifier (e.g. "FsF-F1-01D")
+        
+        Returns:
+            True/False, or None if the metric was not tested
+        """
+        try:
+            index = self.metric_ids.index(metric_id)
+        except ValueError:
+            return None
+        return bool(self.metrics_passed >> index & 1)
+    
+    def failed_metrics(self) -> List[str]:
+        """Identifiers of all tested metrics that did not pass."""
+        return [
+            metric_id for index, metric_id in enumerate(self.metric_ids)
+            if not self.metrics_passed >> index & 1
+        ]
 
 
 class FujiClient:
@@ -67,6 +153,7 @@ class FujiClient:
     _DEFAULT_PASSWORD = "wonderwoman"
     
     TIMEOUT = 120  # Assessment can take a while
+    DEFAULT_METRIC_VERSION = "metrics_v0.5"
     
     @classmethod
     def get_default_username(cls) -> str:
@@ -82,7 +169,9 @@ class FujiClient:
         self,
         endpoint: str = None,
         username: str = None,
-        password: str = None
+        password: str = None,
+        circuit_breaker: Optional[HostCircuitBreaker] = None,
+        response_store: Optional[FujiResponseStore] = None
     ):
         """
         Initialize the F-UJI client.
@@ -91,11 +180,19 @@ class FujiClient:
             endpoint: F-UJI API endpoint URL (default: GFZ server)
             username: API username (default: from FUJI_USERNAME env or 'marvel')
             password: API password (default: from FUJI_PASSWORD env or 'wonderwoman')
+            circuit_breaker: Circuit breaker for the F-UJI host; after repeated
+                             connection errors/timeouts assessments fail fast
+                             (default: new HostCircuitBreaker)
+            response_store: Optional store for the full API responses
+                            (otherwise they are discarded after parsing)
         """
         self.endpoint = (endpoint or self.DEFAULT_ENDPOINT).rstrip('/')
         self.username = username or self.get_default_username()
         self.password = password or self.get_default_password()
         self.auth = HTTPBasicAuth(self.username, self.password)
+        self.circuit_breaker = circuit_breaker or HostCircuitBreaker()
+        self.response_store = response_store
+        self._host = url_host(self.endpoint)
         
         logger.info(f"F-UJI client initialized with endpoint: {self.endpoint}")
     
@@ -121,7 +218,7 @@ class FujiClient:
         self,
         doi: str,
         use_datacite: bool = True,
-        metric_version: str = "metrics_v0.5"
+        metric_version: str = DEFAULT_METRIC_VERSION
     ) -> FujiResult:
         """
         Assess a DOI against FAIR principles.
@@ -157,13 +254,34 @@ class FujiClient:
         logger.debug(f"Assessing DOI: {doi}")
         
         try:
-            response = requests.post(
-                f"{self.endpoint}/evaluate",
-                json=payload,
-                auth=self.auth,
-                timeout=self.TIMEOUT,
-                headers={"Content-Type": "application/json"}
+            self.circuit_breaker.before_request(self._host)
+        except HostUnreachableError as e:
+            return FujiResult(
+                doi=doi,
+                score_percent=-1,
+                score_earned=0,
+                score_total=0,
+                metrics_count=0,
+                error=str(e),
+                host_unreachable=True
             )
+        
+        try:
+            try:
+                response = requests.post(
+                    f"{self.endpoint}/evaluate",
+                    json=payload,
+                    auth=self.auth,
+                    timeout=self.TIMEOUT,
+                    headers={"Content-Type": "application/json"}
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                self.circuit_breaker.record_failure(self._host)
+                raise
+            except requests.exceptions.RequestException:
+                self.circuit_breaker.record_success(self._host)
+                raise
+            self.circuit_breaker.record_success(self._host)
             
             if response.status_code == 401:
                 raise FujiAuthenticationError("Authentifizierung fehlgeschlagen. Bitte Zugangsdaten prüfen.")
@@ -194,10 +312,12 @@ class FujiClient:
                     score_earned=0,
                     score_total=0,
                     metrics_count=0,
-                    error=error_msg
+                    error=error_msg,
+                    server_busy=response.status_code == 429 or response.status_code >= 500
                 )
             
             data = response.json()
+            self._spill_response(doi, data)
             return self._parse_response(doi, data)
             
         except requests.exceptions.Timeout:
@@ -208,7 +328,8 @@ class FujiClient:
                 score_earned=0,
                 score_total=0,
                 metrics_count=0,
-                error="Timeout bei der Bewertung"
+                error="Timeout bei der Bewertung",
+                server_busy=True
             )
             
         except requests.exceptions.ConnectionError as e:
@@ -272,6 +393,12 @@ class FujiClient:
             
             metrics_count = data.get('total_metrics', len(data.get('results', [])))
             
+            principle_scores = None
+            if isinstance(score_percent_data, dict) and all(p in score_percent_data for p in FAIR_PRINCIPLES):
+                principle_scores = tuple(float(score_percent_data[p]) for p in FAIR_PRINCIPLES)
+            
+            metric_ids, metrics_passed = self._parse_metric_results(data.get('results', []))
+            
             logger.debug(f"DOI {doi}: {score_percent:.1f}% ({score_earned}/{score_total})")
             
             return FujiResult(
@@ -280,7 +407,9 @@ class FujiClient:
                 score_earned=score_earned,
                 score_total=score_total,
                 metrics_count=metrics_count,
-                raw_response=data
+                principle_scores=principle_scores,
+                metric_ids=metric_ids,
+                metrics_passed=metrics_passed
             )
             
         except Exception as e:
@@ -291,6 +420,38 @@ class FujiClient:
                 score_earned=0,
                 score_total=0,
                 metrics_count=0,
-                error=f"Fehler beim Parsen der Antwort: {str(e)}",
-                raw_response=data
+                error=f"Fehler beim Parsen der Antwort: {str(e)}"
             )
+    
+    @staticmethod
+    def _parse_metric_results(results: List[Any]) -> Tuple[Tuple[str, ...], int]:
+        """
+        Reduce the per-metric results to identifiers and a pass bitset.
+        
+        Args:
+            results: "results" list of the API response
+        
+        Returns:
+            (metric identifiers, bitset with bit i set if metric i passed)
+        """
+        metric_ids = []
+        passed = 0
+        for entry in results:
+            if not isinstance(entry, dict):
+                continue
+            identifier = metric_identifier(entry)
+            if identifier is None:
+                continue
+            if metric_passed(entry):
+                passed |= 1 << len(metric_ids)
+            metric_ids.append(identifier)
+        return _intern_metric_ids(tuple(metric_ids)), passed
+    
+    def _spill_response(self, doi: str, data: Dict[str, Any]):
+        """Write the full response to the response store, if any (failures only lose the details)."""
+        if self.response_store is None:
+            return
+        try:
+            self.response_store.put(doi, data)
+        except FujiResponseStoreError as e:
+            logger.warning(f"Could not store F-UJI response of {doi}: {e}")
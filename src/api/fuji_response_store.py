@@ -0,0 +1,133 @@
+"""Compressed on-disk store of raw F-UJI responses (SQLite)."""
+
+import json
+import logging
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.api.sqlite_cache import SQLiteCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class FujiResponseStoreError(Exception):
+    """Raised when the F-UJI response store cannot be opened, read or written."""
+    pass
+
+
+class FujiResponseStore(SQLiteCache):
+    """
+    Spill store for the full JSON responses of F-UJI assessments.
+    
+    A response holds dozens of metric blocks with debug output and is only
+    needed when the user opens the details of a single DOI. Instead of
+    keeping it in every FujiResult, the client writes it here
+    (zlib-compressed) and the results window loads it on demand.
+    
+    The store is kept in AppData/Roaming/GROBI next to the FujiResultCache
+    and scoped by F-UJI endpoint and metric version, so the details of DOIs
+    served from the result cache or restored from a checkpoint are still
+    available in later sessions.
+    
+    The connection may be shared by several threads.
+    """
+    
+    CACHE_FILE = "fuji_response_store.sqlite3"
+    SCHEMA_VERSION = 1
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS responses (
+            endpoint TEXT NOT NULL,
+            metric_version TEXT NOT NULL,
+            doi TEXT NOT NULL,
+            data BLOB NOT NULL,
+            PRIMARY KEY (endpoint, metric_version, doi)
+        )
+        """,
+    )
+    ERROR_CLASS = FujiResponseStoreError
+    DISPLAY_NAME = "F-UJI-Antwortspeicher"
+    COMPRESSION_LEVEL = 6  # zlib level (speed/size trade-off)
+    
+    def __init__(self, endpoint: str, metric_version: str, db_path: Optional[Path] = None):
+        """
+        Open (and create if necessary) the store.
+        
+        Args:
+            endpoint: F-UJI API endpoint the responses come from
+            metric_version: Metric version of the assessments
+            db_path: Path to the SQLite file (default: AppData/Roaming/GROBI/fuji_response_store.sqlite3),
+                     or ":memory:" for a temporary store
+        
+        Raises:
+            FujiResponseStoreError: If the database cannot be opened
+        """
+        self.endpoint = endpoint
+        self.metric_version = metric_version
+        super().__init__(db_path)
+    
+    @staticmethod
+    def _normalize_doi(doi: str) -> str:
+        """DOIs are case-insensitive; store them lowercase."""
+        return doi.strip().lower()
+    
+    def put(self, doi: str, response: Dict[str, Any]):
+        """
+        Store the raw response of a DOI (replaces an earlier one).
+        
+        Args:
+            doi: Assessed DOI
+            response: Parsed JSON response of the F-UJI API
+        
+        Raises:
+            FujiResponseStoreError: If writing fails
+        """
+        data = zlib.compress(
+            json.dumps(response, separators=(",", ":")).encode("utf-8"),
+            self.COMPRESSION_LEVEL
+        )
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (endpoint, metric_version, doi, data) "
+                    "VALUES (?, ?, ?, ?)",
+                    (self.endpoint, self.metric_version, self._normalize_doi(doi), data)
+                )
+        except sqlite3.Error as e:
+            raise FujiResponseStoreError(f"F-UJI-Antwort konnte nicht gespeichert werden: {e}") from e
+    
+    def get(self, doi: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the raw response of a DOI.
+        
+        Args:
+            doi: Assessed DOI
+        
+        Returns:
+            Parsed JSON response, or None if none was stored
+        
+        Raises:
+            FujiResponseStoreError: If reading fails
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT data FROM responses WHERE endpoint = ? AND metric_version = ? AND doi = ?",
+                    (self.endpoint, self.metric_version, self._normalize_doi(doi))
+                ).fetchone()
+            if row is None:
+                return None
+            return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            raise FujiResponseStoreError(f"F-UJI-Antwort konnte nicht gelesen werden: {e}") from e
+    
+    def count(self) -> int:
+        """Number of stored responses of this endpoint and metric version."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM responses WHERE endpoint = ? AND metric_version = ?",
+                (self.endpoint, self.metric_version)
+            ).fetchone()[0]
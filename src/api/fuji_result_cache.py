@@ -0,0 +1,202 @@
+"""Persistent local cache of F-UJI assessment results (SQLite)."""
+
+import json
+import logging
+import sqlite3
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.api.fuji_client import FujiResult, _intern_metric_ids
+from src.api.sqlite_cache import SQLiteCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class FujiResultCacheError(Exception):
+    """Raised when the F-UJI result cache cannot be opened, read or written."""
+    pass
+
+
+class FujiResultCache(SQLiteCache):
+    """
+    On-disk cache of FAIR assessment scores.
+    
+    A result is stored per F-UJI endpoint, DOI and metric version together
+    with the DataCite `updated` timestamp of the DOI at assessment time,
+    including the F/A/I/R breakdown and the per-metric pass bits. It
+    is only reused while that timestamp is unchanged, so a FAIR check run
+    re-assesses new and modified DOIs and serves all others instantly.
+    
+    Only successful assessments are stored; failed ones are retried on the
+    next run.
+    
+    The connection may be shared by several threads.
+    """
+    
+    CACHE_FILE = "fuji_result_cache.sqlite3"
+    SCHEMA_VERSION = 2
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS fuji_results (
+            endpoint TEXT NOT NULL,
+            doi TEXT NOT NULL,
+            metric_version TEXT NOT NULL,
+            updated TEXT NOT NULL,
+            score_percent REAL NOT NULL,
+            score_earned REAL NOT NULL,
+            score_total REAL NOT NULL,
+            metrics_count INTEGER NOT NULL,
+            assessed_at TEXT NOT NULL,
+            principle_scores TEXT,
+            metric_ids TEXT,
+            metrics_passed TEXT,
+            PRIMARY KEY (endpoint, doi, metric_version)
+        )
+        """,
+    )
+    MIGRATIONS = {
+        # Results stored before version 2 are served without details
+        2: (
+            "ALTER TABLE fuji_results ADD COLUMN principle_scores TEXT",
+            "ALTER TABLE fuji_results ADD COLUMN metric_ids TEXT",
+            "ALTER TABLE fuji_results ADD COLUMN metrics_passed TEXT",
+        ),
+    }
+    ERROR_CLASS = FujiResultCacheError
+    DISPLAY_NAME = "F-UJI-Ergebnis-Cache"
+    QUERY_CHUNK_SIZE = 500  # DOIs per IN (...) lookup (SQLite parameter limit)
+    
+    @staticmethod
+    def _normalize_doi(doi: str) -> str:
+        """DOIs are case-insensitive; store them lowercase."""
+        return doi.strip().lower()
+    
+    @staticmethod
+    def _decode_principle_scores(value: Optional[str]) -> Optional[Tuple[float, float, float, float]]:
+        """Parse the stored F/A/I/R scores (None for results without breakdown)."""
+        if not value:
+            return None
+        return tuple(float(score) for score in json.loads(value))
+    
+    def get_many(
+        self,
+        endpoint: str,
+        metric_version: str,
+        dois: Iterable[Tuple[str, str]]
+    ) -> Dict[str, FujiResult]:
+        """
+        Look up the stored results of DOIs that did not change since their assessment.
+        
+        Args:
+            endpoint: F-UJI API endpoint
+            metric_version: Metric version of the assessment
+            dois: (DOI, DataCite `updated` timestamp) pairs
+        
+        Returns:
+            Dictionary mapping the given DOIs to their cached result; DOIs that
+            were never assessed or were updated since are missing
+        
+        Raises:
+            FujiResultCacheError: If reading fails
+        """
+        wanted: Dict[str, Tuple[str, str]] = {}
+        for doi, updated in dois:
+            if doi and updated:
+                wanted[self._normalize_doi(doi)] = (doi, updated)
+        keys = list(wanted)
+        results: Dict[str, FujiResult] = {}
+        
+        try:
+            with self._lock:
+                for start in range(0, len(keys), self.QUERY_CHUNK_SIZE):
+                    chunk = keys[start:start + self.QUERY_CHUNK_SIZE]
+                    placeholders = ", ".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        "SELECT doi, updated, score_percent, score_earned, score_total, metrics_count, "
+                        "principle_scores, metric_ids, metrics_passed "
+                        "FROM fuji_results WHERE endpoint = ? AND metric_version = ? "
+                        f"AND doi IN ({placeholders})",
+                        [endpoint, metric_version, *chunk]
+                    ).fetchall()
+                    for (key, updated, score_percent, score_earned, score_total, metrics_count,
+                         principle_scores, metric_ids, metrics_passed) in rows:
+                        doi, current_updated = wanted[key]
+                        if updated != current_updated:
+                            continue
+                        results[doi] = FujiResult(
+                            doi=doi,
+                            score_percent=score_percent,
+                            score_earned=score_earned,
+                            score_total=score_total,
+                            metrics_count=metrics_count,
+                            principle_scores=self._decode_principle_scores(principle_scores),
+                            metric_ids=_intern_metric_ids(tuple(json.loads(metric_ids))) if metric_ids else (),
+                            metrics_passed=int(metrics_passed or 0)
+                        )
+        except (sqlite3.Error, ValueError, TypeError) as e:
+            raise FujiResultCacheError(f"F-UJI-Ergebnis-Cache konnte nicht gelesen werden: {e}") from e
+        
+        return results
+    
+    def store(
+        self,
+        endpoint: str,
+        metric_version: str,
+        results: Iterable[Tuple[FujiResult, str]]
+    ) -> int:
+        """
+        Insert or replace assessment results.
+        
+        Args:
+            endpoint: F-UJI API endpoint
+            metric_version: Metric version of the assessment
+            results: (result, DataCite `updated` timestamp of the DOI) pairs;
+                     failed results and DOIs without timestamp are skipped
+        
+        Returns:
+            Number of results stored
+        
+        Raises:
+            FujiResultCacheError: If writing fails
+        """
+        assessed_at = datetime.now(timezone.utc).isoformat()
+        rows: List[Tuple] = [
+            (
+                endpoint, self._normalize_doi(result.doi), metric_version, updated,
+                result.score_percent, result.score_earned, result.score_total,
+                result.metrics_count, assessed_at,
+                json.dumps(result.principle_scores) if result.principle_scores is not None else None,
+                json.dumps(result.metric_ids) if result.metric_ids else None,
+                # Stored as text: the bitset can exceed SQLite's 64-bit integers
+                str(result.metrics_passed)
+            )
+            for result, updated in results
+            if result.is_success and updated
+        ]
+        if not rows:
+            return 0
+        
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO fuji_results (endpoint, doi, metric_version, updated, "
+                    "score_percent, score_earned, score_total, metrics_count, assessed_at, "
+                    "principle_scores, metric_ids, metrics_passed) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+        except sqlite3.Error as e:
+            raise FujiResultCacheError(f"F-UJI-Ergebnis-Cache konnte nicht geschrieben werden: {e}") from e
+        
+        return len(rows)
+    
+    def count(self) -> int:
+        """Number of stored results."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM fuji_results").fetchone()[0]
+    
+    def clear(self):
+        """Remove all stored results."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM fuji_results")
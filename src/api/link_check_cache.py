@@ -0,0 +1,153 @@
+"""Persistent store of dead-link check results (SQLite)."""
+
+import logging
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional
+
+from src.api.sqlite_cache import SQLiteCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class LinkCheckCacheError(Exception):
+    """Raised when the link check cache cannot be opened, read or written."""
+    pass
+
+
+@dataclass
+class LinkCheckResult:
+    """Outcome of one URL check, with the validators needed for revalidation."""
+    url: str
+    status: int
+    checked_at: datetime
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    
+    @property
+    def is_ok(self) -> bool:
+        """Return True if the URL answered without a client/server error."""
+        return self.status < 400
+    
+    def is_fresh(self, ttl: timedelta, now: Optional[datetime] = None) -> bool:
+        """Return True if the result is younger than ttl."""
+        now = now or datetime.now(timezone.utc)
+        return now - self.checked_at < ttl
+    
+    def conditional_headers(self) -> Dict[str, str]:
+        """Request headers that let the server answer 304 if nothing changed."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class LinkCheckCache(SQLiteCache):
+    """
+    On-disk store of the last check result per URL.
+    
+    The dead-link check skips URLs that were verified within a TTL and
+    revalidates older ones with conditional requests (ETag/Last-Modified),
+    so repeated audits mostly spend network time on stale or failing links.
+    
+    The connection may be shared by several threads.
+    """
+    
+    CACHE_FILE = "link_check_cache.sqlite3"
+    SCHEMA_VERSION = 1
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS link_checks (
+            url TEXT PRIMARY KEY,
+            status INTEGER NOT NULL,
+            checked_at TEXT NOT NULL,
+            etag TEXT,
+            last_modified TEXT
+        )
+        """,
+    )
+    ERROR_CLASS = LinkCheckCacheError
+    DISPLAY_NAME = "Link-Check-Cache"
+    QUERY_CHUNK_SIZE = 500  # URLs per IN (...) lookup (SQLite parameter limit)
+    
+    def get_many(self, urls: Iterable[str]) -> Dict[str, LinkCheckResult]:
+        """
+        Look up the stored results of many URLs.
+        
+        Args:
+            urls: URLs (duplicates are ignored)
+        
+        Returns:
+            Dictionary mapping URLs to their last result; URLs that were
+            never checked are missing
+        
+        Raises:
+            LinkCheckCacheError: If reading fails
+        """
+        urls = list(dict.fromkeys(urls))
+        results: Dict[str, LinkCheckResult] = {}
+        
+        try:
+            with self._lock:
+                for start in range(0, len(urls), self.QUERY_CHUNK_SIZE):
+                    chunk = urls[start:start + self.QUERY_CHUNK_SIZE]
+                    placeholders = ", ".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        "SELECT url, status, checked_at, etag, last_modified FROM link_checks "
+                        f"WHERE url IN ({placeholders})",
+                        chunk
+                    ).fetchall()
+                    for url, status, checked_at, etag, last_modified in rows:
+                        results[url] = LinkCheckResult(
+                            url, status, datetime.fromisoformat(checked_at), etag, last_modified
+                        )
+        except (sqlite3.Error, ValueError) as e:
+            raise LinkCheckCacheError(f"Link-Check-Cache konnte nicht gelesen werden: {e}") from e
+        
+        return results
+    
+    def store(self, results: Iterable[LinkCheckResult]) -> int:
+        """
+        Insert or replace check results.
+        
+        Args:
+            results: Results to store (one row per URL)
+        
+        Returns:
+            Number of results stored
+        
+        Raises:
+            LinkCheckCacheError: If writing fails
+        """
+        rows = [
+            (result.url, result.status, result.checked_at.isoformat(), result.etag, result.last_modified)
+            for result in results
+        ]
+        if not rows:
+            return 0
+        
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO link_checks (url, status, checked_at, etag, last_modified) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+        except sqlite3.Error as e:
+            raise LinkCheckCacheError(f"Link-Check-Cache konnte nicht geschrieben werden: {e}") from e
+        
+        return len(rows)
+    
+    def count(self) -> int:
+        """Number of stored URLs."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM link_checks").fetchone()[0]
+    
+    def clear(self):
+        """Remove all stored results."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM link_checks")
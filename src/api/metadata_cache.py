@@ -0,0 +1,290 @@
+"""Persistent local cache of DataCite DOI metadata (SQLite)."""
+
+import json
+import logging
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.api.sqlite_cache import SQLiteCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class MetadataCacheError(Exception):
+    """Raised when the metadata cache cannot be opened or written."""
+    pass
+
+
+class MetadataCache(SQLiteCache):
+    """
+    On-disk cache of the JSON attributes of DataCite DOIs.
+    
+    Every DOI is stored with its full attributes and the `updated` timestamp
+    reported by DataCite. Entries are scoped by API endpoint and client-id, so
+    production and test data never mix.
+    
+    The cache itself never talks to the API; DataCiteClient.sync_cache() fills
+    it and only downloads DOIs updated since the newest cached `updated` value.
+    
+    The connection may be shared by several threads.
+    """
+    
+    CACHE_FILE = "datacite_cache.sqlite3"
+    SCHEMA_VERSION = 2
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS dois (
+            endpoint TEXT NOT NULL,
+            client_id TEXT NOT NULL,
+            doi TEXT NOT NULL,
+            updated TEXT,
+            attributes TEXT NOT NULL,
+            PRIMARY KEY (endpoint, client_id, doi)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS sync_state (
+            endpoint TEXT NOT NULL,
+            client_id TEXT NOT NULL,
+            last_updated TEXT,
+            synced_at TEXT NOT NULL,
+            full_synced_at TEXT,
+            PRIMARY KEY (endpoint, client_id)
+        )
+        """,
+    )
+    MIGRATIONS = {
+        2: ("ALTER TABLE sync_state ADD COLUMN full_synced_at TEXT",),
+    }
+    ERROR_CLASS = MetadataCacheError
+    DISPLAY_NAME = "Metadaten-Cache"
+    
+    @staticmethod
+    def _normalize_doi(doi: str) -> str:
+        """DOIs are case-insensitive; store them lowercase."""
+        return doi.strip().lower()
+    
+    def get(self, endpoint: str, client_id: str, doi: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the cached attributes of a DOI.
+        
+        Args:
+            endpoint: API base URL
+            client_id: DataCite client-id
+            doi: DOI identifier (case-insensitive)
+        
+        Returns:
+            Dictionary shaped like a GET /dois/{doi} response ({"data": {...}}),
+            or None if the DOI is not cached
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT attributes FROM dois WHERE endpoint = ? AND client_id = ? AND doi = ?",
+                (endpoint, client_id, self._normalize_doi(doi))
+            ).fetchone()
+        
+        if row is None:
+            return None
+        return self._to_record(json.loads(row[0]))
+    
+    def store(self, endpoint: str, client_id: str, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or replace DOI records.
+        
+        Args:
+            endpoint: API base URL
+            client_id: DataCite client-id
+            records: JSON:API records as returned in the "data" list of /dois
+        
+        Returns:
+            Number of records stored
+        
+        Raises:
+            MetadataCacheError: If writing fails
+        """
+        rows = []
+        for record in records:
+            doi = record.get("id")
+            attributes = record.get("attributes")
+            if not doi or not isinstance(attributes, dict):
+                continue
+            # Keep the DOI in its original spelling inside the attributes
+            attributes = dict(attributes)
+            attributes.setdefault("doi", doi)
+            rows.append((
+                endpoint,
+                client_id,
+                self._normalize_doi(doi),
+                attributes.get("updated"),
+                json.dumps(attributes, ensure_ascii=False)
+            ))
+        
+        if not rows:
+            return 0
+        
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO dois (endpoint, client_id, doi, updated, attributes) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+        except sqlite3.Error as e:
+            raise MetadataCacheError(f"Metadaten-Cache konnte nicht geschrieben werden: {e}") from e
+        
+        return len(rows)
+    
+    def remove(self, endpoint: str, client_id: str, dois: Iterable[str]) -> int:
+        """
+        Remove DOIs from the cache.
+        
+        Args:
+            endpoint: API base URL
+            client_id: DataCite client-id
+            dois: DOI identifiers (case-insensitive)
+        
+        Returns:
+            Number of removed entries
+        """
+        keys = [(endpoint, client_id, self._normalize_doi(doi)) for doi in dois]
+        if not keys:
+            return 0
+        
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "DELETE FROM dois WHERE endpoint = ? AND client_id = ? AND doi = ?",
+                keys
+            )
+            return self._conn.total_changes - before
+    
+    def clear(self, endpoint: Optional[str] = None, client_id: Optional[str] = None):
+        """
+        Remove cached entries and sync state.
+        
+        Args:
+            endpoint: Only clear this endpoint (default: all)
+            client_id: Only clear this client-id (requires endpoint)
+        """
+        where = ""
+        params: Tuple = ()
+        if endpoint is not None and client_id is not None:
+            where, params = " WHERE endpoint = ? AND client_id = ?", (endpoint, client_id)
+        elif endpoint is not None:
+            where, params = " WHERE endpoint = ?", (endpoint,)
+        
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM dois{where}", params)
+            self._conn.execute(f"DELETE FROM sync_state{where}", params)
+    
+    def count(self, endpoint: str, client_id: str) -> int:
+        """Number of cached DOIs of a client."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM dois WHERE endpoint = ? AND client_id = ?",
+                (endpoint, client_id)
+            ).fetchone()[0]
+    
+    def cached_dois(self, endpoint: str, client_id: str) -> List[str]:
+        """Lowercase DOIs currently cached for a client."""
+        with self._lock:
+            return [
+                row[0] for row in self._conn.execute(
+                    "SELECT doi FROM dois WHERE endpoint = ? AND client_id = ?",
+                    (endpoint, client_id)
+                )
+            ]
+    
+    def iter_pages(self, endpoint: str, client_id: str, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the cached DOIs of a client as /dois-shaped pages.
+        
+        The pages have the same structure as API responses ({"data": [...]}),
+        so the existing page extractors of DataCiteClient work unchanged.
+        DOIs are ordered alphabetically. The database is not locked between pages.
+        
+        Args:
+            endpoint: API base URL
+            client_id: DataCite client-id
+            page_size: Number of DOIs per page
+        
+        Yields:
+            Page dictionaries with a "data" list and empty "links"
+        """
+        last_doi = ""
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT doi, attributes FROM dois "
+                    "WHERE endpoint = ? AND client_id = ? AND doi > ? "
+                    "ORDER BY doi LIMIT ?",
+                    (endpoint, client_id, last_doi, page_size)
+                ).fetchall()
+            
+            if not rows:
+                break
+            
+            last_doi = rows[-1][0]
+            yield {
+                "data": [self._to_record(json.loads(attributes))["data"] for _, attributes in rows],
+                "links": {}
+            }
+            
+            if len(rows) < page_size:
+                break
+    
+    def get_sync_state(self, endpoint: str, client_id: str) -> Optional[Dict[str, str]]:
+        """
+        Get the state of the last completed sync.
+        
+        Returns:
+            Dictionary with last_updated (newest DataCite `updated` value seen,
+            may be None for clients without DOIs), synced_at (local UTC time)
+            and full_synced_at (local UTC time of the last full sync, None if
+            there was none), or None if the client was never synced
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_updated, synced_at, full_synced_at FROM sync_state "
+                "WHERE endpoint = ? AND client_id = ?",
+                (endpoint, client_id)
+            ).fetchone()
+        
+        if row is None:
+            return None
+        return {"last_updated": row[0], "synced_at": row[1], "full_synced_at": row[2]}
+    
+    def mark_synced(self, endpoint: str, client_id: str, full: bool = False):
+        """
+        Record a completed sync.
+        
+        last_updated is taken from the cached entries themselves, i.e. from the
+        DataCite server clock, so clock skew of the local machine cannot cause
+        changes to be missed.
+        
+        Args:
+            endpoint: API endpoint
+            client_id: DataCite client-id
+            full: True if the sync downloaded all DOIs (also updates full_synced_at)
+        """
+        synced_at = datetime.now(timezone.utc).isoformat()
+        with self._lock, self._conn:
+            last_updated = self._conn.execute(
+                "SELECT MAX(updated) FROM dois WHERE endpoint = ? AND client_id = ?",
+                (endpoint, client_id)
+            ).fetchone()[0]
+            self._conn.execute(
+                "INSERT INTO sync_state (endpoint, client_id, last_updated, synced_at, full_synced_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (endpoint, client_id) DO UPDATE SET "
+                "last_updated = excluded.last_updated, synced_at = excluded.synced_at, "
+                "full_synced_at = COALESCE(excluded.full_synced_at, full_synced_at)",
+                (endpoint, client_id, last_updated, synced_at, synced_at if full else None)
+            )
+    
+    @staticmethod
+    def _to_record(attributes: Dict[str, Any]) -> Dict[str, Any]:
+        """Wrap cached attributes like a GET /dois/{doi} response."""
+        return {"data": {"id": attributes.get("doi"), "type": "dois", "attributes": attributes}}
@@ -0,0 +1,288 @@
+"""Adaptive client-side rate limiting for the DataCite REST API."""
+
+import email.utils
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import requests
+
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+    
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+        now: Reference time for HTTP-dates (default: current UTC time)
+    
+    Returns:
+        Delay in seconds (never negative), or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.debug(f"Invalid Retry-After header: {value}")
+        return None
+    
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max((retry_at - now).total_seconds(), 0.0)
+
+
+class AdaptiveRateLimiter:
+    """
+    Thread-safe token bucket whose rate adapts to the server (AIMD).
+    
+    - Every request takes one token; tokens refill at the current rate.
+      Requests that find the bucket empty reserve a future slot, so several
+      threads sharing the limiter are served in arrival order.
+    - A 429 response halves the rate (multiplicative decrease) and pauses all
+      requests until the Retry-After delay has passed. Reservations start
+      after the pause, so waiting threads resume one by one at the current
+      rate instead of all at once.
+    - Every successful response raises the rate by a small step (additive
+      increase) until max_rate is reached again.
+    - X-RateLimit-Limit/-Remaining/-Reset headers cap the rate before the
+      server quota is exhausted.
+    """
+    
+    DEFAULT_BURST = 5  # Requests that may be sent back-to-back
+    MIN_RATE = 0.5  # Lower bound for the request rate (requests/second)
+    DECREASE_FACTOR = 0.5  # Multiplicative decrease on 429
+    INCREASE_STEP = 0.1  # Additive increase per successful request (requests/second)
+    LOW_QUOTA_RATIO = 0.1  # Start slowing down when less than 10% of the quota is left
+    
+    def __init__(
+        self,
+        max_rate: float,
+        burst: Optional[int] = None,
+        clock=time.monotonic,
+        sleep=time.sleep
+    ):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            max_rate: Maximum request rate in requests per second
+            burst: Bucket capacity (default: DEFAULT_BURST)
+            clock: Monotonic clock function (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.max_rate = float(max_rate)
+        self.burst = burst or self.DEFAULT_BURST
+        self.clock = clock
+        self.sleep = sleep
+        
+        self._rate = self.max_rate
+        self._quota_cap = None  # Rate cap derived from X-RateLimit-* headers
+        self._tokens = float(self.burst)
+        self._last_refill = self.clock()  # Lies in the future while requests are paused
+        self._lock = threading.Lock()
+        
+        # Statistics
+        self._requests = 0
+        self._rate_limited = 0
+        self._waited_seconds = 0.0
+    
+    @property
+    def current_rate(self) -> float:
+        """Current effective request rate in requests per second."""
+        with self._lock:
+            return self._effective_rate()
+    
+    def acquire(self) -> float:
+        """
+        Wait until the next request may be sent.
+        
+        Returns:
+            Number of seconds waited
+        """
+        with self._lock:
+            now = self.clock()
+            rate = self._effective_rate()
+            if now > self._last_refill:
+                self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * rate)
+                self._last_refill = now
+            
+            # Take a token; a negative balance reserves a slot after the
+            # refill time (the end of a pause, if requests are paused)
+            self._tokens -= 1
+            wait = (self._last_refill - now) + max(-self._tokens / rate, 0.0)
+            
+            self._requests += 1
+            self._waited_seconds += wait
+        
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+    
+    def on_success(self):
+        """Additive increase after a successful (non-429) response."""
+        with self._lock:
+            if self._rate < self.max_rate:
+                self._rate = min(self._rate + self.INCREASE_STEP, self.max_rate)
+    
+    def on_rate_limited(self, retry_after: Optional[float], fallback_delay: float):
+        """
+        Multiplicative decrease and pause after a 429 response.
+        
+        Args:
+            retry_after: Delay requested by the server in seconds, or None
+            fallback_delay: Delay to use if the server did not send Retry-After
+        """
+        delay = retry_after if retry_after is not None else fallback_delay
+        with self._lock:
+            self._rate = max(self._rate * self.DECREASE_FACTOR, self.MIN_RATE)
+            self._pause(delay)
+            self._rate_limited += 1
+            rate = self._rate
+        
+        logger.warning(f"Rate limit hit, pausing requests for {delay:.1f}s (new rate: {rate:.2f} req/s)")
+    
+    def update_from_headers(self, headers):
+        """
+        Adjust the rate to the quota reported in X-RateLimit-* headers.
+        
+        Args:
+            headers: Case-insensitive response headers
+        """
+        limit = self._parse_number(headers.get("X-RateLimit-Limit"))
+        remaining = self._parse_number(headers.get("X-RateLimit-Remaining"))
+        if limit is None or remaining is None or limit <= 0:
+            return
+        
+        with self._lock:
+            if remaining <= 0:
+                # Quota exhausted: wait for the reset if the server told us when
+                reset = self._parse_reset(headers.get("X-RateLimit-Reset"))
+                if reset:
+                    self._pause(reset)
+                self._quota_cap = self.MIN_RATE
+            elif remaining < limit * self.LOW_QUOTA_RATIO:
+                # Slow down proportionally to the remaining quota
+                fraction = remaining / (limit * self.LOW_QUOTA_RATIO)
+                self._quota_cap = max(self.max_rate * fraction, self.MIN_RATE)
+            else:
+                self._quota_cap = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Report throttling statistics.
+        
+        Returns:
+            Dictionary with current_rate (requests/second), requests,
+            rate_limited (number of 429 responses) and waited_seconds
+        """
+        with self._lock:
+            return {
+                "current_rate": self._effective_rate(),
+                "requests": self._requests,
+                "rate_limited": self._rate_limited,
+                "waited_seconds": self._waited_seconds
+            }
+    
+    def _effective_rate(self) -> float:
+        """Current rate including the quota cap. Caller must hold the lock."""
+        if self._quota_cap is not None:
+            return min(self._rate, self._quota_cap)
+        return self._rate
+    
+    def _pause(self, delay: float):
+        """
+        Pause all requests for delay seconds. Caller must hold the lock.
+        
+        The refill time is moved to the end of the pause and the bucket is
+        left with one token: one request may go when the pause ends, all
+        others follow at the current rate.
+        """
+        now = self.clock()
+        if now > self._last_refill:
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self._effective_rate())
+            self._last_refill = now
+        resume_at = now + delay
+        if resume_at > self._last_refill:
+            self._last_refill = resume_at
+            self._tokens = min(self._tokens, 0.0) + 1.0
+    
+    @staticmethod
+    def _parse_number(value: Optional[str]) -> Optional[float]:
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+    
+    def _parse_reset(self, value: Optional[str]) -> Optional[float]:
+        """Parse X-RateLimit-Reset as delay in seconds (accepts delta or epoch seconds)."""
+        reset = self._parse_number(value)
+        if reset is None:
+            return None
+        # Values larger than one day are epoch timestamps
+        if reset > 86400:
+            reset = reset - time.time()
+        return max(reset, 0.0)
+
+
+class RateLimitedSession(requests.Session):
+    """
+    requests.Session that sends every request through an AdaptiveRateLimiter.
+    
+    429 responses are retried transparently after the Retry-After delay (or an
+    exponential backoff). If the retries are exhausted, the last 429 response
+    is returned so the caller can report it as before.
+    """
+    
+    def __init__(self, rate_limiter: AdaptiveRateLimiter, max_retries: int = 3, max_backoff: float = 60.0):
+        """
+        Initialize the session.
+        
+        Args:
+            rate_limiter: Limiter shared by all requests of this session
+            max_retries: Number of retries after a 429 response
+            max_backoff: Upper bound for a single wait in seconds
+        """
+        super().__init__()
+        self.rate_limiter = rate_limiter
+        self.max_rate_limit_retries = max_retries
+        self.max_backoff = max_backoff
+    
+    def request(self, method, url, *args, **kwargs):
+        """Send a request, waiting for the rate limiter and retrying on 429."""
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            response = super().request(method, url, *args, **kwargs)
+            self.rate_limiter.update_from_headers(response.headers)
+            
+            if response.status_code != 429:
+                self.rate_limiter.on_success()
+                return response
+            
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                retry_after = min(retry_after, self.max_backoff)
+            fallback_delay = min(2.0 ** attempt, self.max_backoff)
+            self.rate_limiter.on_rate_limited(retry_after, fallback_delay)
+            
+            if attempt >= self.max_rate_limit_retries:
+                logger.error(f"Rate limit still exceeded after {attempt} retries: {method} {url}")
+                return response
+            
+            attempt += 1
+            logger.info(f"Retrying {method} {url} after rate limit (attempt {attempt}/{self.max_rate_limit_retries})")
+            response.close()
@@ -0,0 +1,88 @@
+"""Common base of the persistent SQLite caches in AppData/Roaming/GROBI."""
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Type
+
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCache:
+    """
+    SQLite database file with WAL journaling, shared by several threads.
+    
+    Subclasses define the file name, their tables and the exception raised
+    when the database cannot be opened; they only implement their queries
+    on self._conn, holding self._lock.
+    """
+    
+    CACHE_FILE = ""  # File name in AppData/Roaming/GROBI
+    SCHEMA_VERSION = 1
+    SCHEMA: Tuple[str, ...] = ()  # CREATE TABLE statements of the current version
+    MIGRATIONS: Dict[int, Tuple[str, ...]] = {}  # Version -> statements upgrading the previous version
+    ERROR_CLASS: Type[Exception] = Exception  # Raised if the database cannot be opened
+    DISPLAY_NAME = "Cache"  # Name used in error messages shown to the user
+    
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Open (and create if necessary) the cache database.
+        
+        Args:
+            db_path: Path to the SQLite file (default: AppData/Roaming/GROBI/<CACHE_FILE>),
+                     or ":memory:" for a temporary cache
+        
+        Raises:
+            ERROR_CLASS: If the database cannot be opened
+        """
+        self.db_path = db_path if db_path is not None else self.default_path()
+        self._lock = threading.Lock()
+        
+        try:
+            if str(self.db_path) != ":memory:":
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._create_schema()
+        except (OSError, sqlite3.Error) as e:
+            raise self.ERROR_CLASS(f"{self.DISPLAY_NAME} konnte nicht geöffnet werden: {e}") from e
+        
+        logger.info(f"{type(self).__name__} opened: {self.db_path}")
+    
+    @classmethod
+    def default_path(cls) -> Path:
+        """
+        Get path to the cache file in AppData/Roaming/GROBI.
+        
+        Returns:
+            Path to CACHE_FILE
+        """
+        # Windows: %APPDATA%\GROBI
+        return Path.home() / "AppData" / "Roaming" / "GROBI" / cls.CACHE_FILE
+    
+    def _create_schema(self):
+        """Create tables on first use and upgrade databases of older schema versions."""
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            # A new database (version 0) gets the current tables directly
+            if version:
+                for target in range(version + 1, self.SCHEMA_VERSION + 1):
+                    for statement in self.MIGRATIONS.get(target, ()):
+                        self._conn.execute(statement)
+                    logger.info(f"{type(self).__name__} upgraded to schema version {target}")
+            for statement in self.SCHEMA:
+                self._conn.execute(statement)
+            self._conn.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,5 +1,6 @@
 """Database clients for GFZ data services."""
 
+from src.db.connection_pool import ConnectionPool, PoolTimeoutError
 from src.db.sumariopmd_client import SumarioPMDClient, DatabaseError
 
-__all__ = ['SumarioPMDClient', 'DatabaseError']
+__all__ = ['SumarioPMDClient', 'DatabaseError', 'ConnectionPool', 'PoolTimeoutError']
@@ -0,0 +1,283 @@
+"""
+Thread-safe connection pool for PyMySQL connections.
+
+Pure Python (threading only), so it works unchanged in the Nuitka-frozen build.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pymysql
+from pymysql.constants import SERVER_STATUS
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection becomes available in time."""
+    pass
+
+
+class PoolClosedError(Exception):
+    """Raised when a connection is requested from a closed pool."""
+    pass
+
+
+class ConnectionPool:
+    """
+    Bounded pool of reusable database connections.
+    
+    - At most max_size connections exist at the same time; further callers
+      wait until a connection is released (or wait_timeout expires).
+    - Idle connections are reused most-recently-used first. Connections idle
+      for longer than max_idle seconds are closed (idle eviction).
+    - Before reuse, connections idle for longer than ping_interval seconds are
+      checked with ping(reconnect=True); broken connections are replaced.
+    - Connections are rolled back on release if a transaction is still open,
+      so no uncommitted state or stale read snapshot leaks to the next user.
+    """
+    
+    DEFAULT_WAIT_TIMEOUT = 30.0  # Seconds to wait for a free connection
+    DEFAULT_MAX_IDLE = 300.0  # Close connections idle for longer (VPN/NAT drop idle TCP sessions)
+    DEFAULT_PING_INTERVAL = 30.0  # Ping connections idle for longer before handing them out
+    
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        max_size: int = 5,
+        wait_timeout: float = DEFAULT_WAIT_TIMEOUT,
+        max_idle: float = DEFAULT_MAX_IDLE,
+        ping_interval: float = DEFAULT_PING_INTERVAL,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the pool. No connection is opened until the first acquire().
+        
+        Args:
+            connect: Factory that opens a new connection (may raise pymysql.Error)
+            max_size: Maximum number of open connections
+            wait_timeout: Seconds acquire() waits for a free connection
+            max_idle: Seconds after which idle connections are closed
+            ping_interval: Idle seconds after which a connection is pinged before reuse
+            clock: Monotonic clock function (injectable for tests)
+        """
+        self._connect = connect
+        self.max_size = max(1, int(max_size))
+        self.wait_timeout = wait_timeout
+        self.max_idle = max_idle
+        self.ping_interval = ping_interval
+        self._clock = clock
+        
+        self._condition = threading.Condition()
+        self._idle: List[Tuple[Any, float]] = []  # (connection, released_at), newest last
+        self._size = 0  # Open connections (idle + in use + being opened)
+        self._closed = False  # Set by close(); released connections are closed instead of kept
+        
+        # Statistics
+        self._created = 0
+        self._reused = 0
+        self._reconnects = 0
+        self._evicted = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+    
+    def acquire(self) -> Any:
+        """
+        Get a connection from the pool, opening a new one if allowed.
+        
+        Returns:
+            Open connection
+        
+        Raises:
+            PoolClosedError: If the pool was closed and not reopened
+            PoolTimeoutError: If all connections stay in use for wait_timeout seconds
+            pymysql.Error: If a new connection cannot be opened
+        """
+        waited = None
+        with self._condition:
+            if self._closed:
+                raise PoolClosedError("Database connection pool is closed")
+            self._evict_idle()
+            
+            if not self._idle and self._size >= self.max_size:
+                start = self._clock()
+                deadline = start + self.wait_timeout
+                while not self._idle and self._size >= self.max_size:
+                    if self._closed:
+                        raise PoolClosedError("Database connection pool was closed while waiting")
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        raise PoolTimeoutError(
+                            f"No database connection available after {self.wait_timeout:.0f}s "
+                            f"(pool size {self.max_size})"
+                        )
+                    self._condition.wait(remaining)
+                waited = self._clock() - start
+                self._waits += 1
+                self._wait_seconds += waited
+                self._max_wait_seconds = max(self._max_wait_seconds, waited)
+            
+            if self._idle:
+                connection, released_at = self._idle.pop()
+                idle_seconds = self._clock() - released_at
+            else:
+                # Reserve the slot; the connection is opened outside the lock
+                connection, idle_seconds = None, 0.0
+                self._size += 1
+        
+        if waited:
+            logger.debug(f"Waited {waited:.3f}s for a pooled database connection")
+        
+        if connection is not None:
+            connection = self._check_health(connection, idle_seconds)
+            if connection is not None:
+                with self._condition:
+                    self._reused += 1
+                return connection
+            # Broken and not recoverable: open a replacement in the same slot
+        
+        try:
+            connection = self._connect()
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        
+        with self._condition:
+            self._created += 1
+        return connection
+    
+    def release(self, connection: Any, discard: bool = False):
+        """
+        Return a connection to the pool.
+        
+        Args:
+            connection: Connection obtained from acquire()
+            discard: If True, close the connection instead of reusing it
+                     (e.g. after a connection-level error)
+        """
+        if not discard:
+            try:
+                if self._in_transaction(connection):
+                    connection.rollback()
+                    logger.debug("Rolled back open transaction of released connection")
+            except pymysql.Error as e:
+                logger.warning(f"Discarding pooled connection after failed rollback: {e}")
+                discard = True
+        
+        with self._condition:
+            keep = not (discard or self._closed) and getattr(connection, "open", True)
+            if keep:
+                self._idle.append((connection, self._clock()))
+            else:
+                self._size -= 1
+            self._condition.notify()
+        
+        if not keep:
+            self._close_quietly(connection)
+    
+    def close(self):
+        """
+        Close all idle connections. Connections in use are closed when released.
+        
+        acquire() raises PoolClosedError until reopen() is called.
+        """
+        with self._condition:
+            self._closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+        
+        for connection in idle:
+            self._close_quietly(connection)
+        if idle:
+            logger.info(f"Closed {len(idle)} pooled database connections")
+    
+    def reopen(self):
+        """Allow acquire() again after close(); connections are opened on demand."""
+        with self._condition:
+            self._closed = False
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Report pool usage.
+        
+        Returns:
+            Dictionary with max_size, open, idle, in_use, created, reused,
+            reconnects, evicted, waits, wait_seconds_total and wait_seconds_max
+        """
+        with self._condition:
+            idle = len(self._idle)
+            return {
+                "max_size": self.max_size,
+                "open": self._size,
+                "idle": idle,
+                "in_use": self._size - idle,
+                "created": self._created,
+                "reused": self._reused,
+                "reconnects": self._reconnects,
+                "evicted": self._evicted,
+                "waits": self._waits,
+                "wait_seconds_total": self._wait_seconds,
+                "wait_seconds_max": self._max_wait_seconds,
+            }
+    
+    def _evict_idle(self):
+        """Close connections idle for longer than max_idle. Caller must hold the lock."""
+        now = self._clock()
+        keep = []
+        for connection, released_at in self._idle:
+            if now - released_at > self.max_idle:
+                self._close_quietly(connection)
+                self._size -= 1
+                self._evicted += 1
+            else:
+                keep.append((connection, released_at))
+        if len(keep) != len(self._idle):
+            logger.debug(f"Evicted {len(self._idle) - len(keep)} idle database connections")
+            self._idle = keep
+    
+    def _check_health(self, connection: Any, idle_seconds: float) -> Optional[Any]:
+        """
+        Make sure a reused connection still works.
+        
+        Returns:
+            The (possibly reconnected) connection, or None if it is broken
+        """
+        if idle_seconds < self.ping_interval and getattr(connection, "open", True):
+            return connection
+        
+        try:
+            was_open = getattr(connection, "open", True)
+            connection.ping(reconnect=True)
+            if not was_open:
+                with self._condition:
+                    self._reconnects += 1
+            return connection
+        except pymysql.Error as e:
+            logger.warning(f"Pooled database connection failed health check: {e}")
+            self._close_quietly(connection)
+            with self._condition:
+                self._reconnects += 1
+            return None
+    
+    @staticmethod
+    def _in_transaction(connection: Any) -> bool:
+        """Check the server status flags of the last response for an open transaction."""
+        try:
+            return bool(connection.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS)
+        except (AttributeError, TypeError):
+            # No status information available - nothing to roll back
+            return False
+    
+    @staticmethod
+    def _close_quietly(connection: Any):
+        try:
+            connection.close()
+        except Exception as e:
+            logger.debug(f"Ignoring error while closing database connection: {e}")
@@ -15,12 +15,15 @@ Table Structure:
 """
 
 import logging
-from typing import Optional, List, Dict, Tuple, Any
+import threading
+from typing import Optional, List, Dict, Tuple, Any, Callable, Iterable, Iterator
 from contextlib import contextmanager
 
 # PyMySQL: Pure Python MySQL client - works perfectly in frozen apps!
 import pymysql
-from pymysql.cursors import DictCursor
+from pymysql.cursors import DictCursor, SSCursor
+
+from src.db.connection_pool import ConnectionPool, PoolClosedError, PoolTimeoutError
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +67,18 @@ class SumarioPMDClient:
         "pointOfContact"  # GFZ-internal type
     ]
     
+    # Maximum number of DOIs per IN (...) query when resolving resource_ids
+    RESOURCE_ID_CHUNK_SIZE = 500
+    
+    # Rows fetched per round-trip from unbuffered (streaming) cursors
+    STREAM_BATCH_SIZE = 1000
+    
+    # resourceagent columns compared when diffing creators/contributors
+    AGENT_FIELDS = ('name', 'firstname', 'lastname', 'identifier', 'identifiertype', 'nametype')
+    
+    # DOIs sharing one transaction in batch-commit mode (see batch_transaction())
+    DEFAULT_BATCH_SIZE = 50
+    
     def __init__(self, host: str, database: str, username: str, password: str, pool_size: int = 5):
         """
         Initialize database client with connection parameters.
@@ -73,7 +88,7 @@ class SumarioPMDClient:
             database: Database name (sumario-pmd)
             username: Database username
             password: Database password
-            pool_size: Unused (kept for API compatibility)
+            pool_size: Maximum number of pooled connections (shared by all threads)
             
         Raises:
             ConnectionError: If test connection fails
@@ -87,14 +102,39 @@ class SumarioPMDClient:
         if not self.host.endswith('.gfz-potsdam.de') and not self.host.startswith('localhost'):
             self.host = f"{self.host}.gfz-potsdam.de"
         
-        logger.info(f"SumarioPMDClient initialized for {self.host}/{self.database} using PyMySQL")
+        # Connections are opened lazily and reused, so repeated calls skip the
+        # MySQL handshake and authentication round-trips
+        self.pool = ConnectionPool(self._connect, max_size=pool_size)
+        
+        # Session-scoped DOI -> resource_id map (None = DOI not in database).
+        # Keys are lowercase because DOIs are case-insensitive.
+        self._resource_ids: Dict[str, Optional[int]] = {}
+        self._resource_ids_lock = threading.Lock()
+        
+        logger.info(f"SumarioPMDClient initialized for {self.host}/{self.database} using PyMySQL (pool size {pool_size})")
+    
+    def _connect(self):
+        """Open a new PyMySQL connection (used by the connection pool)."""
+        # PyMySQL connection - pure Python, works great in frozen apps!
+        # No SSL/auth_plugin parameters needed - PyMySQL handles everything automatically
+        return pymysql.connect(
+            host=self.host,
+            database=self.database,
+            user=self.username,
+            password=self.password,
+            connect_timeout=10,
+            charset='utf8mb4',
+            cursorclass=DictCursor  # Return results as dictionaries
+        )
     
     @contextmanager
     def get_connection(self):
         """
-        Context manager for getting database connection.
+        Context manager for getting a pooled database connection.
         
-        PyMySQL creates connections on demand (no pooling), which is perfect for frozen apps.
+        The connection is returned to the pool afterwards. Open transactions are
+        rolled back on return; connections that failed with a connection-level
+        error (OperationalError/InterfaceError) are discarded instead of reused.
         
         Yields:
             connection: PyMySQL connection
@@ -102,29 +142,90 @@ class SumarioPMDClient:
         Raises:
             ConnectionError: If connection cannot be established
         """
-        connection = None
         try:
-            # PyMySQL connection - pure Python, works great in frozen apps!
-            # No SSL/auth_plugin parameters needed - PyMySQL handles everything automatically
-            connection = pymysql.connect(
-                host=self.host,
-                database=self.database,
-                user=self.username,
-                password=self.password,
-                connect_timeout=10,
-                charset='utf8mb4',
-                cursorclass=DictCursor  # Return results as dictionaries
-            )
+            connection = self.pool.acquire()
         except pymysql.Error as e:
             # Only catch connection errors here, not query errors during transactions
             logger.error(f"Failed to connect to database: {e}")
             raise ConnectionError(f"Database connection failed: {e}") from e
+        except PoolTimeoutError as e:
+            logger.error(f"Database connection pool exhausted: {e}")
+            raise ConnectionError(f"Database connection failed: {e}") from e
+        except PoolClosedError as e:
+            logger.error(f"Database connection requested after close_pool(): {e}")
+            raise ConnectionError(f"Database connection failed: {e}") from e
         
+        discard = False
         try:
             yield connection
+        except (pymysql.OperationalError, pymysql.InterfaceError):
+            discard = True
+            raise
         finally:
-            if connection:
-                connection.close()
+            self.pool.release(connection, discard=discard)
+    
+    @contextmanager
+    def batch_transaction(self):
+        """
+        Context manager for writing several DOIs in one transaction (batch-commit mode).
+        
+        Every update made through the yielded TransactionBatch runs in its own
+        SAVEPOINT, so a failing DOI is rolled back on its own while the others
+        stay in the transaction. All successful updates are committed together
+        when the block exits; if the block raises, nothing is committed.
+        
+        Yields:
+            TransactionBatch bound to one pooled connection
+            
+        Raises:
+            ConnectionError: If connection cannot be established
+            TransactionError: If the transaction cannot be started or committed,
+                              or a savepoint could not be rolled back (in all
+                              cases no update of the batch is committed)
+        """
+        with self.get_connection() as connection:
+            try:
+                connection.begin()
+            except pymysql.Error as e:
+                logger.error(f"Failed to start batch transaction: {e}")
+                raise TransactionError(f"Failed to start batch transaction: {e}") from e
+            
+            batch = TransactionBatch(self, connection)
+            try:
+                yield batch
+            except BaseException:
+                # Roll back before the connection goes back to the pool
+                self._rollback_batch(connection, batch)
+                raise
+            
+            try:
+                connection.commit()
+            except pymysql.Error as e:
+                self._rollback_batch(connection, batch)
+                logger.error(f"Batch commit of {batch.updated} DOIs failed: {e}")
+                raise TransactionError(f"Batch commit failed, no DOI of the batch was saved: {e}") from e
+        
+        logger.info(
+            f"Committed batch transaction: {batch.updated} DOIs updated, "
+            f"{batch.failed} rolled back to their savepoint"
+        )
+    
+    @staticmethod
+    def _rollback_batch(connection, batch: "TransactionBatch"):
+        try:
+            connection.rollback()
+            logger.warning(f"Batch transaction rolled back ({batch.updated} DOI updates discarded)")
+        except pymysql.Error as rollback_error:
+            logger.error(f"Rollback of batch transaction failed: {rollback_error}")
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Report connection pool usage, including how long callers waited.
+        
+        Returns:
+            Dictionary as described in ConnectionPool.get_stats()
+        """
+        return self.pool.get_stats()
     
     def test_connection(self) -> Tuple[bool, str]:
         """
@@ -160,6 +261,11 @@ class SumarioPMDClient:
         Raises:
             DatabaseError: If query fails
         """
+        key = doi.strip().lower()
+        with self._resource_ids_lock:
+            if key in self._resource_ids:
+                return self._resource_ids[key]
+        
         query = """
             SELECT id 
             FROM resource 
@@ -176,14 +282,94 @@ class SumarioPMDClient:
                     if result:
                         resource_id = result['id']
                         logger.debug(f"Found resource_id {resource_id} for DOI {doi}")
-                        return resource_id
                     else:
+                        resource_id = None
                         logger.warning(f"No resource found for DOI {doi}")
-                        return None
                         
         except pymysql.Error as e:
             logger.error(f"Database error fetching resource_id for {doi}: {e}")
             raise DatabaseError(f"Failed to fetch resource_id: {e}") from e
+        
+        with self._resource_ids_lock:
+            self._resource_ids[key] = resource_id
+        return resource_id
+    
+    def get_resource_ids_for_dois(
+        self,
+        dois: Iterable[str],
+        chunk_size: Optional[int] = None
+    ) -> Dict[str, Optional[int]]:
+        """
+        Resolve many DOIs to resource_ids with chunked IN (...) queries.
+        
+        Results (including DOIs that are not in the database) are kept in a
+        session cache, so later calls - and get_resource_id_for_doi() - only
+        query DOIs that were not resolved before.
+        
+        Args:
+            dois: DOI strings (duplicates are ignored)
+            chunk_size: DOIs per query (default: RESOURCE_ID_CHUNK_SIZE)
+            
+        Returns:
+            Dictionary mapping every given DOI (original spelling) to its
+            resource_id, or None if the DOI is not in the database
+            
+        Raises:
+            DatabaseError: If a query fails
+        """
+        chunk_size = chunk_size or self.RESOURCE_ID_CHUNK_SIZE
+        dois = list(dict.fromkeys(doi for doi in dois if doi))
+        
+        # Query with the original spelling (the column collation decides about
+        # case sensitivity), but match results case-insensitively
+        missing: Dict[str, str] = {}
+        with self._resource_ids_lock:
+            for doi in dois:
+                key = doi.strip().lower()
+                if key not in self._resource_ids:
+                    missing.setdefault(key, doi.strip())
+        
+        if missing:
+            resolved: Dict[str, Optional[int]] = dict.fromkeys(missing)
+            identifiers = list(missing.values())
+            try:
+                with self.get_connection() as conn:
+                    with conn.cursor() as cursor:
+                        for start in range(0, len(identifiers), chunk_size):
+                            chunk = identifiers[start:start + chunk_size]
+                            placeholders = ', '.join(['%s'] * len(chunk))
+                            query = f"""
+                                SELECT id, identifier 
+                                FROM resource 
+                                WHERE identifier IN ({placeholders})
+                                ORDER BY id
+                            """
+                            cursor.execute(query, chunk)
+                            for row in cursor.fetchall():
+                                key = (row['identifier'] or '').strip().lower()
+                                # Keep the first (lowest) id like LIMIT 1 would
+                                if key in resolved and resolved[key] is None:
+                                    resolved[key] = row['id']
+            except pymysql.Error as e:
+                logger.error(f"Database error resolving resource_ids for {len(missing)} DOIs: {e}")
+                raise DatabaseError(f"Failed to fetch resource_ids: {e}") from e
+            
+            found = sum(1 for resource_id in resolved.values() if resource_id is not None)
+            logger.info(
+                f"Resolved {found}/{len(missing)} DOIs to resource_ids "
+                f"in {(len(missing) + chunk_size - 1) // chunk_size} queries"
+            )
+            
+            with self._resource_ids_lock:
+                self._resource_ids.update(resolved)
+        
+        with self._resource_ids_lock:
+            return {doi: self._resource_ids.get(doi.strip().lower()) for doi in dois}
+    
+    def clear_resource_id_cache(self):
+        """Forget all resolved DOI -> resource_id mappings."""
+        with self._resource_ids_lock:
+            self._resource_ids.clear()
     
     def fetch_creators_for_resource(self, resource_id: int) -> List[Dict[str, Any]]:
         """
@@ -250,8 +436,12 @@ class SumarioPMDClient:
         
         Strategy:
         1. BEGIN TRANSACTION
-        2. Delete existing Creator entries (resourceagent + role)
-        3. Insert new Creator entries
+        2. Read and lock the current resourceagent rows of the resource
+        3. Compare them with the new creators (matched by order):
+           - changed creators are updated in place, unchanged ones are not touched
+           - new creators are inserted (batched with executemany)
+           - creators missing from the new list lose their Creator role; their
+             resourceagent row is deleted if no other role remains
         4. COMMIT if successful, ROLLBACK on any error
         
         Args:
@@ -268,131 +458,307 @@ class SumarioPMDClient:
             TransactionError: If transaction fails and cannot be rolled back
         """
         errors = []
-        connection = None
         
         try:
             with self.get_connection() as connection:
-                # Start transaction
-                connection.begin()
-                logger.debug(f"Started transaction for resource_id {resource_id}")
-                
-                with connection.cursor() as cursor:
-                    # Step 1: Delete existing Creator entries
-                    # First delete from role table (foreign key constraint)
-                    delete_role_query = """
-                        DELETE FROM role 
-                        WHERE resourceagent_resource_id = %s 
-                            AND role = 'Creator'
-                    """
-                    cursor.execute(delete_role_query, (resource_id,))
-                    deleted_roles = cursor.rowcount
-                    logger.debug(f"Deleted {deleted_roles} role entries")
-                    
-                    # Then delete from resourceagent table
-                    # Get the orders first to delete exact matches
-                    select_orders_query = """
-                        SELECT DISTINCT ra.order 
-                        FROM resourceagent ra
-                        INNER JOIN role r 
-                            ON r.resourceagent_resource_id = ra.resource_id 
-                            AND r.resourceagent_order = ra.order
-                        WHERE ra.resource_id = %s 
-                            AND r.role = 'Creator'
-                    """
-                    cursor.execute(select_orders_query, (resource_id,))
-                    creator_orders = [row['order'] for row in cursor.fetchall()]
-                    
-                    if creator_orders:
-                        # Delete resourceagent entries for these specific orders
-                        placeholders = ','.join(['%s'] * len(creator_orders))
-                        delete_ra_query = f"""
-                            DELETE FROM resourceagent 
-                            WHERE resource_id = %s 
-                                AND `order` IN ({placeholders})
-                        """
-                        cursor.execute(delete_ra_query, (resource_id, *creator_orders))
-                        deleted_agents = cursor.rowcount
-                        logger.debug(f"Deleted {deleted_agents} resourceagent entries")
-                    
-                    # Step 2: Insert new Creator entries
-                    insert_ra_query = """
-                        INSERT INTO resourceagent 
-                        (resource_id, `order`, name, firstname, lastname, identifier, identifiertype, nametype)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    """
+                try:
+                    # Start transaction
+                    connection.begin()
+                    logger.debug(f"Started transaction for resource_id {resource_id}")
                     
-                    insert_role_query = """
-                        INSERT INTO role 
-                        (role, resourceagent_resource_id, resourceagent_order)
-                        VALUES (%s, %s, %s)
-                    """
+                    with connection.cursor() as cursor:
+                        changes = self._write_creators(cursor, resource_id, creators, errors)
                     
-                    for order, creator in enumerate(creators, start=1):
-                        firstname = creator.get('firstname', '').strip()
-                        lastname = creator.get('lastname', '').strip()
-                        orcid_raw = creator.get('orcid', '').strip()
-                        
-                        # Validate required fields
-                        if not lastname:
-                            errors.append(f"Creator {order}: Missing lastname")
-                            continue
-                        
-                        # Normalize ORCID: Remove URL prefix if present
-                        # DataCite: https://orcid.org/0000-0001-5401-6794
-                        # Database: 0000-0001-5401-6794
-                        orcid_id = orcid_raw
-                        if orcid_raw.startswith('https://orcid.org/'):
-                            orcid_id = orcid_raw.replace('https://orcid.org/', '')
-                        elif orcid_raw.startswith('http://orcid.org/'):
-                            orcid_id = orcid_raw.replace('http://orcid.org/', '')
-                        
-                        # Build full name in "Lastname, Firstname" format
-                        if firstname:
-                            name = f"{lastname}, {firstname}"
-                        else:
-                            name = lastname
-                        
-                        # Insert into resourceagent
-                        ra_values = (
-                            resource_id,
-                            order,
-                            name,
-                            firstname,
-                            lastname,
-                            orcid_id if orcid_id else None,
-                            'ORCID' if orcid_id else None,
-                            'Personal'
-                        )
-                        cursor.execute(insert_ra_query, ra_values)
-                        
-                        # Insert into role
-                        role_values = ('Creator', resource_id, order)
-                        cursor.execute(insert_role_query, role_values)
-                        
-                        logger.debug(f"Inserted creator {order}: {name} (ORCID: {orcid_id or 'N/A'})")
-                
-                # Commit transaction
-                connection.commit()
-                message = f"✓ Successfully updated {len(creators)} creators for resource_id {resource_id}"
-                logger.info(message)
-                
-                return True, message, errors
+                    # Commit transaction
+                    connection.commit()
+                except pymysql.Error as e:
+                    # Roll back before the connection goes back to the pool
+                    self._rollback(connection, resource_id, e)
+                    raise
+            
+            message = f"✓ Successfully updated {len(creators)} creators for resource_id {resource_id}"
+            logger.info(f"{message} ({self._describe_changes(changes)})")
+            
+            return True, message, errors
                 
         except pymysql.Error as e:
-            # Rollback on error
-            if connection:
-                try:
-                    connection.rollback()
-                    logger.warning(f"Transaction rolled back for resource_id {resource_id}")
-                except pymysql.Error as rollback_error:
-                    logger.error(f"CRITICAL: Rollback failed: {rollback_error}")
-                    raise TransactionError(f"Transaction failed AND rollback failed: {rollback_error}") from e
-            
             error_msg = f"✗ Database transaction failed: {str(e)}"
             logger.error(error_msg)
             errors.append(str(e))
             return False, error_msg, errors
     
+    def _write_creators(
+        self,
+        cursor,
+        resource_id: int,
+        creators: List[Dict[str, str]],
+        errors: List[str]
+    ) -> Dict[str, List[Tuple]]:
+        """
+        Diff and write the creators of a resource inside the caller's transaction.
+        
+        Returns:
+            The applied changes (see _empty_changes())
+        """
+        agents = self._lock_resource_agents(cursor, resource_id)
+        changes = self._plan_creator_changes(resource_id, agents, creators, errors)
+        self._apply_agent_changes(cursor, changes)
+        return changes
+    
+    def _plan_creator_changes(
+        self,
+        resource_id: int,
+        agents: Dict[int, Dict[str, Any]],
+        creators: List[Dict[str, str]],
+        errors: List[str]
+    ) -> Dict[str, List[Tuple]]:
+        """
+        Compute the minimal set of row changes that turns the current Creators into the new list.
+        
+        Args:
+            resource_id: Resource ID from resource table
+            agents: Current rows as returned by _lock_resource_agents()
+            creators: New creator dicts (see update_creators_transactional())
+            errors: List that validation errors are appended to
+            
+        Returns:
+            Change lists as expected by _apply_agent_changes()
+        """
+        changes = self._empty_changes()
+        
+        # Desired resourceagent values per order (order = position in the creator list)
+        desired = {}
+        for order, creator in enumerate(creators, start=1):
+            firstname = creator.get('firstname', '').strip()
+            lastname = creator.get('lastname', '').strip()
+            orcid_id = self._normalize_orcid(creator.get('orcid', '').strip())
+            
+            # Validate required fields
+            if not lastname:
+                errors.append(f"Creator {order}: Missing lastname")
+                continue
+            
+            # Build full name in "Lastname, Firstname" format
+            if firstname:
+                name = f"{lastname}, {firstname}"
+            else:
+                name = lastname
+            
+            desired[order] = (
+                name,
+                firstname,
+                lastname,
+                orcid_id if orcid_id else None,
+                'ORCID' if orcid_id else None,
+                'Personal'
+            )
+        
+        # Creators that are no longer part of the list
+        for order, agent in agents.items():
+            if 'Creator' not in agent['roles'] or order in desired:
+                continue
+            changes['role_deletes'].append(('Creator', resource_id, order))
+            if agent['roles'] == {'Creator'}:
+                if agent['contactinfo'] is not None:
+                    changes['contactinfo_deletes'].append((resource_id, order))
+                changes['agent_deletes'].append((resource_id, order))
+        
+        for order, values in desired.items():
+            agent = agents.get(order)
+            if agent is None or (agent['roles'] and 'Creator' not in agent['roles']):
+                # New creator. An order taken by a contributor is not overwritten;
+                # the insert fails on the primary key and the transaction is rolled back.
+                changes['agent_inserts'].append((resource_id, order, *values))
+                changes['role_inserts'].append(('Creator', resource_id, order))
+                logger.debug(f"Inserting creator {order}: {values[0]} (ORCID: {values[3] or 'N/A'})")
+                continue
+            
+            if self._agent_changed(agent, values):
+                changes['agent_updates'].append((*values, resource_id, order))
+                logger.debug(f"Updating creator {order}: {values[0]} (ORCID: {values[3] or 'N/A'})")
+            if 'Creator' not in agent['roles']:
+                # Orphaned resourceagent row without any role - reuse it
+                changes['role_inserts'].append(('Creator', resource_id, order))
+        
+        return changes
+    
+    # =========================================================================
+    # Diff Helpers (shared by Creator and Contributor updates)
+    # =========================================================================
+    
+    @staticmethod
+    def _normalize_orcid(orcid_raw: str) -> str:
+        """
+        Remove the URL prefix from an ORCID.
+        
+        DataCite: https://orcid.org/0000-0001-5401-6794
+        Database: 0000-0001-5401-6794
+        """
+        if orcid_raw.startswith('https://orcid.org/'):
+            return orcid_raw.replace('https://orcid.org/', '')
+        if orcid_raw.startswith('http://orcid.org/'):
+            return orcid_raw.replace('http://orcid.org/', '')
+        return orcid_raw
+    
+    def _lock_resource_agents(self, cursor, resource_id: int) -> Dict[int, Dict[str, Any]]:
+        """
+        Read all resourceagent rows of a resource with their roles and contactinfo.
+        
+        Same data as fetch_creators_for_resource() and fetch_contributors_for_resource(),
+        but read inside the caller's transaction with SELECT ... FOR UPDATE, so the
+        rows cannot change between computing the diff and writing it.
+        
+        Args:
+            cursor: Cursor of a connection with an open transaction
+            resource_id: Resource ID from resource table
+            
+        Returns:
+            Dictionary order -> agent dict with the AGENT_FIELDS columns,
+            roles (set of role names, empty for orphaned rows) and
+            contactinfo ((email, website, position) tuple or None)
+        """
+        query = """
+            SELECT 
+                ra.order AS `order`,
+                ra.name,
+                ra.firstname,
+                ra.lastname,
+                ra.identifier,
+                ra.identifiertype,
+                ra.nametype,
+                r.role,
+                ci.resourceagent_order AS contactinfo_order,
+                ci.email,
+                ci.website,
+                ci.position
+            FROM resourceagent ra
+            LEFT JOIN role r 
+                ON r.resourceagent_resource_id = ra.resource_id 
+                AND r.resourceagent_order = ra.order
+            LEFT JOIN contactinfo ci 
+                ON ci.resourceagent_resource_id = ra.resource_id 
+                AND ci.resourceagent_order = ra.order
+            WHERE ra.resource_id = %s
+            ORDER BY ra.order ASC
+            FOR UPDATE
+        """
+        cursor.execute(query, (resource_id,))
+        
+        # One row per (agent, role) - fold them into one entry per order
+        agents = {}
+        for row in cursor.fetchall():
+            agent = agents.get(row['order'])
+            if agent is None:
+                agent = {field: row.get(field) for field in self.AGENT_FIELDS}
+                agent['roles'] = set()
+                agent['contactinfo'] = None
+                agents[row['order']] = agent
+            if row.get('role'):
+                agent['roles'].add(row['role'])
+            if row.get('contactinfo_order') is not None:
+                agent['contactinfo'] = (row.get('email'), row.get('website'), row.get('position'))
+        
+        return agents
+    
+    def _agent_changed(self, agent: Dict[str, Any], values: Tuple) -> bool:
+        """Compare a current resourceagent row with new values (in AGENT_FIELDS order); NULL equals ''."""
+        return any(
+            (agent.get(field) or None) != (value or None)
+            for field, value in zip(self.AGENT_FIELDS, values)
+        )
+    
+    @staticmethod
+    def _empty_changes() -> Dict[str, List[Tuple]]:
+        """Change lists filled by the _plan_* methods, keyed in execution order."""
+        return {
+            'contactinfo_deletes': [],  # (resource_id, order)
+            'role_deletes': [],  # (role, resource_id, order)
+            'agent_deletes': [],  # (resource_id, order)
+            'agent_updates': [],  # (name, firstname, lastname, identifier, identifiertype, nametype, resource_id, order)
+            'agent_inserts': [],  # (resource_id, order, name, firstname, lastname, identifier, identifiertype, nametype)
+            'role_inserts': [],  # (role, resource_id, order)
+            'contactinfo_updates': [],  # (email, website, position, resource_id, order)
+            'contactinfo_inserts': [],  # (resource_id, order, email, website, position)
+        }
+    
+    @staticmethod
+    def _describe_changes(changes: Dict[str, List[Tuple]]) -> str:
+        """Summarize change lists for logging, e.g. '1 agent_updates, 2 role_inserts'."""
+        return ", ".join(f"{len(rows)} {kind}" for kind, rows in changes.items() if rows) or "no changes"
+    
+    @staticmethod
+    def _apply_agent_changes(cursor, changes: Dict[str, List[Tuple]]):
+        """
+        Write planned changes with one executemany() per statement type.
+        
+        Deletes run before updates and inserts, and child rows (contactinfo,
+        role) are deleted before and inserted after their resourceagent row.
+        
+        Args:
+            cursor: Cursor of a connection with an open transaction
+            changes: Change lists as returned by _empty_changes()
+        """
+        queries = {
+            'contactinfo_deletes': """
+                DELETE FROM contactinfo 
+                WHERE resourceagent_resource_id = %s AND resourceagent_order = %s
+            """,
+            'role_deletes': """
+                DELETE FROM role 
+                WHERE role = %s AND resourceagent_resource_id = %s AND resourceagent_order = %s
+            """,
+            'agent_deletes': """
+                DELETE FROM resourceagent 
+                WHERE resource_id = %s AND `order` = %s
+            """,
+            'agent_updates': """
+                UPDATE resourceagent 
+                SET name = %s, firstname = %s, lastname = %s, 
+                    identifier = %s, identifiertype = %s, nametype = %s
+                WHERE resource_id = %s AND `order` = %s
+            """,
+            'agent_inserts': """
+                INSERT INTO resourceagent 
+                (resource_id, `order`, name, firstname, lastname, identifier, identifiertype, nametype)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            """,
+            'role_inserts': """
+                INSERT INTO role 
+                (role, resourceagent_resource_id, resourceagent_order)
+                VALUES (%s, %s, %s)
+            """,
+            'contactinfo_updates': """
+                UPDATE contactinfo 
+                SET email = %s, website = %s, position = %s
+                WHERE resourceagent_resource_id = %s AND resourceagent_order = %s
+            """,
+            'contactinfo_inserts': """
+                INSERT INTO contactinfo 
+                (resourceagent_resource_id, resourceagent_order, email, website, position)
+                VALUES (%s, %s, %s, %s, %s)
+            """,
+        }
+        
+        for kind, rows in changes.items():
+            if rows:
+                cursor.executemany(queries[kind], rows)
+                logger.debug(f"Executed {len(rows)} {kind}")
+    
+    @staticmethod
+    def _rollback(connection, resource_id: int, error: Exception):
+        """
+        Roll back a failed transaction.
+        
+        Raises:
+            TransactionError: If the rollback itself fails
+        """
+        try:
+            connection.rollback()
+            logger.warning(f"Transaction rolled back for resource_id {resource_id}")
+        except pymysql.Error as rollback_error:
+            logger.error(f"CRITICAL: Rollback failed: {rollback_error}")
+            raise TransactionError(f"Transaction failed AND rollback failed: {rollback_error}") from error
+    
     # =========================================================================
     # Publisher Methods
     # =========================================================================
@@ -466,19 +832,13 @@ class SumarioPMDClient:
         if resource_id is None:
             return False, f"DOI {doi} nicht in der Datenbank gefunden"
         
-        query = """
-            UPDATE resource 
-            SET publisher = %s, updated_at = NOW()
-            WHERE identifier = %s
-        """
-        
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cursor:
-                    cursor.execute(query, (publisher_name, doi))
+                    rows_affected = self._write_publisher(cursor, doi, publisher_name)
                     conn.commit()
                     
-                    if cursor.rowcount > 0:
+                    if rows_affected > 0:
                         message = f"✓ Publisher für DOI {doi} aktualisiert: {publisher_name}"
                         logger.info(message)
                         return True, message
@@ -492,9 +852,39 @@ class SumarioPMDClient:
             logger.error(error_msg)
             raise DatabaseError(error_msg) from e
     
+    @staticmethod
+    def _write_publisher(cursor, doi: str, publisher_name: str) -> int:
+        """
+        Set the publisher name of a DOI inside the caller's transaction.
+        
+        Returns:
+            Number of rows changed
+        """
+        query = """
+            UPDATE resource 
+            SET publisher = %s, updated_at = NOW()
+            WHERE identifier = %s
+        """
+        cursor.execute(query, (publisher_name, doi))
+        return cursor.rowcount
+    
     def close_pool(self):
-        """No-op for PyMySQL (connections are created on demand)."""
-        logger.info("Connection cleanup requested (PyMySQL creates connections on demand)")
+        """
+        Close all idle pooled connections.
+        
+        Queries fail with ConnectionError until reopen_pool() is called.
+        """
+        stats = self.pool.get_stats()
+        logger.info(
+            f"Closing database connection pool: {stats['created']} connections opened, "
+            f"{stats['reused']} reuses, {stats['waits']} waits "
+            f"({stats['wait_seconds_total']:.2f}s total)"
+        )
+        self.pool.close()
+    
+    def reopen_pool(self):
+        """Make the client usable again after close_pool(); connections are opened on demand."""
+        self.pool.reopen()
 
     # =========================================================================
     # Contributor Methods (non-Creator roles)
@@ -552,6 +942,71 @@ class SumarioPMDClient:
             logger.error(f"Database error fetching contactinfo for resource_id {resource_id}: {e}")
             raise DatabaseError(f"Failed to fetch contactinfo: {e}") from e
     
+    def iter_contactinfo_for_dois(
+        self,
+        dois: Iterable[str],
+        chunk_size: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream ContactInfo data of many DOIs, regardless of role.
+        
+        Bulk variant of get_resource_id_for_doi() + fetch_all_contactinfo_for_resource():
+        one joined query per chunk of DOIs instead of two queries per DOI.
+        Rows are yielded chunk by chunk, so memory use does not grow with the
+        number of DOIs. A chunk whose query fails is logged with its DOIs and
+        skipped; the remaining chunks are still fetched.
+        
+        Args:
+            dois: DOI strings (duplicates are ignored)
+            chunk_size: DOIs per query (default: RESOURCE_ID_CHUNK_SIZE)
+            
+        Yields:
+            Dictionaries with the keys of fetch_all_contactinfo_for_resource()
+            plus doi (identifier as stored in the resource table)
+        """
+        chunk_size = chunk_size or self.RESOURCE_ID_CHUNK_SIZE
+        identifiers = list(dict.fromkeys(doi.strip() for doi in dois if doi and doi.strip()))
+        
+        for start in range(0, len(identifiers), chunk_size):
+            chunk = identifiers[start:start + chunk_size]
+            placeholders = ', '.join(['%s'] * len(chunk))
+            query = f"""
+                SELECT 
+                    r.identifier AS doi,
+                    ra.firstname,
+                    ra.lastname,
+                    ra.name,
+                    ci.email,
+                    ci.website,
+                    ci.position
+                FROM resource r
+                INNER JOIN resourceagent ra 
+                    ON ra.resource_id = r.id
+                INNER JOIN contactinfo ci 
+                    ON ci.resourceagent_resource_id = ra.resource_id 
+                    AND ci.resourceagent_order = ra.order
+                WHERE r.identifier IN ({placeholders})
+                    AND (ci.email IS NOT NULL OR ci.website IS NOT NULL OR ci.position IS NOT NULL)
+                ORDER BY r.id ASC, ra.order ASC
+            """
+            
+            try:
+                with self.get_connection() as conn:
+                    with conn.cursor() as cursor:
+                        cursor.execute(query, chunk)
+                        rows = cursor.fetchall()
+            except (pymysql.Error, DatabaseError) as e:
+                # One failed chunk must not cost the contactinfo of all other DOIs
+                logger.error(
+                    f"Database error fetching contactinfo for {len(chunk)} DOIs, "
+                    f"they are not enriched: {e} - DOIs: {', '.join(chunk)}"
+                )
+                continue
+            
+            logger.debug(f"Fetched {len(rows)} contactinfo entries for {len(chunk)} DOIs")
+            # The connection is back in the pool before the caller processes the rows
+            yield from rows
+    
     def fetch_contributors_for_resource(self, resource_id: int) -> List[Dict[str, Any]]:
         """
         Fetch all Contributors (non-Creator roles) for a resource.
@@ -674,11 +1129,16 @@ class SumarioPMDClient:
         
         Strategy:
         1. BEGIN TRANSACTION
-        2. Delete existing non-Creator entries (role + contactinfo + resourceagent)
-        3. Insert new contributor entries into resourceagent
-        4. Insert role entries (multiple per contributor if needed)
-        5. Insert contactinfo entries (only for ContactPerson roles)
-        6. COMMIT if successful, ROLLBACK on any error
+        2. Read and lock the current resourceagent rows of the resource
+        3. Match the new contributors by position with the existing contributor
+           entries and write only the differences:
+           - changed resourceagent rows are updated in place
+           - roles and contactinfo (only for ContactPerson roles) are added,
+             updated or removed per entry
+           - surplus contributor entries are removed (role + contactinfo + resourceagent)
+           - additional contributors are appended after the highest order
+             (batched with executemany)
+        4. COMMIT if successful, ROLLBACK on any error
         
         Args:
             resource_id: Resource ID from resource table
@@ -699,205 +1159,217 @@ class SumarioPMDClient:
             TransactionError: If transaction fails and cannot be rolled back
         """
         errors = []
-        connection = None
         
         try:
             with self.get_connection() as connection:
-                # Start transaction
-                connection.begin()
-                logger.debug(f"Started transaction for contributors, resource_id {resource_id}")
-                
-                with connection.cursor() as cursor:
-                    # Step 1: Get existing non-Creator orders to delete
-                    select_orders_query = """
-                        SELECT DISTINCT ra.order 
-                        FROM resourceagent ra
-                        INNER JOIN role r 
-                            ON r.resourceagent_resource_id = ra.resource_id 
-                            AND r.resourceagent_order = ra.order
-                        WHERE ra.resource_id = %s 
-                            AND r.role != 'Creator'
-                    """
-                    cursor.execute(select_orders_query, (resource_id,))
-                    contributor_orders = [row['order'] for row in cursor.fetchall()]
-                    
-                    if contributor_orders:
-                        # Step 2a: Delete from contactinfo first (no FK constraint, but clean up)
-                        placeholders = ','.join(['%s'] * len(contributor_orders))
-                        delete_ci_query = f"""
-                            DELETE FROM contactinfo 
-                            WHERE resourceagent_resource_id = %s 
-                                AND resourceagent_order IN ({placeholders})
-                        """
-                        cursor.execute(delete_ci_query, (resource_id, *contributor_orders))
-                        deleted_ci = cursor.rowcount
-                        logger.debug(f"Deleted {deleted_ci} contactinfo entries")
-                        
-                        # Step 2b: Delete from role table (only non-Creator)
-                        delete_role_query = f"""
-                            DELETE FROM role 
-                            WHERE resourceagent_resource_id = %s 
-                                AND role != 'Creator'
-                                AND resourceagent_order IN ({placeholders})
-                        """
-                        cursor.execute(delete_role_query, (resource_id, *contributor_orders))
-                        deleted_roles = cursor.rowcount
-                        logger.debug(f"Deleted {deleted_roles} role entries")
-                        
-                        # Step 2c: Delete from resourceagent
-                        # But only if the order has NO remaining roles (could still have Creator)
-                        for order in contributor_orders:
-                            # Check if this order still has roles
-                            check_query = """
-                                SELECT COUNT(*) as cnt FROM role 
-                                WHERE resourceagent_resource_id = %s AND resourceagent_order = %s
-                            """
-                            cursor.execute(check_query, (resource_id, order))
-                            remaining = cursor.fetchone()['cnt']
-                            
-                            if remaining == 0:
-                                delete_ra_query = """
-                                    DELETE FROM resourceagent 
-                                    WHERE resource_id = %s AND `order` = %s
-                                """
-                                cursor.execute(delete_ra_query, (resource_id, order))
-                                logger.debug(f"Deleted resourceagent order {order}")
-                    
-                    # Step 3: Determine next order number
-                    # Get max order from existing resourceagent entries
-                    max_order_query = """
-                        SELECT COALESCE(MAX(`order`), 0) as max_order 
-                        FROM resourceagent 
-                        WHERE resource_id = %s
-                    """
-                    cursor.execute(max_order_query, (resource_id,))
-                    max_order = cursor.fetchone()['max_order']
-                    next_order = max_order + 1
-                    
-                    # Step 4: Insert new contributor entries
-                    insert_ra_query = """
-                        INSERT INTO resourceagent 
-                        (resource_id, `order`, name, firstname, lastname, identifier, identifiertype, nametype)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    """
-                    
-                    insert_role_query = """
-                        INSERT INTO role 
-                        (role, resourceagent_resource_id, resourceagent_order)
-                        VALUES (%s, %s, %s)
-                    """
+                try:
+                    # Start transaction
+                    connection.begin()
+                    logger.debug(f"Started transaction for contributors, resource_id {resource_id}")
                     
-                    insert_ci_query = """
-                        INSERT INTO contactinfo 
-                        (resourceagent_resource_id, resourceagent_order, email, website, position)
-                        VALUES (%s, %s, %s, %s, %s)
-                    """
+                    with connection.cursor() as cursor:
+                        changes = self._write_contributors(cursor, resource_id, contributors, errors)
                     
-                    for contributor in contributors:
-                        firstname = contributor.get('firstname', '').strip()
-                        lastname = contributor.get('lastname', '').strip()
-                        orcid_raw = contributor.get('orcid', '').strip()
-                        nametype = contributor.get('nametype', 'Personal').strip()
-                        contributor_types = contributor.get('contributorTypes', '').strip()
-                        email = contributor.get('email', '').strip() or None
-                        website = contributor.get('website', '').strip() or None
-                        position = contributor.get('position', '').strip() or None
-                        
-                        # Validate: need at least lastname or name
-                        name = contributor.get('name', '').strip()
-                        if not lastname and not name:
-                            errors.append(f"Contributor: Missing lastname/name")
-                            continue
-                        
-                        # Normalize ORCID: Remove URL prefix if present
-                        orcid_id = orcid_raw
-                        if orcid_raw.startswith('https://orcid.org/'):
-                            orcid_id = orcid_raw.replace('https://orcid.org/', '')
-                        elif orcid_raw.startswith('http://orcid.org/'):
-                            orcid_id = orcid_raw.replace('http://orcid.org/', '')
-                        
-                        # Build full name in "Lastname, Firstname" format
-                        if not name:
-                            if firstname:
-                                name = f"{lastname}, {firstname}"
-                            else:
-                                name = lastname
-                        
-                        # Parse contributor types
-                        types_list = [t.strip() for t in contributor_types.split(',') if t.strip()]
-                        if not types_list:
-                            types_list = ['Other']
-                        
-                        # Validate types
-                        valid_types = []
-                        for t in types_list:
-                            if t in self.VALID_CONTRIBUTOR_TYPES:
-                                valid_types.append(t)
-                            else:
-                                logger.warning(f"Unknown contributor type: {t}, using 'Other'")
-                                if 'Other' not in valid_types:
-                                    valid_types.append('Other')
-                        
-                        if not valid_types:
-                            valid_types = ['Other']
-                        
-                        # Determine identifier type
-                        identifier_type = None
-                        if orcid_id:
-                            if orcid_id.startswith('https://ror.org/') or 'ror.org' in orcid_id:
-                                identifier_type = 'ROR'
-                            else:
-                                identifier_type = 'ORCID'
-                        
-                        # Insert into resourceagent
-                        ra_values = (
-                            resource_id,
-                            next_order,
-                            name,
-                            firstname if nametype == 'Personal' else None,
-                            lastname if nametype == 'Personal' else None,
-                            orcid_id if orcid_id else None,
-                            identifier_type,
-                            nametype
-                        )
-                        cursor.execute(insert_ra_query, ra_values)
-                        
-                        # Insert roles (one entry per type)
-                        for role_type in valid_types:
-                            role_values = (role_type, resource_id, next_order)
-                            cursor.execute(insert_role_query, role_values)
-                        
-                        # Insert contactinfo if this is a ContactPerson and has email/website
-                        if 'ContactPerson' in valid_types and (email or website or position):
-                            ci_values = (resource_id, next_order, email, website, position)
-                            cursor.execute(insert_ci_query, ci_values)
-                            logger.debug(f"Inserted contactinfo for order {next_order}")
-                        
-                        logger.debug(f"Inserted contributor {next_order}: {name} (Roles: {', '.join(valid_types)})")
-                        next_order += 1
-                
-                # Commit transaction
-                connection.commit()
-                message = f"✓ Successfully updated {len(contributors)} contributors for resource_id {resource_id}"
-                logger.info(message)
-                
-                return True, message, errors
+                    # Commit transaction
+                    connection.commit()
+                except pymysql.Error as e:
+                    # Roll back before the connection goes back to the pool
+                    self._rollback(connection, resource_id, e)
+                    raise
+            
+            message = f"✓ Successfully updated {len(contributors)} contributors for resource_id {resource_id}"
+            logger.info(f"{message} ({self._describe_changes(changes)})")
+            
+            return True, message, errors
                 
         except pymysql.Error as e:
-            # Rollback on error
-            if connection:
-                try:
-                    connection.rollback()
-                    logger.warning(f"Transaction rolled back for resource_id {resource_id}")
-                except pymysql.Error as rollback_error:
-                    logger.error(f"CRITICAL: Rollback failed: {rollback_error}")
-                    raise TransactionError(f"Transaction failed AND rollback failed: {rollback_error}") from e
-            
             error_msg = f"✗ Database transaction failed: {str(e)}"
             logger.error(error_msg)
             errors.append(str(e))
             return False, error_msg, errors
     
+    def _write_contributors(
+        self,
+        cursor,
+        resource_id: int,
+        contributors: List[Dict[str, Any]],
+        errors: List[str]
+    ) -> Dict[str, List[Tuple]]:
+        """
+        Diff and write the contributors of a resource inside the caller's transaction.
+        
+        Returns:
+            The applied changes (see _empty_changes())
+        """
+        agents = self._lock_resource_agents(cursor, resource_id)
+        changes = self._plan_contributor_changes(resource_id, agents, contributors, errors)
+        self._apply_agent_changes(cursor, changes)
+        return changes
+    
+    def _prepare_contributor(self, contributor: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Convert a contributor dict into database values.
+        
+        Returns:
+            Dict with values (tuple in AGENT_FIELDS order), roles (list of valid
+            contributor types) and contactinfo ((email, website, position) or None),
+            or None if the contributor has neither lastname nor name
+        """
+        firstname = contributor.get('firstname', '').strip()
+        lastname = contributor.get('lastname', '').strip()
+        orcid_id = self._normalize_orcid(contributor.get('orcid', '').strip())
+        nametype = contributor.get('nametype', 'Personal').strip()
+        contributor_types = contributor.get('contributorTypes', '').strip()
+        email = contributor.get('email', '').strip() or None
+        website = contributor.get('website', '').strip() or None
+        position = contributor.get('position', '').strip() or None
+        
+        # Validate: need at least lastname or name
+        name = contributor.get('name', '').strip()
+        if not lastname and not name:
+            return None
+        
+        # Build full name in "Lastname, Firstname" format
+        if not name:
+            if firstname:
+                name = f"{lastname}, {firstname}"
+            else:
+                name = lastname
+        
+        # Parse contributor types
+        types_list = [t.strip() for t in contributor_types.split(',') if t.strip()]
+        if not types_list:
+            types_list = ['Other']
+        
+        # Validate types
+        valid_types = []
+        for t in types_list:
+            if t in self.VALID_CONTRIBUTOR_TYPES:
+                if t not in valid_types:
+                    valid_types.append(t)
+            else:
+                logger.warning(f"Unknown contributor type: {t}, using 'Other'")
+                if 'Other' not in valid_types:
+                    valid_types.append('Other')
+        
+        # Determine identifier type
+        identifier_type = None
+        if orcid_id:
+            if orcid_id.startswith('https://ror.org/') or 'ror.org' in orcid_id:
+                identifier_type = 'ROR'
+            else:
+                identifier_type = 'ORCID'
+        
+        # Contactinfo only for ContactPersons with email/website/position
+        contactinfo = None
+        if 'ContactPerson' in valid_types and (email or website or position):
+            contactinfo = (email, website, position)
+        
+        return {
+            'values': (
+                name,
+                firstname if nametype == 'Personal' else None,
+                lastname if nametype == 'Personal' else None,
+                orcid_id if orcid_id else None,
+                identifier_type,
+                nametype
+            ),
+            'roles': valid_types,
+            'contactinfo': contactinfo,
+        }
+    
+    def _plan_contributor_changes(
+        self,
+        resource_id: int,
+        agents: Dict[int, Dict[str, Any]],
+        contributors: List[Dict[str, Any]],
+        errors: List[str]
+    ) -> Dict[str, List[Tuple]]:
+        """
+        Compute the minimal set of row changes that turns the current contributors into the new list.
+        
+        The n-th new contributor is matched with the n-th existing contributor
+        entry (ascending order). Entries that also carry the Creator role are
+        never reused: they only lose their contributor roles, and the
+        contributor is written as a separate entry (as before).
+        
+        Args:
+            resource_id: Resource ID from resource table
+            agents: Current rows as returned by _lock_resource_agents()
+            contributors: New contributor dicts (see update_contributors_transactional())
+            errors: List that validation errors are appended to
+            
+        Returns:
+            Change lists as expected by _apply_agent_changes()
+        """
+        changes = self._empty_changes()
+        
+        desired = []
+        for contributor in contributors:
+            prepared = self._prepare_contributor(contributor)
+            if prepared is None:
+                errors.append(f"Contributor: Missing lastname/name")
+                continue
+            desired.append(prepared)
+        
+        contributor_orders = sorted(
+            order for order, agent in agents.items() if agent['roles'] - {'Creator'}
+        )
+        reusable = [order for order in contributor_orders if 'Creator' not in agents[order]['roles']]
+        shared_with_creator = [order for order in contributor_orders if 'Creator' in agents[order]['roles']]
+        surplus = reusable[len(desired):]
+        
+        # Step 1: Remove contributor entries that are no longer needed
+        for order in shared_with_creator + surplus:
+            agent = agents[order]
+            for role in sorted(agent['roles'] - {'Creator'}):
+                changes['role_deletes'].append((role, resource_id, order))
+            if agent['contactinfo'] is not None:
+                changes['contactinfo_deletes'].append((resource_id, order))
+            if order in surplus:
+                changes['agent_deletes'].append((resource_id, order))
+        
+        # Step 2: Update matched entries in place
+        for order, contributor in zip(reusable, desired):
+            agent = agents[order]
+            values = contributor['values']
+            
+            if self._agent_changed(agent, values):
+                changes['agent_updates'].append((*values, resource_id, order))
+                logger.debug(f"Updating contributor {order}: {values[0]}")
+            
+            for role in sorted(agent['roles'] - set(contributor['roles'])):
+                changes['role_deletes'].append((role, resource_id, order))
+            for role in contributor['roles']:
+                if role not in agent['roles']:
+                    changes['role_inserts'].append((role, resource_id, order))
+            
+            current_ci = agent['contactinfo']
+            new_ci = contributor['contactinfo']
+            if new_ci is None:
+                if current_ci is not None:
+                    changes['contactinfo_deletes'].append((resource_id, order))
+            elif current_ci is None:
+                changes['contactinfo_inserts'].append((resource_id, order, *new_ci))
+            elif tuple(value or None for value in current_ci) != new_ci:
+                changes['contactinfo_updates'].append((*new_ci, resource_id, order))
+        
+        # Step 3: Append additional contributors after the highest remaining order
+        deleted_orders = {order for _, order in changes['agent_deletes']}
+        next_order = max((order for order in agents if order not in deleted_orders), default=0) + 1
+        
+        for contributor in desired[len(reusable):]:
+            values = contributor['values']
+            changes['agent_inserts'].append((resource_id, next_order, *values))
+            for role in contributor['roles']:
+                changes['role_inserts'].append((role, resource_id, next_order))
+            if contributor['contactinfo'] is not None:
+                changes['contactinfo_inserts'].append((resource_id, next_order, *contributor['contactinfo']))
+            logger.debug(f"Inserting contributor {next_order}: {values[0]} (Roles: {', '.join(contributor['roles'])})")
+            next_order += 1
+        
+        return changes
+    
     def upsert_contactinfo(
         self, 
         resource_id: int, 
@@ -1100,6 +1572,76 @@ class SumarioPMDClient:
             logger.error(f"Database error fetching DOIs with downloads: {e}")
             raise DatabaseError(f"Failed to fetch DOIs with downloads: {e}") from e
 
+    def iter_all_dois_with_downloads(self) -> Iterator[Tuple[str, str, str, str, str, int]]:
+        """
+        Stream all DOIs with their download URLs from the file table.
+        
+        Streaming variant of fetch_all_dois_with_downloads(): rows are read
+        from an unbuffered server-side cursor in batches and yielded as plain
+        tuples, so memory use stays constant regardless of the table size.
+        The pooled connection is held until the iteration ends.
+        
+        Yields:
+            Tuples (DOI, Filename, Download_URL, Description, Format, Size_Bytes)
+            
+        Raises:
+            DatabaseError: If the query fails (also while iterating)
+        """
+        query = """
+            SELECT 
+                r.identifier,
+                f.name,
+                f.url,
+                f.description,
+                f.filemimetype,
+                f.size
+            FROM resource r
+            INNER JOIN file f ON f.resource_id = r.id
+            ORDER BY r.identifier ASC, f.name ASC
+        """
+        
+        try:
+            count = 0
+            for row in self._stream_query(query):
+                count += 1
+                yield row
+            logger.info(f"Streamed {count} file entries from database")
+                    
+        except pymysql.Error as e:
+            logger.error(f"Database error streaming DOIs with downloads: {e}")
+            raise DatabaseError(f"Failed to fetch DOIs with downloads: {e}") from e
+    
+    def _stream_query(self, query: str, params: Optional[Tuple] = None) -> Iterator[Tuple]:
+        """
+        Execute a query on an unbuffered cursor and yield its rows as tuples.
+        
+        If the iteration is abandoned early (generator closed), the connection
+        is closed instead of the cursor: closing an unbuffered cursor reads the
+        rest of the result set from the server, while closing the connection
+        aborts the query.
+        
+        Raises:
+            pymysql.Error: If the query or fetching fails
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor(SSCursor)
+            abandoned = False
+            try:
+                cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(self.STREAM_BATCH_SIZE)
+                    if not rows:
+                        break
+                    yield from rows
+            except GeneratorExit:
+                abandoned = True
+                logger.info("Streaming query abandoned, closing its connection")
+                conn.close()
+                raise
+            finally:
+                if not abandoned:
+                    cursor.close()
+    
     def get_file_by_doi_and_filename(self, doi: str, filename: str) -> Optional[Dict[str, Any]]:
         """
         Get a file entry by DOI and filename.
@@ -1222,6 +1764,136 @@ class SumarioPMDClient:
             logger.error(f"Database error updating file: {e}")
             raise DatabaseError(f"Failed to update file entry: {e}") from e
 
+    def fetch_files_for_dois(
+        self,
+        dois: Iterable[str],
+        chunk_size: Optional[int] = None
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Load the file entries of many DOIs at once.
+        
+        All chunks are read inside one transaction, so they come from the same
+        consistent snapshot (InnoDB REPEATABLE READ).
+        
+        Args:
+            dois: DOI identifiers (duplicates are ignored)
+            chunk_size: DOIs per query (default: RESOURCE_ID_CHUNK_SIZE)
+            
+        Returns:
+            Dictionary mapping (lowercase DOI, lowercase filename) to a dictionary
+            with the keys of get_file_by_doi_and_filename() plus doi
+            
+        Raises:
+            DatabaseError: If a query fails
+        """
+        chunk_size = chunk_size or self.RESOURCE_ID_CHUNK_SIZE
+        identifiers = list(dict.fromkeys(doi.strip() for doi in dois if doi and doi.strip()))
+        files: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        
+        if not identifiers:
+            return files
+        
+        try:
+            with self.get_connection() as conn:
+                conn.begin()
+                with conn.cursor() as cursor:
+                    for start in range(0, len(identifiers), chunk_size):
+                        chunk = identifiers[start:start + chunk_size]
+                        placeholders = ', '.join(['%s'] * len(chunk))
+                        query = f"""
+                            SELECT 
+                                r.identifier AS doi,
+                                f.resource_id,
+                                f.name,
+                                f.url,
+                                f.description,
+                                f.filemimetype,
+                                f.size
+                            FROM file f
+                            INNER JOIN resource r ON r.id = f.resource_id
+                            WHERE r.identifier IN ({placeholders})
+                            ORDER BY r.id ASC
+                        """
+                        cursor.execute(query, chunk)
+                        for row in cursor.fetchall():
+                            key = ((row['doi'] or '').strip().lower(), (row['name'] or '').lower())
+                            # Keep the first match like a single-row lookup would
+                            files.setdefault(key, row)
+                conn.commit()
+                    
+        except pymysql.Error as e:
+            logger.error(f"Database error fetching files for {len(identifiers)} DOIs: {e}")
+            raise DatabaseError(f"Failed to fetch file entries: {e}") from e
+        
+        logger.info(f"Fetched {len(files)} file entries for {len(identifiers)} DOIs")
+        return files
+    
+    def update_file_entries(self, updates: List[Dict[str, Any]]) -> int:
+        """
+        Update many file entries in a single transaction.
+        
+        Each update dictionary takes the arguments of update_file_entry():
+        resource_id and filename identify the row; url, description,
+        filemimetype and size are optional and left unchanged if missing or None.
+        Either all updates are committed or none.
+        
+        Args:
+            updates: List of update dictionaries
+            
+        Returns:
+            Number of rows changed
+            
+        Raises:
+            DatabaseError: If the update fails (the transaction is rolled back)
+        """
+        if not updates:
+            return 0
+        
+        # One statement shape for all rows, so executemany can be used;
+        # COALESCE keeps columns that are not part of an update
+        query = """
+            UPDATE file
+            SET url = COALESCE(%s, url),
+                description = COALESCE(%s, description),
+                filemimetype = COALESCE(%s, filemimetype),
+                size = COALESCE(%s, size)
+            WHERE resource_id = %s AND name = %s
+        """
+        params = [
+            (
+                update.get('url'),
+                update.get('description'),
+                update.get('filemimetype'),
+                update.get('size'),
+                update['resource_id'],
+                update['filename']
+            )
+            for update in updates
+        ]
+        
+        try:
+            with self.get_connection() as connection:
+                try:
+                    connection.begin()
+                    with connection.cursor() as cursor:
+                        cursor.executemany(query, params)
+                        rows_affected = cursor.rowcount
+                    connection.commit()
+                except pymysql.Error:
+                    # Roll back before the connection goes back to the pool
+                    try:
+                        connection.rollback()
+                    except pymysql.Error as rollback_error:
+                        logger.error(f"Rollback of file batch update failed: {rollback_error}")
+                    raise
+                
+        except pymysql.Error as e:
+            logger.error(f"Database error updating {len(updates)} file entries: {e}")
+            raise DatabaseError(f"Failed to update file entries: {e}") from e
+        
+        logger.info(f"Updated {len(updates)} file entries in one transaction ({rows_affected} rows changed)")
+        return rows_affected
+    
     def fetch_pending_dois(self) -> List[Tuple[str, str, str]]:
         """
         Fetch all DOIs with status 'pending' along with title and first author.
@@ -1272,4 +1944,204 @@ class SumarioPMDClient:
         except pymysql.Error as e:
             logger.error(f"Database error fetching pending DOIs: {e}")
             raise DatabaseError(f"Failed to fetch pending DOIs: {e}") from e
+    
+    def iter_pending_dois(self) -> Iterator[Tuple[str, str, str]]:
+        """
+        Stream all DOIs with status 'pending' along with title and first author.
+        
+        Streaming variant of fetch_pending_dois() based on an unbuffered
+        server-side cursor; memory use stays constant.
+        
+        Yields:
+            Tuples (doi, title, first_author) as described in fetch_pending_dois()
+            
+        Raises:
+            DatabaseError: If the query fails (also while iterating)
+        """
+        query = """
+            SELECT 
+                COALESCE(r.identifier, ''),
+                COALESCE(t.title, ''),
+                CASE 
+                    WHEN ra.lastname IS NOT NULL AND ra.firstname IS NOT NULL 
+                    THEN CONCAT(ra.lastname, ', ', ra.firstname)
+                    ELSE COALESCE(ra.name, '')
+                END
+            FROM resource r
+            LEFT JOIN title t ON t.resource_id = r.id AND t.titletype IS NULL
+            LEFT JOIN role ro ON ro.resourceagent_resource_id = r.id 
+                AND ro.role = 'Creator' AND ro.resourceagent_order = 1
+            LEFT JOIN resourceagent ra ON ra.resource_id = r.id 
+                AND ra.order = ro.resourceagent_order
+            WHERE r.publicstatus = 'pending'
+            ORDER BY r.identifier
+        """
+        
+        try:
+            count = 0
+            for row in self._stream_query(query):
+                count += 1
+                yield row
+            logger.info(f"Streamed {count} pending DOIs from database")
+                    
+        except pymysql.Error as e:
+            logger.error(f"Database error streaming pending DOIs: {e}")
+            raise DatabaseError(f"Failed to fetch pending DOIs: {e}") from e
+
 
+class TransactionBatch:
+    """
+    Several DOI updates sharing one transaction, each isolated by a SAVEPOINT.
+    
+    Obtained from SumarioPMDClient.batch_transaction(). The update methods
+    mirror the single-DOI methods of the client (same arguments and return
+    values), but nothing is committed until the batch block exits.
+    
+    If a DOI fails, only its savepoint is rolled back. If the savepoint itself
+    cannot be rolled back (e.g. the server aborted the whole transaction after
+    a deadlock), the batch is unusable and every further call raises
+    TransactionError.
+    """
+    
+    def __init__(self, client: SumarioPMDClient, connection):
+        self._client = client
+        self._connection = connection
+        self._savepoints = 0
+        self._aborted: Optional[Exception] = None
+        
+        # Statistics
+        self.updated = 0  # DOIs written (released savepoints)
+        self.failed = 0  # DOIs rolled back to their savepoint
+    
+    def update_creators(
+        self,
+        resource_id: int,
+        creators: List[Dict[str, str]]
+    ) -> Tuple[bool, str, List[str]]:
+        """
+        Update the creators of a resource (see SumarioPMDClient.update_creators_transactional()).
+        
+        Returns:
+            Tuple of (success: bool, message: str, errors: List[str])
+            
+        Raises:
+            TransactionError: If the batch transaction is aborted
+        """
+        errors = []
+        try:
+            changes = self._in_savepoint(
+                lambda cursor: self._client._write_creators(cursor, resource_id, creators, errors)
+            )
+        except pymysql.Error as e:
+            error_msg = f"✗ Database transaction failed: {str(e)}"
+            logger.error(f"{error_msg} (resource_id {resource_id}, rolled back to savepoint)")
+            errors.append(str(e))
+            return False, error_msg, errors
+        
+        message = f"✓ Successfully updated {len(creators)} creators for resource_id {resource_id}"
+        logger.info(f"{message} ({self._client._describe_changes(changes)}, pending batch commit)")
+        return True, message, errors
+    
+    def update_contributors(
+        self,
+        resource_id: int,
+        contributors: List[Dict[str, Any]]
+    ) -> Tuple[bool, str, List[str]]:
+        """
+        Update the contributors of a resource (see SumarioPMDClient.update_contributors_transactional()).
+        
+        Returns:
+            Tuple of (success: bool, message: str, errors: List[str])
+            
+        Raises:
+            TransactionError: If the batch transaction is aborted
+        """
+        errors = []
+        try:
+            changes = self._in_savepoint(
+                lambda cursor: self._client._write_contributors(cursor, resource_id, contributors, errors)
+            )
+        except pymysql.Error as e:
+            error_msg = f"✗ Database transaction failed: {str(e)}"
+            logger.error(f"{error_msg} (resource_id {resource_id}, rolled back to savepoint)")
+            errors.append(str(e))
+            return False, error_msg, errors
+        
+        message = f"✓ Successfully updated {len(contributors)} contributors for resource_id {resource_id}"
+        logger.info(f"{message} ({self._client._describe_changes(changes)}, pending batch commit)")
+        return True, message, errors
+    
+    def update_publisher(self, doi: str, publisher_name: str) -> Tuple[bool, str]:
+        """
+        Update the publisher name of a DOI (see SumarioPMDClient.update_publisher()).
+        
+        Returns:
+            Tuple of (success: bool, message: str)
+            
+        Raises:
+            TransactionError: If the batch transaction is aborted
+            DatabaseError: If the update fails (only this DOI is rolled back)
+        """
+        if not publisher_name:
+            return False, "Publisher-Name darf nicht leer sein"
+        
+        resource_id = self._client.get_resource_id_for_doi(doi)
+        if resource_id is None:
+            return False, f"DOI {doi} nicht in der Datenbank gefunden"
+        
+        try:
+            rows_affected = self._in_savepoint(
+                lambda cursor: self._client._write_publisher(cursor, doi, publisher_name)
+            )
+        except pymysql.Error as e:
+            error_msg = f"✗ Database update failed for {doi}: {str(e)}"
+            logger.error(error_msg)
+            raise DatabaseError(error_msg) from e
+        
+        if rows_affected > 0:
+            message = f"✓ Publisher für DOI {doi} aktualisiert: {publisher_name}"
+            logger.info(f"{message} (pending batch commit)")
+            return True, message
+        
+        message = f"✗ Keine Änderung für DOI {doi}"
+        logger.warning(message)
+        return False, message
+    
+    def _in_savepoint(self, write: Callable[[Any], Any]) -> Any:
+        """
+        Run write(cursor) inside a new savepoint.
+        
+        Returns:
+            Result of write()
+            
+        Raises:
+            pymysql.Error: If write() fails (rolled back to the savepoint)
+            TransactionError: If the batch is aborted or savepoint handling fails
+        """
+        if self._aborted is not None:
+            raise TransactionError(f"Batch transaction aborted: {self._aborted}")
+        
+        self._savepoints += 1
+        name = f"doi_{self._savepoints}"
+        
+        with self._connection.cursor() as cursor:
+            self._execute_savepoint(cursor, f"SAVEPOINT {name}")
+            try:
+                result = write(cursor)
+            except pymysql.Error:
+                self._execute_savepoint(cursor, f"ROLLBACK TO SAVEPOINT {name}")
+                self.failed += 1
+                raise
+            self._execute_savepoint(cursor, f"RELEASE SAVEPOINT {name}")
+        
+        self.updated += 1
+        return result
+    
+    def _execute_savepoint(self, cursor, statement: str):
+        """Execute a savepoint statement; a failure aborts the whole batch."""
+        try:
+            cursor.execute(statement)
+        except pymysql.Error as e:
+            self._aborted = e
+            logger.error(f"CRITICAL: '{statement}' failed, batch transaction aborted: {e}")
+            raise TransactionError(f"Batch transaction aborted ({statement} failed): {e}") from e
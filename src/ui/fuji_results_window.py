@@ -5,7 +5,7 @@ import logging
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, TextIO
+from typing import Any, Dict, Optional, TextIO, Tuple
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QScrollArea,
@@ -15,6 +15,8 @@ from PySide6.QtCore import Qt, Signal, Slot
 from PySide6.QtGui import QFont, QCloseEvent, QDesktopServices
 from PySide6.QtCore import QUrl
 
+from src.api.fuji_client import FAIR_PRINCIPLES, metric_identifier, metric_passed
+from src.api.fuji_response_store import FujiResponseStore, FujiResponseStoreError
 from src.ui.flow_layout import FlowLayout
 from src.ui.fuji_tile import FujiTile
 
@@ -34,7 +36,8 @@ class FujiResultsWindow(QMainWindow):
     - Responsive tile grid that adjusts to window size
     - Dynamic tile sizing based on DOI count
     - Real-time updates as assessments complete
-    - Status bar showing progress
+    - Status bar showing progress and the current number of parallel assessments
+    - Assessment details per tile, loaded on click from a FujiResponseStore
     """
     
     # Signals
@@ -64,6 +67,9 @@ class FujiResultsWindow(QMainWindow):
         self._csv_path: Optional[Path] = None
         self._csv_lock = threading.Lock()  # Thread-safe CSV operations
         
+        # Full F-UJI responses of this run (owned by the window)
+        self._response_store: Optional[FujiResponseStore] = None
+        
         self._setup_ui()
         self._apply_styles()
         
@@ -146,6 +152,14 @@ class FujiResultsWindow(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Bereit")
+        
+        # Adaptive concurrency of the running assessment
+        self.concurrency_label = QLabel("")
+        self.concurrency_label.setToolTip(
+            "Anzahl gleichzeitiger Bewertungen - passt sich an Antwortzeiten "
+            "und Fehlerrate des F-UJI Servers an"
+        )
+        self.status_bar.addPermanentWidget(self.concurrency_label)
     
     def _apply_styles(self):
         """Apply theme-aware styles."""
@@ -216,6 +230,74 @@ class FujiResultsWindow(QMainWindow):
         """
         self.total_dois = total
         self._update_status()
+        
+        # A resumed run may have nothing left to assess
+        if self._is_running and 0 < self.total_dois <= self.completed_count:
+            self._on_assessment_complete()
+    
+    def restore_results(self, scores: Dict[str, float]):
+        """
+        Show the results of an interrupted run at once (resume mode).
+        
+        All tiles are created with updates disabled and sized, averaged and
+        written to the CSV file in one pass instead of once per DOI.
+        
+        Args:
+            scores: Scores by DOI from the checkpoint journal
+        """
+        new_scores = {doi: score for doi, score in scores.items() if doi not in self.tiles}
+        if not new_scores:
+            return
+        
+        self.total_dois = max(self.total_dois, len(self.tiles) + len(new_scores))
+        tile_size = self._calculate_tile_size()
+        
+        self.tiles_container.setUpdatesEnabled(False)
+        try:
+            for doi, score_percent in new_scores.items():
+                tile = FujiTile(doi, score_percent)
+                tile.clicked.connect(self._on_tile_clicked)
+                tile.set_tile_size(tile_size)
+                self.tiles[doi] = tile
+                self.flow_layout.addWidget(tile)
+                self.completed_count += 1
+                if score_percent < 0:
+                    self.error_count += 1
+        finally:
+            self.tiles_container.setUpdatesEnabled(True)
+        
+        self._write_csv_rows(new_scores.items())
+        self._recalculate_tile_sizes()
+        self._update_average_score()
+        self._update_status()
+        self.info_label.setText(
+            f"Setze Bewertung fort: {len(new_scores)} DOIs aus Checkpoint übernommen, "
+            f"lade weitere DOIs..."
+        )
+        
+        logger.info(f"Restored {len(new_scores)} results from checkpoint")
+    
+    def set_response_store(self, response_store: Optional[FujiResponseStore]):
+        """
+        Attach the store the F-UJI client spills the full responses to.
+        
+        The window takes ownership and closes the store when it is closed.
+        
+        Args:
+            response_store: Store with the responses of the current endpoint and metric version
+        """
+        self._response_store = response_store
+    
+    @Slot(int)
+    def set_concurrency(self, concurrency: int):
+        """
+        Show how many assessments currently run in parallel.
+        
+        Args:
+            concurrency: Current limit of the adaptive concurrency controller
+        """
+        if self._is_running:
+            self.concurrency_label.setText(f"Parallele Bewertungen: {concurrency}")
     
     @Slot(str)
     def add_pending_tile(self, doi: str):
@@ -437,6 +519,21 @@ class FujiResultsWindow(QMainWindow):
             except Exception as e:
                 logger.error(f"Failed to write CSV row for {doi}: {e}")
     
+    def _write_csv_rows(self, rows):
+        """Write many (doi, score_percent) rows with a single flush (resume mode)."""
+        with self._csv_lock:
+            if self._csv_writer is None or self._csv_file is None:
+                return
+            
+            try:
+                self._csv_writer.writerows(
+                    [doi, "Fehler" if score_percent < 0 else f"{score_percent:.1f}"]
+                    for doi, score_percent in rows
+                )
+                self._csv_file.flush()
+            except Exception as e:
+                logger.error(f"Failed to write restored CSV rows: {e}")
+    
     def _close_csv(self):
         """Close the CSV file and return the path.
         
@@ -465,6 +562,7 @@ class FujiResultsWindow(QMainWindow):
         """Called when all assessments are complete."""
         self._is_running = False
         self.action_button.setText("Schließen")
+        self.concurrency_label.clear()
         
         # Close CSV file
         csv_path = self._close_csv()
@@ -522,6 +620,7 @@ class FujiResultsWindow(QMainWindow):
                 self._is_running = False
                 self.assessment_cancelled.emit()
                 self.action_button.setText("Schließen")
+                self.concurrency_label.clear()
                 self.info_label.setText("Assessment abgebrochen.")
                 self.status_bar.showMessage("Abgebrochen")
                 
@@ -533,9 +632,67 @@ class FujiResultsWindow(QMainWindow):
             self.close()
     
     def _on_tile_clicked(self, doi: str):
-        """Handle tile click (placeholder for future functionality)."""
+        """Show the assessment details of a DOI, loaded from the response store on demand."""
         logger.debug(f"Tile clicked: {doi}")
-        # Future: Show detailed results dialog
+        
+        response = None
+        if self._response_store is not None:
+            try:
+                response = self._response_store.get(doi)
+            except FujiResponseStoreError as e:
+                logger.warning(f"Could not load F-UJI response of {doi}: {e}")
+        
+        if response is None:
+            QMessageBox.information(
+                self,
+                "FAIR-Details",
+                f"Für {doi} liegen keine Detaildaten vor "
+                f"(noch nicht bewertet oder aus dem Cache übernommen)."
+            )
+            return
+        
+        summary_text, metrics_text = self._format_details(response)
+        box = QMessageBox(self)
+        box.setWindowTitle("FAIR-Details")
+        box.setText(f"{doi}\n\n{summary_text}")
+        box.setDetailedText(metrics_text)
+        box.exec()
+    
+    @staticmethod
+    def _format_details(response: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Format a raw F-UJI response for the details dialog.
+        
+        Args:
+            response: Full API response
+        
+        Returns:
+            (FAIR and per-principle scores, one line per tested metric)
+        """
+        score_percent = response.get('summary', {}).get('score_percent', {})
+        if not isinstance(score_percent, dict):
+            score_percent = {'FAIR': score_percent}
+        
+        summary_lines = []
+        if 'FAIR' in score_percent:
+            summary_lines.append(f"FAIR-Score: {float(score_percent['FAIR']):.1f}%")
+        principles = [
+            f"{p}: {float(score_percent[p]):.1f}%" for p in FAIR_PRINCIPLES if p in score_percent
+        ]
+        if principles:
+            summary_lines.append("   ".join(principles))
+        
+        metric_lines = []
+        for entry in response.get('results', []):
+            if not isinstance(entry, dict):
+                continue
+            status = "bestanden" if metric_passed(entry) else "nicht bestanden"
+            line = f"[{status}] {metric_identifier(entry) or '?'}"
+            if entry.get('metric_name'):
+                line += f": {entry['metric_name']}"
+            metric_lines.append(line)
+        
+        return "\n".join(summary_lines), "\n".join(metric_lines)
     
     def resizeEvent(self, event):
         """Handle window resize."""
@@ -564,5 +721,9 @@ class FujiResultsWindow(QMainWindow):
             if csv_path and csv_path.exists():
                 logger.info(f"CSV export saved on cancel: {csv_path}")
         
+        if self._response_store is not None:
+            self._response_store.close()
+            self._response_store = None
+        
         self.closed.emit()
         event.accept()
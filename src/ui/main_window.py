@@ -5,6 +5,7 @@ import logging
 import os
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
@@ -23,8 +24,12 @@ from src.ui.fuji_results_window import FujiResultsWindow
 from src.ui.flow_layout import FlowLayout
 from src.ui.components import ActionCard, CollapsibleSection
 from src.api.datacite_client import DataCiteClient, DataCiteAPIError, AuthenticationError, NetworkError
+from src.api.metadata_cache import MetadataCache, MetadataCacheError
 from src.api.fuji_client import FujiClient
-from src.utils.csv_exporter import export_dois_to_csv, export_dois_with_creators_to_csv, export_dois_with_publisher_to_csv, export_dois_with_contributors_to_csv, export_dois_with_rights_to_csv, CSVExportError
+from src.api.fuji_result_cache import FujiResultCache, FujiResultCacheError
+from src.api.fuji_response_store import FujiResponseStore, FujiResponseStoreError
+from src.api.fuji_checkpoint import FujiCheckpointJournal, FujiCheckpointError
+from src.utils.csv_exporter import CSVExportError, IncrementalCSVWriter
 from src.utils.csv_parser import SPDXValidationError, LanguageCodeError
 from src.workers.update_worker import UpdateWorker
 from src.workers.authors_update_worker import AuthorsUpdateWorker
@@ -60,16 +65,106 @@ SETTINGS_WINDOW_STATE = "window/state"
 SETTINGS_WINDOW_MAXIMIZED = "window/maximized"
 
 
+def _open_metadata_cache(emit_progress):
+    """
+    Open the local DataCite metadata cache, if enabled in the settings.
+    
+    Args:
+        emit_progress: Callable receiving progress/log messages
+        
+    Returns:
+        MetadataCache instance, or None if the cache is disabled or cannot be opened
+    """
+    settings = QSettings("GFZ", "GROBI")
+    if not settings.value("datacite/metadata_cache", False, type=bool):
+        return None
+    
+    try:
+        cache = MetadataCache()
+    except MetadataCacheError as e:
+        # Continue without cache - the export then pages through the API as before
+        emit_progress(f"[WARNUNG] {str(e)} - Export ohne Cache")
+        return None
+    
+    emit_progress("Lokaler Metadaten-Cache wird mit DataCite abgeglichen...")
+    return cache
+
+
+def _connect_contactinfo_db(emit_progress):
+    """
+    Create a database client for ContactInfo enrichment, if enabled.
+    
+    Args:
+        emit_progress: Callable receiving progress/log messages
+        
+    Returns:
+        SumarioPMDClient instance, or None if the database is disabled,
+        no credentials are saved or the client cannot be created
+    """
+    try:
+        from src.utils.credential_manager import load_db_credentials
+        from src.db.sumariopmd_client import SumarioPMDClient
+        
+        settings = QSettings("GFZ", "GROBI")
+        db_enabled = settings.value("database/enabled", False, type=bool)
+        
+        if not db_enabled:
+            emit_progress("[INFO] Datenbank-Synchronisation deaktiviert - ContactInfo nicht verfügbar")
+            return None
+        
+        db_creds = load_db_credentials()
+        if not db_creds:
+            emit_progress("[INFO] Keine DB-Zugangsdaten gespeichert - ContactInfo nicht verfügbar")
+            return None
+        
+        return SumarioPMDClient(
+            host=db_creds['host'],
+            username=db_creds['username'],
+            password=db_creds['password'],
+            database=db_creds['database']
+        )
+        
+    except Exception as db_error:
+        # Log but don't fail - continue without DB enrichment
+        emit_progress(f"[WARNUNG] ContactInfo konnte nicht geladen werden: {str(db_error)}")
+        return None
+
+
+def _enrich_contributor_page(page, db_client, emit_progress):
+    """
+    Enrich one page of contributor rows with ContactInfo from the database.
+    
+    Database errors are reported via emit_progress and never raised; the
+    pool is closed and the remaining pages are exported with the DataCite
+    data alone.
+    
+    Args:
+        page: List of 14-field contributor tuples
+        db_client: SumarioPMDClient (see _connect_contactinfo_db)
+        emit_progress: Callable receiving progress/log messages
+        
+    Returns:
+        Tuple of (contributor tuples, client for the next page or None after an error)
+    """
+    try:
+        return DataCiteClient.enrich_contributors_with_db_data(page, db_client), db_client
+    except Exception as db_error:
+        # Log but don't fail - continue without DB enrichment
+        emit_progress(f"[WARNUNG] ContactInfo konnte nicht geladen werden: {str(db_error)}")
+        db_client.close_pool()
+        return page, None
+
+
 class DOIFetchWorker(QObject):
     """Worker for fetching DOIs in a separate thread."""
     
     # Signals
     progress = Signal(str)  # Progress message
-    finished = Signal(list, str)  # List of (DOI, URL) tuples and username
+    finished = Signal(str, str, int, int)  # CSV path (empty if no DOIs), username, row count, DOI count
     error = Signal(str)  # Error message
     request_save_credentials = Signal(str, str, str)  # username, password, api_type
     
-    def __init__(self, username, password, use_test_api, credentials_are_new=False):
+    def __init__(self, username, password, use_test_api, credentials_are_new=False, output_dir=None):
         """
         Initialize the worker.
         
@@ -78,34 +173,45 @@ class DOIFetchWorker(QObject):
             password: DataCite password
             use_test_api: Whether to use test API
             credentials_are_new: Whether these are newly entered credentials (not from saved account)
+            output_dir: Directory for the CSV file (default: current working directory)
         """
         super().__init__()
         self.username = username
         self.password = password
         self.use_test_api = use_test_api
         self.credentials_are_new = credentials_are_new
+        self.output_dir = output_dir or os.getcwd()
     
     def run(self):
-        """Fetch DOIs from DataCite API."""
+        """Fetch DOIs from DataCite API and write them to CSV page by page."""
+        cache = None
+        client = None
         try:
             self.progress.emit("Verbindung zur DataCite API wird hergestellt...")
             
+            cache = _open_metadata_cache(self.progress.emit)
             client = DataCiteClient(
                 self.username,
                 self.password,
-                self.use_test_api
+                self.use_test_api,
+                cache=cache
             )
             
-            self.progress.emit("DOIs werden abgerufen...")
-            dois = client.fetch_all_dois()
+            self.progress.emit("DOIs werden abgerufen und exportiert...")
+            
+            # Stream pages straight into the CSV file instead of collecting all rows
+            with IncrementalCSVWriter("urls", self.username, self.output_dir) as writer:
+                for page in client.iter_facet_pages("urls"):
+                    writer.write_rows(page)
             
             # If credentials are new and API call was successful, offer to save them
-            if self.credentials_are_new and dois:
+            if self.credentials_are_new and writer.row_count:
                 api_type = "test" if self.use_test_api else "production"
                 self.request_save_credentials.emit(self.username, self.password, api_type)
             
-            self.progress.emit(f"[OK] {len(dois)} DOIs erfolgreich abgerufen")
-            self.finished.emit(dois, self.username)
+            if writer.row_count:
+                self.progress.emit(f"[OK] {writer.row_count} DOIs erfolgreich abgerufen")
+            self.finished.emit(writer.filepath if writer.row_count else "", self.username, writer.row_count, writer.doi_count)
             
         except AuthenticationError as e:
             self.error.emit(str(e))
@@ -113,8 +219,15 @@ class DOIFetchWorker(QObject):
             self.error.emit(str(e))
         except DataCiteAPIError as e:
             self.error.emit(str(e))
+        except CSVExportError as e:
+            self.error.emit(f"Fehler beim CSV-Export: {str(e)}")
         except Exception as e:
             self.error.emit(f"Unerwarteter Fehler: {str(e)}")
+        finally:
+            if client is not None:
+                client.close()
+            if cache is not None:
+                cache.close()
 
 
 class DOICreatorFetchWorker(QObject):
@@ -122,11 +235,11 @@ class DOICreatorFetchWorker(QObject):
     
     # Signals
     progress = Signal(str)  # Progress message
-    finished = Signal(list, str)  # List of creator tuples and username
+    finished = Signal(str, str, int, int)  # CSV path (empty if no rows), username, row count, DOI count
     error = Signal(str)  # Error message
     request_save_credentials = Signal(str, str, str)  # username, password, api_type
     
-    def __init__(self, username, password, use_test_api, credentials_are_new=False):
+    def __init__(self, username, password, use_test_api, credentials_are_new=False, output_dir=None):
         """
         Initialize the worker.
         
@@ -135,36 +248,45 @@ class DOICreatorFetchWorker(QObject):
             password: DataCite password
             use_test_api: Whether to use test API
             credentials_are_new: Whether these are newly entered credentials (not from saved account)
+            output_dir: Directory for the CSV file (default: current working directory)
         """
         super().__init__()
         self.username = username
         self.password = password
         self.use_test_api = use_test_api
         self.credentials_are_new = credentials_are_new
+        self.output_dir = output_dir or os.getcwd()
     
     def run(self):
-        """Fetch DOIs with creator information from DataCite API."""
+        """Fetch DOIs with creator information from DataCite API and write them to CSV page by page."""
+        cache = None
+        client = None
         try:
             self.progress.emit("Verbindung zur DataCite API wird hergestellt...")
             
+            cache = _open_metadata_cache(self.progress.emit)
             client = DataCiteClient(
                 self.username,
                 self.password,
-                self.use_test_api
+                self.use_test_api,
+                cache=cache
             )
             
-            self.progress.emit("DOIs und Autoren werden abgerufen...")
-            creator_data = client.fetch_all_dois_with_creators()
+            self.progress.emit("DOIs und Autoren werden abgerufen und exportiert...")
+            
+            # Stream pages straight into the CSV file instead of collecting all rows
+            with IncrementalCSVWriter("creators", self.username, self.output_dir) as writer:
+                for page in client.iter_facet_pages("creators"):
+                    writer.write_rows(page)
             
             # If credentials are new and API call was successful, offer to save them
-            if self.credentials_are_new and creator_data:
+            if self.credentials_are_new and writer.row_count:
                 api_type = "test" if self.use_test_api else "production"
                 self.request_save_credentials.emit(self.username, self.password, api_type)
             
-            # Count unique DOIs for better user feedback
-            unique_dois = len(set(row[0] for row in creator_data))
-            self.progress.emit(f"[OK] {unique_dois} DOIs mit {len(creator_data)} Autoren erfolgreich abgerufen")
-            self.finished.emit(creator_data, self.username)
+            if writer.row_count:
+                self.progress.emit(f"[OK] {writer.doi_count} DOIs mit {writer.row_count} Autoren erfolgreich abgerufen")
+            self.finished.emit(writer.filepath if writer.row_count else "", self.username, writer.row_count, writer.doi_count)
             
         except AuthenticationError as e:
             self.error.emit(str(e))
@@ -172,8 +294,15 @@ class DOICreatorFetchWorker(QObject):
             self.error.emit(str(e))
         except DataCiteAPIError as e:
             self.error.emit(str(e))
+        except CSVExportError as e:
+            self.error.emit(f"Fehler beim CSV-Export: {str(e)}")
         except Exception as e:
             self.error.emit(f"Unerwarteter Fehler: {str(e)}")
+        finally:
+            if client is not None:
+                client.close()
+            if cache is not None:
+                cache.close()
 
 
 class DOIPublisherFetchWorker(QObject):
@@ -181,11 +310,11 @@ class DOIPublisherFetchWorker(QObject):
     
     # Signals
     progress = Signal(str)  # Progress message
-    finished = Signal(list, str, int)  # List of publisher tuples, username, warnings count
+    finished = Signal(str, str, int, int)  # CSV path (empty if no rows), username, row count, warnings count
     error = Signal(str)  # Error message
     request_save_credentials = Signal(str, str, str)  # username, password, api_type
     
-    def __init__(self, username, password, use_test_api, credentials_are_new=False):
+    def __init__(self, username, password, use_test_api, credentials_are_new=False, output_dir=None):
         """
         Initialize the worker.
         
@@ -194,35 +323,45 @@ class DOIPublisherFetchWorker(QObject):
             password: DataCite password
             use_test_api: Whether to use test API
             credentials_are_new: Whether these are newly entered credentials (not from saved account)
+            output_dir: Directory for the CSV file (default: current working directory)
         """
         super().__init__()
         self.username = username
         self.password = password
         self.use_test_api = use_test_api
         self.credentials_are_new = credentials_are_new
+        self.output_dir = output_dir or os.getcwd()
     
     def run(self):
-        """Fetch DOIs with publisher information from DataCite API."""
+        """Fetch DOIs with publisher information from DataCite API and write them to CSV page by page."""
+        cache = None
+        client = None
         try:
             self.progress.emit("Verbindung zur DataCite API wird hergestellt...")
             
+            cache = _open_metadata_cache(self.progress.emit)
             client = DataCiteClient(
                 self.username,
                 self.password,
-                self.use_test_api
+                self.use_test_api,
+                cache=cache
             )
             
-            self.progress.emit("DOIs und Publisher-Metadaten werden abgerufen...")
-            publisher_data = client.fetch_all_dois_with_publisher()
+            self.progress.emit("DOIs und Publisher-Metadaten werden abgerufen und exportiert...")
+            
+            # Stream pages straight into the CSV file instead of collecting all rows
+            with IncrementalCSVWriter("publisher", self.username, self.output_dir) as writer:
+                for page in client.iter_facet_pages("publisher"):
+                    writer.write_rows(page)
             
             # If credentials are new and API call was successful, offer to save them
-            if self.credentials_are_new and publisher_data:
+            if self.credentials_are_new and writer.row_count:
                 api_type = "test" if self.use_test_api else "production"
                 self.request_save_credentials.emit(self.username, self.password, api_type)
             
-            self.progress.emit(f"[OK] {len(publisher_data)} DOIs mit Publisher-Daten erfolgreich abgerufen")
-            # warnings_count will be calculated during export
-            self.finished.emit(publisher_data, self.username, 0)
+            if writer.row_count:
+                self.progress.emit(f"[OK] {writer.row_count} DOIs mit Publisher-Daten erfolgreich abgerufen")
+            self.finished.emit(writer.filepath if writer.row_count else "", self.username, writer.row_count, writer.warnings_count)
             
         except AuthenticationError as e:
             self.error.emit(str(e))
@@ -230,8 +369,15 @@ class DOIPublisherFetchWorker(QObject):
             self.error.emit(str(e))
         except DataCiteAPIError as e:
             self.error.emit(str(e))
+        except CSVExportError as e:
+            self.error.emit(f"Fehler beim CSV-Export: {str(e)}")
         except Exception as e:
             self.error.emit(f"Unerwarteter Fehler: {str(e)}")
+        finally:
+            if client is not None:
+                client.close()
+            if cache is not None:
+                cache.close()
 
 
 class DOIContributorFetchWorker(QObject):
@@ -239,11 +385,11 @@ class DOIContributorFetchWorker(QObject):
     
     # Signals
     progress = Signal(str)  # Progress message
-    finished = Signal(list, str)  # List of contributor tuples and username
+    finished = Signal(str, str, int, int)  # CSV path (empty if no rows), username, row count, DOI count
     error = Signal(str)  # Error message
     request_save_credentials = Signal(str, str, str)  # username, password, api_type
     
-    def __init__(self, username, password, use_test_api, credentials_are_new=False):
+    def __init__(self, username, password, use_test_api, credentials_are_new=False, output_dir=None):
         """
         Initialize the worker.
         
@@ -252,72 +398,53 @@ class DOIContributorFetchWorker(QObject):
             password: DataCite password
             use_test_api: Whether to use test API
             credentials_are_new: Whether these are newly entered credentials (not from saved account)
+            output_dir: Directory for the CSV file (default: current working directory)
         """
         super().__init__()
         self.username = username
         self.password = password
         self.use_test_api = use_test_api
         self.credentials_are_new = credentials_are_new
+        self.output_dir = output_dir or os.getcwd()
     
     def run(self):
-        """Fetch DOIs with contributor information from DataCite API."""
+        """Fetch DOIs with contributor information from DataCite API and write them to CSV page by page."""
+        cache = None
+        client = None
+        db_client = None
         try:
             self.progress.emit("Verbindung zur DataCite API wird hergestellt...")
             
+            cache = _open_metadata_cache(self.progress.emit)
             client = DataCiteClient(
                 self.username,
                 self.password,
-                self.use_test_api
+                self.use_test_api,
+                cache=cache
             )
             
-            self.progress.emit("DOIs und Contributors werden abgerufen...")
-            contributor_data = client.fetch_all_dois_with_contributors()
+            # Enrich each page with ContactInfo if DB is enabled and credentials are saved
+            db_client = _connect_contactinfo_db(self.progress.emit)
+            if db_client is not None:
+                self.progress.emit("ContactInfo aus Datenbank wird pro Seite ergänzt...")
+            
+            self.progress.emit("DOIs und Contributors werden abgerufen und exportiert...")
+            
+            # Stream pages straight into the CSV file instead of collecting all rows
+            with IncrementalCSVWriter("contributors", self.username, self.output_dir) as writer:
+                for page in client.iter_facet_pages("contributors"):
+                    if db_client is not None:
+                        page, db_client = _enrich_contributor_page(page, db_client, self.progress.emit)
+                    writer.write_rows(page)
             
             # If credentials are new and API call was successful, offer to save them
-            if self.credentials_are_new and contributor_data:
+            if self.credentials_are_new and writer.row_count:
                 api_type = "test" if self.use_test_api else "production"
                 self.request_save_credentials.emit(self.username, self.password, api_type)
             
-            # Try to enrich with database data if DB is enabled and credentials are saved
-            if contributor_data:
-                try:
-                    from PySide6.QtCore import QSettings
-                    from src.utils.credential_manager import load_db_credentials
-                    from src.db.sumariopmd_client import SumarioPMDClient
-                    
-                    settings = QSettings("GFZ", "GROBI")
-                    db_enabled = settings.value("database/enabled", False, type=bool)
-                    
-                    if db_enabled:
-                        db_creds = load_db_credentials()
-                        if db_creds:
-                            self.progress.emit("ContactInfo aus Datenbank wird abgerufen...")
-                            
-                            db_client = SumarioPMDClient(
-                                host=db_creds['host'],
-                                username=db_creds['username'],
-                                password=db_creds['password'],
-                                database=db_creds['database']
-                            )
-                            
-                            contributor_data = DataCiteClient.enrich_contributors_with_db_data(
-                                contributor_data, db_client
-                            )
-                            
-                            self.progress.emit("ContactInfo erfolgreich hinzugefügt")
-                        else:
-                            self.progress.emit("[INFO] Keine DB-Zugangsdaten gespeichert - ContactInfo nicht verfügbar")
-                    else:
-                        self.progress.emit("[INFO] Datenbank-Synchronisation deaktiviert - ContactInfo nicht verfügbar")
-                        
-                except Exception as db_error:
-                    # Log but don't fail - continue without DB enrichment
-                    self.progress.emit(f"[WARNUNG] ContactInfo konnte nicht geladen werden: {str(db_error)}")
-            
-            # Count unique DOIs for better user feedback
-            unique_dois = len(set(row[0] for row in contributor_data))
-            self.progress.emit(f"[OK] {unique_dois} DOIs mit {len(contributor_data)} Contributors erfolgreich abgerufen")
-            self.finished.emit(contributor_data, self.username)
+            if writer.row_count:
+                self.progress.emit(f"[OK] {writer.doi_count} DOIs mit {writer.row_count} Contributors erfolgreich abgerufen")
+            self.finished.emit(writer.filepath if writer.row_count else "", self.username, writer.row_count, writer.doi_count)
             
         except AuthenticationError as e:
             self.error.emit(str(e))
@@ -325,8 +452,17 @@ class DOIContributorFetchWorker(QObject):
             self.error.emit(str(e))
         except DataCiteAPIError as e:
             self.error.emit(str(e))
+        except CSVExportError as e:
+            self.error.emit(f"Fehler beim CSV-Export: {str(e)}")
         except Exception as e:
             self.error.emit(f"Unerwarteter Fehler: {str(e)}")
+        finally:
+            if client is not None:
+                client.close()
+            if cache is not None:
+                cache.close()
+            if db_client is not None:
+                db_client.close_pool()
 
 
 class DOIRightsFetchWorker(QObject):
@@ -334,11 +470,11 @@ class DOIRightsFetchWorker(QObject):
     
     # Signals
     progress = Signal(str)  # Progress message
-    finished = Signal(list, str)  # List of rights tuples and username
+    finished = Signal(str, str, int, int)  # CSV path (empty if no rows), username, row count, DOI count
     error = Signal(str)  # Error message
     request_save_credentials = Signal(str, str, str)  # username, password, api_type
     
-    def __init__(self, username, password, use_test_api, credentials_are_new=False):
+    def __init__(self, username, password, use_test_api, credentials_are_new=False, output_dir=None):
         """
         Initialize the worker.
         
@@ -347,36 +483,45 @@ class DOIRightsFetchWorker(QObject):
             password: DataCite password
             use_test_api: Whether to use test API
             credentials_are_new: Whether these are newly entered credentials (not from saved account)
+            output_dir: Directory for the CSV file (default: current working directory)
         """
         super().__init__()
         self.username = username
         self.password = password
         self.use_test_api = use_test_api
         self.credentials_are_new = credentials_are_new
+        self.output_dir = output_dir or os.getcwd()
     
     def run(self):
-        """Fetch DOIs with rights information from DataCite API."""
+        """Fetch DOIs with rights information from DataCite API and write them to CSV page by page."""
+        cache = None
+        client = None
         try:
             self.progress.emit("Verbindung zur DataCite API wird hergestellt...")
             
+            cache = _open_metadata_cache(self.progress.emit)
             client = DataCiteClient(
                 self.username,
                 self.password,
-                self.use_test_api
+                self.use_test_api,
+                cache=cache
             )
             
-            self.progress.emit("DOIs und Rights werden abgerufen...")
-            rights_data = client.fetch_all_dois_with_rights()
+            self.progress.emit("DOIs und Rights werden abgerufen und exportiert...")
+            
+            # Stream pages straight into the CSV file instead of collecting all rows
+            with IncrementalCSVWriter("rights", self.username, self.output_dir) as writer:
+                for page in client.iter_facet_pages("rights"):
+                    writer.write_rows(page)
             
             # If credentials are new and API call was successful, offer to save them
-            if self.credentials_are_new and rights_data:
+            if self.credentials_are_new and writer.row_count:
                 api_type = "test" if self.use_test_api else "production"
                 self.request_save_credentials.emit(self.username, self.password, api_type)
             
-            # Count unique DOIs for better user feedback
-            unique_dois = len(set(row[0] for row in rights_data))
-            self.progress.emit(f"[OK] {unique_dois} DOIs mit {len(rights_data)} Rights-Einträgen erfolgreich abgerufen")
-            self.finished.emit(rights_data, self.username)
+            if writer.row_count:
+                self.progress.emit(f"[OK] {writer.doi_count} DOIs mit {writer.row_count} Rights-Einträgen erfolgreich abgerufen")
+            self.finished.emit(writer.filepath if writer.row_count else "", self.username, writer.row_count, writer.doi_count)
             
         except AuthenticationError as e:
             self.error.emit(str(e))
@@ -384,8 +529,128 @@ class DOIRightsFetchWorker(QObject):
             self.error.emit(str(e))
         except DataCiteAPIError as e:
             self.error.emit(str(e))
+        except CSVExportError as e:
+            self.error.emit(f"Fehler beim CSV-Export: {str(e)}")
         except Exception as e:
             self.error.emit(f"Unerwarteter Fehler: {str(e)}")
+        finally:
+            if client is not None:
+                client.close()
+            if cache is not None:
+                cache.close()
+
+
+class DOIAllFacetsFetchWorker(QObject):
+    """Worker for exporting all metadata facets from a single pagination pass."""
+    
+    FACETS = ("urls", "creators", "publisher", "contributors", "rights")
+    
+    # Signals
+    progress = Signal(str)  # Progress message
+    finished = Signal(dict, str, int)  # Facet -> (CSV path or "", row count, error message or ""), username, DOI count
+    error = Signal(str)  # Error message
+    request_save_credentials = Signal(str, str, str)  # username, password, api_type
+    
+    def __init__(self, username, password, use_test_api, credentials_are_new=False, output_dir=None):
+        """
+        Initialize the worker.
+        
+        Args:
+            username: DataCite username
+            password: DataCite password
+            use_test_api: Whether to use test API
+            credentials_are_new: Whether these are newly entered credentials (not from saved account)
+            output_dir: Directory for the CSV files (default: current working directory)
+        """
+        super().__init__()
+        self.username = username
+        self.password = password
+        self.use_test_api = use_test_api
+        self.credentials_are_new = credentials_are_new
+        self.output_dir = output_dir or os.getcwd()
+    
+    def run(self):
+        """Fetch URLs, creators, publisher, contributors and rights in one pass and write one CSV per facet page by page."""
+        cache = None
+        client = None
+        db_client = None
+        writers = {}
+        errors = {}
+        try:
+            self.progress.emit("Verbindung zur DataCite API wird hergestellt...")
+            
+            cache = _open_metadata_cache(self.progress.emit)
+            client = DataCiteClient(
+                self.username,
+                self.password,
+                self.use_test_api,
+                cache=cache
+            )
+            
+            # Enrich each contributor page with ContactInfo if DB is enabled and credentials are saved
+            db_client = _connect_contactinfo_db(self.progress.emit)
+            if db_client is not None:
+                self.progress.emit("ContactInfo aus Datenbank wird pro Seite ergänzt...")
+            
+            self.progress.emit("Alle Metadaten werden in einem Durchlauf abgerufen und exportiert...")
+            
+            # One writer per facet; every page of the single pass goes straight into the files
+            writers = {facet: IncrementalCSVWriter(facet, self.username, self.output_dir) for facet in self.FACETS}
+            for page in client.iter_harvest_pages(progress_callback=self.progress.emit):
+                if db_client is not None:
+                    page["contributors"], db_client = _enrich_contributor_page(
+                        page["contributors"], db_client, self.progress.emit
+                    )
+                for facet, writer in writers.items():
+                    if facet in errors:
+                        continue
+                    try:
+                        writer.write_rows(page[facet])
+                    except CSVExportError as e:
+                        # A failing file must not stop the other exports
+                        writer.abort()
+                        errors[facet] = str(e)
+            
+            results = {}
+            for facet, writer in writers.items():
+                filepath = ""
+                if facet not in errors:
+                    try:
+                        filepath = writer.close() or ""
+                    except CSVExportError as e:
+                        errors[facet] = str(e)
+                results[facet] = (filepath, writer.row_count, errors.get(facet, ""))
+            writers = {}
+            
+            doi_count = results["urls"][1]
+            
+            # If credentials are new and API call was successful, offer to save them
+            if self.credentials_are_new and doi_count:
+                api_type = "test" if self.use_test_api else "production"
+                self.request_save_credentials.emit(self.username, self.password, api_type)
+            
+            if doi_count:
+                self.progress.emit(f"[OK] {doi_count} DOIs mit allen Metadaten erfolgreich abgerufen")
+            self.finished.emit(results, self.username, doi_count)
+            
+        except AuthenticationError as e:
+            self.error.emit(str(e))
+        except NetworkError as e:
+            self.error.emit(str(e))
+        except DataCiteAPIError as e:
+            self.error.emit(str(e))
+        except Exception as e:
+            self.error.emit(f"Unerwarteter Fehler: {str(e)}")
+        finally:
+            # Writers still open here belong to an aborted harvest
+            for writer in writers.values():
+                writer.abort()
+            if client is not None:
+                client.close()
+            if cache is not None:
+                cache.close()
+            if db_client is not None:
+                db_client.close_pool()
 
 
 class MainWindow(QMainWindow):
@@ -453,6 +718,10 @@ class MainWindow(QMainWindow):
         self.rights_update_thread = None
         self.rights_update_worker = None
         
+        # Thread and worker for one-pass export of all metadata
+        self.export_all_thread = None
+        self.export_all_worker = None
+        
         # Flag to prevent double dialogs on rights update errors
         self._rights_update_had_critical_error = False
         
@@ -488,6 +757,15 @@ class MainWindow(QMainWindow):
         csv_splitter_action.triggered.connect(self._open_csv_splitter)
         tools_menu.addAction(csv_splitter_action)
         
+        export_all_action = QAction("Alle Metadaten exportieren...", self)
+        export_all_action.setShortcut("Ctrl+Shift+E")
+        export_all_action.setToolTip(
+            "Exportiert Landing Page URLs, Autoren, Publisher, Contributors und Rights "
+            "in einem einzigen Durchlauf durch die DataCite API."
+        )
+        export_all_action.triggered.connect(self._on_export_all_clicked)
+        tools_menu.addAction(export_all_action)
+        
         # Einstellungen-Menü
         settings_menu = menubar.addMenu("Einstellungen")
         
@@ -1483,15 +1761,19 @@ class MainWindow(QMainWindow):
         # Start the thread
         self.thread.start()
     
-    def _on_fetch_finished(self, dois, username):
+    def _on_fetch_finished(self, filepath, username, row_count, doi_count):
         """
-        Handle successful DOI fetch.
+        Handle finished DOI export.
+        
+        The worker already wrote the CSV file while fetching the pages.
         
         Args:
-            dois: List of (DOI, URL) tuples
+            filepath: Path to the created CSV file, or empty string if nothing was found
             username: DataCite username
+            row_count: Number of exported rows
+            doi_count: Number of exported DOIs
         """
-        if not dois:
+        if not filepath:
             self._log("[WARNUNG] Keine DOIs gefunden.")
             QMessageBox.information(
                 self,
@@ -1500,32 +1782,19 @@ class MainWindow(QMainWindow):
             )
             return
         
-        # Export to CSV
-        try:
-            output_dir = os.getcwd()
-            filepath = export_dois_to_csv(dois, username, output_dir)
-            
-            self._log(f"[OK] CSV-Datei erfolgreich erstellt: {filepath}")
-            
-            # Update username and check CSV files
-            self._current_username = username
-            self._check_csv_files()
-            
-            QMessageBox.information(
-                self,
-                "Erfolg",
-                f"{len(dois)} DOIs wurden erfolgreich exportiert.\n\n"
-                f"Datei: {Path(filepath).name}\n"
-                f"Verzeichnis: {output_dir}"
-            )
-            
-        except CSVExportError as e:
-            self._log(f"[FEHLER] Fehler beim CSV-Export: {str(e)}")
-            QMessageBox.critical(
-                self,
-                "CSV-Export Fehler",
-                f"Die CSV-Datei konnte nicht erstellt werden:\n\n{str(e)}"
-            )
+        self._log(f"[OK] CSV-Datei erfolgreich erstellt: {filepath}")
+        
+        # Update username and check CSV files
+        self._current_username = username
+        self._check_csv_files()
+        
+        QMessageBox.information(
+            self,
+            "Erfolg",
+            f"{row_count} DOIs wurden erfolgreich exportiert.\n\n"
+            f"Datei: {Path(filepath).name}\n"
+            f"Verzeichnis: {Path(filepath).parent}"
+        )
     
     def _on_fetch_error(self, error_message):
         """
@@ -1618,15 +1887,19 @@ class MainWindow(QMainWindow):
         # Start the thread
         self.creator_thread.start()
     
-    def _on_creator_fetch_finished(self, creator_data, username):
+    def _on_creator_fetch_finished(self, filepath, username, row_count, doi_count):
         """
-        Handle successful creator fetch.
+        Handle finished creator export.
+        
+        The worker already wrote the CSV file while fetching the pages.
         
         Args:
-            creator_data: List of creator tuples (DOI, Creator Name, Name Type, etc.)
+            filepath: Path to the created CSV file, or empty string if nothing was found
             username: DataCite username
+            row_count: Number of exported rows
+            doi_count: Number of DOIs with creators
         """
-        if not creator_data:
+        if not filepath:
             self._log("[WARNUNG] Keine DOIs mit Autoren gefunden.")
             QMessageBox.information(
                 self,
@@ -1635,35 +1908,19 @@ class MainWindow(QMainWindow):
             )
             return
         
-        # Export to CSV
-        try:
-            output_dir = os.getcwd()
-            filepath = export_dois_with_creators_to_csv(creator_data, username, output_dir)
-            
-            # Count unique DOIs
-            unique_dois = len(set(row[0] for row in creator_data))
-            
-            self._log(f"[OK] CSV-Datei erfolgreich erstellt: {filepath}")
-            
-            # Update username and check CSV files
-            self._current_username = username
-            self._check_csv_files()
-            
-            QMessageBox.information(
-                self,
-                "Erfolg",
-                f"{unique_dois} DOIs mit {len(creator_data)} Autoren wurden erfolgreich exportiert.\n\n"
-                f"Datei: {Path(filepath).name}\n"
-                f"Verzeichnis: {output_dir}"
-            )
-            
-        except CSVExportError as e:
-            self._log(f"[FEHLER] Fehler beim CSV-Export: {str(e)}")
-            QMessageBox.critical(
-                self,
-                "Fehler beim Export",
-                f"Die CSV-Datei konnte nicht erstellt werden:\n\n{str(e)}"
-            )
+        self._log(f"[OK] CSV-Datei erfolgreich erstellt: {filepath}")
+        
+        # Update username and check CSV files
+        self._current_username = username
+        self._check_csv_files()
+        
+        QMessageBox.information(
+            self,
+            "Erfolg",
+            f"{doi_count} DOIs mit {row_count} Autoren wurden erfolgreich exportiert.\n\n"
+            f"Datei: {Path(filepath).name}\n"
+            f"Verzeichnis: {Path(filepath).parent}"
+        )
     
     def _on_creator_fetch_error(self, error_message):
         """
@@ -1714,8 +1971,14 @@ class MainWindow(QMainWindow):
         self._set_buttons_enabled(False)
         self.progress_bar.setVisible(True)
         
+        # Bulk URL diff: compare against one paginated harvest instead of per-DOI metadata
+        settings = QSettings("GFZ", "GROBI")
+        bulk_diff = settings.value("datacite/bulk_url_diff", False, type=bool)
+        
         # Create worker and thread
-        self.update_worker = UpdateWorker(username, password, csv_path, use_test_api, credentials_are_new)
+        self.update_worker = UpdateWorker(
+            username, password, csv_path, use_test_api, credentials_are_new, bulk_diff=bulk_diff
+        )
         self.update_thread = QThread()
         self.update_worker.moveToThread(self.update_thread)
         
@@ -2108,7 +2371,8 @@ class MainWindow(QMainWindow):
         
         # Create new worker with dry_run_only=False
         self.authors_update_worker = AuthorsUpdateWorker(
-            username, password, csv_path, use_test_api, dry_run_only=False, credentials_are_new=credentials_are_new
+            username, password, csv_path, use_test_api, dry_run_only=False, credentials_are_new=credentials_are_new,
+            db_batch_size=AuthorsUpdateWorker.DB_BATCH_SIZE
         )
         self.authors_update_thread = QThread()
         self.authors_update_worker.moveToThread(self.authors_update_thread)
@@ -2379,16 +2643,19 @@ class MainWindow(QMainWindow):
         # Start the thread
         self.publisher_thread.start()
     
-    def _on_publisher_fetch_finished(self, publisher_data, username, _warnings_count):
+    def _on_publisher_fetch_finished(self, filepath, username, row_count, warnings_count):
         """
-        Handle successful publisher fetch.
+        Handle finished publisher export.
+        
+        The worker already wrote the CSV file while fetching the pages.
         
         Args:
-            publisher_data: List of publisher tuples (DOI, Name, Identifier, ...)
+            filepath: Path to the created CSV file, or empty string if nothing was found
             username: DataCite username
-            _warnings_count: Ignored, we calculate warnings during export
+            row_count: Number of exported rows
+            warnings_count: Number of DOIs without publisherIdentifier
         """
-        if not publisher_data:
+        if not filepath:
             self._log("[WARNUNG] Keine DOIs mit Publisher-Daten gefunden.")
             QMessageBox.information(
                 self,
@@ -2397,41 +2664,28 @@ class MainWindow(QMainWindow):
             )
             return
         
-        # Export to CSV
-        try:
-            output_dir = os.getcwd()
-            filepath, warnings_count = export_dois_with_publisher_to_csv(publisher_data, username, output_dir)
-            
-            self._log(f"[OK] CSV-Datei erfolgreich erstellt: {filepath}")
-            
-            if warnings_count > 0:
-                self._log(f"[WARNUNG] {warnings_count} DOI(s) ohne Publisher Identifier")
-            
-            # Update username and check CSV files
-            self._current_username = username
-            self._check_csv_files()
-            
-            message = (
-                f"{len(publisher_data)} DOIs mit Publisher-Daten wurden erfolgreich exportiert.\n\n"
-                f"Datei: {Path(filepath).name}\n"
-                f"Verzeichnis: {output_dir}"
-            )
-            if warnings_count > 0:
-                message += f"\n\n⚠️ {warnings_count} DOI(s) haben keinen Publisher Identifier."
-            
-            QMessageBox.information(
-                self,
-                "Erfolg",
-                message
-            )
-            
-        except CSVExportError as e:
-            self._log(f"[FEHLER] Fehler beim CSV-Export: {str(e)}")
-            QMessageBox.critical(
-                self,
-                "Fehler beim Export",
-                f"Die CSV-Datei konnte nicht erstellt werden:\n\n{str(e)}"
-            )
+        self._log(f"[OK] CSV-Datei erfolgreich erstellt: {filepath}")
+        
+        if warnings_count > 0:
+            self._log(f"[WARNUNG] {warnings_count} DOI(s) ohne Publisher Identifier")
+        
+        message = (
+            f"{row_count} DOIs mit Publisher-Daten wurden erfolgreich exportiert.\n\n"
+            f"Datei: {Path(filepath).name}\n"
+            f"Verzeichnis: {Path(filepath).parent}"
+        )
+        if warnings_count > 0:
+            message += f"\n\n⚠️ {warnings_count} DOI(s) haben keinen Publisher Identifier."
+        
+        # Update username and check CSV files
+        self._current_username = username
+        self._check_csv_files()
+        
+        QMessageBox.information(
+            self,
+            "Erfolg",
+            message
+        )
     
     def _on_publisher_fetch_error(self, error_message):
         """
@@ -2649,7 +2903,8 @@ class MainWindow(QMainWindow):
         
         # Create new worker with dry_run_only=False
         self.publisher_update_worker = PublisherUpdateWorker(
-            username, password, csv_path, use_test_api, dry_run_only=False, credentials_are_new=credentials_are_new
+            username, password, csv_path, use_test_api, dry_run_only=False, credentials_are_new=credentials_are_new,
+            db_batch_size=PublisherUpdateWorker.DB_BATCH_SIZE
         )
         self.publisher_update_thread = QThread()
         self.publisher_update_worker.moveToThread(self.publisher_update_thread)
@@ -2919,15 +3174,19 @@ class MainWindow(QMainWindow):
         # Start the thread
         self.contributor_thread.start()
     
-    def _on_contributor_fetch_finished(self, contributor_data, username):
+    def _on_contributor_fetch_finished(self, filepath, username, row_count, doi_count):
         """
-        Handle successful contributor fetch.
+        Handle finished contributor export.
+        
+        The worker already wrote the CSV file while fetching the pages.
         
         Args:
-            contributor_data: List of contributor tuples (DOI, Contributor Name, Name Type, etc.)
+            filepath: Path to the created CSV file, or empty string if nothing was found
             username: DataCite username
+            row_count: Number of exported rows
+            doi_count: Number of DOIs with contributors
         """
-        if not contributor_data:
+        if not filepath:
             self._log("[WARNUNG] Keine DOIs mit Contributors gefunden.")
             QMessageBox.information(
                 self,
@@ -2936,35 +3195,19 @@ class MainWindow(QMainWindow):
             )
             return
         
-        # Export to CSV
-        try:
-            output_dir = os.getcwd()
-            filepath = export_dois_with_contributors_to_csv(contributor_data, username, output_dir)
-            
-            # Count unique DOIs
-            unique_dois = len(set(row[0] for row in contributor_data))
-            
-            self._log(f"[OK] CSV-Datei erfolgreich erstellt: {filepath}")
-            
-            # Update username and check CSV files
-            self._current_username = username
-            self._check_csv_files()
-            
-            QMessageBox.information(
-                self,
-                "Erfolg",
-                f"{unique_dois} DOIs mit {len(contributor_data)} Contributors wurden erfolgreich exportiert.\n\n"
-                f"Datei: {Path(filepath).name}\n"
-                f"Verzeichnis: {output_dir}"
-            )
-            
-        except CSVExportError as e:
-            self._log(f"[FEHLER] Fehler beim CSV-Export: {str(e)}")
-            QMessageBox.critical(
-                self,
-                "Fehler beim Export",
-                f"Die CSV-Datei konnte nicht erstellt werden:\n\n{str(e)}"
-            )
+        self._log(f"[OK] CSV-Datei erfolgreich erstellt: {filepath}")
+        
+        # Update username and check CSV files
+        self._current_username = username
+        self._check_csv_files()
+        
+        QMessageBox.information(
+            self,
+            "Erfolg",
+            f"{doi_count} DOIs mit {row_count} Contributors wurden erfolgreich exportiert.\n\n"
+            f"Datei: {Path(filepath).name}\n"
+            f"Verzeichnis: {Path(filepath).parent}"
+        )
     
     def _on_contributor_fetch_error(self, error_message):
         """
@@ -3155,7 +3398,8 @@ class MainWindow(QMainWindow):
         
         # Create new worker with dry_run_only=False
         self.contributors_update_worker = ContributorsUpdateWorker(
-            username, password, csv_path, use_test_api, dry_run_only=False, credentials_are_new=credentials_are_new
+            username, password, csv_path, use_test_api, dry_run_only=False, credentials_are_new=credentials_are_new,
+            db_batch_size=ContributorsUpdateWorker.DB_BATCH_SIZE
         )
         self.contributors_update_thread = QThread()
         self.contributors_update_worker.moveToThread(self.contributors_update_thread)
@@ -3403,11 +3647,30 @@ class MainWindow(QMainWindow):
             )
             return
         
+        # Ask for the target file first; the worker streams rows directly into it
+        from PySide6.QtWidgets import QFileDialog
+        
+        # Use current username if available, otherwise use generic name
+        if self._current_username:
+            default_filename = f"{self._current_username}_download_urls.csv"
+        else:
+            default_filename = "download_urls.csv"
+        
+        filepath, _ = QFileDialog.getSaveFileName(
+            self,
+            "CSV-Datei speichern",
+            default_filename,
+            "CSV Files (*.csv)"
+        )
+        
+        if not filepath:
+            return  # User cancelled
+        
         # Start worker
-        self._start_download_url_fetch(db_creds)
+        self._start_download_url_fetch(db_creds, filepath)
     
-    def _start_download_url_fetch(self, db_creds: dict):
-        """Start worker to fetch DOIs with download URLs from database."""
+    def _start_download_url_fetch(self, db_creds: dict, filepath: str):
+        """Start worker to export DOIs with download URLs from database."""
         self._log("Starte Download-URL Export...")
         
         # Import worker
@@ -3418,12 +3681,13 @@ class MainWindow(QMainWindow):
             db_host=db_creds['host'],
             db_name=db_creds['database'],
             db_user=db_creds['username'],
-            db_password=db_creds['password']
+            db_password=db_creds['password'],
+            output_path=filepath
         )
         
         # Connect signals
         self.download_url_worker.progress.connect(self._log)
-        self.download_url_worker.finished.connect(self._on_download_urls_fetched)
+        self.download_url_worker.exported.connect(self._on_download_urls_exported)
         self.download_url_worker.error.connect(self._on_download_urls_error)
         
         # Create thread
@@ -3432,11 +3696,11 @@ class MainWindow(QMainWindow):
         
         # Connect thread signals
         self.download_url_thread.started.connect(self.download_url_worker.run)
-        self.download_url_worker.finished.connect(self.download_url_thread.quit)
+        self.download_url_worker.exported.connect(self.download_url_thread.quit)
         self.download_url_worker.error.connect(self.download_url_thread.quit)
         
         # Clean up after worker finishes or errors
-        self.download_url_worker.finished.connect(self.download_url_worker.deleteLater)
+        self.download_url_worker.exported.connect(self.download_url_worker.deleteLater)
         self.download_url_worker.error.connect(self.download_url_worker.deleteLater)
         
         # Clean up thread when it finishes
@@ -3450,49 +3714,17 @@ class MainWindow(QMainWindow):
         self.export_download_urls_btn.setEnabled(False)
         self.progress_bar.setVisible(True)
     
-    def _on_download_urls_fetched(self, dois_files):
-        """Called when DOIs with download URLs have been fetched."""
-        from PySide6.QtWidgets import QFileDialog
-        from src.utils.csv_exporter import export_dois_download_urls
-        
-        self._log(f"[OK] {len(dois_files)} Datei-Einträge abgerufen")
-        
-        # Use current username if available, otherwise use generic name
-        if self._current_username:
-            default_filename = f"{self._current_username}_download_urls.csv"
-        else:
-            default_filename = "download_urls.csv"
-        
-        filepath, _ = QFileDialog.getSaveFileName(
+    def _on_download_urls_exported(self, filepath: str, file_count: int, doi_count: int):
+        """Called when DOIs with download URLs have been exported."""
+        self._log(f"[OK] CSV-Datei gespeichert: {filepath}")
+        QMessageBox.information(
             self,
-            "CSV-Datei speichern",
-            default_filename,
-            "CSV Files (*.csv)"
+            "Export erfolgreich",
+            f"DOIs und Download-URLs wurden exportiert:\n\n"
+            f"Datei: {Path(filepath).name}\n"
+            f"DOIs: {doi_count}\n"
+            f"Dateien: {file_count}"
         )
-        
-        if filepath:
-            try:
-                export_dois_download_urls(dois_files, filepath)
-                
-                # Count unique DOIs
-                unique_dois = len(set(doi for doi, _, _, _, _, _ in dois_files))
-                
-                self._log(f"[OK] CSV-Datei gespeichert: {filepath}")
-                QMessageBox.information(
-                    self,
-                    "Export erfolgreich",
-                    f"DOIs und Download-URLs wurden exportiert:\n\n"
-                    f"Datei: {Path(filepath).name}\n"
-                    f"DOIs: {unique_dois}\n"
-                    f"Dateien: {len(dois_files)}"
-                )
-            except Exception as e:
-                self._log(f"[FEHLER] CSV-Export fehlgeschlagen: {e}")
-                QMessageBox.critical(
-                    self,
-                    "Fehler",
-                    f"CSV-Export fehlgeschlagen:\n{e}"
-                )
     
     def _on_download_urls_error(self, error_msg: str):
         """Called when fetch failed."""
@@ -3574,7 +3806,8 @@ class MainWindow(QMainWindow):
             db_host=db_creds['host'],
             db_name=db_creds['database'],
             db_user=db_creds['username'],
-            db_password=db_creds['password']
+            db_password=db_creds['password'],
+            bulk_mode=True
         )
         
         # Connect signals
@@ -3714,18 +3947,34 @@ class MainWindow(QMainWindow):
         """Start worker to check dead download links in database."""
         self._log("Starte Dead-Link-Check...")
 
+        from src.api.link_check_cache import LinkCheckCache, LinkCheckCacheError
         from src.workers.dead_links_check_worker import DeadLinksCheckWorker
 
+        settings = QSettings("GFZ", "GROBI")
+        cache_ttl_hours = settings.value(
+            "deadlinks/cache_ttl_hours", DeadLinksCheckWorker.DEFAULT_CACHE_TTL_HOURS, type=int
+        )
+        result_cache = None
+        if cache_ttl_hours > 0:
+            try:
+                result_cache = LinkCheckCache()
+            except LinkCheckCacheError as e:
+                # Continue without cache - every URL is requested as before
+                self._log(f"[WARNUNG] {str(e)} - Prüfung ohne Cache")
+
         self.dead_links_worker = DeadLinksCheckWorker(
             db_host=db_creds['host'],
             db_name=db_creds['database'],
             db_user=db_creds['username'],
-            db_password=db_creds['password']
+            db_password=db_creds['password'],
+            result_cache=result_cache,
+            cache_ttl_hours=cache_ttl_hours
         )
 
         self.dead_links_worker.progress_update.connect(self._on_dead_links_check_progress)
         self.dead_links_worker.finished.connect(self._on_dead_links_check_finished)
         self.dead_links_worker.error_occurred.connect(self._on_dead_links_check_error)
+        self.dead_links_worker.hosts_unreachable.connect(self._on_dead_links_hosts_unreachable)
 
         self.dead_links_thread = QThread()
         self.dead_links_worker.moveToThread(self.dead_links_thread)
@@ -3805,6 +4054,11 @@ class MainWindow(QMainWindow):
         else:
             self._log("Dead-Link-Check abgeschlossen (kein Export gewählt).")
 
+    def _on_dead_links_hosts_unreachable(self, hosts: dict):
+        """Log hosts that were cut off by the circuit breaker."""
+        for host, count in hosts.items():
+            self._log(f"[WARNUNG] Host nicht erreichbar: {host} - {count} URLs nicht geprüft")
+
     def _on_dead_links_check_error(self, error_msg: str):
         """Handle dead link check error."""
         self._log(f"[FEHLER] {error_msg}")
@@ -4017,13 +4271,43 @@ class MainWindow(QMainWindow):
             self.fuji_results_window.show()
             
             try:
+                # Unchanged DOIs are served from the local result cache
+                try:
+                    result_cache = FujiResultCache()
+                except FujiResultCacheError as e:
+                    self._log(f"[WARNUNG] {str(e)} - alle DOIs werden neu bewertet")
+                    result_cache = None
+                
                 # Start streaming assessment thread
-                self.fuji_thread = StreamingFujiThread(datacite_client, max_workers=5)
+                # Full responses are spilled to disk and only loaded when a tile is clicked;
+                # they are kept between sessions so cached and resumed DOIs keep their details
+                try:
+                    response_store = FujiResponseStore(FujiClient.DEFAULT_ENDPOINT, FujiClient.DEFAULT_METRIC_VERSION)
+                except FujiResponseStoreError as e:
+                    self._log(f"[WARNUNG] {str(e)} - Detailansicht nicht verfügbar")
+                    response_store = None
+                self.fuji_results_window.set_response_store(response_store)
+                
+                # Completed assessments are journaled so an interrupted run can be resumed
+                checkpoint, resumed_scores = self._open_fuji_checkpoint(username, use_test_api)
+                if resumed_scores:
+                    self.fuji_results_window.restore_results(resumed_scores)
+                
+                # max_workers is an upper bound; the worker adapts the actual
+                # concurrency to the server's latency and error rate (starts at 5)
+                self.fuji_thread = StreamingFujiThread(
+                    datacite_client,
+                    fuji_client=FujiClient(response_store=response_store),
+                    max_workers=10,
+                    result_cache=result_cache,
+                    checkpoint=checkpoint
+                )
                 
                 # Connect signals for streaming mode
                 self.fuji_thread.worker.doi_discovered.connect(self.fuji_results_window.add_pending_tile)
                 self.fuji_thread.worker.doi_assessed.connect(self.fuji_results_window.add_result)
                 self.fuji_thread.worker.fetch_complete.connect(self.fuji_results_window.set_total_dois)
+                self.fuji_thread.worker.concurrency_changed.connect(self.fuji_results_window.set_concurrency)
                 self.fuji_thread.worker.progress.connect(self._log)
                 self.fuji_thread.worker.error.connect(self._on_fuji_error)
                 self.fuji_thread.worker.finished.connect(self._on_fuji_finished)
@@ -4034,6 +4318,7 @@ class MainWindow(QMainWindow):
                 # Thread setup failed after window was created - close window
                 if self.fuji_results_window:
                     self.fuji_results_window.close()
+                datacite_client.close()
                 raise
             
         except AuthenticationError as e:
@@ -4054,6 +4339,44 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Fehler", f"Unerwarteter Fehler: {e}")
             self._cleanup_fuji_check()
     
+    def _open_fuji_checkpoint(
+        self, username: str, use_test_api: bool
+    ) -> Tuple[Optional[FujiCheckpointJournal], Dict[str, float]]:
+        """
+        Open the checkpoint journal of the account and offer to resume an interrupted run.
+        
+        Args:
+            username: DataCite username (the journal is kept per account and API)
+            use_test_api: Whether the test API is used
+        
+        Returns:
+            (journal or None if unusable, scores to restore - empty for a new run)
+        """
+        api_type = "test" if use_test_api else "production"
+        checkpoint = FujiCheckpointJournal(FujiCheckpointJournal.default_path(f"{username}_{api_type}"))
+        try:
+            scores = checkpoint.load()
+        except FujiCheckpointError as e:
+            self._log(f"[WARNUNG] {str(e)} - Bewertung kann später nicht fortgesetzt werden")
+            return None, {}
+        
+        if scores:
+            reply = QMessageBox.question(
+                self,
+                "FAIR Assessment fortsetzen",
+                f"Eine unterbrochene FAIR-Bewertung mit {len(scores)} bereits bewerteten DOIs "
+                f"wurde gefunden.\n\nMöchtest du sie fortsetzen? Bei \"Nein\" werden alle DOIs "
+                f"neu bewertet.",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.Yes
+            )
+            if reply == QMessageBox.Yes:
+                self._log(f"Setze FAIR Assessment fort: {len(scores)} DOIs aus Checkpoint übernommen")
+                return checkpoint, scores
+        
+        checkpoint.clear()
+        return checkpoint, {}
+    
     def _on_fuji_cancelled(self):
         """Handle FAIR assessment cancellation."""
         if self.fuji_thread and self.fuji_thread.isRunning():
@@ -4086,6 +4409,145 @@ class MainWindow(QMainWindow):
         self.fuji_thread = None
         self._log("Bereit für nächsten Vorgang.")
     
+    # ==================== EXPORT ALL METHODS ====================
+    
+    def _on_export_all_clicked(self):
+        """Handle export all metadata action."""
+        # Show credentials dialog
+        dialog = CredentialsDialog(self)
+        credentials = dialog.get_credentials()
+        
+        if credentials is None:
+            self._log("Export aller Metadaten abgebrochen.")
+            return
+        
+        username, password, csv_path, use_test_api = credentials
+        # csv_path is None in export mode, we don't need it here
+        
+        # Check if user selected new credentials or loaded saved account
+        credentials_are_new = dialog.is_new_credentials()
+        
+        api_type = "Test-API" if use_test_api else "Produktions-API"
+        self._log(f"Starte Export aller Metadaten für Benutzer '{username}' ({api_type})...")
+        
+        # Disable buttons and show progress
+        self._set_buttons_enabled(False)
+        self.progress_bar.setVisible(True)
+        
+        # Create worker and thread
+        self.export_all_worker = DOIAllFacetsFetchWorker(username, password, use_test_api, credentials_are_new)
+        self.export_all_thread = QThread()
+        self.export_all_worker.moveToThread(self.export_all_thread)
+        
+        # Connect signals
+        self.export_all_thread.started.connect(self.export_all_worker.run)
+        self.export_all_worker.progress.connect(self._log)
+        self.export_all_worker.finished.connect(self._on_export_all_finished)
+        self.export_all_worker.error.connect(self._on_export_all_error)
+        self.export_all_worker.request_save_credentials.connect(self._on_request_save_credentials)
+        
+        # Clean up after worker finishes or errors
+        self.export_all_worker.finished.connect(self.export_all_worker.deleteLater)
+        self.export_all_worker.error.connect(self.export_all_worker.deleteLater)
+        self.export_all_worker.finished.connect(self.export_all_thread.quit)
+        self.export_all_worker.error.connect(self.export_all_thread.quit)
+        
+        # Clean up thread when it finishes
+        self.export_all_thread.finished.connect(self.export_all_thread.deleteLater)
+        self.export_all_thread.finished.connect(self._cleanup_export_all_thread)
+        
+        # Start the thread
+        self.export_all_thread.start()
+    
+    def _on_export_all_finished(self, results, username, doi_count):
+        """
+        Handle successful one-pass export of all metadata.
+        
+        Args:
+            results: Dict with the keys "urls", "creators", "publisher",
+                     "contributors" and "rights" mapping to tuples of
+                     (CSV path or "", row count, error message or "")
+            username: DataCite username
+            doi_count: Number of exported DOIs
+        """
+        if not doi_count:
+            self._log("[WARNUNG] Keine DOIs gefunden.")
+            QMessageBox.information(
+                self,
+                "Keine DOIs",
+                f"Für den Benutzer '{username}' wurden keine DOIs gefunden."
+            )
+            return
+        
+        labels = {
+            "urls": "Landing Page URLs",
+            "creators": "Autoren",
+            "publisher": "Publisher",
+            "contributors": "Contributors",
+            "rights": "Rights",
+        }
+        
+        written_files = []
+        failed_exports = []
+        output_dir = os.getcwd()
+        for facet, label in labels.items():
+            filepath, _, error_message = results.get(facet, ("", 0, ""))
+            if error_message:
+                failed_exports.append(f"{label}: {error_message}")
+                self._log(f"[FEHLER] Fehler beim CSV-Export ({label}): {error_message}")
+            elif not filepath:
+                self._log(f"[INFO] Keine Daten für {label} - CSV wird übersprungen")
+            else:
+                written_files.append(f"{label}: {Path(filepath).name}")
+                output_dir = str(Path(filepath).parent)
+                self._log(f"[OK] CSV-Datei erfolgreich erstellt: {filepath}")
+        
+        # Update username and check CSV files
+        self._current_username = username
+        self._check_csv_files()
+        
+        if failed_exports:
+            QMessageBox.warning(
+                self,
+                "Export unvollständig",
+                f"{len(written_files)} von {len(labels)} CSV-Dateien wurden erstellt.\n\n"
+                f"Fehler:\n{self._format_error_list(failed_exports, bullet='•')}"
+            )
+        else:
+            QMessageBox.information(
+                self,
+                "Erfolg",
+                f"{doi_count} DOIs wurden in einem Durchlauf exportiert.\n\n"
+                + "\n".join(written_files)
+                + f"\n\nVerzeichnis: {output_dir}"
+            )
+    
+    def _on_export_all_error(self, error_message):
+        """
+        Handle export all error.
+        
+        Args:
+            error_message: Error message
+        """
+        self._log(f"[FEHLER] {error_message}")
+        
+        QMessageBox.critical(
+            self,
+            "Fehler",
+            f"Beim Abrufen der Metadaten ist ein Fehler aufgetreten:\n\n{error_message}"
+        )
+    
+    def _cleanup_export_all_thread(self):
+        """Clean up export all thread and worker after completion."""
+        self.progress_bar.setVisible(False)
+        self._set_buttons_enabled(True)
+        
+        # Reset references (objects are deleted via deleteLater)
+        self.export_all_thread = None
+        self.export_all_worker = None
+        
+        self._log("Bereit für nächsten Vorgang.")
+    
     # ==================== RIGHTS METHODS ====================
     
     def _on_load_rights_clicked(self):
@@ -4134,15 +4596,19 @@ class MainWindow(QMainWindow):
         # Start the thread
         self.rights_thread.start()
     
-    def _on_rights_fetch_finished(self, rights_data, username):
+    def _on_rights_fetch_finished(self, filepath, username, row_count, doi_count):
         """
-        Handle successful rights fetch.
+        Handle finished rights export.
+        
+        The worker already wrote the CSV file while fetching the pages.
         
         Args:
-            rights_data: List of rights tuples (DOI, rights, rightsUri, etc.)
+            filepath: Path to the created CSV file, or empty string if nothing was found
             username: DataCite username
+            row_count: Number of exported rows
+            doi_count: Number of DOIs
         """
-        if not rights_data:
+        if not filepath:
             self._log("[WARNUNG] Keine DOIs mit Rights gefunden.")
             QMessageBox.information(
                 self,
@@ -4151,35 +4617,19 @@ class MainWindow(QMainWindow):
             )
             return
         
-        # Export to CSV
-        try:
-            output_dir = os.getcwd()
-            filepath = export_dois_with_rights_to_csv(rights_data, username, output_dir)
-            
-            # Count unique DOIs
-            unique_dois = len(set(row[0] for row in rights_data))
-            
-            self._log(f"[OK] CSV-Datei erfolgreich erstellt: {filepath}")
-            
-            # Update username and check CSV files
-            self._current_username = username
-            self._check_csv_files()
-            
-            QMessageBox.information(
-                self,
-                "Erfolg",
-                f"{unique_dois} DOIs mit {len(rights_data)} Rights-Einträgen wurden erfolgreich exportiert.\n\n"
-                f"Datei: {Path(filepath).name}\n"
-                f"Verzeichnis: {output_dir}"
-            )
-            
-        except CSVExportError as e:
-            self._log(f"[FEHLER] Fehler beim CSV-Export: {str(e)}")
-            QMessageBox.critical(
-                self,
-                "Fehler beim Export",
-                f"Die CSV-Datei konnte nicht erstellt werden:\n\n{str(e)}"
-            )
+        self._log(f"[OK] CSV-Datei erfolgreich erstellt: {filepath}")
+        
+        # Update username and check CSV files
+        self._current_username = username
+        self._check_csv_files()
+        
+        QMessageBox.information(
+            self,
+            "Erfolg",
+            f"{doi_count} DOIs mit {row_count} Rights-Einträgen wurden erfolgreich exportiert.\n\n"
+            f"Datei: {Path(filepath).name}\n"
+            f"Verzeichnis: {Path(filepath).parent}"
+        )
     
     def _on_rights_fetch_error(self, error_message):
         """
@@ -4567,6 +5017,12 @@ class MainWindow(QMainWindow):
             self.pending_export_thread.quit()
             self.pending_export_thread.wait(3000)  # Wait max 3 seconds
         
+        # If export all thread is running, wait for it to finish
+        if self.export_all_thread is not None and self.export_all_thread.isRunning():
+            self._log("Warte auf Abschluss des Metadaten-Exports...")
+            self.export_all_thread.quit()
+            self.export_all_thread.wait(3000)  # Wait max 3 seconds
+        
         # If rights thread is running, wait for it to finish
         if self.rights_thread is not None and self.rights_thread.isRunning():
             self._log("Warte auf Abschluss des Rights-Abrufs...")
@@ -2,7 +2,7 @@
 Settings Dialog for GROBI application.
 
 Provides a tab-based interface for configuring:
-- General settings (Theme)
+- General settings (Theme, DataCite options)
 - Database connection settings
 """
 
@@ -146,7 +146,7 @@ class SettingsDialog(QDialog):
         Create General settings tab.
         
         Returns:
-            QWidget with theme settings
+            QWidget with theme and DataCite settings
         """
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -173,6 +173,33 @@ class SettingsDialog(QDialog):
         theme_group.setLayout(theme_layout)
         layout.addWidget(theme_group)
         
+        # DataCite options group
+        datacite_group = QGroupBox("DataCite")
+        datacite_layout = QVBoxLayout()
+        
+        self.bulk_url_diff_checkbox = QCheckBox(
+            "Landing Page URLs vor dem Update gesammelt abrufen"
+        )
+        self.bulk_url_diff_checkbox.setToolTip(
+            "Lädt beim URL-Update alle aktuellen Landing Page URLs des Accounts "
+            "seitenweise (100 DOIs pro Anfrage) und vergleicht sie lokal, statt "
+            "die Metadaten jeder DOI einzeln abzufragen. Empfohlen für große CSV-Dateien."
+        )
+        datacite_layout.addWidget(self.bulk_url_diff_checkbox)
+        
+        self.metadata_cache_checkbox = QCheckBox(
+            "Lokalen Metadaten-Cache für Exporte verwenden"
+        )
+        self.metadata_cache_checkbox.setToolTip(
+            "Speichert die Metadaten aller DOIs lokal und lädt bei späteren Exporten "
+            "nur die seit dem letzten Abgleich geänderten DOIs von DataCite. "
+            "Wiederholte Exporte dauern dadurch Sekunden statt Minuten."
+        )
+        datacite_layout.addWidget(self.metadata_cache_checkbox)
+        
+        datacite_group.setLayout(datacite_layout)
+        layout.addWidget(datacite_group)
+        
         layout.addStretch()
         
         return widget
@@ -268,6 +295,12 @@ class SettingsDialog(QDialog):
         else:  # DARK
             self.dark_theme_radio.setChecked(True)
         
+        # Load DataCite settings
+        bulk_url_diff = self.settings.value("datacite/bulk_url_diff", False, type=bool)
+        self.bulk_url_diff_checkbox.setChecked(bulk_url_diff)
+        metadata_cache = self.settings.value("datacite/metadata_cache", False, type=bool)
+        self.metadata_cache_checkbox.setChecked(metadata_cache)
+        
         # Load database settings
         db_enabled = self.settings.value("database/enabled", False, type=bool)
         self.db_enabled_checkbox.setChecked(db_enabled)
@@ -367,6 +400,14 @@ class SettingsDialog(QDialog):
                 self.theme_manager.set_theme(new_theme)
                 self.theme_changed.emit(new_theme)
             
+            # Save DataCite settings
+            self.settings.setValue(
+                "datacite/bulk_url_diff", self.bulk_url_diff_checkbox.isChecked()
+            )
+            self.settings.setValue(
+                "datacite/metadata_cache", self.metadata_cache_checkbox.isChecked()
+            )
+            
             # Save database settings
             db_enabled = self.db_enabled_checkbox.isChecked()
             self.settings.setValue("database/enabled", db_enabled)
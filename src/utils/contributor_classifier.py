@@ -0,0 +1,405 @@
+"""Heuristics for classifying DataCite contributor names as persons or organizations."""
+
+import logging
+import re
+from functools import lru_cache
+from typing import Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ContributorTypes that are ALWAYS organizations (never persons)
+# Note: "Sponsor", "Funder", "ResearchGroup" are NOT here because they can be persons too!
+# (e.g., an individual person can be a sponsor or funder)
+ORGANIZATIONAL_CONTRIBUTOR_TYPES = frozenset({
+    "HostingInstitution",
+    "DistributionCenter",
+    "RegistrationAgency",
+    "RegistrationAuthority",
+})
+
+# ContributorTypes that are ALWAYS persons (never organizations)
+# Note: "Producer" is intentionally NOT here - it can be a person OR organization
+PERSONAL_CONTRIBUTOR_TYPES = frozenset({
+    "ContactPerson",
+    "DataCollector",
+    "DataCurator",
+    "DataManager",
+    "Editor",
+    "ProjectLeader",
+    "ProjectManager",
+    "ProjectMember",
+    "Researcher",
+    "RightsHolder",
+    "Supervisor",
+    "WorkPackageLeader",
+})
+
+# Keywords that indicate an organizational name (case-insensitive)
+# Used to detect when DataCite incorrectly splits an org name into given/family name
+# Two sets of keywords:
+# 1. SUBSTRING_ORG_KEYWORDS: Long, unique keywords that can be matched as substrings
+#    (safe for German compound words like "GeoForschungsZentrum")
+# 2. WORD_BOUNDARY_ORG_KEYWORDS: Shorter keywords that need word boundary matching
+#    (to avoid false positives like "Wagner" matching "ag")
+
+# Keywords long enough to safely match as substrings in compound words
+SUBSTRING_ORG_KEYWORDS = frozenset({
+    # German compound-safe (6+ chars, unlikely in names)
+    "universität", "université", "universidad", "universidade", "università", "university",
+    "universite",  # ASCII transcription without accent (e.g., "Universite Grenoble Alpes")
+    "institute", "institut", "instituto", "istituto",
+    "zentrum", "center", "centre", "centro",
+    "forschung",  # research (German) - catches "GeoForschungsZentrum"
+    "laboratory", "laboratorium", "laboratorio", "laboratoire",
+    "department", "abteilung", "departamento",
+    "ministry", "ministerium", "ministère", "ministerio",
+    "foundation", "stiftung", "fondation", "fundación",
+    "gesellschaft", "association", "verband", "verein",
+    "organisation", "organization",
+    "corporation", "company",
+    "consortium", "konsortium",
+    "bibliothek", "library",
+    "krankenhaus", "hospital",
+    "geosurvey",  # catches "Iceland GeoSurvey"
+    "helmholtz",  # German research org
+    "fraunhofer",  # Fraunhofer Society
+    # German government/geo agencies
+    "landesamt",  # Landesamt für Geologie und Bergbau
+    "regierungspräsidium",  # Regierungspräsidium Freiburg
+    "geological survey",  # Geological Survey of Baden-Württemberg
+    "geodynamics",  # European Center for Geodynamics
+    "geophysik", "geophysics",  # Fachbereich Geophysik
+    "geowissenschaften", "geosciences",  # Institut für Geowissenschaften
+    "erdbebenstation",  # Erdbebenstation Bensberg
+    "fachbereich",  # Fachbereich (academic department)
+    # Observatories, research facilities
+    "observatory",  # Goma Volcano Observatory, INGV-Osservatorio
+    "osservatorio",  # Italian observatories
+    "observatoire",  # French observatories
+    "observatorium",  # German observatories
+    "synchrotron",  # ESRF, PETRA III, etc.
+    "röntgenstrahlungsquelle",  # X-ray source PETRA III
+    "meteorolog",  # Meteorological services (catches Meteorologie, Meteorology, etc.)
+    "klimatolog",  # Climatology services
+    "hochschule",  # German universities of applied sciences
+    "zentralanstalt",  # ZAMG - Zentralanstalt für Meteorologie und Geodynamik
+    "géothermie", "geothermie",  # Geothermal companies (és-Géothermie)
+    "geomanagement",  # ECW Geomanagement BV
+    "transregio",  # CRC/Transregio 32
+})
+
+# Shorter keywords that need word boundary matching
+WORD_BOUNDARY_ORG_KEYWORDS = frozenset({
+    "college", "school", "faculty", "fakultät",
+    "agency", "agentur", "authority", "behörde",
+    "office", "bureau", "service", "dienst",
+    "commission", "kommission", "council", "board",
+    "gremium", "committee", "ausschuss",
+    "museum", "archive", "archiv",
+    "klinik", "clinic", "division",
+    "firma", "gmbh", "ltd",
+    "group", "gruppe", "network", "netzwerk",
+    "survey",  # catches geological surveys
+    "pool",  # Geophysical Instrument Pool
+    # Well-known research institution abbreviations (need word boundary)
+    "eth",  # ETH Zürich
+    "mit",  # Massachusetts Institute of Technology
+    "cnrs",  # Centre national de la recherche scientifique
+    "nasa",  # National Aeronautics and Space Administration
+    "noaa",  # National Oceanic and Atmospheric Administration
+    "usgs",  # United States Geological Survey
+    "csic",  # Spanish National Research Council
+    "csiro",  # Commonwealth Scientific and Industrial Research Organisation
+    "rwth",  # RWTH Aachen
+    "ipgp",  # Institut de Physique du Globe de Paris
+    "gipp",  # Geophysical Instrument Pool Potsdam
+    "gfz",  # GFZ German Research Centre for Geosciences
+    "ucl",  # University College London
+    # French research keywords
+    "isterre",  # Institut des Sciences de la Terre
+    "globe",  # Institut de physique du globe
+    # Nordic/Scandinavian institutions
+    "norsar",  # Norwegian Seismic Array
+    "nve",  # Norges vassdrags- og energidirektorat (Norwegian Water Resources and Energy Directorate)
+    "dmi",  # Danish Meteorological Institute
+    "smhi",  # Swedish Meteorological and Hydrological Institute
+    # Other research institutions
+    "arditi",  # Agência Regional para o Desenvolvimento da Investigação, Tecnologia e Inovação
+    "fccn",  # Fundação para Computação Científica Nacional
+    "fct",  # Fundação para a Ciência e Tecnologia
+    # Funding/grant keywords
+    "fellowship",  # Marie Curie Fellowship, etc.
+    "grant",  # Research grants
+    "fund",  # Various funds
+    "award",  # Awards
+    # Team/staff/group identifiers (organizational entities)
+    "staff",  # ISG Staff, Support Staff
+    "team",  # WSM Team, DIGIS Team, Science Team
+    "authorities",  # Ebro Water Authorities
+    "isg",  # International Service of Geodynamics
+    "platform",  # Spanish Geothermal Technology Platform
+    # Additional institution abbreviations from validation
+    "awi",  # Alfred Wegener Institut
+    "bmkg",  # Badan Meteorologi, Klimatologi, dan Geofisika (Indonesian)
+    "ingv",  # Istituto Nazionale di Geofisica e Vulcanologia
+    "ipma",  # Instituto Português do Mar e da Atmosfera
+    "hbo",  # Hochschule Bochum
+    "zamg",  # Zentralanstalt für Meteorologie und Geodynamik
+    "eseo",  # European Student Earth Orbiter
+    "afad",  # Disaster and Emergency Management Presidency (Turkey)
+    "desy",  # Deutsches Elektronen-Synchrotron
+    "enbw",  # Energie Baden-Württemberg AG
+    "ecw",  # ECW Geomanagement BV
+    "esg",  # és-Géothermie
+    "cnr",  # Consiglio Nazionale delle Ricerche (Italian)
+    "esrf",  # European Synchrotron Radiation Facility
+    "gvo",  # Goma Volcano Observatory
+    "petra",  # PETRA III synchrotron
+    "imaa",  # Institute of Methodologies for Environmental Analysis
+    "crc",  # Collaborative Research Centre
+    "radar",  # RADAR4KIT, radar facilities
+    # Project/Program identifiers
+    "project",  # X0-Deep Fault Drilling Project, MEET Project, etc.
+    "programme",  # EU programmes
+    "program",  # US spelling
+    "sfb",  # Sonderforschungsbereich (German collaborative research centre)
+    "minas",  # 5E-MINAS project
+    # Institute acronyms (from validation)
+    "caiag",  # Central-Asian Institute of Applied Geosciences
+    "geopribor",  # Russian geophysical instrument manufacturer
+    "dekorp",  # Deutsches Kontinentales Reflexionsseismisches Programm
+    "ilge",  # Infrastructure for Large-scale Ground-based E-science
+    "tna",  # Transnational Access (EU programs)
+})
+
+# Keywords that disqualify a word from being part of a "Lastname, Firstname" person name
+_PERSON_PART_ORG_KEYWORDS = ("university", "institut", "center", "centre")
+
+
+class ContributorClassifier:
+    """
+    Classify contributor names as personal or organizational.
+    
+    The keyword sets are compiled once into two regular expressions (one
+    substring alternation, one word-boundary alternation), and the results
+    of the name checks are memoized per raw name string. Large harvests
+    contain the same few thousand names over and over, so most checks are
+    a dictionary lookup.
+    """
+    
+    MEMO_SIZE = 65536  # Distinct names remembered per check
+    
+    def __init__(self, memo_size: int = MEMO_SIZE):
+        """
+        Compile the keyword patterns.
+        
+        Args:
+            memo_size: Maximum number of names memoized per check
+        """
+        # Longest keywords first so overlapping alternatives behave like the plain substring test
+        substring_keywords = sorted(SUBSTRING_ORG_KEYWORDS, key=len, reverse=True)
+        word_keywords = sorted(WORD_BOUNDARY_ORG_KEYWORDS, key=len, reverse=True)
+        self._substring_pattern = re.compile("|".join(re.escape(kw) for kw in substring_keywords))
+        self._word_boundary_pattern = re.compile(
+            r"\b(?:" + "|".join(re.escape(kw) for kw in word_keywords) + r")\b"
+        )
+        self._email_pattern = re.compile(r"^[\w.-]+@[\w.-]+\.[a-z]{2,}$")
+        
+        self.is_organization_name = lru_cache(maxsize=memo_size)(self._is_organization_name)
+        self.looks_like_person_name = lru_cache(maxsize=memo_size)(self._looks_like_person_name)
+    
+    def cache_clear(self):
+        """Forget all memoized names."""
+        self.is_organization_name.cache_clear()
+        self.looks_like_person_name.cache_clear()
+    
+    def _is_organization_name(self, name: str) -> bool:
+        """Check if a name contains organizational keywords, URLs, or email addresses.
+        
+        IMPORTANT: This function should NOT match person names with affiliations!
+        Examples that should return False (persons):
+        - "Bindi, Dino (GFZ)" - person with affiliation
+        - "Simone Cesca, cesca@gfz.de" - person with email
+        - "Jari Kortström, jari.kortstrom@helsinki.fi" - person with email
+        
+        Examples that should return True (organizations):
+        - "geofon@gfz.de" - email as contact (no person name)
+        - "Deutsches GeoForschungsZentrum GFZ" - organization
+        - "University of Potsdam, Germany" - organization with location
+        """
+        if not name:
+            return False
+        name_lower = name.lower()
+        
+        # First, detect "Person Name, email" or "Person Name (Affiliation)" patterns
+        # These are persons with contact info, NOT organizations
+        if ',' in name:
+            parts = name.split(',', 1)
+            first_part = parts[0].strip()
+            second_part = parts[1].strip() if len(parts) > 1 else ""
+            
+            # Check if first part looks like a person name (1-3 words, starts with uppercase)
+            first_words = first_part.split()
+            if 1 <= len(first_words) <= 3:
+                all_name_like = all(
+                    len(w) >= 1 and w[0].isupper() and
+                    not any(kw in w.lower() for kw in _PERSON_PART_ORG_KEYWORDS)
+                    for w in first_words
+                )
+                if all_name_like:
+                    # Second part is email? -> Person with contact
+                    if '@' in second_part:
+                        return False
+                    # Second part is short (likely first name)? -> Person
+                    second_words = second_part.split()
+                    if len(second_words) == 1 and len(second_part) <= 20:
+                        # Likely "Lastname, Firstname" pattern
+                        return False
+        
+        # Check for "Name (Affiliation)" pattern - person with institutional affiliation
+        if '(' in name and ')' in name:
+            before_paren = name.split('(')[0].strip()
+            # If what's before parenthesis looks like "Lastname, Firstname" -> person
+            if ',' in before_paren:
+                parts = before_paren.split(',')
+                if len(parts) == 2:
+                    p1, p2 = parts[0].strip(), parts[1].strip()
+                    # Both parts are short name-like strings
+                    if (1 <= len(p1.split()) <= 2 and 1 <= len(p2.split()) <= 2 and
+                        len(p1) <= 30 and len(p2) <= 20):
+                        return False
+        
+        # URLs are always organizational (websites, project pages, etc.)
+        if name_lower.startswith(('http://', 'https://', 'www.')):
+            return True
+        
+        # Email addresses ONLY when they ARE the name (not attached to person name)
+        # "geofon@gfz.de" -> Org, but "Simone Cesca, cesca@gfz.de" -> Person (handled above)
+        if '@' in name and '.' in name:
+            # Check if the ENTIRE name is basically just an email
+            if self._email_pattern.match(name_lower.strip()):
+                return True
+        
+        # First check substring keywords (safe for compound words)
+        if self._substring_pattern.search(name_lower):
+            return True
+        
+        # Then check word-boundary keywords (need exact word match)
+        if self._word_boundary_pattern.search(name_lower):
+            return True
+        
+        return False
+    
+    def _looks_like_person_name(self, name: str) -> bool:
+        """Check if a name looks like a person's name based on format heuristics."""
+        if not name:
+            return False
+        # Format "Nachname, Vorname" - very likely a person
+        if "," in name:
+            parts = [p.strip() for p in name.split(",")]
+            if len(parts) == 2 and all(len(p) > 0 for p in parts):
+                return True
+        # Format "Vorname Nachname" or "Vorname M. Nachname" - 2-3 words without org keywords
+        words = name.split()
+        if 2 <= len(words) <= 4 and not self.is_organization_name(name):
+            # Check if words look like name parts (start with uppercase, reasonable length)
+            return all(len(w) >= 1 and w[0].isupper() for w in words)
+        return False
+    
+    def resolve_name_type(
+        self,
+        contributor_name: str,
+        name_type: str,
+        contributor_type: str,
+        has_structured_name: bool,
+        has_orcid: bool,
+        has_ror: bool
+    ) -> Tuple[str, bool]:
+        """
+        Determine the nameType of a contributor.
+        
+        Priority:
+        1. ORCID present → ALWAYS Personal (ORCID is only for persons, this is a hard fact)
+        2. ROR present → ALWAYS Organizational (ROR is only for organizations, this is a hard fact)
+        3. Name contains org keywords → Organizational (override API nameType)
+        4. API provides nameType → TRUST IT (don't override DataCite's data)
+        5. Organizational contributor types (and no API nameType) → Organizational
+        6. Personal contributor types (and no API nameType, name doesn't look like org) → Personal
+        7. Fallback: infer from givenName/familyName presence and name format
+        
+        Args:
+            contributor_name: Full contributor name
+            name_type: nameType reported by DataCite (may be empty)
+            contributor_type: contributorType (already defaulted to "Other")
+            has_structured_name: Whether givenName or familyName is set
+            has_orcid: Whether the contributor has an ORCID
+            has_ror: Whether the contributor has a ROR ID
+        
+        Returns:
+            Tuple of (nameType, clear_name_parts); clear_name_parts is True if
+            givenName/familyName must be dropped because the contributor was
+            identified as an organization
+        """
+        if has_orcid:
+            # ORCID is ONLY given to persons - this overrides everything including API data
+            # because ORCID is a hard fact that cannot be wrong
+            if name_type != "Personal":
+                if name_type:
+                    logger.warning(f"Overriding nameType '{name_type}' to 'Personal' for '{contributor_name}' (has ORCID)")
+                name_type = "Personal"
+            return name_type, False
+        
+        if has_ror:
+            # ROR is ONLY given to organizations - this overrides everything including API data
+            # because ROR (Research Organization Registry) is a hard fact that cannot be wrong
+            if name_type != "Organizational" and name_type:
+                logger.warning(f"Overriding nameType '{name_type}' to 'Organizational' for '{contributor_name}' (has ROR)")
+            return "Organizational", True
+        
+        if self.is_organization_name(contributor_name):
+            # Name contains CLEAR organizational keywords (University, Institut, etc.)
+            # This overrides even API nameType because DataCite often incorrectly
+            # marks organizations as Personal when they have comma in name
+            # (e.g., "University of Potsdam, Germany" → givenName: Germany, familyName: University of Potsdam)
+            if name_type == "Personal":
+                logger.warning(f"Overriding nameType 'Personal' to 'Organizational' for '{contributor_name}' (name contains org keywords)")
+            return "Organizational", True
+        
+        if name_type:
+            # API provides nameType and name doesn't look like org - TRUST IT
+            return name_type, False
+        
+        if contributor_type in ORGANIZATIONAL_CONTRIBUTOR_TYPES:
+            # These roles are ALWAYS organizations - set nameType
+            logger.debug(f"Setting nameType 'Organizational' for '{contributor_name}' (contributorType={contributor_type})")
+            return "Organizational", True
+        
+        if contributor_type in PERSONAL_CONTRIBUTOR_TYPES:
+            # These roles are ALWAYS persons - set nameType
+            # (the name was already checked for org keywords above)
+            logger.debug(f"Setting nameType 'Personal' for '{contributor_name}' (contributorType={contributor_type})")
+            return "Personal", False
+        
+        # For ambiguous contributorTypes (e.g., "Other", "RelatedPerson"),
+        # No API nameType and no clear signals - infer from multiple signals
+        if has_structured_name:
+            # Has structured name parts - definitely a person
+            logger.debug(f"Inferred nameType 'Personal' for '{contributor_name}' (has given/family name)")
+            return "Personal", False
+        
+        if self.looks_like_person_name(contributor_name):
+            # Name format looks like a person (e.g., "Blöcher Guido" or "Doe, John")
+            logger.debug(f"Inferred nameType 'Personal' for '{contributor_name}' (name format looks like person)")
+            return "Personal", False
+        
+        # Default to Organizational for other cases
+        logger.debug(f"Inferred nameType 'Organizational' for '{contributor_name}' (no person indicators)")
+        return "Organizational", False
+
+
+# Shared classifier; the patterns are compiled once at import time
+CONTRIBUTOR_CLASSIFIER = ContributorClassifier()
+
+is_organization_name = CONTRIBUTOR_CLASSIFIER.is_organization_name
+looks_like_person_name = CONTRIBUTOR_CLASSIFIER.looks_like_person_name
@@ -4,7 +4,7 @@ import csv
 import logging
 import os
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Iterable, List, Optional, Tuple
 
 
 logger = logging.getLogger(__name__)
@@ -15,6 +15,66 @@ class CSVExportError(Exception):
     pass
 
 
+# CSV headers of the DataCite metadata exports
+URLS_HEADER = ['DOI', 'Landing_Page_URL']
+
+CREATORS_HEADER = [
+    'DOI',
+    'Creator Name',
+    'Name Type',
+    'Given Name',
+    'Family Name',
+    'Name Identifier',
+    'Name Identifier Scheme',
+    'Scheme URI'
+]
+
+PUBLISHER_HEADER = [
+    'DOI',
+    'Publisher Name',
+    'Publisher Identifier',
+    'Publisher Identifier Scheme',
+    'Scheme URI',
+    'Language'
+]
+
+CONTRIBUTORS_HEADER = [
+    'DOI',
+    'Contributor Name',
+    'Name Type',
+    'Given Name',
+    'Family Name',
+    'Name Identifier',
+    'Name Identifier Scheme',
+    'Scheme URI',
+    'Contributor Types',
+    'Affiliation',
+    'Affiliation Identifier',
+    'Email',
+    'Website',
+    'Position'
+]
+
+RIGHTS_HEADER = [
+    'DOI',
+    'rights',
+    'rightsUri',
+    'schemeUri',
+    'rightsIdentifier',
+    'rightsIdentifierScheme',
+    'lang'
+]
+
+# Facet name -> (filename suffix, header), facet names as in DataCiteClient.FACET_EXTRACTORS
+EXPORT_LAYOUTS = {
+    "urls": ("urls", URLS_HEADER),
+    "creators": ("authors", CREATORS_HEADER),
+    "publisher": ("publishers", PUBLISHER_HEADER),
+    "contributors": ("contributors", CONTRIBUTORS_HEADER),
+    "rights": ("rights", RIGHTS_HEADER),
+}
+
+
 def export_dois_to_csv(
     dois_list: List[Tuple[str, str]], 
     username: str, 
@@ -73,7 +133,7 @@ def export_dois_to_csv(
             writer = csv.writer(csvfile)
             
             # Write header
-            writer.writerow(['DOI', 'Landing_Page_URL'])
+            writer.writerow(URLS_HEADER)
             
             # Write data rows
             for doi, url in dois_list:
@@ -161,16 +221,7 @@ def export_dois_with_creators_to_csv(
             writer = csv.writer(csvfile)
             
             # Write header
-            writer.writerow([
-                'DOI',
-                'Creator Name',
-                'Name Type',
-                'Given Name',
-                'Family Name',
-                'Name Identifier',
-                'Name Identifier Scheme',
-                'Scheme URI'
-            ])
+            writer.writerow(CREATORS_HEADER)
             
             # Write data rows
             for row in data:
@@ -262,14 +313,7 @@ def export_dois_with_publisher_to_csv(
             writer = csv.writer(csvfile)
             
             # Write header
-            writer.writerow([
-                'DOI',
-                'Publisher Name',
-                'Publisher Identifier',
-                'Publisher Identifier Scheme',
-                'Scheme URI',
-                'Language'
-            ])
+            writer.writerow(PUBLISHER_HEADER)
             
             # Write data rows
             for row in data:
@@ -370,22 +414,7 @@ def export_dois_with_contributors_to_csv(
             writer = csv.writer(csvfile)
             
             # Write header (14 columns)
-            writer.writerow([
-                'DOI',
-                'Contributor Name',
-                'Name Type',
-                'Given Name',
-                'Family Name',
-                'Name Identifier',
-                'Name Identifier Scheme',
-                'Scheme URI',
-                'Contributor Types',
-                'Affiliation',
-                'Affiliation Identifier',
-                'Email',
-                'Website',
-                'Position'
-            ])
+            writer.writerow(CONTRIBUTORS_HEADER)
             
             # Write data rows
             for row in data:
@@ -412,20 +441,28 @@ def export_dois_with_contributors_to_csv(
 
 
 def export_dois_download_urls(
-    dois_files: List[Tuple[str, str, str, str, str, int]], 
+    dois_files: Iterable[Tuple[str, str, str, str, str, int]], 
     filepath: str
-) -> None:
+) -> int:
     """
     Export DOIs with download URLs to CSV.
     
+    Rows are written as they are consumed, so dois_files may be a stream
+    (e.g. SumarioPMDClient.iter_all_dois_with_downloads()).
+    
     Args:
-        dois_files: List of (DOI, Filename, Download_URL, Description, Format, Size_Bytes) tuples
+        dois_files: (DOI, Filename, Download_URL, Description, Format, Size_Bytes) tuples
         filepath: Output CSV file path
         
+    Returns:
+        Number of file entries written
+        
     Raises:
-        CSVExportError: If file cannot be written
+        CSVExportError: If file cannot be written (exceptions raised by the
+                        dois_files stream propagate unchanged)
     """
-    logger.info(f"Exporting {len(dois_files)} file entries to {filepath}")
+    logger.info(f"Exporting file entries to {filepath}")
+    count = 0
     
     try:
         with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
@@ -437,8 +474,10 @@ def export_dois_download_urls(
             # Data rows
             for doi, filename, url, description, format_str, size in dois_files:
                 writer.writerow([doi, filename, url, description, format_str, size])
+                count += 1
         
-        logger.info(f"Successfully exported {len(dois_files)} file entries to {filepath}")
+        logger.info(f"Successfully exported {count} file entries to {filepath}")
+        return count
         
     except PermissionError as e:
         error_msg = f"Keine Berechtigung zum Schreiben der Datei: {filepath}"
@@ -450,9 +489,9 @@ def export_dois_download_urls(
         logger.error(f"OS error writing file: {e}")
         raise CSVExportError(error_msg)
     
-    except Exception as e:
-        error_msg = f"Unerwarteter Fehler beim Speichern der CSV-Datei: {str(e)}"
-        logger.error(f"Unexpected error: {e}")
+    except csv.Error as e:
+        error_msg = f"Die CSV-Datei konnte nicht geschrieben werden: {str(e)}"
+        logger.error(f"CSV error writing file: {e}")
         raise CSVExportError(error_msg)
 
 
@@ -539,23 +578,29 @@ def validate_csv_format(filepath: str) -> bool:
 
 
 def export_pending_dois(
-    data: List[Tuple[str, str, str]],
+    data: Iterable[Tuple[str, str, str]],
     output_path: str
-) -> None:
+) -> int:
     """
     Export pending DOIs to a CSV file with UTF-8 BOM encoding.
     
     Creates a CSV file with columns: DOI, Title, First Author
-    Uses UTF-8 with BOM for Excel compatibility.
+    Uses UTF-8 with BOM for Excel compatibility. Rows are written as they are
+    consumed, so data may be a stream (e.g. SumarioPMDClient.iter_pending_dois()).
     
     Args:
-        data: List of tuples containing (DOI, Title, First Author)
+        data: Tuples containing (DOI, Title, First Author)
         output_path: Full path to the output CSV file
         
+    Returns:
+        Number of DOIs written
+        
     Raises:
         CSVExportError: If export fails due to permissions, disk space, etc.
+                        (exceptions raised by the data stream propagate unchanged)
     """
-    logger.info(f"Exporting {len(data)} pending DOIs to {output_path}")
+    logger.info(f"Exporting pending DOIs to {output_path}")
+    count = 0
     
     # Check if directory exists and is writable
     try:
@@ -590,8 +635,10 @@ def export_pending_dois(
             # Write data rows
             for doi, title, first_author in data:
                 writer.writerow([doi, title, first_author])
+                count += 1
         
-        logger.info(f"Successfully exported {len(data)} pending DOIs to {output_path}")
+        logger.info(f"Successfully exported {count} pending DOIs to {output_path}")
+        return count
         
     except PermissionError as e:
         error_msg = f"Keine Berechtigung zum Schreiben der Datei: {output_path}"
@@ -603,9 +650,9 @@ def export_pending_dois(
         logger.error(f"OS error writing file: {e}")
         raise CSVExportError(error_msg)
     
-    except Exception as e:
-        error_msg = f"Unerwarteter Fehler beim Speichern der CSV-Datei: {str(e)}"
-        logger.error(f"Unexpected error: {e}")
+    except csv.Error as e:
+        error_msg = f"Die CSV-Datei konnte nicht geschrieben werden: {str(e)}"
+        logger.error(f"CSV error writing file: {e}")
         raise CSVExportError(error_msg)
 
 
@@ -672,15 +719,7 @@ def export_dois_with_rights_to_csv(
             writer = csv.writer(csvfile)
             
             # Write header
-            writer.writerow([
-                'DOI',
-                'rights',
-                'rightsUri',
-                'schemeUri',
-                'rightsIdentifier',
-                'rightsIdentifierScheme',
-                'lang'
-            ])
+            writer.writerow(RIGHTS_HEADER)
             
             # Write data rows
             for row in data:
@@ -704,3 +743,226 @@ def export_dois_with_rights_to_csv(
         error_msg = f"Unerwarteter Fehler beim Speichern der CSV-Datei: {str(e)}"
         logger.error(f"Unexpected error: {e}")
         raise CSVExportError(error_msg)
+
+
+def export_stream_atomically(
+    export_function: Callable[[Iterable[Tuple], str], int],
+    rows: Iterable[Tuple],
+    filepath: str
+) -> int:
+    """
+    Run an export function on a row stream without leaving partial files.
+    
+    The rows are written to a temporary ".part" file that replaces filepath
+    only if the export succeeds and at least one row was written. If the
+    stream fails midway (e.g. the database connection drops), any previous
+    file at filepath is kept.
+    
+    Args:
+        export_function: export_dois_download_urls or export_pending_dois
+        rows: Row stream passed to the export function
+        filepath: Final CSV file path
+        
+    Returns:
+        Number of rows written (0 means no file was created)
+        
+    Raises:
+        CSVExportError: If the file cannot be written (exceptions raised by
+                        the row stream, e.g. DatabaseError, propagate unchanged)
+    """
+    part_path = filepath + ".part"
+    try:
+        count = export_function(rows, part_path)
+        if count:
+            os.replace(part_path, filepath)
+        return count
+    except OSError as e:
+        error_msg = f"Die CSV-Datei konnte nicht gespeichert werden: {str(e)}"
+        logger.error(f"OS error finalizing file: {e}")
+        raise CSVExportError(error_msg)
+    finally:
+        if os.path.exists(part_path):
+            try:
+                os.remove(part_path)
+            except OSError as e:
+                logger.warning(f"Could not remove partial export {part_path}: {e}")
+
+
+class IncrementalCSVWriter:
+    """
+    Write a DataCite metadata export to CSV page by page.
+    
+    Streaming counterpart of the export_dois_*_to_csv functions: rows are
+    written as soon as a page arrives (see DataCiteClient.iter_facet_pages()),
+    so memory usage does not grow with the number of DOIs. The file has the
+    same name, header and row layout as the corresponding export function.
+    
+    Rows are written to a temporary ".part" file that replaces the target
+    file only when the export completes, so an aborted export never leaves a
+    truncated CSV behind. If no rows were written, no file is created.
+    
+    Usage:
+        with IncrementalCSVWriter("creators", username, output_dir) as writer:
+            for page in client.iter_facet_pages("creators"):
+                writer.write_rows(page)
+        print(writer.filepath, writer.row_count, writer.doi_count)
+    """
+    
+    def __init__(self, facet: str, username: str, output_dir: Optional[str] = None):
+        """
+        Initialize the writer.
+        
+        Args:
+            facet: Export type, one of the keys of EXPORT_LAYOUTS
+            username: DataCite username (used for filename)
+            output_dir: Directory where CSV should be saved.
+                       If None, uses current working directory.
+        
+        Raises:
+            ValueError: If the facet is unknown
+        """
+        if facet not in EXPORT_LAYOUTS:
+            raise ValueError(f"Unknown export facet: {facet}")
+        
+        if output_dir is None:
+            output_dir = os.getcwd()
+        
+        suffix, self.header = EXPORT_LAYOUTS[facet]
+        
+        # Sanitize username for filename (remove problematic characters)
+        safe_username = "".join(c if c.isalnum() or c in ".-_" else "_" for c in username)
+        
+        self.facet = facet
+        self.output_dir = output_dir
+        self.filepath = str(Path(output_dir) / f"{safe_username}_{suffix}.csv")
+        self.row_count = 0
+        self.doi_count = 0
+        self.warnings_count = 0  # Publisher rows without publisherIdentifier
+        self._part_path = self.filepath + ".part"
+        self._file = None
+        self._writer = None
+        self._last_doi = None
+    
+    def __enter__(self) -> "IncrementalCSVWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+    
+    def write_rows(self, rows: Iterable[Tuple]) -> int:
+        """
+        Append rows to the CSV file.
+        
+        Args:
+            rows: Row tuples in the layout of the export facet
+            
+        Returns:
+            Number of rows written
+            
+        Raises:
+            CSVExportError: If the file cannot be created or written
+        """
+        written = 0
+        try:
+            for row in rows:
+                if self._writer is None:
+                    self._open()
+                self._writer.writerow(row)
+                written += 1
+                
+                # Rows of one DOI are consecutive, so counting DOI changes
+                # gives the number of unique DOIs without keeping a set
+                if row[0] != self._last_doi:
+                    self.doi_count += 1
+                    self._last_doi = row[0]
+                
+                # Check if publisherIdentifier is empty (column index 2)
+                if self.facet == "publisher" and len(row) >= 3 and (not row[2] or not str(row[2]).strip()):
+                    self.warnings_count += 1
+                    logger.warning(f"DOI {row[0]} has no publisherIdentifier")
+        
+        except PermissionError as e:
+            error_msg = f"Keine Berechtigung zum Schreiben der Datei: {self.filepath}"
+            logger.error(f"Permission error writing file: {e}")
+            raise CSVExportError(error_msg)
+        
+        except OSError as e:
+            # This could be disk full, invalid path, etc.
+            error_msg = f"Die CSV-Datei konnte nicht gespeichert werden: {str(e)}"
+            logger.error(f"OS error writing file: {e}")
+            raise CSVExportError(error_msg)
+        
+        self.row_count += written
+        return written
+    
+    def close(self) -> Optional[str]:
+        """
+        Finish the export and move the file to its final name.
+        
+        Returns:
+            Path to the created CSV file, or None if no rows were written
+            
+        Raises:
+            CSVExportError: If the file cannot be finalized
+        """
+        if self._file is None:
+            logger.info(f"No {self.facet} entries to export, no file created")
+            return None
+        
+        try:
+            self._file.close()
+            self._file = None
+            os.replace(self._part_path, self.filepath)
+        except OSError as e:
+            error_msg = f"Die CSV-Datei konnte nicht gespeichert werden: {str(e)}"
+            logger.error(f"OS error finalizing file: {e}")
+            raise CSVExportError(error_msg)
+        
+        logger.info(f"Successfully exported {self.row_count} {self.facet} entries to {self.filepath}")
+        if self.warnings_count > 0:
+            logger.warning(f"{self.warnings_count} DOIs have no publisherIdentifier")
+        return self.filepath
+    
+    def abort(self):
+        """Discard the partially written file, keeping any previous export."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self._part_path):
+            try:
+                os.remove(self._part_path)
+            except OSError as e:
+                logger.warning(f"Could not remove partial export {self._part_path}: {e}")
+        logger.info(f"Export of {self.facet} entries aborted after {self.row_count} rows")
+    
+    def _open(self):
+        """Create the output directory and the temporary file, and write the header."""
+        try:
+            output_path = Path(self.output_dir)
+            if not output_path.exists():
+                output_path.mkdir(parents=True, exist_ok=True)
+                logger.debug(f"Created output directory: {self.output_dir}")
+            
+            # Test write permissions
+            if not os.access(self.output_dir, os.W_OK):
+                error_msg = f"Keine Schreibrechte für Verzeichnis: {self.output_dir}"
+                logger.error(error_msg)
+                raise CSVExportError(error_msg)
+        
+        except PermissionError as e:
+            error_msg = f"Keine Berechtigung zum Erstellen des Verzeichnisses: {self.output_dir}"
+            logger.error(f"Permission error: {e}")
+            raise CSVExportError(error_msg)
+        except OSError as e:
+            error_msg = f"Fehler beim Erstellen des Verzeichnisses: {str(e)}"
+            logger.error(f"OS error: {e}")
+            raise CSVExportError(error_msg)
+        
+        logger.info(f"Streaming {self.facet} export to {self.filepath}")
+        self._file = open(self._part_path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.header)
@@ -0,0 +1,258 @@
+"""Concurrent URL checking with global and per-host limits."""
+
+import logging
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+
+logger = logging.getLogger(__name__)
+
+
+def url_host(url: str) -> str:
+    """
+    Return the host part of a URL (lowercase, including a non-default port).
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        Host key used for per-host limits, or "" if the URL has no host
+    """
+    try:
+        return urlsplit(url).netloc.rsplit("@", 1)[-1].lower()
+    except ValueError:
+        return ""
+
+
+class LinkChecker:
+    """
+    Run a check function for many URLs on a thread pool.
+
+    - At most max_workers checks run at the same time (global cap).
+    - At most per_host_limit checks run against the same host, so a single
+      slow server cannot occupy all threads.
+    - Checks against the same host start at least host_delay seconds apart
+      (politeness delay).
+    - URLs are grouped by host and at most max_active_hosts hosts are worked
+      on at a time; a host stays active until all its URLs are done, so its
+      checks run back to back on the same keep-alive connections instead of
+      being spread over the whole run.
+    - An optional host_error callback can declare a host unreachable (e.g. an
+      open circuit breaker). If the error has a retry_in attribute (like
+      HostUnreachableError), the host's URLs are held back until then and a
+      single probe check is sent; if it succeeds the host's queue resumes,
+      if the host is still unreachable afterwards its remaining URLs are
+      reported with the error. Errors without retry_in fail the remaining
+      URLs at once.
+
+    Scheduling happens in the consuming thread: a check is only handed to the
+    pool once its host has a free slot, so no thread ever waits for a host.
+    Results are yielded as soon as they are available (completion order).
+
+    Errors raised by the check function are not raised by the checker but
+    returned with the result.
+
+    Usage:
+        checker = LinkChecker(check_url)
+        for key, url, status, error in checker.run(items):
+            ...
+    """
+
+    DEFAULT_MAX_WORKERS = 16
+    DEFAULT_PER_HOST_LIMIT = 4
+    DEFAULT_HOST_DELAY = 0.05  # Seconds between two request starts on the same host
+    DEFAULT_MAX_ACTIVE_HOSTS = 100  # Hosts worked on at the same time
+
+    def __init__(
+        self,
+        check: Callable[[str], Any],
+        max_workers: Optional[int] = None,
+        per_host_limit: Optional[int] = None,
+        host_delay: Optional[float] = None,
+        max_active_hosts: Optional[int] = None,
+        host_error: Optional[Callable[[str], Optional[Exception]]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the checker.
+
+        Args:
+            check: Function checking one URL (e.g. returning the HTTP status code)
+            max_workers: Maximum number of concurrent checks (default: DEFAULT_MAX_WORKERS)
+            per_host_limit: Maximum concurrent checks per host (default: DEFAULT_PER_HOST_LIMIT)
+            host_delay: Minimum seconds between check starts on one host (default: DEFAULT_HOST_DELAY)
+            max_active_hosts: Maximum number of hosts worked on at the same time
+                              (default: DEFAULT_MAX_ACTIVE_HOSTS)
+            host_error: Function returning an exception for hosts whose queued
+                        URLs should not be checked now, else None
+            clock: Monotonic clock function (injectable for tests)
+        """
+        self.check = check
+        self.max_workers = max(1, max_workers or self.DEFAULT_MAX_WORKERS)
+        self.per_host_limit = max(1, per_host_limit or self.DEFAULT_PER_HOST_LIMIT)
+        self.host_delay = self.DEFAULT_HOST_DELAY if host_delay is None else max(0.0, host_delay)
+        self.max_active_hosts = max(1, max_active_hosts or self.DEFAULT_MAX_ACTIVE_HOSTS)
+        self.host_error = host_error
+        self._clock = clock
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._cancelled = False
+
+    def run(self, items: Iterable[Tuple[Any, str]]) -> Iterator[Tuple[Any, str, Any, Optional[Exception]]]:
+        """
+        Check all URLs and yield the results in completion order.
+
+        Args:
+            items: (key, url) pairs; key is passed through unchanged
+
+        Yields:
+            (key, url, result, error) tuples - result is the return value of
+            the check function (None on error), error the raised exception or None
+        """
+        waiting: "OrderedDict[str, Deque[Tuple[Any, str]]]" = OrderedDict()
+        for key, url in items:
+            waiting.setdefault(url_host(url), deque()).append((key, url))
+        if not waiting:
+            return
+
+        # Hosts being worked on: queues holds those with URLs left to start,
+        # admitted additionally those that only have checks in flight
+        queues: "OrderedDict[str, Deque[Tuple[Any, str]]]" = OrderedDict()
+        admitted: Set[str] = set()
+        in_flight: Dict[str, int] = {}
+        next_start: Dict[str, float] = {}
+        futures: Dict[Any, Tuple[str, Any, str]] = {}
+        # Hosts declared unreachable: parked ones wait for their probe time,
+        # probing ones for the result of their probe, probed ones are decided
+        # by the next host_error call
+        parked: Dict[str, float] = {}
+        probing: Set[str] = set()
+        probed: Set[str] = set()
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="link-check"
+        )
+        try:
+            while (waiting or queues or futures) and not self._cancelled:
+                while waiting and len(admitted) < self.max_active_hosts:
+                    host, queue = waiting.popitem(last=False)
+                    queues[host] = queue
+                    admitted.add(host)
+
+                if self.host_error is not None:
+                    now = self._clock()
+                    for host in list(queues):
+                        if host in probing:
+                            continue
+                        error = self.host_error(host)
+                        if error is None:
+                            # Reachable, or the probe of a parked host is due
+                            probed.discard(host)
+                            if parked.pop(host, None) is not None:
+                                probing.add(host)
+                                self._submit(queues, host, in_flight, next_start, futures)
+                            continue
+                        retry_in = getattr(error, "retry_in", None)
+                        if retry_in is not None and host not in probed:
+                            parked[host] = now + retry_in
+                            continue
+                        # No probe possible, or the probe failed: give up on the host
+                        parked.pop(host, None)
+                        probed.discard(host)
+                        for key, url in queues.pop(host):
+                            yield key, url, None, error
+                        if not in_flight.get(host):
+                            admitted.discard(host)
+                    if not queues and not futures:
+                        continue
+
+                wake_at = self._dispatch(queues, in_flight, next_start, futures, parked.keys() | probing)
+                if parked:
+                    probe_at = min(parked.values())
+                    wake_at = probe_at if wake_at is None else min(wake_at, probe_at)
+                if not futures:
+                    # Every host with work left is waiting for its politeness delay
+                    if wake_at is not None:
+                        time.sleep(max(0.0, wake_at - self._clock()))
+                    continue
+
+                timeout = None if wake_at is None else max(0.0, wake_at - self._clock())
+                done, _ = wait(futures, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    host, key, url = futures.pop(future)
+                    in_flight[host] -= 1
+                    if host in probing:
+                        probing.discard(host)
+                        probed.add(host)
+                    if not in_flight[host] and host not in queues:
+                        admitted.discard(host)
+                    try:
+                        result, error = future.result(), None
+                    except Exception as e:
+                        result, error = None, e
+                    yield key, url, result, error
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop checking and discard checks that have not started yet."""
+        self._cancelled = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _dispatch(
+        self,
+        queues: "OrderedDict[str, Deque[Tuple[Any, str]]]",
+        in_flight: Dict[str, int],
+        next_start: Dict[str, float],
+        futures: Dict[Any, Tuple[str, Any, str]],
+        held: Set[str] = frozenset()
+    ) -> Optional[float]:
+        """
+        Hand queued checks to the pool as far as the limits allow.
+
+        Hosts are served round-robin, so all hosts make progress. Hosts in
+        held (unreachable ones) are skipped.
+
+        Returns:
+            Earliest time a host that is only blocked by its politeness delay
+            may start its next check, or None if no host is waiting for that
+        """
+        wake_at = None
+        progress = True
+        while progress and len(futures) < self.max_workers:
+            progress = False
+            now = self._clock()
+            for host in list(queues):
+                if len(futures) >= self.max_workers:
+                    break
+                if host in held or in_flight.get(host, 0) >= self.per_host_limit:
+                    continue
+                start = next_start.get(host, 0.0)
+                if start > now:
+                    wake_at = start if wake_at is None else min(wake_at, start)
+                    continue
+
+                self._submit(queues, host, in_flight, next_start, futures)
+                progress = True
+        return wake_at
+
+    def _submit(
+        self,
+        queues: "OrderedDict[str, Deque[Tuple[Any, str]]]",
+        host: str,
+        in_flight: Dict[str, int],
+        next_start: Dict[str, float],
+        futures: Dict[Any, Tuple[str, Any, str]]
+    ):
+        """Start the check of the next queued URL of a host."""
+        key, url = queues[host].popleft()
+        if not queues[host]:
+            del queues[host]
+        in_flight[host] = in_flight.get(host, 0) + 1
+        next_start[host] = self._clock() + self.host_delay
+        futures[self._executor.submit(self.check, url)] = (host, key, url)
@@ -1,10 +1,10 @@
 """Worker thread for updating DOI creator metadata via DataCite API and Database."""
 
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from PySide6.QtCore import QObject, Signal, QSettings
 
-from src.api.datacite_client import DataCiteClient, NetworkError, DataCiteAPIError, AuthenticationError
+from src.api.datacite_client import DataCiteClient, MetadataPrefetcher, NetworkError, DataCiteAPIError, AuthenticationError
 from src.utils.csv_parser import CSVParser, CSVParseError
 from src.db.sumariopmd_client import (
     SumarioPMDClient,
@@ -34,6 +34,9 @@ class AuthorsUpdateWorker(QObject):
     datacite_update = Signal(str)    # DataCite update status
     database_update = Signal(str)    # Database update status
     
+    # DOIs written per database transaction in batch-commit mode
+    DB_BATCH_SIZE = 50
+    
     def __init__(
         self, 
         username: str, 
@@ -41,7 +44,8 @@ class AuthorsUpdateWorker(QObject):
         csv_path: str, 
         use_test_api: bool = False,
         dry_run_only: bool = True,
-        credentials_are_new: bool = False
+        credentials_are_new: bool = False,
+        db_batch_size: int = 1
     ):
         """
         Initialize the authors update worker.
@@ -53,6 +57,9 @@ class AuthorsUpdateWorker(QObject):
             use_test_api: If True, use test API instead of production
             dry_run_only: If True, only validate without updating
             credentials_are_new: Whether these are newly entered credentials (not from saved account)
+            db_batch_size: Number of DOIs whose database updates share one
+                           transaction (each DOI in its own savepoint); 1 commits
+                           every DOI separately
         """
         super().__init__()
         self.username = username
@@ -61,6 +68,7 @@ class AuthorsUpdateWorker(QObject):
         self.use_test_api = use_test_api
         self.dry_run_only = dry_run_only
         self.credentials_are_new = credentials_are_new
+        self.db_batch_size = max(1, int(db_batch_size))
         self._is_running = False
         self._first_success = False
         
@@ -223,6 +231,40 @@ class AuthorsUpdateWorker(QObject):
             logger.error(f"Database initialization failed: {e}")
             return False
     
+    def _update_database_batch(self, dois: List[str], creators_by_doi: dict) -> Dict[str, Any]:
+        """
+        Write the creators of several DOIs in one database transaction (batch-commit mode).
+        
+        Each DOI runs in its own savepoint, so a failing DOI is rolled back on
+        its own. The batch is committed before any of its DOIs is sent to
+        DataCite, which keeps the Database-First pattern intact.
+        
+        Args:
+            dois: DOIs of the batch
+            creators_by_doi: Creator data per DOI (from the CSV)
+            
+        Returns:
+            Dictionary mapping DOIs to the (success, message, errors) tuple of
+            the update, or to the exception that prevented it. DOIs that are
+            not in the database are left out.
+        """
+        results: Dict[str, Any] = {}
+        try:
+            with self.db_client.batch_transaction() as batch:
+                for doi in dois:
+                    try:
+                        resource_id = self.db_client.get_resource_id_for_doi(doi)
+                    except DatabaseError as e:
+                        results[doi] = e
+                        continue
+                    if resource_id is not None:
+                        results[doi] = batch.update_creators(resource_id, creators_by_doi[doi])
+        except (DatabaseError, DBConnectionError, TransactionError) as e:
+            # Nothing of this batch was committed
+            logger.error(f"Database batch of {len(dois)} DOIs failed: {e}")
+            return {doi: e for doi in dois}
+        return results
+    
     def run(self):
         """
         Execute the creator update process with Database-First Pattern.
@@ -236,6 +278,8 @@ class AuthorsUpdateWorker(QObject):
         6. Emit progress signals and final results
         """
         self._is_running = True
+        prefetcher = None
+        client = None
         
         try:
             # Step 1: Parse CSV file
@@ -331,6 +375,11 @@ class AuthorsUpdateWorker(QObject):
             metadata_cache = {}  # Cache metadata for later updates
             skipped_details = []  # List of (doi, reason) tuples for skipped DOIs
             
+            # Current metadata is fetched concurrently ahead of the loop and
+            # handed out in CSV order
+            prefetcher = MetadataPrefetcher(client, list(creators_by_doi.keys()))
+            prefetched_metadata = iter(prefetcher)
+            
             for index, (doi, creators) in enumerate(creators_by_doi.items(), start=1):
                 if not self._is_running:
                     logger.info("Validation process cancelled by user")
@@ -345,7 +394,9 @@ class AuthorsUpdateWorker(QObject):
                 
                 # Fetch current metadata
                 try:
-                    metadata = client.get_doi_metadata(doi)
+                    _, metadata, fetch_error = next(prefetched_metadata)
+                    if fetch_error is not None:
+                        raise fetch_error
                     
                     if metadata is None:
                         invalid_count += 1
@@ -362,7 +413,7 @@ class AuthorsUpdateWorker(QObject):
                     metadata_cache[doi] = metadata
                     
                     # Validate creators match
-                    is_valid, message = client.validate_creators_match(doi, creators)
+                    is_valid, message = client.validate_creators_match(doi, creators, metadata=metadata)
                     
                     if is_valid:
                         # Phase 2: Check if creators actually changed
@@ -485,11 +536,38 @@ class AuthorsUpdateWorker(QObject):
                 if len(skipped_dois) > 10:
                     logger.info(f"  ... and {len(skipped_dois) - 10} more")
             
+            # Resolve all resource_ids up front in a few bulk queries; the
+            # per-DOI lookups below are then served from the client's cache
+            if self.db_client and self.db_updates_enabled and valid_dois_with_changes:
+                try:
+                    self.db_client.get_resource_ids_for_dois(valid_dois_with_changes)
+                except DatabaseError as e:
+                    logger.warning(f"Bulk resource_id lookup failed, falling back to per-DOI lookups: {e}")
+            
+            # Batch-commit mode: the database updates of DB_BATCH_SIZE DOIs are
+            # committed together before their DataCite updates run
+            batch_mode = bool(self.db_client and self.db_updates_enabled and self.db_batch_size > 1)
+            db_batch_results: Dict[str, Any] = {}
+            batch_end = 0
+            
             for index, doi in enumerate(valid_dois_with_changes, start=1):
-                if not self._is_running:
+                # A committed batch is always finished, otherwise its remaining
+                # DOIs would be changed in the database but not in DataCite
+                if not self._is_running and index > batch_end:
                     logger.info("Update process cancelled by user")
                     break
                 
+                if batch_mode and index > batch_end:
+                    batch_end = min(index - 1 + self.db_batch_size, total_updates)
+                    self.database_update.emit(
+                        f"⏳ Datenbank-Batch: DOIs {index}-{batch_end} werden in einer Transaktion aktualisiert..."
+                    )
+                    batch_dois = [
+                        batch_doi for batch_doi in valid_dois_with_changes[index - 1:batch_end]
+                        if metadata_cache.get(batch_doi) is not None
+                    ]
+                    db_batch_results = self._update_database_batch(batch_dois, creators_by_doi)
+                
                 # Emit progress
                 self.progress_update.emit(
                     index, 
@@ -523,6 +601,10 @@ class AuthorsUpdateWorker(QObject):
                         logger.info(f"Starting database update for DOI: {doi}")
                         
                         try:
+                            db_batch_result = db_batch_results.get(doi)
+                            if isinstance(db_batch_result, Exception):
+                                raise db_batch_result
+                            
                             # Get resource_id for DOI
                             resource_id = self.db_client.get_resource_id_for_doi(doi)
                             
@@ -534,11 +616,15 @@ class AuthorsUpdateWorker(QObject):
                                 logger.warning(f"DOI {doi} not found in database - skipping DB update")
                                 self.database_update.emit(f"  ⚠️ {db_message}")
                             else:
-                                # Update creators transactionally
-                                db_success, db_message, db_errors = self.db_client.update_creators_transactional(
-                                    resource_id,
-                                    creators
-                                )
+                                if db_batch_result is not None:
+                                    # Already written (and committed) by the batch
+                                    db_success, db_message, db_errors = db_batch_result
+                                else:
+                                    # Update creators transactionally
+                                    db_success, db_message, db_errors = self.db_client.update_creators_transactional(
+                                        resource_id,
+                                        creators
+                                    )
                                 
                                 if db_success:
                                     logger.info(f"Database update successful for DOI: {doi}")
@@ -654,6 +740,20 @@ class AuthorsUpdateWorker(QObject):
                     # Critical network error - abort process
                     error_msg = f"Netzwerkfehler: {str(e)}"
                     logger.error(error_msg)
+                    
+                    # DOIs of the committed batch that never reached DataCite
+                    for pending_doi in valid_dois_with_changes[index:batch_end]:
+                        db_batch_result = db_batch_results.get(pending_doi)
+                        if isinstance(db_batch_result, tuple) and db_batch_result[0]:
+                            logger.critical(
+                                f"INCONSISTENCY DETECTED: Database committed but DataCite not updated for DOI: {pending_doi}"
+                            )
+                            error_count += 1
+                            error_list.append(
+                                f"{pending_doi}: INKONSISTENZ - Datenbank erfolgreich, DataCite wegen "
+                                f"Netzwerkfehler nicht aktualisiert. Manuelle Korrektur erforderlich!"
+                            )
+                    
                     self.error_occurred.emit(error_msg)
                     self.finished.emit(success_count, error_count, skipped_count, error_list, skipped_details)
                     return
@@ -684,6 +784,12 @@ class AuthorsUpdateWorker(QObject):
             self.finished.emit(success_count, error_count, skipped_count, error_list, skipped_details)
         
         finally:
+            if prefetcher is not None:
+                prefetcher.close()
+            if client is not None:
+                client.close()
+            if self.db_client is not None:
+                self.db_client.close_pool()
             self._is_running = False
     
     def stop(self):
@@ -1,22 +1,41 @@
 """Worker for checking download URLs for HTTP 404 responses."""
 
 import logging
-from typing import List, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from PySide6.QtCore import QObject, Signal
 
+from src.api.circuit_breaker import HostCircuitBreaker, HostUnreachableError
 from src.db.sumariopmd_client import SumarioPMDClient, DatabaseError, ConnectionError as DBConnectionError
+from src.api.link_check_cache import LinkCheckCache, LinkCheckCacheError, LinkCheckResult
+from src.utils.link_checker import LinkChecker, url_host
 
 logger = logging.getLogger(__name__)
 
 
 class DeadLinksCheckWorker(QObject):
-    """Worker that checks download URLs from the database for dead links."""
+    """
+    Worker that checks download URLs from the database for dead links.
+
+    Each distinct URL is requested once, even if many DOIs reference it, and
+    URLs are checked concurrently host by host (see LinkChecker); progress is
+    reported as each check completes. Hosts that stop answering are cut off
+    by a circuit breaker instead of costing one timeout per URL. With a
+    LinkCheckCache, URLs verified within the cache TTL are not requested
+    again, and older results are revalidated with conditional requests.
+    """
 
     progress_update = Signal(int, int, str)  # current, total, message
     finished = Signal(list, int, int, int)  # dead_links, checked_count, skipped_count, error_count
     error_occurred = Signal(str)
+    hosts_unreachable = Signal(dict)  # host -> number of DOI/URL pairs not checked
+
+    POOL_HOSTS = 100  # Hosts whose keep-alive connection pools are kept open
+    DEFAULT_CACHE_TTL_HOURS = 168  # Reuse successful results for one week
+    CACHE_WRITE_BATCH = 200  # Results written to the cache per transaction
 
     def __init__(
         self,
@@ -24,14 +43,44 @@ class DeadLinksCheckWorker(QObject):
         db_name: str,
         db_user: str,
         db_password: str,
-        timeout: int = 10
+        timeout: int = 10,
+        max_workers: int = LinkChecker.DEFAULT_MAX_WORKERS,
+        per_host_limit: int = LinkChecker.DEFAULT_PER_HOST_LIMIT,
+        host_delay: float = LinkChecker.DEFAULT_HOST_DELAY,
+        result_cache: Optional[LinkCheckCache] = None,
+        cache_ttl_hours: float = DEFAULT_CACHE_TTL_HOURS,
+        circuit_breaker: Optional[HostCircuitBreaker] = None
     ):
+        """
+        Initialize the worker.
+
+        Args:
+            db_host: Database host
+            db_name: Database name
+            db_user: Database username
+            db_password: Database password
+            timeout: Timeout per HTTP request in seconds
+            max_workers: Maximum number of URLs checked at the same time
+            per_host_limit: Maximum number of concurrent requests per host
+            host_delay: Minimum seconds between two requests to the same host
+            result_cache: Optional persistent store of check results; the
+                          worker closes it when the check is done
+            cache_ttl_hours: Hours during which a successful result is reused
+                             without a request
+            circuit_breaker: Per-host circuit breaker (default: new HostCircuitBreaker)
+        """
         super().__init__()
         self.db_host = db_host
         self.db_name = db_name
         self.db_user = db_user
         self.db_password = db_password
         self.timeout = timeout
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        self.host_delay = host_delay
+        self.result_cache = result_cache
+        self.cache_ttl_hours = cache_ttl_hours
+        self.circuit_breaker = circuit_breaker or HostCircuitBreaker()
         self._is_running = False
 
     def stop(self):
@@ -46,6 +95,7 @@ class DeadLinksCheckWorker(QObject):
         skipped_count = 0
         error_count = 0
         dead_links: List[Tuple[str, str]] = []
+        db_client = None
 
         try:
             self.progress_update.emit(0, 0, "Verbindung zur Datenbank wird hergestellt...")
@@ -73,35 +123,97 @@ class DeadLinksCheckWorker(QObject):
             total = len(unique_pairs)
             self.progress_update.emit(0, total, f"{total} eindeutige Download-URLs gefunden")
 
-            session = requests.Session()
-            session.headers.update({
-                "User-Agent": "GROBI Dead Link Checker"
-            })
-
-            for idx, (doi, url) in enumerate(unique_pairs, start=1):
-                if not self._is_running:
-                    self.progress_update.emit(idx, total, "Abgebrochen durch Benutzer")
-                    break
-
-                if not url or not url.strip():
-                    skipped_count += 1
-                    continue
-
-                normalized_url = url.strip()
+            # Only HTTP(S) URLs are checked, each distinct URL once; its result
+            # applies to every DOI referencing it (position keeps the input order)
+            referrers: Dict[str, List[Tuple[int, str]]] = {}
+            for position, (doi, url) in enumerate(unique_pairs):
+                normalized_url = (url or "").strip()
                 if not normalized_url.lower().startswith(("http://", "https://")):
                     skipped_count += 1
                     continue
+                referrers.setdefault(normalized_url, []).append((position, doi))
+
+            if len(referrers) < total - skipped_count:
+                self.progress_update.emit(
+                    skipped_count, total,
+                    f"{len(referrers)} verschiedene URLs werden für {total - skipped_count} DOI-Verweise geprüft"
+                )
+
+            # Results verified within the TTL count as checked without a request
+            known = self._load_cached_results(referrers)
+            ttl = timedelta(hours=self.cache_ttl_hours)
+            cached_count = 0
+            pending = []
+            for normalized_url, refs in referrers.items():
+                cached = known.get(normalized_url)
+                if cached is not None and cached.is_ok and cached.is_fresh(ttl):
+                    cached_count += len(refs)
+                else:
+                    pending.append((normalized_url, normalized_url))
+            checked_count += cached_count
+            if cached_count:
+                self.progress_update.emit(
+                    skipped_count + cached_count, total,
+                    f"{cached_count} URLs innerhalb der letzten {self.cache_ttl_hours:g} Stunden "
+                    f"erfolgreich geprüft (aus Cache)"
+                )
+
+            session = self._create_session()
+            checker = LinkChecker(
+                lambda url: self._check_url(session, url, known.get(url)),
+                max_workers=self.max_workers,
+                per_host_limit=self.per_host_limit,
+                host_delay=self.host_delay,
+                max_active_hosts=self.POOL_HOSTS,
+                host_error=self.circuit_breaker.unreachable_error
+            )
+
+            found_dead_links: List[Tuple[int, str, str]] = []
+            unreachable: Dict[str, int] = {}
+            new_results: List[LinkCheckResult] = []
+            done = skipped_count + cached_count
+            try:
+                for normalized_url, _, result, error in checker.run(pending):
+                    if not self._is_running:
+                        break
+
+                    refs = referrers[normalized_url]
+                    done += len(refs)
+                    if isinstance(error, HostUnreachableError):
+                        error_count += len(refs)
+                        unreachable[error.host] = unreachable.get(error.host, 0) + len(refs)
+                    elif error is not None:
+                        error_count += len(refs)
+                        logger.warning(f"Fehler beim Prüfen {normalized_url}: {error}")
+                    else:
+                        checked_count += len(refs)
+                        new_results.append(result)
+                        if result.status == 404:
+                            found_dead_links.extend(
+                                (position, doi, normalized_url) for position, doi in refs
+                            )
+                        if len(new_results) >= self.CACHE_WRITE_BATCH:
+                            self._store_results(new_results)
+                            new_results = []
+
+                    message = f"Geprüft: {refs[0][1]}"
+                    if len(refs) > 1:
+                        message += f" (+{len(refs) - 1} weitere DOIs mit derselben URL)"
+                    self.progress_update.emit(done, total, message)
+            finally:
+                checker.close()
+                session.close()
+                self._store_results(new_results)
+
+            if not self._is_running:
+                self.progress_update.emit(done, total, "Abgebrochen durch Benutzer")
 
-                self.progress_update.emit(idx, total, f"Prüfe {doi}")
+            dead_links = [(doi, url) for _, doi, url in sorted(found_dead_links)]
 
-                try:
-                    status = self._check_url(session, normalized_url)
-                    checked_count += 1
-                    if status == 404:
-                        dead_links.append((doi, normalized_url))
-                except Exception as e:
-                    error_count += 1
-                    logger.warning(f"Fehler beim Prüfen {normalized_url}: {e}")
+            if unreachable:
+                for host, count in unreachable.items():
+                    logger.warning(f"Host {host} unreachable, {count} URLs not checked")
+                self.hosts_unreachable.emit(unreachable)
 
             self.progress_update.emit(
                 total,
@@ -127,6 +239,31 @@ class DeadLinksCheckWorker(QObject):
             logger.error(error_msg, exc_info=True)
             self.error_occurred.emit(error_msg)
 
+        finally:
+            if self.result_cache is not None:
+                self.result_cache.close()
+            if db_client is not None:
+                db_client.close_pool()
+
+    def _load_cached_results(self, urls: Iterable[str]) -> Dict[str, LinkCheckResult]:
+        """Look up stored results; without a usable cache every URL is checked."""
+        if self.result_cache is None:
+            return {}
+        try:
+            return self.result_cache.get_many(urls)
+        except LinkCheckCacheError as e:
+            logger.warning(f"Link check cache could not be read, checking all URLs: {e}")
+            return {}
+
+    def _store_results(self, results: List[LinkCheckResult]):
+        """Write check results to the cache (failures only cost a re-check next time)."""
+        if self.result_cache is None or not results:
+            return
+        try:
+            self.result_cache.store(results)
+        except LinkCheckCacheError as e:
+            logger.warning(f"Could not store {len(results)} link check results: {e}")
+
     @staticmethod
     def _unique_doi_url_pairs(dois_files: list) -> List[Tuple[str, str]]:
         """Extract unique (doi, url) pairs from the database result list."""
@@ -140,15 +277,76 @@ class DeadLinksCheckWorker(QObject):
             unique_pairs.append((doi, url))
         return unique_pairs
 
-    def _check_url(self, session: requests.Session, url: str) -> int:
-        """Return HTTP status code for the URL (404 indicates dead link)."""
+    def _create_session(self) -> requests.Session:
+        """
+        Create the HTTP session shared by all check threads.
+
+        Returns:
+            requests.Session with one keep-alive connection pool per host
+            (per_host_limit connections each)
+        """
+        session = requests.Session()
+        session.headers.update({
+            "User-Agent": "GROBI Dead Link Checker"
+        })
+
+        # No urllib3 retries: a failing URL is reported as an error
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_HOSTS,
+            pool_maxsize=self.per_host_limit,
+            max_retries=0
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _check_url(
+        self,
+        session: requests.Session,
+        url: str,
+        previous: Optional[LinkCheckResult] = None
+    ) -> LinkCheckResult:
+        """
+        Check one URL (status 404 indicates a dead link).
+
+        A previous successful result is revalidated with a conditional request
+        (If-None-Match/If-Modified-Since); a 304 answer confirms it.
+
+        Raises:
+            HostUnreachableError: If the circuit of the URL's host is open
+            requests.RequestException: If the request fails
+        """
+        host = url_host(url)
+        self.circuit_breaker.before_request(host)
+
+        headers = previous.conditional_headers() if previous is not None and previous.is_ok else {}
         response = None
         try:
-            response = session.head(url, allow_redirects=True, timeout=self.timeout)
-            if response.status_code in (405, 501):
-                response.close()
-                response = session.get(url, allow_redirects=True, stream=True, timeout=self.timeout)
-            return response.status_code
+            try:
+                response = session.head(url, allow_redirects=True, timeout=self.timeout, headers=headers)
+                if response.status_code in (405, 501):
+                    response.close()
+                    response = session.get(
+                        url, allow_redirects=True, stream=True, timeout=self.timeout, headers=headers
+                    )
+            except (requests.ConnectionError, requests.Timeout):
+                self.circuit_breaker.record_failure(host)
+                raise
+            except Exception:
+                # The host answered, but the request failed otherwise (e.g. too many redirects)
+                self.circuit_breaker.record_success(host)
+                raise
+            self.circuit_breaker.record_success(host)
+
+            checked_at = datetime.now(timezone.utc)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if response.status_code == 304 and headers:
+                return LinkCheckResult(
+                    url, previous.status, checked_at,
+                    etag or previous.etag, last_modified or previous.last_modified
+                )
+            return LinkCheckResult(url, response.status_code, checked_at, etag, last_modified)
         finally:
             if response is not None:
                 response.close()
@@ -1,10 +1,11 @@
 """Worker for fetching DOIs with download URLs from database."""
 
 import logging
-from typing import List, Tuple
+from typing import Iterator, Optional, Tuple
 from PySide6.QtCore import QObject, Signal
 
 from src.db.sumariopmd_client import SumarioPMDClient, DatabaseError, ConnectionError as DBConnectionError
+from src.utils.csv_exporter import export_dois_download_urls, export_stream_atomically, CSVExportError
 
 logger = logging.getLogger(__name__)
 
@@ -15,9 +16,17 @@ class DownloadURLFetchWorker(QObject):
     # Signals
     progress = Signal(str)  # Progress messages
     finished = Signal(list)  # List of (DOI, Filename, URL, Description, Format, Size) tuples
+    exported = Signal(str, int, int)  # file_path, file_count, doi_count (streaming export)
     error = Signal(str)     # Error message
     
-    def __init__(self, db_host: str, db_name: str, db_user: str, db_password: str):
+    def __init__(
+        self,
+        db_host: str,
+        db_name: str,
+        db_user: str,
+        db_password: str,
+        output_path: Optional[str] = None
+    ):
         """
         Initialize worker with database credentials.
         
@@ -26,15 +35,19 @@ class DownloadURLFetchWorker(QObject):
             db_name: Database name
             db_user: Database username
             db_password: Database password
+            output_path: If given, stream the entries directly into this CSV file
+                         and emit exported instead of finished
         """
         super().__init__()
         self.db_host = db_host
         self.db_name = db_name
         self.db_user = db_user
         self.db_password = db_password
+        self.output_path = output_path
     
     def run(self):
         """Fetch DOIs with download URLs from database."""
+        db_client = None
         try:
             self.progress.emit("Verbindung zur Datenbank wird hergestellt...")
             
@@ -52,6 +65,10 @@ class DownloadURLFetchWorker(QObject):
                 self.error.emit(f"Datenbankverbindung fehlgeschlagen: {message}")
                 return
             
+            if self.output_path:
+                self._export_to_file(db_client)
+                return
+            
             self.progress.emit("DOIs und Download-URLs werden abgerufen...")
             
             # Fetch all DOIs with download URLs
@@ -83,3 +100,45 @@ class DownloadURLFetchWorker(QObject):
             error_msg = f"Unerwarteter Fehler: {str(e)}"
             logger.error(error_msg, exc_info=True)
             self.error.emit(error_msg)
+        
+        finally:
+            if db_client is not None:
+                db_client.close_pool()
+    
+    def _export_to_file(self, db_client: SumarioPMDClient):
+        """
+        Stream all entries from a server-side cursor into the CSV file.
+        
+        Memory use is constant; the file only appears once the export is complete.
+        
+        Raises:
+            DatabaseError: If reading from the database fails (passed through
+                           the export unchanged)
+        """
+        self.progress.emit("DOIs und Download-URLs werden exportiert...")
+        doi_count = 0
+        
+        def rows() -> Iterator[Tuple]:
+            nonlocal doi_count
+            last_doi = None
+            for row in db_client.iter_all_dois_with_downloads():
+                # Rows are ordered by DOI, so counting changes counts unique DOIs
+                if row[0] != last_doi:
+                    doi_count += 1
+                    last_doi = row[0]
+                yield row
+        
+        try:
+            file_count = export_stream_atomically(export_dois_download_urls, rows(), self.output_path)
+        except CSVExportError as e:
+            error_msg = f"CSV-Export fehlgeschlagen: {str(e)}"
+            logger.error(error_msg)
+            self.error.emit(error_msg)
+            return
+        
+        if not file_count:
+            self.error.emit("Keine DOIs mit Download-URLs gefunden.")
+            return
+        
+        self.progress.emit(f"[OK] {file_count} Dateien für {doi_count} DOIs exportiert")
+        self.exported.emit(self.output_path, file_count, doi_count)
@@ -1,7 +1,7 @@
 """Worker for updating download URLs in database from CSV."""
 
 import logging
-from typing import Dict
+from typing import Any, Dict, List, Tuple
 from PySide6.QtCore import QObject, Signal
 
 from src.db.sumariopmd_client import SumarioPMDClient, DatabaseError, ConnectionError as DBConnectionError
@@ -19,13 +19,17 @@ class DownloadURLUpdateWorker(QObject):
     finished = Signal(int, int, int, list, list)  # success_count, error_count, skipped_count, error_list, skipped_details
     error_occurred = Signal(str)  # error_message
     
+    # Entries written per transaction in bulk mode
+    BULK_CHUNK_SIZE = 200
+    
     def __init__(
         self, 
         csv_path: str,
         db_host: str, 
         db_name: str, 
         db_user: str, 
-        db_password: str
+        db_password: str,
+        bulk_mode: bool = False
     ):
         """
         Initialize worker with CSV path and database credentials.
@@ -36,6 +40,9 @@ class DownloadURLUpdateWorker(QObject):
             db_name: Database name
             db_user: Database username
             db_password: Database password
+            bulk_mode: Load all current file entries with one snapshot read and
+                       write changes in batched transactions instead of two
+                       queries per CSV row
         """
         super().__init__()
         self.csv_path = csv_path
@@ -43,6 +50,7 @@ class DownloadURLUpdateWorker(QObject):
         self.db_name = db_name
         self.db_user = db_user
         self.db_password = db_password
+        self.bulk_mode = bulk_mode
         self._is_running = False
     
     def stop(self):
@@ -58,6 +66,7 @@ class DownloadURLUpdateWorker(QObject):
         skipped_count = 0
         error_list = []  # List of error messages
         skipped_details = []  # List of (doi, filename, reason) tuples
+        db_client = None
         
         try:
             # Step 1: Parse CSV file
@@ -98,9 +107,22 @@ class DownloadURLUpdateWorker(QObject):
                 self.error_occurred.emit(f"Datenbankverbindung fehlgeschlagen: {str(e)}")
                 return
             
+            # Bulk mode: one snapshot read of all affected file entries
+            current_files = None
+            if self.bulk_mode:
+                self.progress_update.emit(0, total_entries, "Aktuelle Einträge werden aus der Datenbank geladen...")
+                try:
+                    current_files = db_client.fetch_files_for_dois(entry['doi'] for entry in entries)
+                except DatabaseError as e:
+                    logger.warning(f"Bulk read of file entries failed, processing row by row: {e}")
+            
             # Step 3: Process each entry
+            chunk_results: List[Any] = []
             for idx, entry in enumerate(entries, start=1):
-                if not self._is_running:
+                position = (idx - 1) % self.BULK_CHUNK_SIZE
+                # A written chunk is always finished, otherwise its remaining
+                # rows would be changed in the database but never reported
+                if not self._is_running and (current_files is None or position == 0):
                     self.progress_update.emit(idx, total_entries, "Abgebrochen durch Benutzer")
                     break
                 
@@ -110,7 +132,19 @@ class DownloadURLUpdateWorker(QObject):
                 self.progress_update.emit(idx, total_entries, f"Verarbeite {doi} / {filename}")
                 
                 try:
-                    result = self._process_entry(db_client, entry)
+                    if current_files is not None:
+                        if position == 0:
+                            chunk = entries[idx - 1:idx - 1 + self.BULK_CHUNK_SIZE]
+                            try:
+                                chunk_results = self._process_chunk(db_client, chunk, current_files)
+                            except Exception as e:
+                                # Every row of the failed chunk reports the error
+                                chunk_results = [e] * len(chunk)
+                        result = chunk_results[position]
+                        if isinstance(result, Exception):
+                            raise result
+                    else:
+                        result = self._process_entry(db_client, entry)
                     
                     if result == 'updated':
                         success_count += 1
@@ -152,6 +186,10 @@ class DownloadURLUpdateWorker(QObject):
             error_msg = f"Unerwarteter Fehler: {str(e)}"
             logger.error(error_msg, exc_info=True)
             self.error_occurred.emit(error_msg)
+        
+        finally:
+            if db_client is not None:
+                db_client.close_pool()
     
     def _process_entry(self, db_client: SumarioPMDClient, entry: Dict) -> str:
         """
@@ -178,7 +216,108 @@ class DownloadURLUpdateWorker(QObject):
         if current is None:
             return 'not_found'
         
-        # Check what has changed
+        changes = self._detect_changes(entry, current)
+        
+        # If no changes, skip
+        if not changes:
+            logger.debug(f"No changes for {doi} / {filename}")
+            return 'skipped'
+        
+        # Perform update
+        logger.info(f"Updating {doi} / {filename}: {list(changes.keys())}")
+        
+        resource_id = current['resource_id']
+        
+        db_client.update_file_entry(
+            resource_id=resource_id,
+            filename=filename,
+            url=changes.get('url'),
+            description=changes.get('description'),
+            filemimetype=changes.get('filemimetype'),
+            size=changes.get('size')
+        )
+        
+        return 'updated'
+    
+    def _process_chunk(
+        self,
+        db_client: SumarioPMDClient,
+        entries: List[Dict],
+        current_files: Dict[Tuple[str, str], Dict[str, Any]]
+    ) -> List[Any]:
+        """
+        Process CSV entries against preloaded file entries (bulk mode).
+        
+        All changes of the chunk are written in one transaction. If that fails,
+        the changed entries are retried one by one, so a single bad row only
+        fails itself.
+        
+        Args:
+            db_client: Database client instance
+            entries: CSV entries of this chunk
+            current_files: Result of SumarioPMDClient.fetch_files_for_dois()
+                           (updated in place with the new values)
+            
+        Returns:
+            One result per entry, like _process_entry(), or the exception
+            raised for that entry
+        """
+        results: List[Any] = []
+        updates: List[Tuple[int, Dict[str, Any]]] = []  # (position in chunk, update)
+        
+        for entry in entries:
+            doi = entry['doi']
+            filename = entry['filename']
+            current = current_files.get((doi.strip().lower(), filename.lower()))
+            
+            if current is None:
+                results.append('not_found')
+                continue
+            
+            changes = self._detect_changes(entry, current)
+            if not changes:
+                logger.debug(f"No changes for {doi} / {filename}")
+                results.append('skipped')
+                continue
+            
+            logger.info(f"Updating {doi} / {filename}: {list(changes.keys())}")
+            updates.append((len(results), {
+                'resource_id': current['resource_id'],
+                'filename': filename,
+                **changes
+            }))
+            # Repeated rows for the same file are compared with the new state
+            current.update(changes)
+            results.append('updated')
+        
+        if not updates:
+            return results
+        
+        try:
+            db_client.update_file_entries([update for _, update in updates])
+        except DatabaseError as e:
+            logger.warning(f"Batch update of {len(updates)} file entries failed, retrying row by row: {e}")
+            for position, update in updates:
+                try:
+                    db_client.update_file_entry(**update)
+                except Exception as row_error:
+                    results[position] = row_error
+        
+        return results
+    
+    @staticmethod
+    def _detect_changes(entry: Dict, current: Dict) -> Dict[str, Any]:
+        """
+        Compare a CSV entry with the current database entry.
+        
+        Args:
+            entry: CSV entry
+            current: Database file entry
+            
+        Returns:
+            Dictionary of changed columns (url, description, filemimetype, size)
+            with their new values
+        """
         changes = {}
         
         # Compare URL
@@ -205,23 +344,4 @@ class DownloadURLUpdateWorker(QObject):
         if csv_size != db_size:
             changes['size'] = csv_size
         
-        # If no changes, skip
-        if not changes:
-            logger.debug(f"No changes for {doi} / {filename}")
-            return 'skipped'
-        
-        # Perform update
-        logger.info(f"Updating {doi} / {filename}: {list(changes.keys())}")
-        
-        resource_id = current['resource_id']
-        
-        db_client.update_file_entry(
-            resource_id=resource_id,
-            filename=filename,
-            url=changes.get('url'),
-            description=changes.get('description'),
-            filemimetype=changes.get('filemimetype'),
-            size=changes.get('size')
-        )
-        
-        return 'updated'
+        return changes
@@ -1,38 +1,104 @@
 """Worker for parallel FAIR assessments using F-UJI API."""
 
+import collections
+import functools
 import logging
 import queue
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from PySide6.QtCore import QObject, Signal, QThread
 
+from src.api.concurrency_limiter import AdaptiveConcurrencyLimiter
+from src.api.fuji_checkpoint import FujiCheckpointJournal, FujiCheckpointError
 from src.api.fuji_client import FujiClient, FujiResult, FujiConnectionError, FujiAuthenticationError
+from src.api.fuji_result_cache import FujiResultCache, FujiResultCacheError
 
 
 logger = logging.getLogger(__name__)
 
+_END_OF_STREAM = None  # Queued by the fetcher after the last DOI (and by cancel())
+_DOI_FETCHED = "fetched"  # Event (kind, doi, updated): DOI to assess
+_RESULT_CACHED = "cached"  # Event (kind, result, None): unchanged DOI served from the result cache
+_ASSESSMENT_DONE = "done"  # Event (kind, future, updated): assessment finished in the pool
+_SLOT_POLL_INTERVAL = 0.5  # Seconds between cancel checks while waiting for a concurrency slot
+
+
+def _load_checkpointed_dois(checkpoint: Optional[FujiCheckpointJournal]) -> Set[str]:
+    """Normalized DOIs completed by an earlier, interrupted run (empty without a usable journal)."""
+    if checkpoint is None:
+        return set()
+    try:
+        return {doi.strip().lower() for doi in checkpoint.load()}
+    except FujiCheckpointError as e:
+        logger.warning(f"Checkpoint journal could not be read, assessing all DOIs: {e}")
+        return set()
+
+
+def _assess_with_limit(
+    fuji_client: FujiClient,
+    concurrency: AdaptiveConcurrencyLimiter,
+    doi: str,
+    is_cancelled: Callable[[], bool]
+) -> Optional[FujiResult]:
+    """
+    Assess a DOI within the adaptive concurrency limit and report its latency.
+    
+    Returns:
+        FujiResult, or None if the run was cancelled while waiting for a slot
+    """
+    while not concurrency.acquire(timeout=_SLOT_POLL_INTERVAL):
+        if is_cancelled():
+            return None
+    
+    started = time.monotonic()
+    latency = None
+    overloaded = False
+    try:
+        result = fuji_client.assess_doi(doi)
+        # Fail-fast results of an open circuit never reached the server
+        if not result.host_unreachable:
+            latency = time.monotonic() - started
+            overloaded = result.server_busy
+        return result
+    except FujiConnectionError:
+        latency = time.monotonic() - started
+        overloaded = True
+        raise
+    finally:
+        concurrency.release(latency, overloaded)
+
 
 class FujiAssessmentWorker(QObject):
     """
     Worker for running FAIR assessments in parallel.
     
     Uses ThreadPoolExecutor to assess multiple DOIs concurrently,
-    emitting signals as each assessment completes.
+    emitting signals as each assessment completes. How many assessments
+    actually run at once is adapted to the F-UJI server's latency and
+    error rate by an AdaptiveConcurrencyLimiter (at most max_workers).
+    
+    With a FujiCheckpointJournal, DOIs completed by an interrupted run are
+    skipped and every new result is journaled; the journal is cleared
+    once all DOIs are done.
     """
     
     # Signals
     doi_assessed = Signal(str, float)  # DOI, score_percent (-1 for error)
     progress = Signal(str)              # Progress message
     error = Signal(str)                 # Error message
+    concurrency_changed = Signal(int)   # Current number of parallel assessments
     finished = Signal()                 # All assessments complete
     
     def __init__(
         self,
         dois: List[str],
         fuji_client: FujiClient = None,
-        max_workers: int = 5
+        max_workers: int = 5,
+        concurrency: Optional[AdaptiveConcurrencyLimiter] = None,
+        checkpoint: Optional[FujiCheckpointJournal] = None
     ):
         """
         Initialize the worker.
@@ -41,12 +107,19 @@ class FujiAssessmentWorker(QObject):
             dois: List of DOIs to assess
             fuji_client: F-UJI client instance (creates default if None)
             max_workers: Maximum parallel workers
+            concurrency: Adaptive limit of parallel assessments
+                         (default: new AdaptiveConcurrencyLimiter up to max_workers)
+            checkpoint: Optional journal of completed assessments for resuming
+                        an interrupted run
         """
         super().__init__()
         
         self.dois = dois
         self.fuji_client = fuji_client or FujiClient()
         self.max_workers = max_workers
+        self.concurrency = concurrency or AdaptiveConcurrencyLimiter(max_limit=max_workers)
+        self.checkpoint = checkpoint
+        self._reported_concurrency = None
         self._cancelled = False
     
     def cancel(self):
@@ -61,8 +134,15 @@ class FujiAssessmentWorker(QObject):
             self.finished.emit()
             return
         
-        logger.info(f"Starting FAIR assessment for {len(self.dois)} DOIs with {self.max_workers} workers")
-        self.progress.emit(f"Starte Bewertung von {len(self.dois)} DOIs...")
+        checkpointed = _load_checkpointed_dois(self.checkpoint)
+        dois = [doi for doi in self.dois if doi.strip().lower() not in checkpointed]
+        resumed = len(self.dois) - len(dois)
+        
+        logger.info(f"Starting FAIR assessment for {len(dois)} DOIs with up to {self.max_workers} workers")
+        message = f"Starte Bewertung von {len(dois)} DOIs..."
+        if resumed:
+            message += f" ({resumed} bereits bewertet, aus Checkpoint übernommen)"
+        self.progress.emit(message)
         
         # Test connection first
         try:
@@ -79,16 +159,18 @@ class FujiAssessmentWorker(QObject):
             return
         
         self.progress.emit("Verbindung zum F-UJI Server hergestellt")
+        self._report_concurrency()
         
         completed = 0
         errors = 0
+        unreachable = 0
         
         try:
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 # Submit all DOIs and track futures
                 future_to_doi = {
                     executor.submit(self._assess_single_doi, doi): doi
-                    for doi in self.dois
+                    for doi in dois
                 }
                 # Keep list of futures for cancellation
                 pending_futures = list(future_to_doi.keys())
@@ -115,11 +197,20 @@ class FujiAssessmentWorker(QObject):
                     try:
                         result = future.result()
                         self.doi_assessed.emit(result.doi, result.score_percent)
+                        self._record_checkpoint(result)
                         
                         if not result.is_success:
                             errors += 1
                             logger.debug(f"Assessment error for {doi}: {result.error}")
                         
+                        if result.host_unreachable:
+                            unreachable += 1
+                            if unreachable == 1:
+                                self.progress.emit(
+                                    f"{result.error} - weitere DOIs werden bis zum nächsten "
+                                    f"Verbindungsversuch übersprungen"
+                                )
+                        
                     except FujiConnectionError as e:
                         # Connection error - likely affects all DOIs
                         self.error.emit(str(e))
@@ -138,10 +229,11 @@ class FujiAssessmentWorker(QObject):
                         errors += 1
                     
                     completed += 1
+                    self._report_concurrency()
                     
                     # Log progress periodically
                     if completed % 10 == 0:
-                        self.progress.emit(f"{completed} von {len(self.dois)} DOIs bewertet...")
+                        self.progress.emit(f"{completed} von {len(dois)} DOIs bewertet...")
         
         except Exception as e:
             logger.error(f"Error in assessment worker: {e}")
@@ -150,7 +242,13 @@ class FujiAssessmentWorker(QObject):
         finally:
             success_count = completed - errors
             logger.info(f"FAIR assessment completed: {success_count} success, {errors} errors")
-            self.progress.emit(f"Bewertung abgeschlossen: {success_count} erfolgreich, {errors} Fehler")
+            message = f"Bewertung abgeschlossen: {success_count} erfolgreich, {errors} Fehler"
+            if resumed:
+                message += f" ({resumed} aus Checkpoint übernommen)"
+            if unreachable:
+                message += f" ({unreachable} nicht bewertet, F-UJI Server nicht erreichbar)"
+            self.progress.emit(message)
+            self._finish_checkpoint(run_complete=completed == len(dois) and not self._cancelled)
             self.finished.emit()
     
     def _assess_single_doi(self, doi: str) -> FujiResult:
@@ -163,7 +261,11 @@ class FujiAssessmentWorker(QObject):
         Returns:
             FujiResult with assessment
         """
-        if self._cancelled:
+        result = None
+        if not self._cancelled:
+            result = _assess_with_limit(self.fuji_client, self.concurrency, doi, lambda: self._cancelled)
+        
+        if result is None:
             return FujiResult(
                 doi=doi,
                 score_percent=-1,
@@ -173,7 +275,33 @@ class FujiAssessmentWorker(QObject):
                 error="Cancelled"
             )
         
-        return self.fuji_client.assess_doi(doi)
+        return result
+    
+    def _report_concurrency(self):
+        """Emit concurrency_changed when the adaptive limit moved."""
+        limit = self.concurrency.limit
+        if limit != self._reported_concurrency:
+            self._reported_concurrency = limit
+            self.concurrency_changed.emit(limit)
+    
+    def _record_checkpoint(self, result: FujiResult):
+        """Journal a successful assessment; journaling stops after the first write error."""
+        if self.checkpoint is None or not result.is_success:
+            return
+        try:
+            self.checkpoint.append(result.doi, result.score_percent)
+        except FujiCheckpointError as e:
+            logger.warning(f"Checkpoint journal disabled: {e}")
+            self.checkpoint = None
+    
+    def _finish_checkpoint(self, run_complete: bool):
+        """Clear the journal of a completed run, keep it for resuming otherwise."""
+        if self.checkpoint is None:
+            return
+        if run_complete:
+            self.checkpoint.clear()
+        else:
+            self.checkpoint.close()
 
 
 class FujiAssessmentThread(QThread):
@@ -195,6 +323,7 @@ class FujiAssessmentThread(QThread):
         dois: List[str],
         fuji_client: FujiClient = None,
         max_workers: int = 5,
+        checkpoint: Optional[FujiCheckpointJournal] = None,
         parent=None
     ):
         """
@@ -204,12 +333,13 @@ class FujiAssessmentThread(QThread):
             dois: List of DOIs to assess
             fuji_client: F-UJI client instance
             max_workers: Maximum parallel workers
+            checkpoint: Optional journal of completed assessments (resume)
             parent: Parent QObject
         """
         super().__init__(parent)
         
         # Create worker without parent so it can be moved to this thread
-        self._worker = FujiAssessmentWorker(dois, fuji_client, max_workers)
+        self._worker = FujiAssessmentWorker(dois, fuji_client, max_workers, checkpoint=checkpoint)
         # Worker stays in main thread until run() is called
         # This avoids the incorrect moveToThread(self) pattern
     
@@ -235,6 +365,27 @@ class StreamingFujiWorker(QObject):
     
     This allows parallel DOI fetching and assessment, starting
     assessments as soon as the first page of DOIs is available.
+    
+    With a FujiResultCache, DOIs whose DataCite `updated` timestamp did not
+    change since their last assessment are served from the cache; only new
+    and modified DOIs are sent to the F-UJI server.
+    
+    Fetcher and assessor form a bounded pipeline, so memory stays constant
+    for any repository size:
+    - At most max_workers * IN_FLIGHT_PER_WORKER assessments are submitted
+      at a time; the assessor waits for a free slot before taking the next DOI.
+    - At most PENDING_QUEUE_SIZE fetched DOIs wait for a slot; when they are
+      used up, the fetcher pauses before requesting the next page.
+    - Fetched DOIs, cache hits and finished assessments (via a completion
+      callback) arrive as events in one queue. The assessor blocks on it and
+      is the only thread that reports results, journals them and frees
+      slots, so no futures are kept beyond the window.
+    
+    Within the window, an AdaptiveConcurrencyLimiter decides how many
+    assessments are sent to the F-UJI server at once (at most max_workers).
+    
+    With a FujiCheckpointJournal, DOIs completed by an interrupted run are
+    discovered but not assessed again, and every new result is journaled.
     """
     
     # Signals
@@ -243,13 +394,21 @@ class StreamingFujiWorker(QObject):
     progress = Signal(str)                # Progress message
     error = Signal(str)                   # Error message
     fetch_complete = Signal(int)          # All DOIs fetched (total count)
+    concurrency_changed = Signal(int)     # Current number of parallel assessments
     finished = Signal()                   # All work complete
     
+    CACHE_WRITE_BATCH = 50  # Assessment results written to the cache per transaction
+    IN_FLIGHT_PER_WORKER = 2  # Submitted assessments per worker thread (keeps workers busy)
+    PENDING_QUEUE_SIZE = 200  # Fetched DOIs waiting for an assessment slot (about two pages)
+    
     def __init__(
         self,
         datacite_client,
         fuji_client: FujiClient = None,
-        max_workers: int = 5
+        max_workers: int = 5,
+        result_cache: Optional[FujiResultCache] = None,
+        concurrency: Optional[AdaptiveConcurrencyLimiter] = None,
+        checkpoint: Optional[FujiCheckpointJournal] = None
     ):
         """
         Initialize the streaming worker.
@@ -258,23 +417,44 @@ class StreamingFujiWorker(QObject):
             datacite_client: DataCite API client for fetching DOIs
             fuji_client: F-UJI client instance (creates default if None)
             max_workers: Maximum parallel assessment workers
+            result_cache: Optional persistent store of assessment results;
+                          the worker closes it when the run is done
+            concurrency: Adaptive limit of parallel assessments
+                         (default: new AdaptiveConcurrencyLimiter up to max_workers)
+            checkpoint: Optional journal of completed assessments for resuming
+                        an interrupted run
         """
         super().__init__()
         
         self.datacite_client = datacite_client
         self.fuji_client = fuji_client or FujiClient()
         self.max_workers = max_workers
+        self.result_cache = result_cache
+        self.concurrency = concurrency or AdaptiveConcurrencyLimiter(max_limit=max_workers)
+        self.checkpoint = checkpoint
+        self._reported_concurrency = None
+        self.metric_version = FujiClient.DEFAULT_METRIC_VERSION
         self._cancelled = False
-        self._doi_queue = queue.Queue()
+        self._events = queue.SimpleQueue()  # Events for the assessor (see _DOI_FETCHED etc.)
+        self._pending_slots = threading.Semaphore(self.PENDING_QUEUE_SIZE)  # Fetched DOIs not yet handled
         self._fetch_complete = threading.Event()
+        self._in_flight = 0  # Submitted assessments not yet reported (assessor thread only)
         self._total_dois = 0
         self._assessed_count = 0
         self._error_count = 0
+        self._unreachable_count = 0
+        self._cached_count = 0
+        self._checkpointed: Set[str] = set()
+        self._resumed_count = 0
+        self._fetch_failed = False
+        self._results_to_cache: List[Tuple[FujiResult, str]] = []
         self._lock = threading.Lock()
     
     def cancel(self):
         """Cancel the assessment process."""
         self._cancelled = True
+        # Wake the assessor if it waits for the next event
+        self._events.put(_END_OF_STREAM)
         logger.info("Streaming FAIR assessment cancelled by user")
     
     def run(self):
@@ -288,14 +468,21 @@ class StreamingFujiWorker(QObject):
                     f"Verbindung zum F-UJI Server fehlgeschlagen.\n"
                     f"Server: {self.fuji_client.endpoint}"
                 )
+                self.datacite_client.close()
                 self.finished.emit()
                 return
         except Exception as e:
             self.error.emit(f"Verbindungstest fehlgeschlagen: {str(e)}")
+            self.datacite_client.close()
             self.finished.emit()
             return
         
         self.progress.emit("Verbindung zum F-UJI Server hergestellt")
+        self._report_concurrency()
+        
+        self._checkpointed = _load_checkpointed_dois(self.checkpoint)
+        if self._checkpointed:
+            self.progress.emit(f"Setze Bewertung fort: {len(self._checkpointed)} DOIs bereits bewertet")
         
         # Start fetcher and assessor threads
         fetch_thread = threading.Thread(target=self._fetch_dois, daemon=True)
@@ -308,10 +495,22 @@ class StreamingFujiWorker(QObject):
         fetch_thread.join()
         assess_thread.join()
         
+        if self.result_cache is not None:
+            self._flush_result_cache()
+            self.result_cache.close()
+        
         if not self._cancelled:
             success = self._assessed_count - self._error_count
-            self.progress.emit(f"Bewertung abgeschlossen: {success} erfolgreich, {self._error_count} Fehler")
+            message = f"Bewertung abgeschlossen: {success} erfolgreich, {self._error_count} Fehler"
+            if self._cached_count:
+                message += f" ({self._cached_count} unverändert aus Cache)"
+            if self._resumed_count:
+                message += f" ({self._resumed_count} aus Checkpoint übernommen)"
+            if self._unreachable_count:
+                message += f" ({self._unreachable_count} nicht bewertet, F-UJI Server nicht erreichbar)"
+            self.progress.emit(message)
         
+        self._finish_checkpoint(run_complete=not self._cancelled and not self._fetch_failed)
         self.finished.emit()
     
     def _fetch_dois(self):
@@ -324,22 +523,35 @@ class StreamingFujiWorker(QObject):
             while not self._cancelled:
                 # Fetch one page using cursor-based pagination
                 try:
-                    # _fetch_page returns (dois_list, next_url)
-                    dois_with_urls, next_url = self.datacite_client._fetch_page(next_url)
+                    # Both page functions return (dois_list, next_url)
+                    if self.result_cache is not None:
+                        entries, next_url = self.datacite_client._fetch_page_with_updated(next_url)
+                    else:
+                        dois_with_urls, next_url = self.datacite_client._fetch_page(next_url)
+                        entries = [(doi, url, "") for doi, url in dois_with_urls]
                     
-                    if not dois_with_urls:
+                    if not entries:
                         break
                     
-                    # Process each DOI (dois_with_urls is list of (doi, url) tuples)
-                    for doi, url in dois_with_urls:
+                    cached = self._load_cached_results(entries)
+                    
+                    # Process each DOI (entries is list of (doi, url, updated) tuples)
+                    for doi, url, updated in entries:
                         if self._cancelled:
                             break
                         
                         if doi:
                             # Emit discovery signal and queue for assessment
                             self.doi_discovered.emit(doi)
-                            self._doi_queue.put(doi)
                             total_fetched += 1
+                            if doi.strip().lower() in self._checkpointed:
+                                # Tile was restored from the checkpoint journal
+                                self._resumed_count += 1
+                            elif doi in cached:
+                                if not self._enqueue((_RESULT_CACHED, cached[doi], None)):
+                                    break
+                            elif not self._enqueue((_DOI_FETCHED, doi, updated)):
+                                break
                     
                     self.progress.emit(f"Seite {page_num}: {total_fetched} DOIs geladen, Bewertung läuft...")
                     
@@ -352,6 +564,7 @@ class StreamingFujiWorker(QObject):
                 except Exception as e:
                     logger.error(f"Error fetching page {page_num}: {e}")
                     self.error.emit(f"Fehler beim Abrufen von Seite {page_num}: {str(e)}")
+                    self._fetch_failed = True
                     break
             
             self._total_dois = total_fetched
@@ -359,69 +572,158 @@ class StreamingFujiWorker(QObject):
             logger.info(f"DOI fetch complete: {total_fetched} DOIs")
             
         finally:
+            # The fetcher is the only user of the DataCite session
+            self.datacite_client.close()
             self._fetch_complete.set()
+            self._events.put(_END_OF_STREAM)
+    
+    def _enqueue(self, event) -> bool:
+        """
+        Hand a fetched DOI to the assessor, waiting while PENDING_QUEUE_SIZE are pending.
+        
+        Returns:
+            False if the run was cancelled while waiting
+        """
+        while not self._cancelled:
+            # The timeout only bounds the reaction time to cancel()
+            if self._pending_slots.acquire(timeout=0.5):
+                self._events.put(event)
+                return True
+        return False
     
     def _assess_dois(self):
-        """Assess DOIs from the queue using thread pool."""
+        """
+        Handle pipeline events until all DOIs are reported, one free slot at a time.
+        
+        This is the only thread that reports results, so the fetcher and the
+        pool threads never emit doi_assessed or write the checkpoint journal.
+        """
+        window = max(1, self.max_workers * self.IN_FLIGHT_PER_WORKER)
+        waiting = collections.deque()  # (doi, updated) received while the window is full
+        end_of_stream = False
+        
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = []
-            
             while not self._cancelled:
-                # Check if we should stop
-                if self._fetch_complete.is_set() and self._doi_queue.empty():
+                if end_of_stream and not waiting and self._in_flight == 0:
                     break
                 
-                # Get DOI from queue with timeout
-                try:
-                    doi = self._doi_queue.get(timeout=0.5)
-                except queue.Empty:
+                event = self._events.get()
+                if self._cancelled:
+                    break
+                
+                if event is _END_OF_STREAM:
+                    end_of_stream = True
                     continue
                 
-                # Submit assessment
-                future = executor.submit(self._assess_single_doi, doi)
-                futures.append(future)
+                kind, payload, updated = event
+                if kind == _ASSESSMENT_DONE:
+                    self._in_flight -= 1
+                    if not payload.cancelled():
+                        self._process_result(payload, updated)
+                        self._report_concurrency()
+                elif kind == _RESULT_CACHED:
+                    self._pending_slots.release()
+                    self._report_result(payload, from_cache=True)
+                else:
+                    waiting.append((payload, updated))
                 
-                # Process completed futures
-                done_futures = [f for f in futures if f.done()]
-                for future in done_futures:
-                    futures.remove(future)
-                    self._process_result(future)
+                while waiting and self._in_flight < window:
+                    doi, updated = waiting.popleft()
+                    self._pending_slots.release()
+                    self._in_flight += 1
+                    future = executor.submit(self._assess_single_doi, doi)
+                    future.add_done_callback(functools.partial(self._on_assessment_done, updated=updated))
             
-            # Wait for remaining futures and process their results
-            for future in futures:
-                if not self._cancelled:
-                    self._process_result(future)
+            if self._cancelled:
+                # Drop submitted assessments that have not started yet
+                executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _on_assessment_done(self, future, updated: str = ""):
+        """Hand a finished assessment to the assessor thread (runs in the worker thread)."""
+        self._events.put((_ASSESSMENT_DONE, future, updated))
     
-    def _process_result(self, future):
-        """Process an assessment future.
+    def _process_result(self, future, updated: str = ""):
+        """Process a completed assessment future.
         
-        Waits for the future to complete if needed. Note that future.result()
-        is safe to call on already-completed futures as it returns immediately.
+        Args:
+            future: Future of _assess_single_doi
+            updated: DataCite `updated` timestamp of the DOI (for the result cache)
         """
         try:
-            result = future.result()  # Waits if not complete, returns cached value if already done
-            self.doi_assessed.emit(result.doi, result.score_percent)
+            result = future.result()
+            self._report_result(result)
+            
+            if self.result_cache is not None and result.is_success and updated:
+                with self._lock:
+                    self._results_to_cache.append((result, updated))
+                    flush = len(self._results_to_cache) >= self.CACHE_WRITE_BATCH
+                if flush:
+                    self._flush_result_cache()
             
-            with self._lock:
-                self._assessed_count += 1
-                if not result.is_success:
-                    self._error_count += 1
-                
-                if self._assessed_count % 10 == 0:
-                    if self._total_dois > 0:
-                        self.progress.emit(f"{self._assessed_count} von {self._total_dois} DOIs bewertet...")
-                    else:
-                        self.progress.emit(f"{self._assessed_count} DOIs bewertet...")
-                        
         except Exception as e:
             logger.error(f"Error processing result: {e}")
             with self._lock:
                 self._assessed_count += 1
                 self._error_count += 1
     
+    def _report_result(self, result: FujiResult, from_cache: bool = False):
+        """Emit an assessment result, journal it and update the counters."""
+        self.doi_assessed.emit(result.doi, result.score_percent)
+        self._record_checkpoint(result)
+        
+        with self._lock:
+            self._assessed_count += 1
+            if from_cache:
+                self._cached_count += 1
+            if not result.is_success:
+                self._error_count += 1
+            
+            if result.host_unreachable:
+                self._unreachable_count += 1
+                if self._unreachable_count == 1:
+                    self.progress.emit(
+                        f"{result.error} - weitere DOIs werden bis zum nächsten "
+                        f"Verbindungsversuch übersprungen"
+                    )
+            
+            if self._assessed_count % 10 == 0:
+                if self._total_dois > 0:
+                    self.progress.emit(f"{self._assessed_count} von {self._total_dois} DOIs bewertet...")
+                else:
+                    self.progress.emit(f"{self._assessed_count} DOIs bewertet...")
+    
+    def _load_cached_results(self, entries: List[Tuple[str, str, str]]) -> Dict[str, FujiResult]:
+        """Look up unchanged DOIs of a page; without a usable cache every DOI is assessed."""
+        if self.result_cache is None:
+            return {}
+        try:
+            return self.result_cache.get_many(
+                self.fuji_client.endpoint,
+                self.metric_version,
+                ((doi, updated) for doi, _, updated in entries)
+            )
+        except FujiResultCacheError as e:
+            logger.warning(f"F-UJI result cache could not be read, assessing all DOIs of the page: {e}")
+            return {}
+    
+    def _flush_result_cache(self):
+        """Write buffered results to the cache (failures only cost a re-assessment next time)."""
+        with self._lock:
+            results, self._results_to_cache = self._results_to_cache, []
+        if not results:
+            return
+        try:
+            self.result_cache.store(self.fuji_client.endpoint, self.metric_version, results)
+        except FujiResultCacheError as e:
+            logger.warning(f"Could not store {len(results)} F-UJI results: {e}")
+    
     def _assess_single_doi(self, doi: str) -> FujiResult:
         """Assess a single DOI."""
-        if self._cancelled:
+        result = None
+        if not self._cancelled:
+            result = _assess_with_limit(self.fuji_client, self.concurrency, doi, lambda: self._cancelled)
+        
+        if result is None:
             return FujiResult(
                 doi=doi,
                 score_percent=-1,
@@ -431,7 +733,33 @@ class StreamingFujiWorker(QObject):
                 error="Cancelled"
             )
         
-        return self.fuji_client.assess_doi(doi)
+        return result
+    
+    def _report_concurrency(self):
+        """Emit concurrency_changed when the adaptive limit moved."""
+        limit = self.concurrency.limit
+        if limit != self._reported_concurrency:
+            self._reported_concurrency = limit
+            self.concurrency_changed.emit(limit)
+    
+    def _record_checkpoint(self, result: FujiResult):
+        """Journal a successful assessment; journaling stops after the first write error."""
+        if self.checkpoint is None or not result.is_success:
+            return
+        try:
+            self.checkpoint.append(result.doi, result.score_percent)
+        except FujiCheckpointError as e:
+            logger.warning(f"Checkpoint journal disabled: {e}")
+            self.checkpoint = None
+    
+    def _finish_checkpoint(self, run_complete: bool):
+        """Clear the journal of a completed run, keep it for resuming otherwise."""
+        if self.checkpoint is None:
+            return
+        if run_complete:
+            self.checkpoint.clear()
+        else:
+            self.checkpoint.close()
 
 
 class StreamingFujiThread(QThread):
@@ -454,12 +782,16 @@ class StreamingFujiThread(QThread):
         datacite_client,
         fuji_client: FujiClient = None,
         max_workers: int = 5,
+        result_cache: Optional[FujiResultCache] = None,
+        checkpoint: Optional[FujiCheckpointJournal] = None,
         parent=None
     ):
         super().__init__(parent)
         
         # Create worker without parent so it can be properly managed
-        self._worker = StreamingFujiWorker(datacite_client, fuji_client, max_workers)
+        self._worker = StreamingFujiWorker(
+            datacite_client, fuji_client, max_workers, result_cache, checkpoint=checkpoint
+        )
         # Worker's run() is called from within QThread.run()
         # so it executes in this thread's context
     
@@ -4,12 +4,17 @@ import logging
 from PySide6.QtCore import QObject, Signal
 
 from src.db.sumariopmd_client import SumarioPMDClient, DatabaseError, ConnectionError
-from src.utils.csv_exporter import export_pending_dois, CSVExportError
+from src.utils.csv_exporter import export_pending_dois, export_stream_atomically, CSVExportError
 
 
 logger = logging.getLogger(__name__)
 
 
+class _ExportCancelled(Exception):
+    """Raised inside the row stream to abort a running export."""
+    pass
+
+
 class PendingExportWorker(QObject):
     """Worker for exporting pending DOIs from SUMARIOPMD database in a separate thread."""
     
@@ -51,11 +56,12 @@ class PendingExportWorker(QObject):
         
         This method will:
         1. Connect to SUMARIOPMD database
-        2. Fetch all pending DOIs with title and first author
-        3. Export to CSV file with UTF-8 BOM
-        4. Emit progress and result signals
+        2. Stream all pending DOIs with title and first author
+           from a server-side cursor directly into the CSV file (UTF-8 BOM)
+        3. Emit progress and result signals
         """
         self._is_running = True
+        client = None
         
         try:
             # Step 1: Connect to database
@@ -84,47 +90,48 @@ class PendingExportWorker(QObject):
                 self.progress.emit("Export abgebrochen.")
                 return
             
-            # Step 2: Fetch pending DOIs
-            self.progress.emit("Pending DOIs werden aus der Datenbank abgerufen...")
+            # Step 2: Stream pending DOIs into the CSV file
+            self.progress.emit("Pending DOIs werden aus der Datenbank abgerufen und exportiert...")
             self.progress_count.emit(25, 100)
             
+            def rows():
+                stream = client.iter_pending_dois()
+                try:
+                    for row in stream:
+                        if not self._is_running:
+                            raise _ExportCancelled()
+                        yield row
+                finally:
+                    # On cancel this drops the connection instead of reading
+                    # the rest of the result set
+                    stream.close()
+            
             try:
-                pending_data = client.fetch_pending_dois()
+                count = export_stream_atomically(export_pending_dois, rows(), self.output_path)
+            except _ExportCancelled:
+                self.progress.emit("Export abgebrochen.")
+                return
             except DatabaseError as e:
+                # The row stream failed, not the file
                 error_msg = f"Fehler beim Abrufen der Daten: {str(e)}"
                 logger.error(error_msg)
                 self.error.emit(error_msg)
                 return
-            
-            if not pending_data:
-                self.progress.emit("[WARNUNG] Keine pending DOIs gefunden.")
-                self.finished.emit("", 0)
-                return
-            
-            self.progress_count.emit(50, 100)
-            self.progress.emit(f"{len(pending_data)} pending DOIs gefunden...")
-            
-            # Check for cancellation before exporting
-            if not self._is_running:
-                self.progress.emit("Export abgebrochen.")
-                return
-            
-            # Step 3: Export to CSV
-            self.progress.emit("CSV-Datei wird erstellt...")
-            self.progress_count.emit(75, 100)
-            
-            try:
-                export_pending_dois(pending_data, self.output_path)
             except CSVExportError as e:
                 error_msg = f"Fehler beim Speichern der CSV-Datei: {str(e)}"
                 logger.error(error_msg)
                 self.error.emit(error_msg)
                 return
             
-            # Step 4: Complete
+            if not count:
+                self.progress.emit("[WARNUNG] Keine pending DOIs gefunden.")
+                self.finished.emit("", 0)
+                return
+            
+            # Step 3: Complete
             self.progress_count.emit(100, 100)
-            self.progress.emit(f"[OK] {len(pending_data)} pending DOIs erfolgreich exportiert")
-            self.finished.emit(self.output_path, len(pending_data))
+            self.progress.emit(f"[OK] {count} pending DOIs erfolgreich exportiert")
+            self.finished.emit(self.output_path, count)
             
         except Exception as e:
             error_msg = f"Unerwarteter Fehler: {str(e)}"
@@ -132,6 +139,8 @@ class PendingExportWorker(QObject):
             self.error.emit(error_msg)
         
         finally:
+            if client is not None:
+                client.close_pool()
             self._is_running = False
     
     def stop(self):
@@ -1,16 +1,17 @@
 """Worker thread for updating DOI publisher metadata via DataCite API and Database."""
 
 import logging
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 from PySide6.QtCore import QObject, Signal, QSettings
 
-from src.api.datacite_client import DataCiteClient, NetworkError, DataCiteAPIError, AuthenticationError
+from src.api.datacite_client import DataCiteClient, MetadataPrefetcher, NetworkError, DataCiteAPIError, AuthenticationError
 from src.utils.csv_parser import CSVParser, CSVParseError
 from src.utils.publisher_parser import parse_publisher_from_metadata
 from src.db.sumariopmd_client import (
     SumarioPMDClient,
     DatabaseError,
-    ConnectionError as DBConnectionError
+    ConnectionError as DBConnectionError,
+    TransactionError
 )
 from src.utils.credential_manager import load_db_credentials
 
@@ -54,6 +55,9 @@ class PublisherUpdateWorker(QObject):
     datacite_update = Signal(str)    # DataCite update status
     database_update = Signal(str)    # Database update status
     
+    # DOIs written per database transaction in batch-commit mode
+    DB_BATCH_SIZE = 50
+    
     def __init__(
         self, 
         username: str, 
@@ -61,7 +65,8 @@ class PublisherUpdateWorker(QObject):
         csv_path: str, 
         use_test_api: bool = False,
         dry_run_only: bool = True,
-        credentials_are_new: bool = False
+        credentials_are_new: bool = False,
+        db_batch_size: int = 1
     ):
         """
         Initialize the publisher update worker.
@@ -73,6 +78,9 @@ class PublisherUpdateWorker(QObject):
             use_test_api: If True, use test API instead of production
             dry_run_only: If True, only validate without updating
             credentials_are_new: Whether these are newly entered credentials
+            db_batch_size: Number of DOIs whose database updates share one
+                           transaction (each DOI in its own savepoint); 1 commits
+                           every DOI separately
         """
         super().__init__()
         self.username = username
@@ -81,6 +89,7 @@ class PublisherUpdateWorker(QObject):
         self.use_test_api = use_test_api
         self.dry_run_only = dry_run_only
         self.credentials_are_new = credentials_are_new
+        self.db_batch_size = max(1, int(db_batch_size))
         self._is_running = False
         self._first_success = False
         
@@ -188,6 +197,46 @@ class PublisherUpdateWorker(QObject):
             logger.error(f"Database initialization failed: {e}")
             return False
     
+    def _update_database_batch(self, dois: List[str], publisher_by_doi: dict) -> Dict[str, Any]:
+        """
+        Write the publisher names of several DOIs in one database transaction (batch-commit mode).
+        
+        Each DOI runs in its own savepoint, so a failing DOI is rolled back on
+        its own. The batch is committed before any of its DOIs is sent to
+        DataCite, which keeps the Database-First pattern intact.
+        
+        Args:
+            dois: DOIs of the batch
+            publisher_by_doi: Publisher data per DOI (from the CSV)
+            
+        Returns:
+            Dictionary mapping DOIs to a (current_db_publisher, update_result)
+            tuple - update_result is the (success, message) tuple of the update,
+            or None if nothing had to be written - or to the exception that
+            prevented the update
+        """
+        results: Dict[str, Any] = {}
+        try:
+            with self.db_client.batch_transaction() as batch:
+                for doi in dois:
+                    new_publisher_name = publisher_by_doi[doi].get("name", "")
+                    try:
+                        current_db_publisher = self.db_client.get_publisher_for_doi(doi)
+                        if current_db_publisher is None or current_db_publisher == new_publisher_name:
+                            results[doi] = (current_db_publisher, None)
+                        else:
+                            update_result = batch.update_publisher(doi, new_publisher_name)
+                            results[doi] = (current_db_publisher, update_result)
+                    except TransactionError:
+                        raise
+                    except DatabaseError as e:
+                        results[doi] = e
+        except (DatabaseError, DBConnectionError, TransactionError) as e:
+            # Nothing of this batch was committed
+            logger.error(f"Database batch of {len(dois)} DOIs failed: {e}")
+            return {doi: e for doi in dois}
+        return results
+    
     def run(self):
         """
         Execute the publisher update process.
@@ -201,6 +250,8 @@ class PublisherUpdateWorker(QObject):
         6. Emit progress signals and final results
         """
         self._is_running = True
+        prefetcher = None
+        client = None
         
         try:
             # Step 1: Parse CSV file
@@ -312,6 +363,11 @@ class PublisherUpdateWorker(QObject):
             skipped_details = []  # List of (doi, reason) tuples for skipped DOIs
             dois_with_changes = []  # DOIs that need updating
             
+            # Current metadata is fetched concurrently ahead of the loop and
+            # handed out in CSV order
+            prefetcher = MetadataPrefetcher(client, list(publisher_by_doi.keys()))
+            prefetched_metadata = iter(prefetcher)
+            
             for index, (doi, publisher_data) in enumerate(publisher_by_doi.items(), start=1):
                 if not self._is_running:
                     logger.info("Validation process cancelled by user")
@@ -326,7 +382,9 @@ class PublisherUpdateWorker(QObject):
                 
                 # Fetch current metadata
                 try:
-                    metadata = client.get_doi_metadata(doi)
+                    _, metadata, fetch_error = next(prefetched_metadata)
+                    if fetch_error is not None:
+                        raise fetch_error
                     
                     if metadata is None:
                         validation_results.append({
@@ -400,11 +458,30 @@ class PublisherUpdateWorker(QObject):
             error_count = 0
             error_list = []
             
+            # Batch-commit mode: the database updates of DB_BATCH_SIZE DOIs are
+            # committed together before their DataCite updates run
+            batch_mode = bool(db_available and self.db_updates_enabled and self.db_batch_size > 1)
+            db_batch_results: Dict[str, Any] = {}
+            batch_end = 0
+            
             for index, doi in enumerate(dois_with_changes, start=1):
-                if not self._is_running:
+                # A committed batch is always finished, otherwise its remaining
+                # DOIs would be changed in the database but not in DataCite
+                if not self._is_running and index > batch_end:
                     logger.info("Update process cancelled by user")
                     break
                 
+                if batch_mode and index > batch_end:
+                    batch_end = min(index - 1 + self.db_batch_size, len(dois_with_changes))
+                    self.database_update.emit(
+                        f"⏳ Datenbank-Batch: DOIs {index}-{batch_end} werden in einer Transaktion aktualisiert..."
+                    )
+                    batch_dois = [
+                        batch_doi for batch_doi in dois_with_changes[index - 1:batch_end]
+                        if metadata_cache.get(batch_doi) is not None
+                    ]
+                    db_batch_results = self._update_database_batch(batch_dois, publisher_by_doi)
+                
                 publisher_data = publisher_by_doi[doi]
                 metadata = metadata_cache.get(doi)
                 
@@ -427,9 +504,17 @@ class PublisherUpdateWorker(QObject):
                 db_was_updated = False  # Track if DB was actually modified
                 if db_available and self.db_updates_enabled:
                     try:
+                        db_batch_result = db_batch_results.get(doi)
+                        if isinstance(db_batch_result, Exception):
+                            raise db_batch_result
+                        
                         # Only update publisher name in database
                         # (extended fields are only in DataCite)
-                        current_db_publisher = self.db_client.get_publisher_for_doi(doi)
+                        if db_batch_result is not None:
+                            current_db_publisher, db_batch_update = db_batch_result
+                        else:
+                            current_db_publisher = self.db_client.get_publisher_for_doi(doi)
+                            db_batch_update = None
                         new_publisher_name = publisher_data.get("name", "")
                         
                         # Handle case when DOI is not in database
@@ -438,7 +523,11 @@ class PublisherUpdateWorker(QObject):
                             logger.warning(f"DOI {doi} not found in database, skipping DB update")
                         elif current_db_publisher != new_publisher_name:
                             self.database_update.emit(f"  📊 DB Update: {doi}")
-                            db_success_result, db_message = self.db_client.update_publisher(doi, new_publisher_name)
+                            if db_batch_update is not None:
+                                # Already written (and committed) by the batch
+                                db_success_result, db_message = db_batch_update
+                            else:
+                                db_success_result, db_message = self.db_client.update_publisher(doi, new_publisher_name)
                             if db_success_result:
                                 self.database_update.emit(f"    ✓ {db_message}")
                                 db_was_updated = True  # DB was actually modified
@@ -512,6 +601,12 @@ class PublisherUpdateWorker(QObject):
             self.finished.emit(0, 0, 0, [], [])
         
         finally:
+            if prefetcher is not None:
+                prefetcher.close()
+            if client is not None:
+                client.close()
+            if self.db_client is not None:
+                self.db_client.close_pool()
             self._is_running = False
     
     def stop(self):
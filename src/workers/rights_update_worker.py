@@ -3,7 +3,7 @@
 import logging
 from PySide6.QtCore import QObject, Signal
 
-from src.api.datacite_client import DataCiteClient, NetworkError
+from src.api.datacite_client import DataCiteClient, MetadataPrefetcher, NetworkError
 from src.utils.csv_parser import CSVParser, CSVParseError
 
 
@@ -89,6 +89,8 @@ class RightsUpdateWorker(QObject):
         5. Emit final results
         """
         self._is_running = True
+        prefetcher = None
+        client = None
         success_count = 0
         error_count = 0
         skipped_count = 0
@@ -134,6 +136,11 @@ class RightsUpdateWorker(QObject):
                 return
             
             # Step 3: Update each DOI
+            # Current metadata is fetched concurrently ahead of the loop and
+            # handed out in CSV order
+            prefetcher = MetadataPrefetcher(client, list(rights_by_doi.keys()))
+            prefetched_metadata = iter(prefetcher)
+            
             for index, (doi, csv_rights) in enumerate(rights_by_doi.items(), start=1):
                 if not self._is_running:
                     logger.info("Update process cancelled by user")
@@ -148,7 +155,9 @@ class RightsUpdateWorker(QObject):
                 
                 try:
                     # Fetch current metadata to check if rights actually changed
-                    current_metadata = client.get_doi_metadata(doi)
+                    _, current_metadata, fetch_error = next(prefetched_metadata)
+                    if fetch_error is not None:
+                        raise fetch_error
                     
                     if current_metadata:
                         current_rights = current_metadata.get('data', {}).get('attributes', {}).get('rightsList', [])
@@ -241,6 +250,10 @@ class RightsUpdateWorker(QObject):
             self.finished.emit(success_count, skipped_count, error_count, error_list, skipped_details)
         
         finally:
+            if prefetcher is not None:
+                prefetcher.close()
+            if client is not None:
+                client.close()
             self._is_running = False
     
     def _detect_rights_changes(
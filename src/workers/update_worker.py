@@ -3,7 +3,13 @@
 import logging
 from PySide6.QtCore import QObject, Signal
 
-from src.api.datacite_client import DataCiteClient, NetworkError
+from src.api.datacite_client import (
+    DataCiteClient,
+    MetadataPrefetcher,
+    NetworkError,
+    AuthenticationError,
+    DataCiteAPIError
+)
 from src.utils.csv_parser import CSVParser, CSVParseError
 
 
@@ -26,7 +32,8 @@ class UpdateWorker(QObject):
         password: str, 
         csv_path: str, 
         use_test_api: bool = False,
-        credentials_are_new: bool = False
+        credentials_are_new: bool = False,
+        bulk_diff: bool = False
     ):
         """
         Initialize the update worker.
@@ -37,6 +44,9 @@ class UpdateWorker(QObject):
             csv_path: Path to CSV file with DOI/URL pairs
             use_test_api: If True, use test API instead of production
             credentials_are_new: Whether these are newly entered credentials (not from saved account)
+            bulk_diff: If True, load all current landing page URLs of the client in one
+                       paginated harvest and compare them in memory, instead of fetching
+                       the metadata of every DOI individually
         """
         super().__init__()
         self.username = username
@@ -44,6 +54,7 @@ class UpdateWorker(QObject):
         self.csv_path = csv_path
         self.use_test_api = use_test_api
         self.credentials_are_new = credentials_are_new
+        self.bulk_diff = bulk_diff
         self._is_running = False
         self._first_success = False
     
@@ -64,6 +75,8 @@ class UpdateWorker(QObject):
         skipped_count = 0
         error_list = []
         skipped_details = []  # List of (doi, reason) tuples
+        prefetcher = None
+        client = None
         
         try:
             # Step 1: Parse CSV file
@@ -98,7 +111,32 @@ class UpdateWorker(QObject):
                 self.finished.emit(0, 0, 0, [], [])
                 return
             
-            # Step 2: Update each DOI
+            # Step 2: Load current URLs for change detection
+            # Bulk diff: one paginated harvest of all (DOI, URL) pairs of this client
+            current_urls = None
+            if self.bulk_diff:
+                self.progress_update.emit(0, total_dois, "Aktuelle Landing Page URLs werden von DataCite geladen...")
+                try:
+                    current_urls = self._fetch_current_urls(client)
+                    logger.info(f"Bulk diff: loaded {len(current_urls)} current URLs from DataCite")
+                except (AuthenticationError, NetworkError) as e:
+                    error_msg = f"Fehler beim Laden der aktuellen URLs: {str(e)}"
+                    logger.error(error_msg)
+                    self.error_occurred.emit(error_msg)
+                    self.finished.emit(0, 0, 0, [], [])
+                    return
+                except DataCiteAPIError as e:
+                    # Fall back to per-DOI change detection
+                    logger.warning(f"Bulk diff harvest failed, falling back to per-DOI metadata: {e}")
+            
+            if current_urls is None:
+                # Current metadata is fetched concurrently ahead of the loop and
+                # handed out in CSV order
+                prefetcher = MetadataPrefetcher(client, [doi for doi, _ in doi_url_pairs])
+                prefetched_metadata = iter(prefetcher)
+            
+            # Step 3: Update each DOI
+            
             for index, (doi, url) in enumerate(doi_url_pairs, start=1):
                 if not self._is_running:
                     logger.info("Update process cancelled by user")
@@ -111,17 +149,23 @@ class UpdateWorker(QObject):
                     f"Prüfe DOI {index}/{total_dois}: {doi}"
                 )
                 
-                # Change Detection: Fetch current metadata to check if URL actually changed
-                # Note: We could optimize by fetching all URLs first, but individual fetches
-                # allow us to fail fast and continue with other DOIs if one fetch fails
+                # Change Detection: Check if URL actually changed, either against the
+                # bulk snapshot or against the prefetched metadata of this DOI
                 
                 # Perform update
                 try:
-                    # First, fetch current metadata to check if URL changed
-                    current_metadata = client.get_doi_metadata(doi)
-                    if current_metadata:
-                        datacite_current_url = current_metadata.get('data', {}).get('attributes', {}).get('url', '')
-                        
+                    # First, determine the current URL (None if unknown)
+                    if current_urls is not None:
+                        datacite_current_url = current_urls.get(doi.lower())
+                    else:
+                        _, current_metadata, fetch_error = next(prefetched_metadata)
+                        if fetch_error is not None:
+                            raise fetch_error
+                        datacite_current_url = None
+                        if current_metadata:
+                            datacite_current_url = current_metadata.get('data', {}).get('attributes', {}).get('url', '')
+                    
+                    if datacite_current_url is not None:
                         # Compare current DataCite URL with CSV URL
                         if datacite_current_url == url:
                             # No change detected - skip update
@@ -200,8 +244,28 @@ class UpdateWorker(QObject):
             self.finished.emit(success_count, error_count, skipped_count, error_list, skipped_details)
         
         finally:
+            if prefetcher is not None:
+                prefetcher.close()
+            if client is not None:
+                client.close()
             self._is_running = False
     
+    @staticmethod
+    def _fetch_current_urls(client: DataCiteClient) -> dict:
+        """
+        Load the current landing page URLs of all DOIs of the client.
+        
+        Uses the cursor pagination of fetch_all_dois(), i.e. one request per
+        page of 100 DOIs instead of one request per DOI.
+        
+        Args:
+            client: Initialized DataCite client
+            
+        Returns:
+            Dictionary mapping lowercase DOI to its current landing page URL
+        """
+        return {doi.lower(): url for doi, url in client.fetch_all_dois()}
+    
     def stop(self):
         """Request the worker to stop processing."""
         logger.info("Stop requested for update worker")
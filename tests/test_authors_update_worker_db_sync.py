@@ -24,6 +24,7 @@ from PySide6.QtCore import QSettings, Signal
 
 from src.workers.authors_update_worker import AuthorsUpdateWorker
 from src.db import DatabaseError
+from src.db.sumariopmd_client import TransactionError
 
 
 @pytest.fixture
@@ -598,3 +599,98 @@ class TestErrorHandling:
         
         # DataCite should only be called once (for first DOI)
         assert mock_datacite_client.update_doi_creators.call_count == 1
+
+
+class TestBatchCommitMode:
+    """Test several DOIs sharing one database transaction."""
+    
+    @pytest.mark.timeout(30)
+    def test_batch_committed_before_datacite_updates(
+        self,
+        qtbot,
+        mock_qsettings,
+        mock_datacite_client,
+        mock_db_client,
+        tmp_path
+    ):
+        """Test that the batch is written first and failing DOIs skip DataCite."""
+        mock_qsettings.value.return_value = True  # DB enabled
+        
+        calls = []
+        batch = Mock()
+        batch.update_creators.side_effect = [
+            (True, "Success", []),
+            (False, "Constraint violation", ["Error"])
+        ]
+        mock_db_client.batch_transaction.return_value.__enter__ = Mock(
+            side_effect=lambda: calls.append("db_batch") or batch
+        )
+        mock_db_client.batch_transaction.return_value.__exit__ = Mock(return_value=False)
+        mock_datacite_client.update_doi_creators.side_effect = (
+            lambda doi, *args: calls.append(doi) or (True, "Update successful")
+        )
+        
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(
+            "DOI,Creator Name,Name Type,Given Name,Family Name,Name Identifier,Name Identifier Scheme,Scheme URI\n"
+            '10.5880/test.001,"Doe, John",Personal,John,Doe,0000-0001-2345-6789,ORCID,https://orcid.org\n'
+            '10.5880/test.002,"Smith, Jane",Personal,Jane,Smith,0000-0002-3456-7890,ORCID,https://orcid.org\n'
+        )
+        
+        worker = AuthorsUpdateWorker("test_user", "test_pass", str(csv_file), True, False, db_batch_size=50)
+        
+        doi_updates = []
+        worker.doi_updated.connect(lambda doi, success, msg: doi_updates.append((doi, success, msg)))
+        
+        with patch('src.workers.authors_update_worker.DataCiteClient', return_value=mock_datacite_client), \
+             patch('src.workers.authors_update_worker.SumarioPMDClient', return_value=mock_db_client), \
+             patch('src.workers.authors_update_worker.load_db_credentials', return_value={'host': 'host', 'database': 'db', 'username': 'user', 'password': 'pass'}):
+            
+            worker.run()
+        
+        # One transaction for both DOIs, committed before DataCite is touched
+        mock_db_client.batch_transaction.assert_called_once()
+        mock_db_client.update_creators_transactional.assert_not_called()
+        assert calls == ["db_batch", "10.5880/test.001"]
+        
+        assert doi_updates[0][:2] == ("10.5880/test.001", True)
+        assert doi_updates[1][:2] == ("10.5880/test.002", False)
+        assert "Datenbank-Update fehlgeschlagen" in doi_updates[1][2]
+    
+    @pytest.mark.timeout(30)
+    def test_failed_batch_skips_datacite_for_all_dois(
+        self,
+        qtbot,
+        mock_qsettings,
+        mock_datacite_client,
+        mock_db_client,
+        tmp_path
+    ):
+        """Test that a batch that could not be committed reports every DOI as failed."""
+        mock_qsettings.value.return_value = True  # DB enabled
+        mock_db_client.batch_transaction.return_value.__enter__ = Mock(return_value=Mock())
+        mock_db_client.batch_transaction.return_value.__exit__ = Mock(
+            side_effect=TransactionError("Batch commit failed")
+        )
+        
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(
+            "DOI,Creator Name,Name Type,Given Name,Family Name,Name Identifier,Name Identifier Scheme,Scheme URI\n"
+            '10.5880/test.001,"Doe, John",Personal,John,Doe,0000-0001-2345-6789,ORCID,https://orcid.org\n'
+            '10.5880/test.002,"Smith, Jane",Personal,Jane,Smith,0000-0002-3456-7890,ORCID,https://orcid.org\n'
+        )
+        
+        worker = AuthorsUpdateWorker("test_user", "test_pass", str(csv_file), True, False, db_batch_size=50)
+        
+        doi_updates = []
+        worker.doi_updated.connect(lambda doi, success, msg: doi_updates.append((doi, success, msg)))
+        
+        with patch('src.workers.authors_update_worker.DataCiteClient', return_value=mock_datacite_client), \
+             patch('src.workers.authors_update_worker.SumarioPMDClient', return_value=mock_db_client), \
+             patch('src.workers.authors_update_worker.load_db_credentials', return_value={'host': 'host', 'database': 'db', 'username': 'user', 'password': 'pass'}):
+            
+            worker.run()
+        
+        mock_datacite_client.update_doi_creators.assert_not_called()
+        assert [update[1] for update in doi_updates] == [False, False]
+        assert all("Batch commit failed" in update[2] for update in doi_updates)
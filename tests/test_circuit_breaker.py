@@ -0,0 +1,102 @@
+"""Tests for the per-host circuit breaker."""
+
+import threading
+
+import pytest
+
+from src.api.circuit_breaker import HostCircuitBreaker, HostUnreachableError
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return HostCircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+
+
+class TestHostCircuitBreaker:
+    """Tests for the circuit states."""
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        for _ in range(2):
+            breaker.before_request("a.example.org")
+            breaker.record_failure("a.example.org")
+        assert not breaker.is_open("a.example.org")
+
+        breaker.record_failure("a.example.org")
+
+        assert breaker.is_open("a.example.org")
+        with pytest.raises(HostUnreachableError) as exc_info:
+            breaker.before_request("a.example.org")
+        assert exc_info.value.host == "a.example.org"
+        assert exc_info.value.retry_in == pytest.approx(30)
+
+    def test_hosts_are_independent(self, breaker):
+        for _ in range(3):
+            breaker.record_failure("a.example.org")
+
+        breaker.before_request("b.example.org")
+        assert breaker.unreachable_error("b.example.org") is None
+
+    def test_success_resets_failure_count(self, breaker):
+        breaker.record_failure("a.example.org")
+        breaker.record_failure("a.example.org")
+        breaker.record_success("a.example.org")
+        breaker.record_failure("a.example.org")
+
+        assert not breaker.is_open("a.example.org")
+
+    def test_single_probe_closes_circuit(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure("a.example.org")
+        clock.now = 31
+
+        assert breaker.unreachable_error("a.example.org") is None
+        breaker.before_request("a.example.org")  # Probe
+        # Further requests fail fast while the probe is in flight
+        assert isinstance(breaker.unreachable_error("a.example.org"), HostUnreachableError)
+        with pytest.raises(HostUnreachableError):
+            breaker.before_request("a.example.org")
+
+        breaker.record_success("a.example.org")
+
+        assert not breaker.is_open("a.example.org")
+        breaker.before_request("a.example.org")
+
+    def test_failed_probe_reopens_circuit(self, breaker, clock):
+        for _ in range(3):
+            breaker.record_failure("a.example.org")
+        clock.now = 31
+        breaker.before_request("a.example.org")
+
+        breaker.record_failure("a.example.org")
+
+        with pytest.raises(HostUnreachableError) as exc_info:
+            breaker.before_request("a.example.org")
+        assert exc_info.value.retry_in == pytest.approx(30)
+
+    def test_concurrent_failures(self, clock):
+        breaker = HostCircuitBreaker(failure_threshold=50, clock=clock)
+        threads = [
+            threading.Thread(target=lambda: [breaker.record_failure("a.example.org") for _ in range(10)])
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert breaker.is_open("a.example.org")
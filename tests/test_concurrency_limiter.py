@@ -0,0 +1,135 @@
+"""Tests for the adaptive concurrency limiter."""
+
+import threading
+
+import pytest
+
+from src.api.concurrency_limiter import AdaptiveConcurrencyLimiter, percentile
+
+
+def run_window(limiter, latency, overloaded=False, count=None):
+    """Send one window of requests that all use every slot."""
+    count = count or limiter.window_size
+    for _ in range(count):
+        held = [limiter.acquire(timeout=0) for _ in range(limiter.limit)]
+        assert all(held)
+        for _ in held[1:]:
+            limiter.release()
+        limiter.release(latency, overloaded)
+
+
+class TestPercentile:
+    """Tests for the nearest-rank percentile."""
+
+    def test_percentiles(self):
+        values = [5.0, 1.0, 4.0, 2.0, 3.0, 6.0, 7.0, 8.0, 9.0, 10.0]
+
+        assert percentile(values, 0.5) == 5.0
+        assert percentile(values, 0.9) == 9.0
+        assert percentile(values, 1.0) == 10.0
+
+    def test_single_value(self):
+        assert percentile([2.5], 0.9) == 2.5
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for limit adaptation and slot handling."""
+
+    def test_initial_limit_defaults_to_half_of_max(self):
+        assert AdaptiveConcurrencyLimiter(max_limit=10).limit == 5
+        assert AdaptiveConcurrencyLimiter(max_limit=1).limit == 1
+        assert AdaptiveConcurrencyLimiter(max_limit=10, initial_limit=20).limit == 10
+
+    def test_acquire_blocks_at_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=4, initial_limit=2)
+
+        assert limiter.acquire(timeout=0)
+        assert limiter.acquire(timeout=0)
+        assert not limiter.acquire(timeout=0.01)
+
+        limiter.release()
+        assert limiter.acquire(timeout=0)
+
+    def test_release_wakes_waiting_thread(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def waiter():
+            if limiter.acquire(timeout=5):
+                acquired.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        limiter.release(1.0)
+        thread.join(timeout=5)
+
+        assert acquired.is_set()
+
+    def test_grows_while_latency_is_stable(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=10, initial_limit=3, window_size=5)
+
+        run_window(limiter, 1.0)
+        run_window(limiter, 1.0)
+
+        assert limiter.limit == 5
+
+    def test_does_not_grow_when_slots_are_idle(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=10, initial_limit=3, window_size=5)
+
+        for _ in range(10):
+            limiter.acquire()
+            limiter.release(1.0)
+
+        assert limiter.limit == 3
+
+    def test_shrinks_when_latency_rises(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=10, initial_limit=6, window_size=5)
+
+        run_window(limiter, 1.0)
+        assert limiter.limit == 7
+
+        run_window(limiter, 5.0)
+
+        assert limiter.limit == 6
+        assert limiter.get_stats()["p90"] == pytest.approx(5.0)
+
+    def test_overload_halves_limit_before_window_is_full(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=10, initial_limit=8, window_size=10)
+
+        run_window(limiter, 1.0, overloaded=True, count=3)
+
+        assert limiter.limit == 4
+
+    def test_limit_stays_within_bounds(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=3, initial_limit=2, min_limit=2, window_size=2)
+
+        run_window(limiter, 1.0, overloaded=True)
+        assert limiter.limit == 2
+
+        for _ in range(5):
+            run_window(limiter, 1.0)
+        assert limiter.limit == 3
+
+    def test_requests_without_latency_are_not_counted(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=10, initial_limit=1, window_size=2)
+
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(None)
+
+        assert limiter.limit == 1
+        assert limiter.get_stats()["in_flight"] == 0
+
+    def test_baseline_drifts_towards_slower_server(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=10, initial_limit=5, window_size=2)
+
+        run_window(limiter, 1.0)
+        run_window(limiter, 3.0)
+        assert limiter.limit == 5
+
+        for _ in range(40):
+            run_window(limiter, 3.0)
+
+        assert limiter.get_stats()["baseline"] == pytest.approx(3.0)
+        assert limiter.limit == 10
@@ -0,0 +1,214 @@
+"""Tests for the thread-safe database connection pool."""
+
+import threading
+from unittest.mock import MagicMock, Mock
+
+import pymysql
+import pytest
+from pymysql.constants import SERVER_STATUS
+
+from src.db.connection_pool import ConnectionPool, PoolClosedError, PoolTimeoutError
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self):
+        self.now = 100.0
+    
+    def __call__(self):
+        return self.now
+
+
+def make_connection():
+    connection = MagicMock()
+    connection.open = True
+    connection.server_status = 0
+    return connection
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def factory():
+    return Mock(side_effect=lambda: make_connection())
+
+
+class TestConnectionPool:
+    """Test acquire/release, limits, health checks and statistics."""
+    
+    def test_connection_is_reused(self, factory, clock):
+        """Test that a released connection is handed out again."""
+        pool = ConnectionPool(factory, max_size=2, clock=clock)
+        
+        first = pool.acquire()
+        pool.release(first)
+        second = pool.acquire()
+        
+        assert second is first
+        assert factory.call_count == 1
+        stats = pool.get_stats()
+        assert stats["created"] == 1
+        assert stats["reused"] == 1
+        assert stats["in_use"] == 1
+    
+    def test_max_size_timeout(self, factory):
+        """Test that acquire() fails when the pool stays exhausted."""
+        pool = ConnectionPool(factory, max_size=1, wait_timeout=0.05)
+        pool.acquire()
+        
+        with pytest.raises(PoolTimeoutError):
+            pool.acquire()
+        assert factory.call_count == 1
+    
+    def test_waiting_caller_gets_released_connection(self, factory):
+        """Test that a waiting thread is woken up by release() and the wait is recorded."""
+        pool = ConnectionPool(factory, max_size=1, wait_timeout=5)
+        held = pool.acquire()
+        result = {}
+        
+        def worker():
+            result["connection"] = pool.acquire()
+        
+        thread = threading.Thread(target=worker)
+        thread.start()
+        threading.Event().wait(0.05)
+        pool.release(held)
+        thread.join(timeout=5)
+        
+        assert result["connection"] is held
+        stats = pool.get_stats()
+        assert stats["waits"] == 1
+        assert stats["wait_seconds_total"] > 0
+        assert stats["wait_seconds_max"] == stats["wait_seconds_total"]
+    
+    def test_idle_connections_are_evicted(self, factory, clock):
+        """Test that connections idle for longer than max_idle are closed."""
+        pool = ConnectionPool(factory, max_size=2, max_idle=60, clock=clock)
+        old = pool.acquire()
+        pool.release(old)
+        
+        clock.now += 61
+        new = pool.acquire()
+        
+        assert new is not old
+        old.close.assert_called_once()
+        assert pool.get_stats()["evicted"] == 1
+        assert pool.get_stats()["open"] == 1
+    
+    def test_ping_after_ping_interval(self, factory, clock):
+        """Test that connections idle for a while are pinged before reuse."""
+        pool = ConnectionPool(factory, ping_interval=30, clock=clock)
+        connection = pool.acquire()
+        pool.release(connection)
+        
+        clock.now += 10
+        pool.release(pool.acquire())
+        connection.ping.assert_not_called()
+        
+        clock.now += 31
+        assert pool.acquire() is connection
+        connection.ping.assert_called_once_with(reconnect=True)
+    
+    def test_broken_connection_is_replaced(self, factory, clock):
+        """Test that a connection failing the ping is replaced by a new one."""
+        pool = ConnectionPool(factory, max_size=1, ping_interval=30, clock=clock)
+        broken = pool.acquire()
+        pool.release(broken)
+        broken.ping.side_effect = pymysql.OperationalError(2006, "MySQL server has gone away")
+        
+        clock.now += 31
+        replacement = pool.acquire()
+        
+        assert replacement is not broken
+        broken.close.assert_called_once()
+        stats = pool.get_stats()
+        assert stats["reconnects"] == 1
+        assert stats["open"] == 1
+    
+    def test_open_transaction_is_rolled_back_on_release(self, factory):
+        """Test that uncommitted work never leaks to the next user."""
+        pool = ConnectionPool(factory)
+        connection = pool.acquire()
+        connection.server_status = SERVER_STATUS.SERVER_STATUS_IN_TRANS
+        
+        pool.release(connection)
+        
+        connection.rollback.assert_called_once()
+        assert pool.get_stats()["idle"] == 1
+    
+    def test_no_rollback_without_transaction(self, factory):
+        """Test that idle connections are not rolled back needlessly."""
+        pool = ConnectionPool(factory)
+        connection = pool.acquire()
+        pool.release(connection)
+        connection.rollback.assert_not_called()
+    
+    def test_discard_frees_slot(self, factory):
+        """Test that discarded connections are closed and free their slot."""
+        pool = ConnectionPool(factory, max_size=1, wait_timeout=0.05)
+        connection = pool.acquire()
+        pool.release(connection, discard=True)
+        
+        connection.close.assert_called_once()
+        assert pool.acquire() is not connection
+    
+    def test_failed_connect_frees_slot(self):
+        """Test that a failed connection attempt does not leak a slot."""
+        factory = Mock(side_effect=[pymysql.OperationalError(2003, "Can't connect"), make_connection()])
+        pool = ConnectionPool(factory, max_size=1, wait_timeout=0.05)
+        
+        with pytest.raises(pymysql.OperationalError):
+            pool.acquire()
+        assert pool.acquire() is not None
+    
+    def test_close_closes_idle_connections(self, factory):
+        """Test that close() closes idle connections."""
+        pool = ConnectionPool(factory, max_size=2)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        pool.release(second)
+        
+        pool.close()
+        
+        first.close.assert_called_once()
+        second.close.assert_called_once()
+        assert pool.get_stats()["open"] == 0
+    
+    def test_connection_in_use_is_closed_on_release_after_close(self, factory):
+        """Test that close() also closes connections that were in use at the time."""
+        pool = ConnectionPool(factory, max_size=2)
+        connection = pool.acquire()
+        
+        pool.close()
+        pool.release(connection)
+        
+        connection.close.assert_called_once()
+        assert pool.get_stats()["open"] == 0
+    
+    def test_acquire_after_close_fails(self, factory):
+        """Test that a closed pool does not silently open new connections."""
+        pool = ConnectionPool(factory, max_size=1)
+        pool.release(pool.acquire())
+        pool.close()
+        
+        with pytest.raises(PoolClosedError):
+            pool.acquire()
+        assert factory.call_count == 1
+    
+    def test_pool_is_usable_after_reopen(self, factory):
+        """Test that acquire() after close() and reopen() opens a new connection."""
+        pool = ConnectionPool(factory, max_size=1)
+        pool.release(pool.acquire())
+        pool.close()
+        pool.reopen()
+        
+        connection = pool.acquire()
+        pool.release(connection)
+        
+        assert factory.call_count == 2
+        connection.close.assert_not_called()
+        assert pool.get_stats()["idle"] == 1
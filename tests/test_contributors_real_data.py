@@ -637,7 +637,7 @@ class TestRealDataUpdate:
         }
         
         # Mock the requests.put call
-        with patch('src.api.datacite_client.requests.put') as mock_put:
+        with patch('src.api.datacite_client.requests.Session.put') as mock_put:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_put.return_value = mock_response
@@ -676,7 +676,7 @@ class TestRealDataUpdate:
             }
         }
         
-        with patch('src.api.datacite_client.requests.put') as mock_put:
+        with patch('src.api.datacite_client.requests.Session.put') as mock_put:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_put.return_value = mock_response
@@ -13,7 +13,8 @@ from src.utils.csv_exporter import (
     export_dois_with_publisher_to_csv,
     export_dead_links_to_csv,
     validate_csv_format,
-    CSVExportError
+    CSVExportError,
+    IncrementalCSVWriter
 )
 
 
@@ -685,3 +686,75 @@ class TestExportDOIsWithPublisherToCSV:
         
         assert os.path.exists(new_dir)
         assert os.path.exists(filepath)
+
+
+class TestIncrementalCSVWriter:
+    """Test page-wise CSV export."""
+    
+    def test_output_matches_list_export(self, temp_dir, sample_creator_data):
+        """Test that streaming pages gives the same file as the list-based export."""
+        list_path = export_dois_with_creators_to_csv(sample_creator_data, "TIB.GFZ", temp_dir)
+        with open(list_path, encoding="utf-8") as f:
+            expected = f.read()
+        os.remove(list_path)
+        
+        with IncrementalCSVWriter("creators", "TIB.GFZ", temp_dir) as writer:
+            writer.write_rows(sample_creator_data[:1])
+            writer.write_rows(sample_creator_data[1:])
+        
+        assert writer.filepath == list_path
+        with open(writer.filepath, encoding="utf-8") as f:
+            assert f.read() == expected
+        assert writer.row_count == len(sample_creator_data)
+        assert writer.doi_count == len({row[0] for row in sample_creator_data})
+    
+    def test_rows_written_before_close(self, temp_dir, sample_dois):
+        """Test that rows reach the disk page by page, not only at the end."""
+        writer = IncrementalCSVWriter("urls", "TIB.GFZ", temp_dir)
+        writer.write_rows(sample_dois[:1])
+        writer._file.flush()
+        
+        with open(writer.filepath + ".part", encoding="utf-8") as f:
+            assert len(f.read().splitlines()) == 2  # Header + first row
+        
+        writer.write_rows(sample_dois[1:])
+        assert writer.close() == writer.filepath
+        assert not os.path.exists(writer.filepath + ".part")
+    
+    def test_no_rows_creates_no_file(self, temp_dir):
+        """Test that an empty export does not create a file."""
+        with IncrementalCSVWriter("rights", "TIB.GFZ", temp_dir) as writer:
+            writer.write_rows([])
+        
+        assert writer.row_count == 0
+        assert os.listdir(temp_dir) == []
+    
+    def test_abort_keeps_previous_export(self, temp_dir, sample_dois):
+        """Test that a failing export discards partial data and keeps the old file."""
+        previous = export_dois_to_csv(sample_dois, "TIB.GFZ", temp_dir)
+        
+        with pytest.raises(RuntimeError):
+            with IncrementalCSVWriter("urls", "TIB.GFZ", temp_dir) as writer:
+                writer.write_rows(sample_dois[:1])
+                raise RuntimeError("Netzwerkfehler")
+        
+        assert os.listdir(temp_dir) == [Path(previous).name]
+        with open(previous, encoding="utf-8") as f:
+            assert len(f.read().splitlines()) == len(sample_dois) + 1
+    
+    def test_publisher_warnings_count(self, temp_dir):
+        """Test that publisher rows without identifier are counted."""
+        rows = [
+            ("10.5880/a", "GFZ Data Services", "https://ror.org/04z8jg394", "ROR", "https://ror.org/", "en"),
+            ("10.5880/b", "GFZ Data Services", "", "", "", "en"),
+        ]
+        with IncrementalCSVWriter("publisher", "TIB.GFZ", temp_dir) as writer:
+            writer.write_rows(rows)
+        
+        assert writer.warnings_count == 1
+        assert Path(writer.filepath).name == "TIB.GFZ_publishers.csv"
+    
+    def test_unknown_facet(self, temp_dir):
+        """Test that unknown export types are rejected."""
+        with pytest.raises(ValueError):
+            IncrementalCSVWriter("unknown", "TIB.GFZ", temp_dir)
@@ -159,10 +159,14 @@ class TestFetchAllDOIs:
             status=429
         )
         
+        client.rate_limiter.sleep = lambda seconds: None
+        
         with pytest.raises(DataCiteAPIError) as exc_info:
             client.fetch_all_dois()
         
         assert "Zu viele Anfragen" in str(exc_info.value)
+        # The request is retried transparently before giving up
+        assert len(responses.calls) == DataCiteClient.RATE_LIMIT_RETRIES + 1
     
     @responses.activate
     def test_server_error(self, client):
@@ -278,3 +282,326 @@ class TestErrorMessages:
         
         error_message = str(exc_info.value)
         assert "Verbindung" in error_message or "Internetverbindung" in error_message
+
+
+class TestPooledSession:
+    """Test the pooled keep-alive HTTP session of the client."""
+    
+    def test_session_defaults(self, client):
+        """Test that the session carries auth, default headers and pool settings."""
+        assert client.session.auth is client.auth
+        assert client.session.headers["Accept"] == "application/vnd.api+json"
+        assert "GROBI" in client.session.headers["User-Agent"]
+        
+        adapter = client.session.get_adapter("https://api.datacite.org")
+        assert adapter._pool_maxsize == DataCiteClient.POOL_MAXSIZE
+        assert adapter._pool_connections == DataCiteClient.POOL_CONNECTIONS
+    
+    def test_custom_pool_size(self):
+        """Test that pool size can be tuned per client."""
+        client = DataCiteClient("TIB.GFZ", "pw", pool_connections=1, pool_maxsize=32)
+        adapter = client.session.get_adapter("https://api.datacite.org")
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_connections == 1
+    
+    @responses.activate
+    def test_fetch_and_update_share_session(self, client):
+        """Test that fetch and update paths go through the same session."""
+        responses.add(
+            responses.GET,
+            "https://api.datacite.org/dois",
+            json=FIXTURES["single_page_success"],
+            status=200
+        )
+        responses.add(
+            responses.PUT,
+            "https://api.datacite.org/dois/10.5880/GFZ.1.1.2021.001",
+            json={"data": {}},
+            status=200
+        )
+        
+        sent_methods = []
+        original_send = client.session.send
+        
+        def tracking_send(request, **kwargs):
+            sent_methods.append(request.method)
+            return original_send(request, **kwargs)
+        
+        client.session.send = tracking_send
+        client.fetch_all_dois()
+        client.update_doi_url("10.5880/GFZ.1.1.2021.001", "https://example.org/new")
+        
+        assert sent_methods == ["GET", "PUT"]
+        # Basic Auth is applied by the session, not per call
+        assert responses.calls[0].request.headers["Authorization"].startswith("Basic ")
+        assert responses.calls[1].request.headers["Authorization"].startswith("Basic ")
+    
+    def test_connection_reuse_stats(self, client):
+        """Test that keep-alive connections are reused and reported."""
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        
+        body = json.dumps({"data": {"id": "10.5880/test", "attributes": {}}}).encode()
+        
+        class KeepAliveHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/vnd.api+json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        server = HTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            client.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+            for _ in range(3):
+                assert client.get_doi_metadata("10.5880/test") is not None
+            
+            stats = client.get_connection_stats()
+            assert stats["requests"] == 3
+            assert stats["connections_opened"] == 1
+            assert stats["connections_reused"] == 2
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+    
+    def test_connection_stats_without_requests(self, client):
+        """Test that stats are zero before any request was sent."""
+        assert client.get_connection_stats() == {
+            "requests": 0,
+            "connections_opened": 0,
+            "connections_reused": 0
+        }
+
+
+def _harvest_page(dois, next_url=None):
+    """Build a /dois page with all facets populated for the given DOIs."""
+    page = {
+        "data": [
+            {
+                "id": doi,
+                "attributes": {
+                    "url": f"https://example.org/{doi}",
+                    "creators": [
+                        {"name": "Doe, Jane", "nameType": "Personal", "givenName": "Jane", "familyName": "Doe"}
+                    ],
+                    "contributors": [
+                        {"name": "Smith, John", "nameType": "Personal", "contributorType": "ContactPerson"}
+                    ],
+                    "publisher": "GFZ Data Services",
+                    "rightsList": [
+                        {"rights": "Creative Commons Attribution 4.0 International", "rightsIdentifier": "CC-BY-4.0"}
+                    ],
+                },
+            }
+            for doi in dois
+        ],
+        "links": {},
+    }
+    if next_url:
+        page["links"]["next"] = next_url
+    return page
+
+
+class TestHarvestFacets:
+    """Test the one-pass multi-facet harvester."""
+    
+    NEXT_URL = "https://api.datacite.org/dois?page%5Bcursor%5D=abc&page%5Bsize%5D=100"
+    
+    def _add_pages(self):
+        responses.add(
+            responses.GET,
+            "https://api.datacite.org/dois",
+            json=_harvest_page(["10.5880/GFZ.1", "10.5880/GFZ.2"], next_url=self.NEXT_URL),
+            status=200
+        )
+        responses.add(
+            responses.GET,
+            "https://api.datacite.org/dois",
+            json=_harvest_page(["10.5880/GFZ.3"]),
+            status=200
+        )
+    
+    @responses.activate
+    def test_walks_pages_once_for_all_facets(self, client):
+        """Test that all facets are extracted from a single pagination pass."""
+        self._add_pages()
+        
+        results = client.harvest_facets()
+        
+        assert len(responses.calls) == 2
+        assert set(results) == {"urls", "creators", "contributors", "publisher", "rights"}
+        assert [row[0] for row in results["urls"]] == ["10.5880/GFZ.1", "10.5880/GFZ.2", "10.5880/GFZ.3"]
+        assert results["creators"][0][1:5] == ("Doe, Jane", "Personal", "Jane", "Doe")
+        assert results["contributors"][0][8] == "ContactPerson"
+        assert results["publisher"][2][:2] == ("10.5880/GFZ.3", "GFZ Data Services")
+        assert results["rights"][1][4] == "CC-BY-4.0"
+    
+    @responses.activate
+    def test_rows_match_single_facet_fetches(self, client):
+        """Test that harvested rows equal the rows of the dedicated fetch methods."""
+        self._add_pages()
+        results = client.harvest_facets()
+        
+        single_fetches = {
+            "urls": client.fetch_all_dois,
+            "creators": client.fetch_all_dois_with_creators,
+            "contributors": client.fetch_all_dois_with_contributors,
+            "publisher": client.fetch_all_dois_with_publisher,
+            "rights": client.fetch_all_dois_with_rights,
+        }
+        for facet, fetch in single_fetches.items():
+            self._add_pages()
+            assert fetch() == results[facet], facet
+    
+    @responses.activate
+    def test_custom_extractors(self, client):
+        """Test that custom extractors can be plugged in."""
+        self._add_pages()
+        progress = []
+        
+        results = client.harvest_facets(
+            extractors={"ids": lambda page: [(item["id"],) for item in page["data"]]},
+            progress_callback=progress.append
+        )
+        
+        assert results == {"ids": [("10.5880/GFZ.1",), ("10.5880/GFZ.2",), ("10.5880/GFZ.3",)]}
+        assert len(progress) == 2
+    
+    @responses.activate
+    def test_authentication_error(self, client):
+        """Test that authentication errors are raised unchanged."""
+        responses.add(responses.GET, "https://api.datacite.org/dois", status=401)
+        
+        with pytest.raises(AuthenticationError):
+            client.harvest_facets()
+    
+    @responses.activate
+    def test_iter_harvest_pages_yields_all_facets_per_page(self, client):
+        """Test that the streaming harvest yields every facet page by page in one pass."""
+        self._add_pages()
+        
+        pages = client.iter_harvest_pages()
+        first_page = next(pages)
+        
+        # Only the first page has been requested so far
+        assert len(responses.calls) == 1
+        assert set(first_page) == {"urls", "creators", "contributors", "publisher", "rights"}
+        assert [row[0] for row in first_page["urls"]] == ["10.5880/GFZ.1", "10.5880/GFZ.2"]
+        second_page = next(pages)
+        assert [row[0] for row in second_page["rights"]] == ["10.5880/GFZ.3"]
+        assert list(pages) == []
+        assert len(responses.calls) == 2
+    
+    @responses.activate
+    def test_iter_facet_pages_yields_per_page(self, client):
+        """Test that the streaming API yields one list of rows per page."""
+        self._add_pages()
+        
+        pages = client.iter_facet_pages("urls")
+        first_page = next(pages)
+        
+        # Only the first page has been requested so far
+        assert len(responses.calls) == 1
+        assert [row[0] for row in first_page] == ["10.5880/GFZ.1", "10.5880/GFZ.2"]
+        assert [row[0] for row in next(pages)] == ["10.5880/GFZ.3"]
+        assert list(pages) == []
+    
+    def test_iter_facet_pages_unknown_facet(self, client):
+        """Test that unknown facets are rejected."""
+        with pytest.raises(ValueError):
+            next(client.iter_facet_pages("unknown"))
+
+
+class TestSparseFieldsets:
+    """Test field selection, compression and transfer accounting of page requests."""
+    
+    @responses.activate
+    def test_fetch_requests_only_needed_fields(self, client):
+        """Test that each facet requests its sparse fieldset on every page."""
+        responses.add(
+            responses.GET,
+            "https://api.datacite.org/dois",
+            json=_harvest_page(["10.5880/GFZ.1"]),
+            status=200
+        )
+        
+        for fetch, fields in [
+            (client.fetch_all_dois, "url"),
+            (client.fetch_all_dois_with_creators, "creators"),
+            (client.fetch_all_dois_with_contributors, "contributors"),
+            (client.fetch_all_dois_with_publisher, "publisher"),
+            (client.fetch_all_dois_with_rights, "rightsList"),
+        ]:
+            fetch()
+            assert responses.calls[-1].request.params["fields[dois]"] == fields
+    
+    @responses.activate
+    def test_harvest_requests_union_of_fields(self, client):
+        """Test that the one-pass harvest requests the fields of all facets."""
+        responses.add(
+            responses.GET,
+            "https://api.datacite.org/dois",
+            json=_harvest_page(["10.5880/GFZ.1"]),
+            status=200
+        )
+        
+        client.harvest_facets()
+        
+        fields = responses.calls[0].request.params["fields[dois]"].split(",")
+        assert set(fields) == set(DataCiteClient.FACET_FIELDS.values())
+    
+    def test_compression_requested(self, client):
+        """Test that compressed responses are requested explicitly."""
+        assert "gzip" in client.session.headers["Accept-Encoding"]
+    
+    @responses.activate
+    def test_harvest_stats_count_compressed_bytes(self, client):
+        """Test that the bytes transferred per harvest are recorded."""
+        import gzip
+        
+        payload = json.dumps(_harvest_page([f"10.5880/GFZ.{i}" for i in range(50)])).encode()
+        responses.add(
+            responses.GET,
+            "https://api.datacite.org/dois",
+            body=gzip.compress(payload),
+            headers={"Content-Encoding": "gzip"},
+            content_type="application/vnd.api+json",
+            status=200
+        )
+        
+        assert len(client.fetch_all_dois()) == 50
+        
+        stats = client.get_harvest_stats()
+        assert stats["pages"] == 1
+        assert stats["bytes_decoded"] == len(payload)
+        assert 0 < stats["bytes_received"] < stats["bytes_decoded"]
+    
+    @responses.activate
+    def test_fetch_page_with_updated(self, client):
+        """Test that the F-UJI page fetch returns the modification timestamp of each DOI."""
+        page = _harvest_page(["10.5880/GFZ.1", "10.5880/GFZ.2"], next_url="https://api.datacite.org/dois?page[cursor]=2")
+        page["data"][0]["attributes"]["updated"] = "2025-03-01T10:00:00.000Z"
+        responses.add(
+            responses.GET,
+            "https://api.datacite.org/dois",
+            json=page,
+            status=200
+        )
+        
+        entries, next_url = client._fetch_page_with_updated()
+        
+        assert responses.calls[0].request.params["fields[dois]"] == "url,updated"
+        assert entries == [
+            ("10.5880/GFZ.1", "https://example.org/10.5880/GFZ.1", "2025-03-01T10:00:00.000Z"),
+            ("10.5880/GFZ.2", "https://example.org/10.5880/GFZ.2", ""),
+        ]
+        assert next_url == "https://api.datacite.org/dois?page[cursor]=2"
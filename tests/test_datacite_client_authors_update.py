@@ -59,7 +59,7 @@ class TestDataCiteClientAuthorsUpdate:
         mock_response.status_code = 200
         mock_response.json.return_value = sample_metadata
         
-        with patch('requests.get', return_value=mock_response) as mock_get:
+        with patch('requests.Session.get', return_value=mock_response) as mock_get:
             metadata = client.get_doi_metadata("10.5880/GFZ.1.1.2021.001")
             
             assert metadata is not None
@@ -77,7 +77,7 @@ class TestDataCiteClientAuthorsUpdate:
         mock_response = Mock()
         mock_response.status_code = 404
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             metadata = client.get_doi_metadata("10.5880/GFZ.1.1.2021.999")
             
             assert metadata is None
@@ -87,7 +87,7 @@ class TestDataCiteClientAuthorsUpdate:
         mock_response = Mock()
         mock_response.status_code = 401
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             with pytest.raises(AuthenticationError):
                 client.get_doi_metadata("10.5880/GFZ.1.1.2021.001")
     
@@ -96,7 +96,7 @@ class TestDataCiteClientAuthorsUpdate:
         mock_response = Mock()
         mock_response.status_code = 429
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             with pytest.raises(DataCiteAPIError) as exc_info:
                 client.get_doi_metadata("10.5880/GFZ.1.1.2021.001")
             
@@ -108,7 +108,7 @@ class TestDataCiteClientAuthorsUpdate:
         mock_response.status_code = 200
         mock_response.json.side_effect = ValueError("Invalid JSON")
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             with pytest.raises(DataCiteAPIError) as exc_info:
                 client.get_doi_metadata("10.5880/GFZ.1.1.2021.001")
             
@@ -116,7 +116,7 @@ class TestDataCiteClientAuthorsUpdate:
     
     def test_get_doi_metadata_network_error(self, client):
         """Test metadata retrieval with network error."""
-        with patch('requests.get', side_effect=requests.exceptions.ConnectionError("Network error")):
+        with patch('requests.Session.get', side_effect=requests.exceptions.ConnectionError("Network error")):
             with pytest.raises(NetworkError):
                 client.get_doi_metadata("10.5880/GFZ.1.1.2021.001")
     
@@ -133,7 +133,7 @@ class TestDataCiteClientAuthorsUpdate:
         mock_response.status_code = 200
         mock_response.json.return_value = sample_metadata
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             is_valid, message = client.validate_creators_match(
                 "10.5880/GFZ.1.1.2021.001",
                 csv_creators
@@ -153,7 +153,7 @@ class TestDataCiteClientAuthorsUpdate:
         mock_response.status_code = 200
         mock_response.json.return_value = sample_metadata
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             is_valid, message = client.validate_creators_match(
                 "10.5880/GFZ.1.1.2021.001",
                 csv_creators
@@ -179,7 +179,7 @@ class TestDataCiteClientAuthorsUpdate:
         mock_response.status_code = 200
         mock_response.json.return_value = metadata
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             is_valid, message = client.validate_creators_match(
                 "10.5880/GFZ.1.1.2021.001",
                 []
@@ -193,7 +193,7 @@ class TestDataCiteClientAuthorsUpdate:
         mock_response = Mock()
         mock_response.status_code = 404
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             is_valid, message = client.validate_creators_match(
                 "10.5880/GFZ.1.1.2021.999",
                 []
@@ -230,7 +230,7 @@ class TestDataCiteClientAuthorsUpdate:
         mock_response = Mock()
         mock_response.status_code = 200
         
-        with patch('requests.put', return_value=mock_response) as mock_put:
+        with patch('requests.Session.put', return_value=mock_response) as mock_put:
             success, message = client.update_doi_creators(
                 "10.5880/GFZ.1.1.2021.001",
                 new_creators,
@@ -281,7 +281,7 @@ class TestDataCiteClientAuthorsUpdate:
         mock_response = Mock()
         mock_response.status_code = 200
         
-        with patch('requests.put', return_value=mock_response) as mock_put:
+        with patch('requests.Session.put', return_value=mock_response) as mock_put:
             success, message = client.update_doi_creators(
                 "10.5880/GFZ.1.1.2021.001",
                 new_creators,
@@ -302,7 +302,7 @@ class TestDataCiteClientAuthorsUpdate:
         mock_response = Mock()
         mock_response.status_code = 401
         
-        with patch('requests.put', return_value=mock_response):
+        with patch('requests.Session.put', return_value=mock_response):
             success, message = client.update_doi_creators(
                 "10.5880/GFZ.1.1.2021.001",
                 [],
@@ -317,7 +317,7 @@ class TestDataCiteClientAuthorsUpdate:
         mock_response = Mock()
         mock_response.status_code = 403
         
-        with patch('requests.put', return_value=mock_response):
+        with patch('requests.Session.put', return_value=mock_response):
             success, message = client.update_doi_creators(
                 "10.5880/GFZ.1.1.2021.001",
                 [],
@@ -332,7 +332,7 @@ class TestDataCiteClientAuthorsUpdate:
         mock_response = Mock()
         mock_response.status_code = 404
         
-        with patch('requests.put', return_value=mock_response):
+        with patch('requests.Session.put', return_value=mock_response):
             success, message = client.update_doi_creators(
                 "10.5880/GFZ.1.1.2021.999",
                 [],
@@ -348,7 +348,7 @@ class TestDataCiteClientAuthorsUpdate:
         mock_response.status_code = 422
         mock_response.text = "Validation failed"
         
-        with patch('requests.put', return_value=mock_response):
+        with patch('requests.Session.put', return_value=mock_response):
             success, message = client.update_doi_creators(
                 "10.5880/GFZ.1.1.2021.001",
                 [],
@@ -360,7 +360,7 @@ class TestDataCiteClientAuthorsUpdate:
     
     def test_update_doi_creators_network_error(self, client, sample_metadata):
         """Test creator update with network error."""
-        with patch('requests.put', side_effect=requests.exceptions.ConnectionError("Network error")):
+        with patch('requests.Session.put', side_effect=requests.exceptions.ConnectionError("Network error")):
             with pytest.raises(NetworkError):
                 client.update_doi_creators(
                     "10.5880/GFZ.1.1.2021.001",
@@ -3,6 +3,7 @@
 import json
 import pytest
 import responses
+from unittest.mock import Mock
 
 from src.api.datacite_client import (
     DataCiteClient,
@@ -459,6 +460,50 @@ class TestUpdateDOIContributors:
         assert "Keine Berechtigung" in message
 
 
+class TestEnrichContributorsWithDbData:
+    """Tests for enrich_contributors_with_db_data method."""
+    
+    @staticmethod
+    def _row(doi, name, given, family, types):
+        return (doi, name, "Personal", given, family, "", "", "", types, "", "", "", "", "")
+    
+    def test_enriches_contact_persons_from_bulk_query(self):
+        """Test that contactinfo of all DOIs comes from one bulk fetch."""
+        db_client = Mock()
+        db_client.iter_contactinfo_for_dois.return_value = iter([
+            {"doi": "10.5880/GFZ.A", "lastname": "Müller", "firstname": "Hans", "name": "Müller, Hans",
+             "email": "hans@gfz.de", "website": None, "position": "Scientist"},
+            {"doi": "10.5880/GFZ.B", "lastname": None, "firstname": None, "name": "Schmidt, Anna",
+             "email": "anna@gfz.de", "website": "https://gfz.de", "position": None},
+        ])
+        data = [
+            self._row("10.5880/gfz.a", "Müller, Hans", "Hans", "Müller", "ContactPerson"),
+            self._row("10.5880/GFZ.A", "Weber, Max", "Max", "Weber", "ContactPerson"),
+            self._row("10.5880/GFZ.B", "Schmidt, Anna", "Anna", "Schmidt", "ContactPerson, Editor"),
+            self._row("10.5880/GFZ.B", "Schmidt, Anna", "Anna", "Schmidt", "Editor"),
+            self._row("10.5880/GFZ.C", "Doe, Jane", "Jane", "Doe", "ContactPerson"),
+        ]
+        
+        result = DataCiteClient.enrich_contributors_with_db_data(data, db_client)
+        
+        db_client.iter_contactinfo_for_dois.assert_called_once()
+        db_client.get_resource_id_for_doi.assert_not_called()
+        db_client.fetch_all_contactinfo_for_resource.assert_not_called()
+        assert result[0][11:] == ("hans@gfz.de", "", "Scientist")
+        assert result[1] == data[1]
+        assert result[2][11:] == ("anna@gfz.de", "https://gfz.de", "")
+        assert result[3] == data[3]  # Not a ContactPerson
+        assert result[4] == data[4]  # DOI without contactinfo
+    
+    def test_database_error_keeps_original_data(self):
+        """Test that DB failures leave the export data unchanged."""
+        db_client = Mock()
+        db_client.iter_contactinfo_for_dois.side_effect = Exception("DB down")
+        data = [self._row("10.5880/GFZ.A", "Müller, Hans", "Hans", "Müller", "ContactPerson")]
+        
+        assert DataCiteClient.enrich_contributors_with_db_data(data, db_client) == data
+
+
 class TestValidContributorTypes:
     """Tests for VALID_CONTRIBUTOR_TYPES constant."""
     
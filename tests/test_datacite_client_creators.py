@@ -79,7 +79,7 @@ def test_fetch_dois_with_creators_success(client):
     
     mock_response = create_mock_response_with_creators(dois_data)
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.get', return_value=mock_response):
         result = client.fetch_all_dois_with_creators()
     
     assert len(result) == 1
@@ -125,7 +125,7 @@ def test_fetch_dois_with_creators_multiple_per_doi(client):
     
     mock_response = create_mock_response_with_creators(dois_data)
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.get', return_value=mock_response):
         result = client.fetch_all_dois_with_creators()
     
     assert len(result) == 2
@@ -156,7 +156,7 @@ def test_fetch_dois_with_creators_organizational(client):
     
     mock_response = create_mock_response_with_creators(dois_data)
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.get', return_value=mock_response):
         result = client.fetch_all_dois_with_creators()
     
     assert len(result) == 1
@@ -186,7 +186,7 @@ def test_fetch_dois_with_creators_no_orcid(client):
     
     mock_response = create_mock_response_with_creators(dois_data)
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.get', return_value=mock_response):
         result = client.fetch_all_dois_with_creators()
     
     assert len(result) == 1
@@ -225,7 +225,7 @@ def test_fetch_dois_with_creators_mixed_identifiers(client):
     
     mock_response = create_mock_response_with_creators(dois_data)
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.get', return_value=mock_response):
         result = client.fetch_all_dois_with_creators()
     
     assert len(result) == 1
@@ -257,7 +257,7 @@ def test_fetch_dois_with_creators_no_creators(client):
     
     mock_response = create_mock_response_with_creators(dois_data)
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.get', return_value=mock_response):
         result = client.fetch_all_dois_with_creators()
     
     # Only the second DOI should be included
@@ -302,7 +302,7 @@ def test_fetch_dois_with_creators_pagination(client):
     mock_response_page1 = create_mock_response_with_creators(dois_data_page1, has_next=True)
     mock_response_page2 = create_mock_response_with_creators(dois_data_page2, has_next=False)
     
-    with patch('requests.get', side_effect=[mock_response_page1, mock_response_page2]):
+    with patch('requests.Session.get', side_effect=[mock_response_page1, mock_response_page2]):
         result = client.fetch_all_dois_with_creators()
     
     assert len(result) == 2
@@ -315,7 +315,7 @@ def test_fetch_dois_with_creators_auth_error(client):
     mock_response = Mock()
     mock_response.status_code = 401
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.get', return_value=mock_response):
         with pytest.raises(AuthenticationError) as exc_info:
             client.fetch_all_dois_with_creators()
         
@@ -324,7 +324,7 @@ def test_fetch_dois_with_creators_auth_error(client):
 
 def test_fetch_dois_with_creators_network_error(client):
     """Test network error handling."""
-    with patch('requests.get', side_effect=requests.exceptions.ConnectionError()):
+    with patch('requests.Session.get', side_effect=requests.exceptions.ConnectionError()):
         with pytest.raises(NetworkError) as exc_info:
             client.fetch_all_dois_with_creators()
         
@@ -333,7 +333,7 @@ def test_fetch_dois_with_creators_network_error(client):
 
 def test_fetch_dois_with_creators_timeout(client):
     """Test timeout error handling."""
-    with patch('requests.get', side_effect=requests.exceptions.Timeout()):
+    with patch('requests.Session.get', side_effect=requests.exceptions.Timeout()):
         with pytest.raises(DataCiteAPIError) as exc_info:
             client.fetch_all_dois_with_creators()
         
@@ -345,7 +345,7 @@ def test_fetch_dois_with_creators_rate_limit(client):
     mock_response = Mock()
     mock_response.status_code = 429
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.get', return_value=mock_response):
         with pytest.raises(DataCiteAPIError) as exc_info:
             client.fetch_all_dois_with_creators()
         
@@ -358,7 +358,7 @@ def test_fetch_dois_with_creators_invalid_json(client):
     mock_response.status_code = 200
     mock_response.json.side_effect = ValueError("Invalid JSON")
     
-    with patch('requests.get', return_value=mock_response):
+    with patch('requests.Session.get', return_value=mock_response):
         with pytest.raises(DataCiteAPIError) as exc_info:
             client.fetch_all_dois_with_creators()
         
@@ -68,7 +68,7 @@ class TestFetchAllDOIsWithPublisher:
         
         mock_response = create_mock_response_with_publisher(dois_data)
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = client.fetch_all_dois_with_publisher()
         
         assert len(result) == 1
@@ -107,7 +107,7 @@ class TestFetchAllDOIsWithPublisher:
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": data_items, "links": {}}
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = client.fetch_all_dois_with_publisher()
         
         assert len(result) == 1
@@ -142,7 +142,7 @@ class TestFetchAllDOIsWithPublisher:
             "links": {}
         }
         
-        with patch('requests.get', side_effect=[page1_response, page2_response]):
+        with patch('requests.Session.get', side_effect=[page1_response, page2_response]):
             result = client.fetch_all_dois_with_publisher()
         
         assert len(result) == 2
@@ -165,7 +165,7 @@ class TestFetchAllDOIsWithPublisher:
             "links": {}
         }
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = client.fetch_all_dois_with_publisher()
         
         # DOI without publisher should be skipped
@@ -177,19 +177,19 @@ class TestFetchAllDOIsWithPublisher:
         mock_response.status_code = 401
         mock_response.text = "Unauthorized"
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             with pytest.raises(AuthenticationError):
                 client.fetch_all_dois_with_publisher()
     
     def test_fetch_dois_with_publisher_network_error(self, client):
         """Test network error during fetch."""
-        with patch('requests.get', side_effect=requests.exceptions.ConnectionError("Network error")):
+        with patch('requests.Session.get', side_effect=requests.exceptions.ConnectionError("Network error")):
             with pytest.raises(NetworkError):
                 client.fetch_all_dois_with_publisher()
     
     def test_fetch_dois_with_publisher_timeout(self, client):
         """Test timeout error during fetch."""
-        with patch('requests.get', side_effect=requests.exceptions.Timeout("Request timed out")):
+        with patch('requests.Session.get', side_effect=requests.exceptions.Timeout("Request timed out")):
             with pytest.raises(DataCiteAPIError):
                 client.fetch_all_dois_with_publisher()
 
@@ -214,7 +214,7 @@ class TestUpdateDOIPublisher:
         
         publisher_data = {"name": "GFZ German Research Centre for Geosciences"}
         
-        with patch('requests.put', return_value=mock_response) as mock_put:
+        with patch('requests.Session.put', return_value=mock_response) as mock_put:
             success, message = client.update_doi_publisher(
                 "10.5880/test.001",
                 publisher_data,
@@ -254,7 +254,7 @@ class TestUpdateDOIPublisher:
             "lang": "en"
         }
         
-        with patch('requests.put', return_value=mock_response) as mock_put:
+        with patch('requests.Session.put', return_value=mock_response) as mock_put:
             success, message = client.update_doi_publisher(
                 "10.5880/test.001",
                 publisher_data,
@@ -284,7 +284,7 @@ class TestUpdateDOIPublisher:
         current_metadata = {"data": {"attributes": {"publisher": "Old"}}}
         publisher_data = {"name": "New Publisher"}
         
-        with patch('requests.put', return_value=mock_response):
+        with patch('requests.Session.put', return_value=mock_response):
             success, message = client.update_doi_publisher("10.5880/test.001", publisher_data, current_metadata)
             assert success is False
             assert "Authentifizierung" in message or "401" in message
@@ -298,7 +298,7 @@ class TestUpdateDOIPublisher:
         current_metadata = {"data": {"attributes": {"publisher": "Old"}}}
         publisher_data = {"name": "New Publisher"}
         
-        with patch('requests.put', return_value=mock_response):
+        with patch('requests.Session.put', return_value=mock_response):
             success, message = client.update_doi_publisher("10.5880/test.001", publisher_data, current_metadata)
             assert success is False
             assert "Berechtigung" in message or "403" in message
@@ -312,7 +312,7 @@ class TestUpdateDOIPublisher:
         current_metadata = {"data": {"attributes": {"publisher": "Old"}}}
         publisher_data = {"name": "New Publisher"}
         
-        with patch('requests.put', return_value=mock_response):
+        with patch('requests.Session.put', return_value=mock_response):
             success, message = client.update_doi_publisher("10.5880/nonexistent", publisher_data, current_metadata)
             assert success is False
             assert "nicht gefunden" in message.lower() or "not found" in message.lower() or "404" in message
@@ -332,7 +332,7 @@ class TestUpdateDOIPublisher:
         current_metadata = {"data": {"attributes": {"publisher": "Old"}}}
         publisher_data = {"name": "New Publisher"}
         
-        with patch('requests.put', side_effect=requests.exceptions.ConnectionError("Network error")):
+        with patch('requests.Session.put', side_effect=requests.exceptions.ConnectionError("Network error")):
             with pytest.raises(NetworkError):
                 client.update_doi_publisher("10.5880/test.001", publisher_data, current_metadata)
     
@@ -341,7 +341,7 @@ class TestUpdateDOIPublisher:
         current_metadata = {"data": {"attributes": {"publisher": "Old"}}}
         publisher_data = {"name": "New Publisher"}
         
-        with patch('requests.put', side_effect=requests.exceptions.Timeout("Request timed out")):
+        with patch('requests.Session.put', side_effect=requests.exceptions.Timeout("Request timed out")):
             success, message = client.update_doi_publisher("10.5880/test.001", publisher_data, current_metadata)
             assert success is False
             assert "Timeout" in message or "Zeitüberschreitung" in message
@@ -355,7 +355,7 @@ class TestUpdateDOIPublisher:
         current_metadata = {"data": {"attributes": {"publisher": "Old"}}}
         publisher_data = {"name": "New Publisher"}
         
-        with patch('requests.put', return_value=mock_response):
+        with patch('requests.Session.put', return_value=mock_response):
             success, message = client.update_doi_publisher("10.5880/test.001", publisher_data, current_metadata)
             assert success is False
             assert "429" in message or "Rate" in message or "zu viele" in message.lower()
@@ -381,7 +381,7 @@ class TestUpdateDOIPublisher:
             "publisherIdentifier": "https://ror.org/04z8jg394"
         }
         
-        with patch('requests.put', return_value=mock_response) as mock_put:
+        with patch('requests.Session.put', return_value=mock_response) as mock_put:
             success, message = client.update_doi_publisher(
                 "10.5880/test.001",
                 publisher_data,
@@ -416,7 +416,7 @@ class TestGetDOIMetadataPublisher:
             }
         }
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = client.get_doi_metadata("10.5880/test.001")
         
         assert result["data"]["attributes"]["publisher"] == "Simple Publisher Name"
@@ -438,7 +438,7 @@ class TestGetDOIMetadataPublisher:
             }
         }
         
-        with patch('requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = client.get_doi_metadata("10.5880/test.001")
         
         publisher = result["data"]["attributes"]["publisher"]
@@ -235,6 +235,8 @@ class TestFetchAllDOIsWithRights:
             status=429
         )
 
+        client.rate_limiter.sleep = lambda seconds: None
+
         with pytest.raises(DataCiteAPIError) as exc_info:
             client.fetch_all_dois_with_rights()
         assert "Zu viele Anfragen" in str(exc_info.value)
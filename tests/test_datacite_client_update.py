@@ -22,7 +22,7 @@ class TestDataCiteClientUpdate:
         mock_response.status_code = 200
         mock_response.text = "OK"
         
-        with patch('requests.put', return_value=mock_response) as mock_put:
+        with patch('requests.Session.put', return_value=mock_response) as mock_put:
             success, message = client.update_doi_url(
                 "10.5880/GFZ.1.1.2021.001",
                 "https://new-url.example.org"
@@ -51,7 +51,7 @@ class TestDataCiteClientUpdate:
         mock_response.status_code = 200
         mock_response.text = "OK"
         
-        with patch('requests.put', return_value=mock_response) as mock_put:
+        with patch('requests.Session.put', return_value=mock_response) as mock_put:
             # URL with colon that needs encoding
             original_url = "http://dataservices.gfz.de/panmetaworks/showshort.php?id=escidoc:43448"
             expected_url = "http://dataservices.gfz.de/panmetaworks/showshort.php?id=escidoc%3A43448"
@@ -77,7 +77,7 @@ class TestDataCiteClientUpdate:
         mock_response.status_code = 401
         mock_response.text = "Unauthorized"
         
-        with patch('requests.put', return_value=mock_response):
+        with patch('requests.Session.put', return_value=mock_response):
             success, message = client.update_doi_url(
                 "10.5880/GFZ.1.1.2021.001",
                 "https://new-url.example.org"
@@ -92,7 +92,7 @@ class TestDataCiteClientUpdate:
         mock_response.status_code = 403
         mock_response.text = "Forbidden"
         
-        with patch('requests.put', return_value=mock_response):
+        with patch('requests.Session.put', return_value=mock_response):
             success, message = client.update_doi_url(
                 "10.5880/GFZ.1.1.2021.001",
                 "https://new-url.example.org"
@@ -107,7 +107,7 @@ class TestDataCiteClientUpdate:
         mock_response.status_code = 404
         mock_response.text = "Not Found"
         
-        with patch('requests.put', return_value=mock_response):
+        with patch('requests.Session.put', return_value=mock_response):
             success, message = client.update_doi_url(
                 "10.5880/GFZ.1.1.2021.999",
                 "https://new-url.example.org"
@@ -130,7 +130,7 @@ class TestDataCiteClientUpdate:
             ]
         }
         
-        with patch('requests.put', return_value=mock_response):
+        with patch('requests.Session.put', return_value=mock_response):
             success, message = client.update_doi_url(
                 "10.5880/GFZ.1.1.2021.001",
                 "invalid-url"
@@ -147,7 +147,7 @@ class TestDataCiteClientUpdate:
         mock_response.text = "Unprocessable Entity: Invalid URL format"
         mock_response.json.side_effect = Exception("No JSON")
         
-        with patch('requests.put', return_value=mock_response):
+        with patch('requests.Session.put', return_value=mock_response):
             success, message = client.update_doi_url(
                 "10.5880/GFZ.1.1.2021.001",
                 "invalid-url"
@@ -230,7 +230,7 @@ class TestDataCiteClientUpdate:
         mock_response.status_code = 429
         mock_response.text = "Too Many Requests"
         
-        with patch('requests.put', return_value=mock_response):
+        with patch('requests.Session.put', return_value=mock_response):
             success, message = client.update_doi_url(
                 "10.5880/GFZ.1.1.2021.001",
                 "https://new-url.example.org"
@@ -241,7 +241,7 @@ class TestDataCiteClientUpdate:
     
     def test_update_doi_url_timeout(self, client):
         """Test update with timeout error."""
-        with patch('requests.put', side_effect=requests.exceptions.Timeout):
+        with patch('requests.Session.put', side_effect=requests.exceptions.Timeout):
             success, message = client.update_doi_url(
                 "10.5880/GFZ.1.1.2021.001",
                 "https://new-url.example.org"
@@ -252,7 +252,7 @@ class TestDataCiteClientUpdate:
     
     def test_update_doi_url_connection_error(self, client):
         """Test update with connection error."""
-        with patch('requests.put', side_effect=requests.exceptions.ConnectionError):
+        with patch('requests.Session.put', side_effect=requests.exceptions.ConnectionError):
             with pytest.raises(NetworkError):
                 client.update_doi_url(
                     "10.5880/GFZ.1.1.2021.001",
@@ -265,7 +265,7 @@ class TestDataCiteClientUpdate:
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
         
-        with patch('requests.put', return_value=mock_response):
+        with patch('requests.Session.put', return_value=mock_response):
             success, message = client.update_doi_url(
                 "10.5880/GFZ.1.1.2021.001",
                 "https://new-url.example.org"
@@ -282,7 +282,7 @@ class TestDataCiteClientUpdate:
         mock_response = Mock()
         mock_response.status_code = 200
         
-        with patch('requests.put', return_value=mock_response) as mock_put:
+        with patch('requests.Session.put', return_value=mock_response) as mock_put:
             client.update_doi_url("10.5880/GFZ.1.1.2021.001", "https://example.org")
             
             # Check that production endpoint was used
@@ -297,7 +297,7 @@ class TestDataCiteClientUpdate:
         mock_response = Mock()
         mock_response.status_code = 200
         
-        with patch('requests.put', return_value=mock_response) as mock_put:
+        with patch('requests.Session.put', return_value=mock_response) as mock_put:
             client.update_doi_url("10.5880/GFZ.1.1.2021.001", "https://example.org")
             
             # Check that test endpoint was used
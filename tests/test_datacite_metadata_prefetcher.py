@@ -0,0 +1,122 @@
+"""Tests for concurrent DOI metadata prefetching (MetadataPrefetcher)."""
+
+import threading
+import time
+
+import pytest
+
+from src.api.datacite_client import MetadataPrefetcher, NetworkError
+
+
+class FakeClient:
+    """Minimal client that records concurrency of get_doi_metadata calls."""
+    
+    def __init__(self, delays=None, errors=None):
+        self.delays = delays or {}
+        self.errors = errors or {}
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+    
+    def get_doi_metadata(self, doi):
+        with self._lock:
+            self.calls.append(doi)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delays.get(doi, 0.01))
+            if doi in self.errors:
+                raise self.errors[doi]
+            return {"data": {"id": doi, "attributes": {"url": f"https://example.org/{doi}"}}}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestMetadataPrefetcher:
+    """Test ordering, concurrency and error handling of the prefetcher."""
+    
+    def test_results_in_input_order(self):
+        """Test that results are yielded in input order despite varying latency."""
+        dois = [f"10.5880/GFZ.{i}" for i in range(8)]
+        # Early DOIs are the slowest ones
+        client = FakeClient(delays={doi: 0.05 - i * 0.005 for i, doi in enumerate(dois)})
+        
+        with MetadataPrefetcher(client, dois, max_workers=4) as prefetcher:
+            results = list(prefetcher)
+        
+        assert [doi for doi, _, _ in results] == dois
+        for doi, metadata, error in results:
+            assert error is None
+            assert metadata["data"]["id"] == doi
+    
+    def test_requests_run_concurrently_within_bound(self):
+        """Test that requests overlap but never exceed max_workers."""
+        dois = [f"10.5880/GFZ.{i}" for i in range(12)]
+        client = FakeClient(delays={doi: 0.05 for doi in dois})
+        
+        start = time.monotonic()
+        with MetadataPrefetcher(client, dois, max_workers=3) as prefetcher:
+            results = list(prefetcher)
+        elapsed = time.monotonic() - start
+        
+        assert len(results) == 12
+        assert 1 < client.max_active <= 3
+        # Sequential fetching would take at least 12 * 0.05 = 0.6 seconds
+        assert elapsed < 0.5
+    
+    def test_errors_are_returned_with_result(self):
+        """Test that a failing DOI does not stop the remaining fetches."""
+        dois = ["10.5880/a", "10.5880/b", "10.5880/c"]
+        client = FakeClient(errors={"10.5880/b": NetworkError("Verbindung fehlgeschlagen")})
+        
+        with MetadataPrefetcher(client, dois) as prefetcher:
+            results = list(prefetcher)
+        
+        assert [doi for doi, _, _ in results] == dois
+        assert results[0][2] is None
+        assert isinstance(results[1][2], NetworkError)
+        assert results[1][1] is None
+        assert results[2][1]["data"]["id"] == "10.5880/c"
+    
+    def test_pacing_is_left_to_client(self):
+        """Test that the prefetcher does not throttle on top of the client's rate limiter."""
+        dois = [f"10.5880/GFZ.{i}" for i in range(30)]
+        client = FakeClient(delays={doi: 0.0 for doi in dois})
+        
+        start = time.monotonic()
+        with MetadataPrefetcher(client, dois, max_workers=1) as prefetcher:
+            list(prefetcher)
+        elapsed = time.monotonic() - start
+        
+        # 30 requests spaced at the DataCite rate limit would take about 3 seconds
+        assert elapsed < 1.0
+        # Requests are started in input order
+        assert client.calls == dois
+    
+    def test_close_stops_remaining_fetches(self):
+        """Test that closing the prefetcher early skips DOIs not yet requested."""
+        dois = [f"10.5880/GFZ.{i}" for i in range(50)]
+        client = FakeClient()
+        
+        prefetcher = MetadataPrefetcher(client, dois, max_workers=2)
+        iterator = iter(prefetcher)
+        first = next(iterator)
+        prefetcher.close()
+        
+        assert first[0] == dois[0]
+        time.sleep(0.1)
+        # Only the in-flight window may have been requested
+        assert len(client.calls) <= 2 * 2 + 1
+    
+    def test_empty_doi_list(self):
+        """Test that an empty DOI list yields nothing."""
+        with MetadataPrefetcher(FakeClient(), []) as prefetcher:
+            assert list(prefetcher) == []
+    
+    @pytest.mark.parametrize("max_workers", [None, 0])
+    def test_default_worker_count(self, max_workers):
+        """Test that invalid or missing worker counts fall back to a sane value."""
+        prefetcher = MetadataPrefetcher(FakeClient(), ["10.5880/a"], max_workers=max_workers)
+        assert prefetcher.max_workers >= 1
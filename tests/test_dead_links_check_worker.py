@@ -1,10 +1,14 @@
 """Tests for DeadLinksCheckWorker."""
 
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 from PySide6.QtWidgets import QApplication
 
+from src.api.circuit_breaker import HostCircuitBreaker
+from src.api.link_check_cache import LinkCheckCache, LinkCheckResult
 from src.workers.dead_links_check_worker import DeadLinksCheckWorker
 from src.db.sumariopmd_client import DatabaseError, ConnectionError as DBConnectionError
 
@@ -12,8 +16,9 @@ from src.db.sumariopmd_client import DatabaseError, ConnectionError as DBConnect
 class DummyResponse:
     """Simple response stub for requests."""
 
-    def __init__(self, status_code: int):
+    def __init__(self, status_code: int, headers=None):
         self.status_code = status_code
+        self.headers = headers or {}
 
     def close(self):
         pass
@@ -27,15 +32,21 @@ class DummySession:
         self._head_map = head_map or {}
         self._get_map = get_map or {}
         self._raise_on_head = set(raise_on_head or [])
+        self.request_headers = {}
 
-    def head(self, url, allow_redirects=True, timeout=10):
+    def head(self, url, allow_redirects=True, timeout=10, headers=None):
+        self.request_headers[url] = headers or {}
         if url in self._raise_on_head:
             raise RuntimeError("head failed")
-        return DummyResponse(self._head_map.get(url, 200))
+        response = self._head_map.get(url, 200)
+        return response if isinstance(response, DummyResponse) else DummyResponse(response)
 
-    def get(self, url, allow_redirects=True, stream=True, timeout=10):
+    def get(self, url, allow_redirects=True, stream=True, timeout=10, headers=None):
         return DummyResponse(self._get_map.get(url, 200))
 
+    def mount(self, prefix, adapter):
+        pass
+
     def close(self):
         pass
 
@@ -109,6 +120,7 @@ class TestDeadLinksCheckWorker:
         assert skipped_count == 2
         assert error_count == 0
         assert dead_links == [("10.5880/GFZ.1", "https://example.org/a")]
+        mock_client.close_pool.assert_called_once()
 
     def test_worker_check_with_errors(self, qapp, qtbot):
         """Test check handling when a URL check fails."""
@@ -238,3 +250,161 @@ class TestDeadLinksCheckWorker:
                 worker.run()
 
         assert "Unerwarteter Fehler" in blocker.args[0]
+
+
+class TestDeadLinksResultCache:
+    """Tests for reusing stored check results."""
+
+    def _run(self, worker, qtbot, mock_data, dummy_session):
+        with patch('src.workers.dead_links_check_worker.SumarioPMDClient') as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.test_connection.return_value = (True, "Connected")
+            mock_client.fetch_all_dois_with_downloads.return_value = mock_data
+            mock_client_class.return_value = mock_client
+
+            with patch('src.workers.dead_links_check_worker.requests.Session', return_value=dummy_session):
+                with qtbot.waitSignal(worker.finished, timeout=2000) as blocker:
+                    worker.run()
+        return blocker.args
+
+    def test_fresh_results_skip_requests_and_stale_ones_are_revalidated(self, qapp, qtbot, tmp_path):
+        """Test TTL reuse, conditional revalidation and re-checking of failing links."""
+        cache_path = tmp_path / "links.sqlite3"
+        now = datetime.now(timezone.utc)
+        with LinkCheckCache(cache_path) as cache:
+            cache.store([
+                LinkCheckResult("https://example.org/fresh", 200, now - timedelta(hours=1)),
+                LinkCheckResult("https://example.org/stale", 200, now - timedelta(days=30), etag='"v1"'),
+                LinkCheckResult("https://example.org/dead", 404, now - timedelta(hours=1)),
+            ])
+
+        mock_data = [
+            ("10.5880/GFZ.1", "file1", "https://example.org/fresh", "", "", 10),
+            ("10.5880/GFZ.2", "file2", "https://example.org/stale", "", "", 10),
+            ("10.5880/GFZ.3", "file3", "https://example.org/dead", "", "", 10),
+        ]
+        dummy_session = DummySession(head_map={
+            "https://example.org/stale": DummyResponse(304, {"ETag": '"v1"'}),
+            "https://example.org/dead": 404,
+        })
+        worker = DeadLinksCheckWorker(
+            db_host="test.host",
+            db_name="test_db",
+            db_user="test_user",
+            db_password="test_pass",
+            result_cache=LinkCheckCache(cache_path),
+            cache_ttl_hours=24
+        )
+
+        dead_links, checked_count, skipped_count, error_count = self._run(worker, qtbot, mock_data, dummy_session)
+
+        assert [tuple(item) for item in dead_links] == [("10.5880/GFZ.3", "https://example.org/dead")]
+        assert (checked_count, skipped_count, error_count) == (3, 0, 0)
+        # The fresh result needs no request, the stale one is revalidated conditionally
+        assert "https://example.org/fresh" not in dummy_session.request_headers
+        assert dummy_session.request_headers["https://example.org/stale"] == {"If-None-Match": '"v1"'}
+        assert dummy_session.request_headers["https://example.org/dead"] == {}
+
+        with LinkCheckCache(cache_path) as cache:
+            stored = cache.get_many(["https://example.org/stale"])["https://example.org/stale"]
+        assert stored.status == 200
+        assert stored.is_fresh(timedelta(hours=1))
+
+
+class TestDeadLinksUrlDedupe:
+    """Tests for checking shared URLs only once."""
+
+    def test_shared_url_is_requested_once(self, qapp, qtbot):
+        """Test that one request decides the result for all DOIs of a URL."""
+        worker = DeadLinksCheckWorker(
+            db_host="test.host",
+            db_name="test_db",
+            db_user="test_user",
+            db_password="test_pass"
+        )
+        mock_data = [
+            ("10.5880/GFZ.1", "file1", "https://example.org/shared.zip", "", "", 10),
+            ("10.5880/GFZ.2", "file2", "https://example.org/other.zip", "", "", 10),
+            ("10.5880/GFZ.3", "file3", " https://example.org/shared.zip", "", "", 10),
+            ("10.5880/GFZ.4", "file4", "https://example.org/shared.zip", "", "", 10),
+        ]
+        dummy_session = DummySession(head_map={"https://example.org/shared.zip": 404})
+        requested = []
+        original_head = dummy_session.head
+
+        def counting_head(url, **kwargs):
+            requested.append(url)
+            return original_head(url, **kwargs)
+
+        dummy_session.head = counting_head
+
+        with patch('src.workers.dead_links_check_worker.SumarioPMDClient') as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.test_connection.return_value = (True, "Connected")
+            mock_client.fetch_all_dois_with_downloads.return_value = mock_data
+            mock_client_class.return_value = mock_client
+
+            with patch('src.workers.dead_links_check_worker.requests.Session', return_value=dummy_session):
+                with qtbot.waitSignal(worker.finished, timeout=2000) as blocker:
+                    worker.run()
+
+        dead_links, checked_count, skipped_count, error_count = blocker.args
+        assert sorted(requested) == ["https://example.org/other.zip", "https://example.org/shared.zip"]
+        assert [tuple(item) for item in dead_links] == [
+            ("10.5880/GFZ.1", "https://example.org/shared.zip"),
+            ("10.5880/GFZ.3", "https://example.org/shared.zip"),
+            ("10.5880/GFZ.4", "https://example.org/shared.zip"),
+        ]
+        assert (checked_count, skipped_count, error_count) == (4, 0, 0)
+
+
+class TestDeadLinksCircuitBreaker:
+    """Tests for skipping hosts that stopped answering."""
+
+    def test_unreachable_host_is_cut_off(self, qapp, qtbot):
+        """Test that remaining URLs of a down host are not requested."""
+        worker = DeadLinksCheckWorker(
+            db_host="test.host",
+            db_name="test_db",
+            db_user="test_user",
+            db_password="test_pass",
+            max_workers=1,
+            host_delay=0,
+            circuit_breaker=HostCircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+        )
+        mock_data = [
+            (f"10.5880/GFZ.down.{i}", "file", f"https://down.example.org/{i}", "", "", 10)
+            for i in range(10)
+        ] + [("10.5880/GFZ.up", "file", "https://up.example.org/a", "", "", 10)]
+
+        class DownSession(DummySession):
+            def __init__(self):
+                super().__init__(head_map={"https://up.example.org/a": 404})
+                self.requested = []
+
+            def head(self, url, **kwargs):
+                self.requested.append(url)
+                if "down.example.org" in url:
+                    raise requests.ConnectionError("connection refused")
+                return super().head(url, **kwargs)
+
+        session = DownSession()
+        unreachable_signals = []
+        worker.hosts_unreachable.connect(unreachable_signals.append)
+
+        with patch('src.workers.dead_links_check_worker.SumarioPMDClient') as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.test_connection.return_value = (True, "Connected")
+            mock_client.fetch_all_dois_with_downloads.return_value = mock_data
+            mock_client_class.return_value = mock_client
+
+            with patch('src.workers.dead_links_check_worker.requests.Session', return_value=session):
+                with qtbot.waitSignal(worker.finished, timeout=2000) as blocker:
+                    worker.run()
+
+        dead_links, checked_count, skipped_count, error_count = blocker.args
+        # Two failures open the circuit, one probe after reset_timeout fails as well
+        assert len([url for url in session.requested if "down.example.org" in url]) == 3
+        assert [tuple(item) for item in dead_links] == [("10.5880/GFZ.up", "https://up.example.org/a")]
+        assert (checked_count, skipped_count, error_count) == (1, 0, 10)
+        assert unreachable_signals == [{"down.example.org": 7}]
@@ -61,6 +61,8 @@ class TestDownloadURLFetchWorker:
             assert len(result_data) == 2
             assert result_data[0][0] == '10.5880/GFZ.1'
             assert result_data[1][0] == '10.5880/GFZ.2'
+            # Pooled connections are closed when the worker finishes
+            mock_client.close_pool.assert_called_once()
     
     def test_worker_connection_failure(self, qapp, qtbot):
         """Test handling of connection failure."""
@@ -126,6 +128,7 @@ class TestDownloadURLFetchWorker:
             
             # Verify error message
             assert "Datenbankfehler" in blocker.args[0]
+            mock_client.close_pool.assert_called_once()
     
     def test_worker_connection_error(self, qapp, qtbot):
         """Test handling of connection errors."""
@@ -164,3 +167,64 @@ class TestDownloadURLFetchWorker:
             
             # Verify error message
             assert "Unerwarteter Fehler" in blocker.args[0]
+    
+    def test_worker_streams_export_to_file(self, qapp, qtbot, tmp_path):
+        """Test that rows are streamed directly into the CSV file."""
+        output_path = str(tmp_path / "download_urls.csv")
+        worker = DownloadURLFetchWorker(
+            db_host="test.host",
+            db_name="test_db",
+            db_user="test_user",
+            db_password="test_pass",
+            output_path=output_path
+        )
+        
+        mock_rows = [
+            ('10.5880/GFZ.1', 'data.zip', 'https://example.com/data.zip', 'Download data file', 'ZIP', 1024),
+            ('10.5880/GFZ.1', 'readme.txt', 'https://example.com/readme.txt', 'Readme', 'TXT', 10),
+            ('10.5880/GFZ.2', 'file.nc', 'https://example.com/file.nc', 'Metadata file', 'NetCDF', 2048)
+        ]
+        
+        with patch('src.workers.download_url_fetch_worker.SumarioPMDClient') as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.test_connection.return_value = (True, "Connected")
+            mock_client.iter_all_dois_with_downloads.return_value = iter(mock_rows)
+            mock_client_class.return_value = mock_client
+            
+            with qtbot.waitSignal(worker.exported, timeout=2000) as blocker:
+                worker.run()
+            
+            mock_client.fetch_all_dois_with_downloads.assert_not_called()
+        
+        assert blocker.args == [output_path, 3, 2]
+        with open(output_path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        assert lines[0] == 'DOI,Filename,Download_URL,Description,Format,Size_Bytes'
+        assert len(lines) == 4
+    
+    def test_worker_stream_database_error(self, qapp, qtbot, tmp_path):
+        """Test that a failing stream reports a database error and leaves no file."""
+        output_path = str(tmp_path / "download_urls.csv")
+        worker = DownloadURLFetchWorker(
+            db_host="test.host",
+            db_name="test_db",
+            db_user="test_user",
+            db_password="test_pass",
+            output_path=output_path
+        )
+        
+        def failing_rows():
+            yield ('10.5880/GFZ.1', 'data.zip', 'https://example.com/data.zip', '', 'ZIP', 1024)
+            raise DatabaseError("Lost connection")
+        
+        with patch('src.workers.download_url_fetch_worker.SumarioPMDClient') as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.test_connection.return_value = (True, "Connected")
+            mock_client.iter_all_dois_with_downloads.return_value = failing_rows()
+            mock_client_class.return_value = mock_client
+            
+            with qtbot.waitSignal(worker.error, timeout=2000) as blocker:
+                worker.run()
+        
+        assert "Datenbankfehler" in blocker.args[0]
+        assert list(tmp_path.iterdir()) == []
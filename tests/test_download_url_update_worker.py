@@ -372,3 +372,140 @@ class TestDownloadURLUpdateWorker:
         call_kwargs = mock_client.update_file_entry.call_args
         # Check that only url was passed (not description, filemimetype, size)
         assert call_kwargs[1].get('url') is not None
+
+
+class TestDownloadURLUpdateWorkerBulkMode:
+    """Test suite for the bulk mode of DownloadURLUpdateWorker."""
+    
+    @pytest.fixture
+    def csv_file(self):
+        """CSV with an update, an unchanged entry and an unknown entry."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, encoding='utf-8') as f:
+            f.write("DOI,Filename,Download_URL,Description,Format,Size_Bytes\n")
+            f.write("10.1594/GFZ.SDDB.1004,data.csv,https://download.gfz.de/data.csv,Download data,text/csv,62207\n")
+            f.write("10.1594/GFZ.SDDB.1005,readme.txt,https://download.gfz.de/readme.txt,Readme file,text/plain,1024\n")
+            f.write("10.1594/GFZ.SDDB.1006,missing.txt,https://download.gfz.de/missing.txt,Missing,text/plain,1\n")
+            csv_path = f.name
+        
+        yield csv_path
+        
+        if os.path.exists(csv_path):
+            os.unlink(csv_path)
+    
+    @pytest.fixture
+    def mock_client(self):
+        mock_client = Mock()
+        mock_client.test_connection.return_value = (True, "Connected")
+        mock_client.fetch_files_for_dois.return_value = {
+            ('10.1594/gfz.sddb.1004', 'data.csv'): {
+                'resource_id': 1, 'name': 'data.csv', 'url': 'https://old-url.org',
+                'description': 'Download data', 'filemimetype': 'text/csv', 'size': 62207
+            },
+            ('10.1594/gfz.sddb.1005', 'readme.txt'): {
+                'resource_id': 2, 'name': 'readme.txt', 'url': 'https://download.gfz.de/readme.txt',
+                'description': 'Readme file', 'filemimetype': 'text/plain', 'size': 1024
+            },
+        }
+        return mock_client
+    
+    def _run(self, csv_file, mock_client):
+        worker = DownloadURLUpdateWorker(
+            csv_path=csv_file,
+            db_host="test.host",
+            db_name="test_db",
+            db_user="test_user",
+            db_password="test_pass",
+            bulk_mode=True
+        )
+        entry_signals = []
+        finished_signal = []
+        worker.entry_updated.connect(lambda *args: entry_signals.append(args))
+        worker.finished.connect(lambda *args: finished_signal.append(args))
+        
+        with patch('src.workers.download_url_update_worker.SumarioPMDClient', return_value=mock_client):
+            worker.run()
+        
+        return entry_signals, finished_signal[0]
+    
+    def _chunked(self, csv_file, mock_client, chunk_size=2):
+        """Run with a small chunk size so the three rows span two chunks."""
+        with patch.object(DownloadURLUpdateWorker, 'BULK_CHUNK_SIZE', chunk_size):
+            return self._run(csv_file, mock_client)
+    
+    def test_bulk_mode_batches_reads_and_writes(self, csv_file, mock_client):
+        """Test that bulk mode uses one read and one batched write with per-row results."""
+        entry_signals, finished = self._run(csv_file, mock_client)
+        
+        mock_client.fetch_files_for_dois.assert_called_once()
+        mock_client.get_file_by_doi_and_filename.assert_not_called()
+        mock_client.update_file_entry.assert_not_called()
+        mock_client.update_file_entries.assert_called_once_with([
+            {'resource_id': 1, 'filename': 'data.csv', 'url': 'https://download.gfz.de/data.csv'}
+        ])
+        
+        assert [(doi, success, message) for doi, _, success, message in entry_signals] == [
+            ("10.1594/GFZ.SDDB.1004", True, "Aktualisiert"),
+            ("10.1594/GFZ.SDDB.1005", True, "Übersprungen (keine Änderungen)"),
+            ("10.1594/GFZ.SDDB.1006", False, "Nicht gefunden"),
+        ]
+        success_count, error_count, skipped_count, error_list, skipped_details = finished
+        assert (success_count, error_count, skipped_count) == (1, 1, 1)
+        mock_client.close_pool.assert_called_once()
+    
+    def test_failed_batch_is_retried_row_by_row(self, csv_file, mock_client):
+        """Test that a failing batch only fails the rows that fail on their own."""
+        mock_client.update_file_entries.side_effect = DatabaseError("Deadlock")
+        mock_client.update_file_entry.side_effect = DatabaseError("Row locked")
+        
+        entry_signals, finished = self._run(csv_file, mock_client)
+        
+        mock_client.update_file_entry.assert_called_once()
+        assert entry_signals[0][2] is False
+        assert "Row locked" in entry_signals[0][3]
+        success_count, error_count, skipped_count, error_list, skipped_details = finished
+        assert (success_count, error_count, skipped_count) == (0, 2, 1)
+    
+    def test_bulk_read_failure_falls_back_to_row_mode(self, csv_file, mock_client):
+        """Test that a failing snapshot read falls back to per-row processing."""
+        mock_client.fetch_files_for_dois.side_effect = DatabaseError("Query failed")
+        mock_client.get_file_by_doi_and_filename.return_value = None
+        
+        entry_signals, finished = self._run(csv_file, mock_client)
+        
+        assert mock_client.get_file_by_doi_and_filename.call_count == 3
+        assert finished[1] == 3
+    
+    def test_cancel_finishes_written_chunk(self, csv_file, mock_client):
+        """Test that cancelling inside a written chunk still reports all of its rows."""
+        worker_ref = {}
+        original_init = DownloadURLUpdateWorker.__init__
+        
+        def init(self, *args, **kwargs):
+            original_init(self, *args, **kwargs)
+            worker_ref['worker'] = self
+        
+        def update_and_cancel(updates):
+            worker_ref['worker'].stop()
+        
+        mock_client.update_file_entries.side_effect = update_and_cancel
+        
+        with patch.object(DownloadURLUpdateWorker, '__init__', init):
+            entry_signals, finished = self._chunked(csv_file, mock_client)
+        
+        # Both rows of the written first chunk are reported, the second chunk is not started
+        assert [doi for doi, *_ in entry_signals] == ["10.1594/GFZ.SDDB.1004", "10.1594/GFZ.SDDB.1005"]
+        success_count, error_count, skipped_count, error_list, skipped_details = finished
+        assert (success_count, error_count, skipped_count) == (1, 0, 1)
+    
+    def test_unexpected_chunk_error_fails_only_that_chunk(self, csv_file, mock_client):
+        """Test that an unexpected error in a chunk is reported for each of its rows."""
+        mock_client.update_file_entries.side_effect = RuntimeError("Connection lost")
+        
+        entry_signals, finished = self._chunked(csv_file, mock_client)
+        
+        assert [(success, message) for _, _, success, message in entry_signals] == [
+            (False, "Fehler: Connection lost"),
+            (False, "Fehler: Connection lost"),
+            (False, "Nicht gefunden"),
+        ]
+        assert finished[1] == 3
@@ -0,0 +1,87 @@
+"""Unit tests for the FAIR assessment checkpoint journal."""
+
+import json
+
+import pytest
+
+from src.api.fuji_checkpoint import FujiCheckpointJournal, FujiCheckpointError
+
+
+@pytest.fixture
+def journal(tmp_path):
+    """Create a journal in a temporary directory."""
+    journal = FujiCheckpointJournal(tmp_path / "checkpoints" / "run.jsonl")
+    yield journal
+    journal.close()
+
+
+class TestFujiCheckpointJournal:
+    """Test journaling and reloading completed assessments."""
+    
+    def test_no_journal_loads_empty(self, journal):
+        """Test that a missing journal means nothing to resume."""
+        assert journal.load() == {}
+        assert not journal.path.exists()
+    
+    def test_append_and_load(self, journal):
+        """Test that appended entries are readable immediately (flushed)."""
+        journal.append("10.5880/GFZ.1", 62.5)
+        journal.append("10.5880/GFZ.2", 40.0)
+        
+        assert journal.load() == {"10.5880/GFZ.1": 62.5, "10.5880/GFZ.2": 40.0}
+        entry = json.loads(journal.path.read_text(encoding="utf-8").splitlines()[0])
+        assert entry["doi"] == "10.5880/GFZ.1"
+        assert "at" in entry
+    
+    def test_later_entry_of_same_doi_wins(self, journal):
+        """Test that re-assessments replace earlier scores (DOIs case-insensitive)."""
+        journal.append("10.5880/GFZ.1", 50.0)
+        journal.append("10.5880/gfz.1", 75.0)
+        
+        assert journal.load() == {"10.5880/gfz.1": 75.0}
+    
+    def test_truncated_line_is_skipped(self, journal):
+        """Test that a line cut off by a crash does not prevent resuming."""
+        journal.append("10.5880/GFZ.1", 50.0)
+        journal.close()
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"doi": "10.5880/GFZ.2", "sco')
+        
+        assert journal.load() == {"10.5880/GFZ.1": 50.0}
+    
+    def test_close_keeps_journal_for_resume(self, journal, tmp_path):
+        """Test that a closed journal can be reopened by a new instance."""
+        journal.append("10.5880/GFZ.1", 50.0)
+        journal.close()
+        
+        reopened = FujiCheckpointJournal(journal.path)
+        reopened.append("10.5880/GFZ.2", 60.0)
+        
+        assert set(reopened.load()) == {"10.5880/GFZ.1", "10.5880/GFZ.2"}
+        reopened.close()
+    
+    def test_clear_deletes_journal_and_allows_new_run(self, journal):
+        """Test that clear() starts over with an empty journal."""
+        journal.append("10.5880/GFZ.1", 50.0)
+        
+        journal.clear()
+        
+        assert not journal.path.exists()
+        assert journal.load() == {}
+        journal.append("10.5880/GFZ.2", 60.0)
+        assert journal.load() == {"10.5880/GFZ.2": 60.0}
+    
+    def test_unreadable_journal_raises(self, tmp_path):
+        """Test that a journal path that cannot be read raises FujiCheckpointError."""
+        path = tmp_path / "run.jsonl"
+        path.mkdir()
+        
+        with pytest.raises(FujiCheckpointError):
+            FujiCheckpointJournal(path).load()
+    
+    def test_default_path_is_sanitized(self):
+        """Test that the run key becomes a safe file name."""
+        path = FujiCheckpointJournal.default_path("GFZ.user/x y_production")
+        
+        assert path.name == "GFZ.user_x_y_production.jsonl"
+        assert path.parent.name == FujiCheckpointJournal.CHECKPOINT_DIR
@@ -11,6 +11,8 @@ from src.api.fuji_client import (
     FujiAuthenticationError,
     FujiConnectionError
 )
+from src.api.circuit_breaker import HostCircuitBreaker
+from src.api.fuji_response_store import FujiResponseStore
 
 
 # Sample F-UJI API responses
@@ -184,6 +186,7 @@ class TestFujiClientAssessment:
         assert not result.is_success
         assert result.score_percent == -1
         assert "nicht gefunden" in result.error
+        assert not result.server_busy
     
     @responses.activate
     def test_assess_doi_server_error(self, client):
@@ -200,6 +203,7 @@ class TestFujiClientAssessment:
         assert not result.is_success
         assert result.score_percent == -1
         assert "500" in result.error
+        assert result.server_busy
     
     @responses.activate
     def test_assess_doi_timeout(self, client):
@@ -215,6 +219,7 @@ class TestFujiClientAssessment:
         assert not result.is_success
         assert result.score_percent == -1
         assert "Timeout" in result.error
+        assert result.server_busy
     
     @responses.activate
     def test_assess_doi_connection_error(self, client):
@@ -231,6 +236,53 @@ class TestFujiClientAssessment:
         assert "Verbindung" in str(excinfo.value)
 
 
+class TestFujiClientCircuitBreaker:
+    """Test failing fast while the F-UJI host is unreachable."""
+    
+    @responses.activate
+    def test_assessments_fail_fast_after_repeated_timeouts(self):
+        """Test that requests stop after the threshold and report the host as unreachable."""
+        client = FujiClient(
+            endpoint="https://fuji.test.example.com/fuji/api/v1",
+            circuit_breaker=HostCircuitBreaker(failure_threshold=2, reset_timeout=60)
+        )
+        responses.add(
+            responses.POST,
+            "https://fuji.test.example.com/fuji/api/v1/evaluate",
+            body=Timeout("Read timed out")
+        )
+        
+        first = client.assess_doi("10.5880/GFZ.1")
+        second = client.assess_doi("10.5880/GFZ.2")
+        third = client.assess_doi("10.5880/GFZ.3")
+        
+        assert len(responses.calls) == 2
+        assert not first.host_unreachable and not second.host_unreachable
+        assert third.host_unreachable
+        assert not third.is_success
+        assert "fuji.test.example.com" in third.error
+    
+    @responses.activate
+    def test_http_errors_do_not_open_circuit(self):
+        """Test that error responses count as a reachable host."""
+        client = FujiClient(
+            endpoint="https://fuji.test.example.com/fuji/api/v1",
+            circuit_breaker=HostCircuitBreaker(failure_threshold=1)
+        )
+        responses.add(
+            responses.POST,
+            "https://fuji.test.example.com/fuji/api/v1/evaluate",
+            json={"detail": "Internal Server Error"},
+            status=500
+        )
+        
+        for _ in range(3):
+            result = client.assess_doi("10.5880/GFZ.1")
+            assert not result.host_unreachable
+        
+        assert len(responses.calls) == 3
+
+
 class TestFujiResponseParsing:
     """Test response parsing edge cases."""
     
@@ -304,6 +356,91 @@ class TestFujiResponseParsing:
         assert result.score_percent == 50.0  # 12/24 * 100
 
 
+class TestCompactResult:
+    """Test the compact score representation and the response spill store."""
+    
+    @responses.activate
+    def test_principle_scores_and_metric_bitset(self, client):
+        """Test that F/A/I/R scores and per-metric pass bits are extracted."""
+        response = dict(FUJI_SUCCESS_RESPONSE, results=[
+            {"metric_identifier": "FsF-F1-01D", "test_status": "pass"},
+            {"metric_identifier": "FsF-A1-01M", "test_status": "fail"},
+            {"metric_identifier": "FsF-R1-01MD", "test_status": "pass"}
+        ])
+        responses.add(
+            responses.POST,
+            "https://fuji.test.example.com/fuji/api/v1/evaluate",
+            json=response,
+            status=200
+        )
+        
+        result = client.assess_doi("10.5880/GFZ.1.1.2021.001")
+        
+        assert result.principle_scores == (70.0, 50.0, 40.0, 40.0)
+        assert result.principle_score("A") == 50.0
+        assert result.metric_ids == ("FsF-F1-01D", "FsF-A1-01M", "FsF-R1-01MD")
+        assert result.metrics_passed == 0b101
+        assert result.metric_passed("FsF-A1-01M") is False
+        assert result.metric_passed("FsF-I1-01M") is None
+        assert result.failed_metrics() == ["FsF-A1-01M"]
+    
+    @responses.activate
+    def test_metric_without_status_passes_with_earned_score(self, client):
+        """Test the fallback for results without test_status."""
+        responses.add(
+            responses.POST,
+            "https://fuji.test.example.com/fuji/api/v1/evaluate",
+            json=dict(FUJI_SUCCESS_RESPONSE, results=[
+                {"metric_id": "FsF-F1-01D", "score": 1, "max_score": 1},
+                {"metric_id": "FsF-F2-01M", "score": {"earned": 0, "total": 2}}
+            ]),
+            status=200
+        )
+        
+        result = client.assess_doi("10.5880/GFZ.1.1.2021.001")
+        
+        assert result.metric_ids == ("FsF-F1-01D", "FsF-F2-01M")
+        assert result.failed_metrics() == ["FsF-F2-01M"]
+    
+    @responses.activate
+    def test_results_share_metric_ids_and_keep_no_response(self, client):
+        """Test that results do not retain the response and share the identifier tuple."""
+        responses.add(
+            responses.POST,
+            "https://fuji.test.example.com/fuji/api/v1/evaluate",
+            json=FUJI_SUCCESS_RESPONSE,
+            status=200
+        )
+        
+        first = client.assess_doi("10.5880/GFZ.1.1.2021.001")
+        second = client.assess_doi("10.5880/GFZ.1.1.2021.002")
+        
+        assert first.metric_ids is second.metric_ids
+        assert not hasattr(first, "__dict__")
+        assert not hasattr(first, "raw_response")
+    
+    @responses.activate
+    def test_response_is_spilled_to_store(self):
+        """Test that the full response goes to the response store."""
+        responses.add(
+            responses.POST,
+            "https://fuji.test.example.com/fuji/api/v1/evaluate",
+            json=FUJI_SUCCESS_RESPONSE,
+            status=200
+        )
+        with FujiResponseStore("https://fuji.test.example.com/fuji/api/v1", "metrics_v0.5", ":memory:") as store:
+            client = FujiClient(
+                endpoint="https://fuji.test.example.com/fuji/api/v1",
+                username="testuser",
+                password="testpass",
+                response_store=store
+            )
+            
+            client.assess_doi("https://doi.org/10.5880/GFZ.1.1.2021.001")
+            
+            assert store.get("10.5880/GFZ.1.1.2021.001") == FUJI_SUCCESS_RESPONSE
+
+
 class TestFujiResult:
     """Test FujiResult dataclass."""
     
@@ -0,0 +1,93 @@
+"""Unit tests for the F-UJI response spill store."""
+
+import zlib
+
+import pytest
+
+from src.api.fuji_response_store import FujiResponseStore, FujiResponseStoreError
+
+
+ENDPOINT = "https://fuji.test.example.com/fuji/api/v1"
+METRICS = "metrics_v0.5"
+
+RESPONSE = {
+    "summary": {"score_percent": {"FAIR": 54.17}},
+    "results": [{"metric_identifier": "FsF-F1-01D", "test_debug": ["found identifier"] * 50}]
+}
+
+
+@pytest.fixture
+def store():
+    """Create an in-memory response store."""
+    store = FujiResponseStore(ENDPOINT, METRICS, ":memory:")
+    yield store
+    store.close()
+
+
+class TestFujiResponseStore:
+    """Test spilling and loading raw responses."""
+    
+    def test_round_trip(self, store):
+        """Test that a stored response is returned unchanged (DOIs case-insensitive)."""
+        store.put("10.5880/GFZ.1", RESPONSE)
+        
+        assert store.get("10.5880/gfz.1") == RESPONSE
+        assert store.count() == 1
+    
+    def test_unknown_doi(self, store):
+        """Test that DOIs without response return None."""
+        assert store.get("10.5880/GFZ.2") is None
+    
+    def test_put_replaces_response(self, store):
+        """Test that a re-assessment replaces the stored response."""
+        store.put("10.5880/GFZ.1", RESPONSE)
+        store.put("10.5880/GFZ.1", {"summary": {}})
+        
+        assert store.get("10.5880/GFZ.1") == {"summary": {}}
+        assert store.count() == 1
+    
+    def test_responses_are_compressed(self, store):
+        """Test that responses are stored zlib-compressed."""
+        store.put("10.5880/GFZ.1", RESPONSE)
+        
+        data = store._conn.execute("SELECT data FROM responses").fetchone()[0]
+        assert len(data) < len(str(RESPONSE))
+        assert zlib.decompress(data)
+    
+    def test_default_path_is_next_to_result_cache(self):
+        """Test that the store lives in AppData/Roaming/GROBI by default."""
+        path = FujiResponseStore.default_path()
+        
+        assert path.name == FujiResponseStore.CACHE_FILE
+        assert path.parent.name == "GROBI"
+    
+    def test_responses_are_scoped_by_endpoint_and_metric_version(self, tmp_path):
+        """Test that other servers or metric versions do not share responses."""
+        path = tmp_path / "responses.sqlite3"
+        with FujiResponseStore(ENDPOINT, METRICS, path) as store:
+            store.put("10.5880/GFZ.1", RESPONSE)
+        
+        with FujiResponseStore("https://other.example.com/api", METRICS, path) as store:
+            assert store.get("10.5880/GFZ.1") is None
+        with FujiResponseStore(ENDPOINT, "metrics_v0.8", path) as store:
+            assert store.get("10.5880/GFZ.1") is None
+            assert store.count() == 0
+    
+    def test_responses_persist_between_sessions(self, tmp_path):
+        """Test that stored responses survive close() for later sessions."""
+        path = tmp_path / "sub" / "responses.sqlite3"
+        with FujiResponseStore(ENDPOINT, METRICS, path) as store:
+            store.put("10.5880/GFZ.1", RESPONSE)
+        
+        with FujiResponseStore(ENDPOINT, METRICS, path) as store:
+            assert store.get("10.5880/GFZ.1") == RESPONSE
+    
+    def test_corrupt_data_raises(self, store):
+        """Test that unreadable entries raise FujiResponseStoreError."""
+        store._conn.execute(
+            "INSERT INTO responses (endpoint, metric_version, doi, data) VALUES (?, ?, ?, ?)",
+            (ENDPOINT, METRICS, "10.5880/gfz.1", b"garbage")
+        )
+        
+        with pytest.raises(FujiResponseStoreError):
+            store.get("10.5880/GFZ.1")
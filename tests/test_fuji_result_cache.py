@@ -0,0 +1,143 @@
+"""Unit tests for the F-UJI result cache."""
+
+import pytest
+
+from src.api.fuji_client import FujiResult
+from src.api.fuji_result_cache import FujiResultCache
+
+
+ENDPOINT = "https://fuji.test.example.com/fuji/api/v1"
+METRICS = "metrics_v0.5"
+
+
+def _result(doi, score=50.0, error=None):
+    return FujiResult(
+        doi=doi,
+        score_percent=score if error is None else -1,
+        score_earned=12,
+        score_total=24,
+        metrics_count=17,
+        error=error
+    )
+
+
+@pytest.fixture
+def cache():
+    """Create an in-memory result cache."""
+    cache = FujiResultCache(":memory:")
+    yield cache
+    cache.close()
+
+
+class TestFujiResultCache:
+    """Test storing and looking up assessment results."""
+    
+    def test_unchanged_doi_is_served(self, cache):
+        """Test that a result is returned while the DOI's updated timestamp is unchanged."""
+        cache.store(ENDPOINT, METRICS, [(_result("10.5880/GFZ.1", 62.5), "2025-01-01T00:00:00Z")])
+        
+        results = cache.get_many(ENDPOINT, METRICS, [("10.5880/gfz.1", "2025-01-01T00:00:00Z")])
+        
+        assert list(results) == ["10.5880/gfz.1"]
+        assert results["10.5880/gfz.1"].score_percent == 62.5
+        assert results["10.5880/gfz.1"].metrics_count == 17
+        assert results["10.5880/gfz.1"].is_success
+    
+    def test_details_are_served_from_cache(self, cache):
+        """Test that the F/A/I/R breakdown and the metric bits survive the cache."""
+        metric_ids = tuple(f"FsF-M{i}" for i in range(70))
+        result = FujiResult(
+            "10.5880/GFZ.1", 62.5, 15, 24, 70,
+            principle_scores=(75.0, 50.0, 40.0, 60.0),
+            metric_ids=metric_ids,
+            metrics_passed=(1 << 69) | 0b101
+        )
+        cache.store(ENDPOINT, METRICS, [(result, "2025-01-01T00:00:00Z")])
+        
+        cached = cache.get_many(ENDPOINT, METRICS, [("10.5880/GFZ.1", "2025-01-01T00:00:00Z")])["10.5880/GFZ.1"]
+        
+        assert cached.principle_scores == (75.0, 50.0, 40.0, 60.0)
+        assert cached.metric_ids == metric_ids
+        assert cached.metrics_passed == result.metrics_passed
+        assert cached.failed_metrics() == result.failed_metrics()
+    
+    def test_version_1_cache_is_upgraded(self, tmp_path):
+        """Test that results stored before the detail columns existed are still served."""
+        import sqlite3
+        
+        path = tmp_path / "fuji.sqlite3"
+        conn = sqlite3.connect(str(path))
+        conn.execute(
+            "CREATE TABLE fuji_results (endpoint TEXT NOT NULL, doi TEXT NOT NULL, "
+            "metric_version TEXT NOT NULL, updated TEXT NOT NULL, score_percent REAL NOT NULL, "
+            "score_earned REAL NOT NULL, score_total REAL NOT NULL, metrics_count INTEGER NOT NULL, "
+            "assessed_at TEXT NOT NULL, PRIMARY KEY (endpoint, doi, metric_version))"
+        )
+        conn.execute(
+            "INSERT INTO fuji_results VALUES (?, '10.5880/gfz.1', ?, '2025-01-01', 50, 12, 24, 17, '2025-01-02')",
+            (ENDPOINT, METRICS)
+        )
+        conn.execute("PRAGMA user_version=1")
+        conn.commit()
+        conn.close()
+        
+        with FujiResultCache(path) as cache:
+            cached = cache.get_many(ENDPOINT, METRICS, [("10.5880/GFZ.1", "2025-01-01")])["10.5880/GFZ.1"]
+        
+        assert cached.score_percent == 50
+        assert cached.principle_scores is None
+        assert cached.metric_ids == ()
+    
+    def test_modified_doi_is_not_served(self, cache):
+        """Test that a newer DataCite timestamp invalidates the stored result."""
+        cache.store(ENDPOINT, METRICS, [(_result("10.5880/GFZ.1"), "2025-01-01T00:00:00Z")])
+        
+        assert cache.get_many(ENDPOINT, METRICS, [("10.5880/GFZ.1", "2025-02-01T00:00:00Z")]) == {}
+        assert cache.get_many(ENDPOINT, METRICS, [("10.5880/GFZ.1", "")]) == {}
+    
+    def test_results_are_scoped_by_endpoint_and_metric_version(self, cache):
+        """Test that other servers or metric versions do not share results."""
+        cache.store(ENDPOINT, METRICS, [(_result("10.5880/GFZ.1"), "2025-01-01T00:00:00Z")])
+        
+        key = [("10.5880/GFZ.1", "2025-01-01T00:00:00Z")]
+        assert cache.get_many("https://other.example.com/api", METRICS, key) == {}
+        assert cache.get_many(ENDPOINT, "metrics_v0.8", key) == {}
+    
+    def test_failed_results_are_not_stored(self, cache):
+        """Test that errors and DOIs without timestamp are skipped."""
+        stored = cache.store(ENDPOINT, METRICS, [
+            (_result("10.5880/GFZ.1", error="Timeout bei der Bewertung"), "2025-01-01T00:00:00Z"),
+            (_result("10.5880/GFZ.2"), ""),
+            (_result("10.5880/GFZ.3"), "2025-01-01T00:00:00Z"),
+        ])
+        
+        assert stored == 1
+        assert cache.count() == 1
+    
+    def test_reassessment_replaces_result(self, cache):
+        """Test that storing a DOI again overwrites the old result."""
+        cache.store(ENDPOINT, METRICS, [(_result("10.5880/GFZ.1", 40.0), "2025-01-01T00:00:00Z")])
+        cache.store(ENDPOINT, METRICS, [(_result("10.5880/GFZ.1", 70.0), "2025-02-01T00:00:00Z")])
+        
+        results = cache.get_many(ENDPOINT, METRICS, [("10.5880/GFZ.1", "2025-02-01T00:00:00Z")])
+        
+        assert cache.count() == 1
+        assert results["10.5880/GFZ.1"].score_percent == 70.0
+    
+    def test_lookup_in_chunks(self, cache):
+        """Test lookups of more DOIs than fit into one query."""
+        dois = [f"10.5880/GFZ.{i}" for i in range(FujiResultCache.QUERY_CHUNK_SIZE + 5)]
+        cache.store(ENDPOINT, METRICS, [(_result(doi), "2025-01-01") for doi in dois])
+        
+        assert len(cache.get_many(ENDPOINT, METRICS, [(doi, "2025-01-01") for doi in dois])) == len(dois)
+    
+    def test_persists_between_sessions(self, tmp_path):
+        """Test that results survive reopening the cache file."""
+        path = tmp_path / "fuji.sqlite3"
+        with FujiResultCache(path) as cache:
+            cache.store(ENDPOINT, METRICS, [(_result("10.5880/GFZ.1"), "2025-01-01")])
+        
+        with FujiResultCache(path) as cache:
+            assert cache.count() == 1
+            cache.clear()
+            assert cache.count() == 0
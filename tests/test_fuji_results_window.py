@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication, QMessageBox
 
+from src.api.fuji_response_store import FujiResponseStore
 from src.ui.fuji_results_window import FujiResultsWindow
 
 
@@ -305,6 +306,18 @@ class TestFujiResultsWindowStatus:
         
         status = window.status_bar.currentMessage()
         assert "Fehler" in status or "1" in status
+    
+    def test_concurrency_shown_while_running(self, window, qapp):
+        """Test the adaptive concurrency is shown until the assessment completes."""
+        window.start_assessment(1)
+        window.set_concurrency(7)
+        
+        assert window.concurrency_label.text() == "Parallele Bewertungen: 7"
+        
+        window.add_result("10.5880/test.001", 50.0)
+        window.set_concurrency(3)  # Late signal after completion
+        
+        assert window.concurrency_label.text() == ""
 
 
 class TestFujiResultsWindowResize:
@@ -325,3 +338,106 @@ class TestFujiResultsWindowResize:
         
         # Tiles should be recalculated (no crash)
         assert len(window.tiles) == 5
+
+
+class TestFujiResultsWindowDetails:
+    """Test the details view of a tile."""
+    
+    RESPONSE = {
+        "summary": {"score_percent": {"FAIR": 54.17, "F": 70.0, "A": 50.0, "I": 40.0, "R": 40.0}},
+        "results": [
+            {"metric_identifier": "FsF-F1-01D", "metric_name": "Unique Identifier", "test_status": "pass"},
+            {"metric_identifier": "FsF-A1-01M", "test_status": "fail"}
+        ]
+    }
+    
+    def test_format_details(self):
+        """Test the summary and metric lines built from a raw response."""
+        summary, metrics = FujiResultsWindow._format_details(self.RESPONSE)
+        
+        assert summary == "FAIR-Score: 54.2%\nF: 70.0%   A: 50.0%   I: 40.0%   R: 40.0%"
+        assert metrics.splitlines() == [
+            "[bestanden] FsF-F1-01D: Unique Identifier",
+            "[nicht bestanden] FsF-A1-01M"
+        ]
+    
+    def test_tile_click_loads_response_from_store(self, window, qapp):
+        """Test that the response is only read from the store when a tile is clicked."""
+        store = MagicMock(spec=FujiResponseStore)
+        store.get.return_value = self.RESPONSE
+        window.set_response_store(store)
+        window.start_assessment(2)
+        window.add_result("10.5880/test.001", 54.17)
+        store.get.assert_not_called()
+        
+        with patch.object(QMessageBox, "exec") as exec_mock:
+            window._on_tile_clicked("10.5880/test.001")
+        
+        store.get.assert_called_once_with("10.5880/test.001")
+        exec_mock.assert_called_once()
+    
+    def test_tile_click_without_details(self, window, qapp):
+        """Test the message for DOIs without a stored response."""
+        with patch.object(QMessageBox, "information") as info_mock:
+            window._on_tile_clicked("10.5880/test.001")
+        
+        info_mock.assert_called_once()
+        assert "keine Detaildaten" in info_mock.call_args[0][2]
+    
+    def test_store_closed_with_window(self, qapp):
+        """Test that the window closes the response store it owns."""
+        win = FujiResultsWindow()
+        store = MagicMock(spec=FujiResponseStore)
+        win.set_response_store(store)
+        
+        win.close()
+        
+        store.close.assert_called_once()
+
+
+class TestFujiResultsWindowResume:
+    """Test restoring the results of an interrupted run."""
+    
+    def test_restore_results_creates_tiles_in_bulk(self, window, qapp):
+        """Test that restored DOIs appear as completed tiles."""
+        window.start_assessment(0)
+        
+        window.restore_results({"10.5880/test.001": 60.0, "10.5880/test.002": 40.0})
+        
+        assert set(window.tiles) == {"10.5880/test.001", "10.5880/test.002"}
+        assert window.tiles["10.5880/test.001"].score_percent == 60.0
+        assert window.completed_count == 2
+        assert window.avg_score_label.text() == "50.0%"
+        assert window._is_running
+    
+    def test_pending_tile_of_restored_doi_is_ignored(self, window, qapp):
+        """Test that rediscovered DOIs keep their restored score."""
+        window.start_assessment(0)
+        window.restore_results({"10.5880/test.001": 60.0})
+        
+        window.add_pending_tile("10.5880/test.001")
+        window.add_pending_tile("10.5880/test.002")
+        
+        assert window.tiles["10.5880/test.001"].score_percent == 60.0
+        assert window.completed_count == 1
+        assert window.total_dois == 2
+    
+    def test_completes_when_nothing_is_left(self, window, qapp):
+        """Test that a resumed run finishes once the fetch finds no new DOIs."""
+        window.start_assessment(0)
+        window.restore_results({"10.5880/test.001": 60.0})
+        
+        window.set_total_dois(1)
+        
+        assert window._is_running is False
+    
+    def test_restored_rows_written_to_csv(self, window, qapp, tmp_path):
+        """Test that the CSV of the resumed run also contains the restored results."""
+        with patch("src.ui.fuji_results_window.Path.home", return_value=tmp_path):
+            window.start_streaming_assessment()
+        
+        window.restore_results({"10.5880/test.001": 60.0})
+        csv_path = window._close_csv()
+        
+        content = csv_path.read_text(encoding="utf-8-sig").splitlines()
+        assert content == ["DOI;Bewertung", "10.5880/test.001;60.0"]
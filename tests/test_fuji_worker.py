@@ -3,12 +3,16 @@
 import pytest
 import queue
 import threading
+import time
 from unittest.mock import MagicMock, patch, PropertyMock
 
 from PySide6.QtCore import QThread
 from PySide6.QtWidgets import QApplication
 
+from src.api.concurrency_limiter import AdaptiveConcurrencyLimiter
+from src.api.fuji_checkpoint import FujiCheckpointJournal
 from src.api.fuji_client import FujiClient, FujiResult, FujiConnectionError, FujiAuthenticationError
+from src.api.fuji_result_cache import FujiResultCache
 from src.workers.fuji_worker import (
     FujiAssessmentWorker,
     FujiAssessmentThread,
@@ -115,6 +119,32 @@ class TestFujiAssessmentWorker:
         
         assert not result.is_success
         assert result.error == "Cancelled"
+    
+    def test_worker_reports_unreachable_server(self, qapp, mock_fuji_client):
+        """Test that fail-fast results are counted separately and reported once."""
+        def assess(doi):
+            return FujiResult(
+                doi=doi,
+                score_percent=-1,
+                score_earned=0,
+                score_total=0,
+                metrics_count=0,
+                error="Host nicht erreichbar: test.example.com (nächster Versuch in 30 s)",
+                host_unreachable=True
+            )
+        mock_fuji_client.assess_doi.side_effect = assess
+        
+        worker = FujiAssessmentWorker(["10.5880/test.001", "10.5880/test.002"], mock_fuji_client)
+        messages = []
+        worker.progress.connect(messages.append)
+        
+        worker.run()
+        
+        assert len([m for m in messages if "Verbindungsversuch übersprungen" in m]) == 1
+        assert messages[-1] == (
+            "Bewertung abgeschlossen: 0 erfolgreich, 2 Fehler "
+            "(2 nicht bewertet, F-UJI Server nicht erreichbar)"
+        )
 
 
 class TestFujiAssessmentThread:
@@ -267,6 +297,313 @@ class TestFujiWorkerIntegration:
         assert finished_called[0] or not thread.is_alive()
 
 
+class TestStreamingFujiResultCache:
+    """Test reusing assessment results of unchanged DOIs."""
+    
+    def test_only_new_or_modified_dois_are_assessed(self, qapp, mock_fuji_client):
+        """Test that unchanged DOIs are served from the cache and new results are stored."""
+        cache = FujiResultCache(":memory:")
+        cache.store(mock_fuji_client.endpoint, FujiClient.DEFAULT_METRIC_VERSION, [
+            (FujiResult("10.5880/test.001", 80.0, 19, 24, 17), "2025-01-01T00:00:00Z"),
+            (FujiResult("10.5880/test.002", 30.0, 7, 24, 17), "2025-01-01T00:00:00Z"),
+        ])
+        
+        datacite_client = MagicMock()
+        datacite_client._fetch_page_with_updated.return_value = ([
+            ("10.5880/test.001", "https://example.com/1", "2025-01-01T00:00:00Z"),  # unchanged
+            ("10.5880/test.002", "https://example.com/2", "2025-06-01T00:00:00Z"),  # modified
+            ("10.5880/test.003", "https://example.com/3", "2025-06-01T00:00:00Z"),  # new
+        ], None)
+        mock_fuji_client.assess_doi.side_effect = lambda doi: FujiResult(doi, 60.0, 14, 24, 17)
+        
+        worker = StreamingFujiWorker(datacite_client, mock_fuji_client, max_workers=2, result_cache=cache)
+        assessed = []
+        messages = []
+        worker.doi_assessed.connect(lambda doi, score: assessed.append((doi, score)))
+        worker.progress.connect(messages.append)
+        
+        # Keep the cache open for the assertions below
+        with patch.object(cache, "close"):
+            worker.run()
+        qapp.processEvents()  # Deliver signals emitted from the fetch/assess threads
+        
+        assert sorted(call.args[0] for call in mock_fuji_client.assess_doi.call_args_list) == [
+            "10.5880/test.002", "10.5880/test.003"
+        ]
+        assert sorted(assessed) == [
+            ("10.5880/test.001", 80.0), ("10.5880/test.002", 60.0), ("10.5880/test.003", 60.0)
+        ]
+        assert any("(1 unverändert aus Cache)" in message for message in messages)
+        
+        stored = cache.get_many(mock_fuji_client.endpoint, FujiClient.DEFAULT_METRIC_VERSION, [
+            ("10.5880/test.002", "2025-06-01T00:00:00Z"),
+            ("10.5880/test.003", "2025-06-01T00:00:00Z"),
+        ])
+        assert {doi: result.score_percent for doi, result in stored.items()} == {
+            "10.5880/test.002": 60.0, "10.5880/test.003": 60.0
+        }
+        cache.close()
+    
+    def test_results_are_reported_on_assessor_thread(self, qapp, mock_fuji_client):
+        """Test that cache hits and new results are both reported by the assessor thread."""
+        cache = FujiResultCache(":memory:")
+        cache.store(mock_fuji_client.endpoint, FujiClient.DEFAULT_METRIC_VERSION, [
+            (FujiResult("10.5880/test.001", 80.0, 19, 24, 17), "2025-01-01T00:00:00Z"),
+        ])
+        
+        datacite_client = MagicMock()
+        datacite_client._fetch_page_with_updated.return_value = ([
+            ("10.5880/test.001", "https://example.com/1", "2025-01-01T00:00:00Z"),  # unchanged
+            ("10.5880/test.002", "https://example.com/2", "2025-06-01T00:00:00Z"),  # new
+        ], None)
+        mock_fuji_client.assess_doi.side_effect = lambda doi: FujiResult(doi, 60.0, 14, 24, 17)
+        
+        worker = StreamingFujiWorker(datacite_client, mock_fuji_client, max_workers=2, result_cache=cache)
+        assessor_threads = []
+        reporting_threads = []
+        assess_dois = worker._assess_dois
+        report_result = worker._report_result
+        
+        def record_assessor():
+            assessor_threads.append(threading.current_thread())
+            assess_dois()
+        
+        def record_report(result, from_cache=False):
+            reporting_threads.append(threading.current_thread())
+            report_result(result, from_cache)
+        
+        with patch.object(worker, "_assess_dois", record_assessor), \
+                patch.object(worker, "_report_result", record_report):
+            worker.run()
+        
+        assert worker._cached_count == 1
+        assert len(reporting_threads) == 2
+        assert set(reporting_threads) == set(assessor_threads)
+
+
+class TestStreamingFujiBackpressure:
+    """Test the bounded fetch/assess pipeline."""
+    
+    @pytest.mark.timeout(20)
+    def test_fetching_pauses_while_assessments_are_busy(self, qapp, mock_fuji_client):
+        """Test that pages are only fetched as fast as DOIs are assessed."""
+        page_size = 5
+        page_count = 4
+        requested_pages = []
+        
+        def fetch_page(next_url):
+            page = 0 if next_url is None else int(next_url)
+            requested_pages.append(page)
+            dois = [(f"10.5880/test.{page}.{i}", "https://example.com") for i in range(page_size)]
+            return dois, (str(page + 1) if page + 1 < page_count else None)
+        
+        datacite_client = MagicMock()
+        datacite_client._fetch_page.side_effect = fetch_page
+        
+        release = threading.Event()
+        running = [0, 0]  # current, maximum
+        running_lock = threading.Lock()
+        
+        def assess(doi):
+            with running_lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            release.wait()
+            with running_lock:
+                running[0] -= 1
+            return FujiResult(doi, 50.0, 12, 24, 17)
+        
+        mock_fuji_client.assess_doi.side_effect = assess
+        
+        with patch.object(StreamingFujiWorker, "PENDING_QUEUE_SIZE", page_size):
+            worker = StreamingFujiWorker(datacite_client, mock_fuji_client, max_workers=2)
+        observed = {}
+        
+        def observe_blocked_pipeline():
+            # Window (2 workers x 2) + queue (one page) + the page being enqueued
+            observed["pages"] = len(requested_pages)
+            observed["in_flight"] = worker._in_flight
+            release.set()
+        
+        timer = threading.Timer(0.5, observe_blocked_pipeline)
+        timer.start()
+        worker.run()
+        timer.join()
+        
+        assert observed["pages"] <= 3
+        assert observed["in_flight"] == 2 * StreamingFujiWorker.IN_FLIGHT_PER_WORKER
+        assert len(requested_pages) == page_count
+        assert worker._assessed_count == page_size * page_count
+        assert worker._in_flight == 0
+        assert running[1] <= 2
+    
+    @pytest.mark.timeout(20)
+    def test_cancel_stops_blocked_pipeline(self, qapp, mock_fuji_client):
+        """Test that cancel() wakes a fetcher and assessor waiting on the full pipeline."""
+        datacite_client = MagicMock()
+        datacite_client._fetch_page.side_effect = lambda next_url: (
+            [(f"10.5880/test.{i}", "https://example.com") for i in range(5)], "more"
+        )
+        release = threading.Event()
+        
+        def assess(doi):
+            release.wait()
+            return FujiResult(doi, 50.0, 12, 24, 17)
+        
+        mock_fuji_client.assess_doi.side_effect = assess
+        with patch.object(StreamingFujiWorker, "PENDING_QUEUE_SIZE", 5):
+            worker = StreamingFujiWorker(datacite_client, mock_fuji_client, max_workers=1)
+        thread = threading.Thread(target=worker.run)
+        thread.start()
+        time.sleep(0.3)
+        
+        worker.cancel()
+        release.set()
+        thread.join(timeout=10)
+        
+        assert not thread.is_alive()
+
+
+class TestAdaptiveConcurrency:
+    """Test that assessments run within the adaptive concurrency limit."""
+    
+    def _tracking_assess(self, result_kwargs=None):
+        """assess_doi replacement that records the maximum number of parallel calls."""
+        running = [0, 0]  # current, maximum
+        lock = threading.Lock()
+        
+        def assess(doi):
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return FujiResult(doi, 50.0, 12, 24, 17, **(result_kwargs or {}))
+        
+        return assess, running
+    
+    def test_assessments_respect_limit(self, qapp, mock_fuji_client):
+        """Test that no more assessments run in parallel than the limit allows."""
+        assess, running = self._tracking_assess()
+        mock_fuji_client.assess_doi.side_effect = assess
+        concurrency = AdaptiveConcurrencyLimiter(max_limit=4, initial_limit=1)
+        
+        worker = FujiAssessmentWorker(
+            [f"10.5880/test.{i}" for i in range(6)], mock_fuji_client,
+            max_workers=4, concurrency=concurrency
+        )
+        reported = []
+        worker.concurrency_changed.connect(reported.append)
+        
+        worker.run()
+        
+        assert running[1] == 1
+        assert reported == [1]
+    
+    def test_busy_server_reduces_concurrency(self, qapp, mock_fuji_client):
+        """Test that timeouts/5xx answers shrink the limit and the change is reported."""
+        assess, _ = self._tracking_assess({"error": "Timeout bei der Bewertung", "server_busy": True})
+        mock_fuji_client.assess_doi.side_effect = assess
+        concurrency = AdaptiveConcurrencyLimiter(max_limit=4, initial_limit=4, window_size=5)
+        
+        worker = FujiAssessmentWorker(
+            [f"10.5880/test.{i}" for i in range(4)], mock_fuji_client,
+            max_workers=4, concurrency=concurrency
+        )
+        reported = []
+        worker.concurrency_changed.connect(reported.append)
+        
+        worker.run()
+        
+        assert reported[0] == 4
+        assert reported[-1] == concurrency.limit < 4
+    
+    def test_streaming_assessments_respect_limit(self, qapp, mock_datacite_client, mock_fuji_client):
+        """Test that the streaming worker sends assessments through the limiter."""
+        assess, running = self._tracking_assess()
+        mock_fuji_client.assess_doi.side_effect = assess
+        concurrency = AdaptiveConcurrencyLimiter(max_limit=3, initial_limit=1)
+        
+        worker = StreamingFujiWorker(
+            mock_datacite_client, mock_fuji_client, max_workers=3, concurrency=concurrency
+        )
+        worker.run()
+        
+        assert worker._assessed_count == 2
+        assert running[1] == 1
+        assert concurrency.get_stats()["in_flight"] == 0
+
+
+class TestCheckpointResume:
+    """Test resuming interrupted runs from the checkpoint journal."""
+    
+    def test_resumed_run_assesses_only_missing_dois(self, qapp, mock_fuji_client, tmp_path):
+        """Test that journaled DOIs are skipped and the journal is cleared when done."""
+        journal = FujiCheckpointJournal(tmp_path / "run.jsonl")
+        journal.append("10.5880/TEST.001", 70.0)
+        mock_fuji_client.assess_doi.side_effect = lambda doi: FujiResult(doi, 50.0, 12, 24, 17)
+        
+        worker = FujiAssessmentWorker(
+            ["10.5880/test.001", "10.5880/test.002"], mock_fuji_client,
+            max_workers=2, checkpoint=journal
+        )
+        messages = []
+        worker.progress.connect(messages.append)
+        
+        worker.run()
+        
+        mock_fuji_client.assess_doi.assert_called_once_with("10.5880/test.002")
+        assert "(1 aus Checkpoint übernommen)" in messages[-1]
+        assert not journal.path.exists()
+    
+    def test_interrupted_run_keeps_journal(self, qapp, mock_fuji_client, tmp_path):
+        """Test that successful results are journaled and kept if the run does not complete."""
+        journal = FujiCheckpointJournal(tmp_path / "run.jsonl")
+        
+        def assess(doi):
+            if doi.endswith("002"):
+                return FujiResult(doi, -1, 0, 0, 0, error="Timeout bei der Bewertung")
+            if doi.endswith("003"):
+                # Cancel only after the first result was handed back to the run loop;
+                # the single executor thread may otherwise get here first
+                journaled.wait(timeout=5)
+                worker.cancel()
+            return FujiResult(doi, 50.0, 12, 24, 17)
+        
+        journaled = threading.Event()
+        mock_fuji_client.assess_doi.side_effect = assess
+        worker = FujiAssessmentWorker(
+            ["10.5880/test.001", "10.5880/test.002", "10.5880/test.003"], mock_fuji_client,
+            max_workers=1, checkpoint=journal
+        )
+        worker.doi_assessed.connect(lambda doi, score: journaled.set())
+        
+        worker.run()
+        
+        assert journal.load() == {"10.5880/test.001": 50.0}
+    
+    def test_streaming_run_skips_journaled_dois(self, qapp, mock_datacite_client, mock_fuji_client, tmp_path):
+        """Test that the streaming worker discovers but does not re-assess journaled DOIs."""
+        journal = FujiCheckpointJournal(tmp_path / "run.jsonl")
+        journal.append("10.5880/test.001", 70.0)
+        mock_fuji_client.assess_doi.side_effect = lambda doi: FujiResult(doi, 50.0, 12, 24, 17)
+        
+        worker = StreamingFujiWorker(
+            mock_datacite_client, mock_fuji_client, max_workers=2, checkpoint=journal
+        )
+        discovered = []
+        worker.doi_discovered.connect(discovered.append)
+        
+        worker.run()
+        qapp.processEvents()  # Deliver signals emitted from the fetch/assess threads
+        
+        assert discovered == ["10.5880/test.001", "10.5880/test.002"]
+        mock_fuji_client.assess_doi.assert_called_once_with("10.5880/test.002")
+        assert worker._resumed_count == 1
+        assert not journal.path.exists()
+
+
 class TestFujiWorkerSignals:
     """Test signal emissions from workers."""
     
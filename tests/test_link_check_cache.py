@@ -0,0 +1,85 @@
+"""Tests for the persistent link check result store."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.api.link_check_cache import LinkCheckCache, LinkCheckResult
+
+
+@pytest.fixture
+def cache():
+    """In-memory link check cache."""
+    cache = LinkCheckCache(":memory:")
+    yield cache
+    cache.close()
+
+
+class TestLinkCheckResult:
+    """Tests for LinkCheckResult helpers."""
+
+    def test_freshness(self):
+        now = datetime(2026, 1, 8, tzinfo=timezone.utc)
+        result = LinkCheckResult("https://example.org", 200, now - timedelta(days=2))
+
+        assert result.is_fresh(timedelta(days=3), now=now)
+        assert not result.is_fresh(timedelta(days=1), now=now)
+
+    def test_conditional_headers(self):
+        result = LinkCheckResult(
+            "https://example.org", 200, datetime.now(timezone.utc),
+            etag='"abc"', last_modified="Wed, 21 Oct 2025 07:28:00 GMT"
+        )
+
+        assert result.conditional_headers() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 21 Oct 2025 07:28:00 GMT",
+        }
+        assert LinkCheckResult("https://example.org", 200, result.checked_at).conditional_headers() == {}
+
+    def test_is_ok(self):
+        checked_at = datetime.now(timezone.utc)
+        assert LinkCheckResult("https://example.org", 301, checked_at).is_ok
+        assert not LinkCheckResult("https://example.org", 404, checked_at).is_ok
+
+
+class TestLinkCheckCache:
+    """Tests for storing and looking up results."""
+
+    def test_store_and_get_many(self, cache):
+        checked_at = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+        cache.store([
+            LinkCheckResult("https://example.org/a", 200, checked_at, etag='"1"'),
+            LinkCheckResult("https://example.org/b", 404, checked_at),
+        ])
+
+        results = cache.get_many(["https://example.org/a", "https://example.org/b", "https://example.org/c"])
+
+        assert set(results) == {"https://example.org/a", "https://example.org/b"}
+        assert results["https://example.org/a"] == LinkCheckResult("https://example.org/a", 200, checked_at, '"1"')
+        assert results["https://example.org/b"].status == 404
+
+    def test_store_replaces_previous_result(self, cache):
+        first = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        cache.store([LinkCheckResult("https://example.org/a", 200, first)])
+        cache.store([LinkCheckResult("https://example.org/a", 404, first + timedelta(days=7))])
+
+        assert cache.count() == 1
+        assert cache.get_many(["https://example.org/a"])["https://example.org/a"].status == 404
+
+    def test_lookup_in_chunks(self, cache):
+        checked_at = datetime.now(timezone.utc)
+        urls = [f"https://example.org/{i}" for i in range(LinkCheckCache.QUERY_CHUNK_SIZE + 10)]
+        cache.store(LinkCheckResult(url, 200, checked_at) for url in urls)
+
+        assert len(cache.get_many(urls)) == len(urls)
+
+    def test_persists_between_sessions(self, tmp_path):
+        path = tmp_path / "links.sqlite3"
+        with LinkCheckCache(path) as cache:
+            cache.store([LinkCheckResult("https://example.org/a", 200, datetime.now(timezone.utc))])
+
+        with LinkCheckCache(path) as cache:
+            assert cache.count() == 1
+            cache.clear()
+            assert cache.count() == 0
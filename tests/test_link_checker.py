@@ -0,0 +1,187 @@
+"""Tests for the concurrent LinkChecker."""
+
+import threading
+import time
+
+import pytest
+
+from src.api.circuit_breaker import HostCircuitBreaker, HostUnreachableError
+from src.utils.link_checker import LinkChecker, url_host
+
+
+class ConcurrencyProbe:
+    """Check function that records how many checks ran at the same time."""
+
+    def __init__(self, duration=0.02, fail=()):
+        self.duration = duration
+        self.fail = set(fail)
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+        self.running_per_host = {}
+        self.max_running_per_host = {}
+        self.starts = []
+
+    def __call__(self, url):
+        host = url_host(url)
+        with self.lock:
+            self.starts.append((host, time.monotonic()))
+            self.running += 1
+            self.running_per_host[host] = self.running_per_host.get(host, 0) + 1
+            self.max_running = max(self.max_running, self.running)
+            self.max_running_per_host[host] = max(
+                self.max_running_per_host.get(host, 0), self.running_per_host[host]
+            )
+        try:
+            time.sleep(self.duration)
+            if url in self.fail:
+                raise ConnectionError(f"cannot reach {url}")
+            return 200
+        finally:
+            with self.lock:
+                self.running -= 1
+                self.running_per_host[host] -= 1
+
+
+class TestUrlHost:
+    """Tests for the host key of a URL."""
+
+    def test_host_is_lowercase_with_port(self):
+        assert url_host("https://Data.GFZ-Potsdam.de:8443/file.zip") == "data.gfz-potsdam.de:8443"
+
+    def test_credentials_are_ignored(self):
+        assert url_host("https://user:pw@example.org/a") == "example.org"
+
+
+class TestLinkChecker:
+    """Tests for LinkChecker scheduling."""
+
+    @pytest.mark.timeout(10)
+    def test_all_urls_are_checked(self):
+        probe = ConcurrencyProbe(duration=0)
+        checker = LinkChecker(probe, max_workers=4, host_delay=0)
+        items = [(i, f"https://host{i % 3}.example.org/{i}") for i in range(20)]
+
+        results = list(checker.run(items))
+
+        assert sorted(key for key, _, _, _ in results) == list(range(20))
+        assert all(status == 200 and error is None for _, _, status, error in results)
+
+    @pytest.mark.timeout(10)
+    def test_global_and_per_host_limits(self):
+        probe = ConcurrencyProbe()
+        checker = LinkChecker(probe, max_workers=5, per_host_limit=2, host_delay=0)
+        items = [(i, f"https://host{i % 4}.example.org/{i}") for i in range(40)]
+
+        list(checker.run(items))
+
+        assert probe.max_running <= 5
+        assert max(probe.max_running_per_host.values()) <= 2
+        # Several hosts are checked in parallel
+        assert probe.max_running > 2
+
+    @pytest.mark.timeout(10)
+    def test_politeness_delay_per_host(self):
+        probe = ConcurrencyProbe(duration=0)
+        checker = LinkChecker(probe, max_workers=4, per_host_limit=4, host_delay=0.05)
+        items = [(i, f"https://example.org/{i}") for i in range(4)]
+
+        list(checker.run(items))
+
+        starts = sorted(start for _, start in probe.starts)
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        assert all(gap >= 0.04 for gap in gaps)
+
+    @pytest.mark.timeout(10)
+    def test_errors_are_returned_with_the_result(self):
+        probe = ConcurrencyProbe(duration=0, fail={"https://example.org/b"})
+        checker = LinkChecker(probe, host_delay=0)
+
+        results = {key: (status, error) for key, _, status, error in checker.run([
+            ("a", "https://example.org/a"),
+            ("b", "https://example.org/b"),
+        ])}
+
+        assert results["a"] == (200, None)
+        assert results["b"][0] is None
+        assert isinstance(results["b"][1], ConnectionError)
+
+    def test_no_items(self):
+        checker = LinkChecker(ConcurrencyProbe())
+        assert list(checker.run([])) == []
+
+    @pytest.mark.timeout(10)
+    def test_hosts_are_worked_on_in_groups(self):
+        probe = ConcurrencyProbe(duration=0.01)
+        checker = LinkChecker(probe, max_workers=8, per_host_limit=2, host_delay=0, max_active_hosts=2)
+        # Hosts interleaved in the input
+        items = [(i, f"https://host{i % 4}.example.org/{i}") for i in range(16)]
+
+        results = list(checker.run(items))
+
+        assert len(results) == 16
+        assert probe.max_running <= 4
+        # A later host only starts once one of the first two hosts has started all its checks
+        first_start = {}
+        last_start = {}
+        for host, start in probe.starts:
+            first_start[host] = min(first_start.get(host, start), start)
+            last_start[host] = max(last_start.get(host, start), start)
+        first_group_done = min(last_start["host0.example.org"], last_start["host1.example.org"])
+        assert first_start["host2.example.org"] >= first_group_done
+        assert first_start["host3.example.org"] >= first_group_done
+
+    @staticmethod
+    def _breaker_check(breaker, failing_calls):
+        """Check function that times out on the given call numbers and records its calls."""
+        calls = []
+
+        def check(url):
+            host = url_host(url)
+            breaker.before_request(host)
+            calls.append(url)
+            if len(calls) in failing_calls:
+                breaker.record_failure(host)
+                raise TimeoutError(f"timeout for {url}")
+            breaker.record_success(host)
+            return 200
+
+        return check, calls
+
+    @pytest.mark.timeout(10)
+    def test_host_recovering_mid_run_resumes_after_probe(self):
+        breaker = HostCircuitBreaker(failure_threshold=2, reset_timeout=0.1)
+        check, calls = self._breaker_check(breaker, failing_calls={1, 2})
+        checker = LinkChecker(
+            check, max_workers=1, per_host_limit=1, host_delay=0,
+            host_error=breaker.unreachable_error
+        )
+        items = [(i, f"https://slow.example.org/{i}") for i in range(10)]
+
+        started = time.monotonic()
+        results = {key: (status, error) for key, _, status, error in checker.run(items)}
+
+        # Two timeouts open the circuit; after reset_timeout one probe closes it again
+        assert time.monotonic() - started >= 0.1
+        assert len(calls) == 10
+        assert [key for key, (_, error) in results.items() if error is not None] == [0, 1]
+        assert all(status == 200 for key, (status, _) in results.items() if key >= 2)
+        assert not breaker.is_open("slow.example.org")
+
+    @pytest.mark.timeout(10)
+    def test_host_still_down_after_probe_is_given_up(self):
+        breaker = HostCircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+        check, calls = self._breaker_check(breaker, failing_calls={1, 2, 3})
+        checker = LinkChecker(
+            check, max_workers=1, per_host_limit=1, host_delay=0,
+            host_error=breaker.unreachable_error
+        )
+        items = [(i, f"https://down.example.org/{i}") for i in range(10)]
+
+        results = {key: error for key, _, _, error in checker.run(items)}
+
+        # Two failures, one failed probe, the rest is reported without a request
+        assert len(calls) == 3
+        assert all(isinstance(results[key], TimeoutError) for key in (0, 1, 2))
+        assert all(isinstance(results[key], HostUnreachableError) for key in range(3, 10))
+
@@ -5,7 +5,7 @@ from unittest.mock import Mock, patch
 
 from PySide6.QtWidgets import QApplication
 
-from src.ui.main_window import MainWindow, DOIFetchWorker
+from src.ui.main_window import MainWindow, DOIFetchWorker, DOIAllFacetsFetchWorker
 
 
 @pytest.fixture(scope="module")
@@ -89,6 +89,112 @@ class TestDOIFetchWorker:
         assert hasattr(worker, 'progress')
         assert hasattr(worker, 'finished')
         assert hasattr(worker, 'error')
+    
+    def test_worker_streams_pages_to_csv(self, tmp_path):
+        """Test that the worker writes each fetched page directly to CSV."""
+        mock_client = Mock()
+        mock_client.iter_facet_pages.return_value = iter([
+            [("10.5880/GFZ.1", "https://example.org/1"), ("10.5880/GFZ.2", "https://example.org/2")],
+            [("10.5880/GFZ.3", "https://example.org/3")],
+        ])
+        worker = DOIFetchWorker("TIB.GFZ", "pass", False, output_dir=str(tmp_path))
+        finished = []
+        worker.finished.connect(lambda *args: finished.append(args))
+        
+        with patch('src.ui.main_window.DataCiteClient', return_value=mock_client):
+            worker.run()
+        
+        filepath, username, row_count, doi_count = finished[0]
+        assert (username, row_count, doi_count) == ("TIB.GFZ", 3, 3)
+        mock_client.iter_facet_pages.assert_called_once_with("urls")
+        with open(filepath, encoding="utf-8") as f:
+            assert len(f.read().splitlines()) == 4
+    
+    def test_worker_reports_empty_result(self, tmp_path):
+        """Test that no file is reported when DataCite returns no DOIs."""
+        mock_client = Mock()
+        mock_client.iter_facet_pages.return_value = iter([[]])
+        worker = DOIFetchWorker("TIB.GFZ", "pass", False, output_dir=str(tmp_path))
+        finished = []
+        worker.finished.connect(lambda *args: finished.append(args))
+        
+        with patch('src.ui.main_window.DataCiteClient', return_value=mock_client):
+            worker.run()
+        
+        assert finished[0] == ("", "TIB.GFZ", 0, 0)
+    
+    def test_worker_closes_metadata_cache(self, tmp_path):
+        """Test that the metadata cache is closed when the fetch ends, also on errors."""
+        mock_cache = Mock()
+        mock_client = Mock()
+        mock_client.iter_facet_pages.side_effect = RuntimeError("boom")
+        worker = DOIFetchWorker("TIB.GFZ", "pass", False, output_dir=str(tmp_path))
+        errors = []
+        worker.error.connect(errors.append)
+        
+        with patch('src.ui.main_window._open_metadata_cache', return_value=mock_cache), \
+                patch('src.ui.main_window.DataCiteClient', return_value=mock_client):
+            worker.run()
+        
+        assert errors == ["Unerwarteter Fehler: boom"]
+        mock_cache.close.assert_called_once()
+
+
+class TestDOIAllFacetsFetchWorker:
+    """Test DOIAllFacetsFetchWorker class."""
+    
+    @staticmethod
+    def _page(dois):
+        """One harvested page with rows for every facet."""
+        return {
+            "urls": [(doi, f"https://example.org/{doi}") for doi in dois],
+            "creators": [(doi, "Doe, Jane", "Personal", "Jane", "Doe", "", "", "") for doi in dois],
+            "publisher": [(doi, "GFZ", "", "", "", "") for doi in dois],
+            "contributors": [(doi,) + ("",) * 13 for doi in dois],
+            "rights": [(doi, "CC BY 4.0", "", "", "CC-BY-4.0", "", "") for doi in dois],
+        }
+    
+    def test_worker_streams_all_facets_to_csv(self, tmp_path):
+        """Test that every page of the single pass is written to one CSV file per facet."""
+        mock_client = Mock()
+        mock_client.iter_harvest_pages.return_value = iter([
+            self._page(["10.5880/GFZ.1", "10.5880/GFZ.2"]),
+            self._page(["10.5880/GFZ.3"]),
+        ])
+        worker = DOIAllFacetsFetchWorker("TIB.GFZ", "pass", False, output_dir=str(tmp_path))
+        finished = []
+        worker.finished.connect(lambda *args: finished.append(args))
+        
+        with patch('src.ui.main_window._connect_contactinfo_db', return_value=None), \
+                patch('src.ui.main_window.DataCiteClient', return_value=mock_client):
+            worker.run()
+        
+        results, username, doi_count = finished[0]
+        assert (username, doi_count) == ("TIB.GFZ", 3)
+        assert set(results) == set(DOIAllFacetsFetchWorker.FACETS)
+        for facet, (filepath, row_count, error_message) in results.items():
+            assert (row_count, error_message) == (3, ""), facet
+            with open(filepath, encoding="utf-8") as f:
+                assert len(f.read().splitlines()) == 4, facet
+    
+    def test_failed_harvest_leaves_no_files(self, tmp_path):
+        """Test that a harvest error mid-run discards the partially written files."""
+        def pages():
+            yield self._page(["10.5880/GFZ.1"])
+            raise RuntimeError("boom")
+        
+        mock_client = Mock()
+        mock_client.iter_harvest_pages.return_value = pages()
+        worker = DOIAllFacetsFetchWorker("TIB.GFZ", "pass", False, output_dir=str(tmp_path))
+        errors = []
+        worker.error.connect(errors.append)
+        
+        with patch('src.ui.main_window._connect_contactinfo_db', return_value=None), \
+                patch('src.ui.main_window.DataCiteClient', return_value=mock_client):
+            worker.run()
+        
+        assert errors == ["Unerwarteter Fehler: boom"]
+        assert list(tmp_path.iterdir()) == []
 
 
 class TestMainWindowDialogIntegration:
@@ -171,7 +277,8 @@ class TestMainWindowAuthorsUpdate:
         
         # Verify worker was created with stored credentials
         mock_worker_class.assert_called_once_with(
-            "stored_user", "stored_pass", "/stored/path.csv", False, dry_run_only=False, credentials_are_new=False
+            "stored_user", "stored_pass", "/stored/path.csv", False, dry_run_only=False, credentials_are_new=False,
+            db_batch_size=mock_worker_class.DB_BATCH_SIZE
         )
     
     @patch('src.ui.main_window.CredentialsDialog')
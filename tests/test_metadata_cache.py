@@ -0,0 +1,245 @@
+"""Tests for the local DataCite metadata cache."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+import responses
+
+from src.api.datacite_client import DataCiteClient
+from src.api.metadata_cache import MetadataCache
+
+
+ENDPOINT = "https://api.datacite.org"
+DOIS_URL = f"{ENDPOINT}/dois"
+
+
+def _record(doi, url, updated="2024-01-01T00:00:00.000Z", creator="Doe, Jane"):
+    return {
+        "id": doi,
+        "type": "dois",
+        "attributes": {
+            "doi": doi,
+            "url": url,
+            "updated": updated,
+            "creators": [{"name": creator, "nameType": "Personal"}],
+        },
+    }
+
+
+def _page(records, next_url=None):
+    page = {"data": records, "links": {}}
+    if next_url:
+        page["links"]["next"] = next_url
+    return page
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with MetadataCache(tmp_path / "cache.sqlite3") as cache:
+        yield cache
+
+
+@pytest.fixture
+def client(cache):
+    return DataCiteClient("TIB.GFZ", "test_password", cache=cache)
+
+
+class TestMetadataCache:
+    """Test the SQLite storage."""
+    
+    def test_store_and_get(self, cache):
+        """Test that stored attributes come back shaped like an API response."""
+        cache.store(ENDPOINT, "TIB.GFZ", [_record("10.5880/GFZ.A", "https://example.org/a")])
+        
+        cached = cache.get(ENDPOINT, "TIB.GFZ", "10.5880/gfz.a")
+        
+        assert cached["data"]["id"] == "10.5880/GFZ.A"
+        assert cached["data"]["attributes"]["url"] == "https://example.org/a"
+        assert cache.get(ENDPOINT, "OTHER.CLIENT", "10.5880/GFZ.A") is None
+        assert cache.get("https://api.test.datacite.org", "TIB.GFZ", "10.5880/GFZ.A") is None
+    
+    def test_iter_pages(self, cache):
+        """Test that cached DOIs are served in /dois-shaped pages."""
+        cache.store(ENDPOINT, "TIB.GFZ", [
+            _record(f"10.5880/GFZ.{i}", f"https://example.org/{i}") for i in range(5)
+        ])
+        
+        pages = list(cache.iter_pages(ENDPOINT, "TIB.GFZ", page_size=2))
+        
+        assert [len(page["data"]) for page in pages] == [2, 2, 1]
+        assert pages[0]["data"][0]["id"] == "10.5880/GFZ.0"
+    
+    def test_mark_synced_uses_newest_updated(self, cache):
+        """Test that the sync watermark is the newest DataCite timestamp."""
+        assert cache.get_sync_state(ENDPOINT, "TIB.GFZ") is None
+        cache.store(ENDPOINT, "TIB.GFZ", [
+            _record("10.5880/GFZ.1", "https://example.org/1", updated="2024-01-01T00:00:00.000Z"),
+            _record("10.5880/GFZ.2", "https://example.org/2", updated="2024-03-01T00:00:00.000Z"),
+        ])
+        
+        cache.mark_synced(ENDPOINT, "TIB.GFZ")
+        
+        assert cache.get_sync_state(ENDPOINT, "TIB.GFZ")["last_updated"] == "2024-03-01T00:00:00.000Z"
+    
+    def test_persists_across_instances(self, tmp_path):
+        """Test that the cache survives closing and reopening."""
+        path = tmp_path / "cache.sqlite3"
+        with MetadataCache(path) as cache:
+            cache.store(ENDPOINT, "TIB.GFZ", [_record("10.5880/GFZ.1", "https://example.org/1")])
+        
+        with MetadataCache(path) as cache:
+            assert cache.count(ENDPOINT, "TIB.GFZ") == 1
+
+
+class TestCacheSync:
+    """Test incremental sync and serving from the cache."""
+    
+    @responses.activate
+    def test_first_sync_downloads_everything(self, client):
+        """Test that the first sync walks all pages without an updated filter."""
+        responses.add(responses.GET, DOIS_URL, json=_page(
+            [_record("10.5880/GFZ.1", "https://example.org/1")],
+            next_url=f"{DOIS_URL}?page%5Bcursor%5D=abc"
+        ))
+        responses.add(responses.GET, DOIS_URL, json=_page(
+            [_record("10.5880/GFZ.2", "https://example.org/2")]
+        ))
+        
+        stats = client.sync_cache()
+        
+        assert stats == {"downloaded": 2, "removed": 0, "total": 2}
+        assert "query" not in responses.calls[0].request.url
+    
+    @responses.activate
+    def test_incremental_sync_uses_updated_filter(self, client, cache):
+        """Test that later syncs only request DOIs changed since the newest cached one."""
+        cache.store(ENDPOINT, "TIB.GFZ", [
+            _record("10.5880/GFZ.1", "https://example.org/1", updated="2024-02-01T10:00:00.000Z")
+        ])
+        cache.mark_synced(ENDPOINT, "TIB.GFZ", full=True)
+        responses.add(responses.GET, DOIS_URL, json=_page([
+            _record("10.5880/GFZ.1", "https://example.org/new", updated="2024-05-01T00:00:00.000Z")
+        ]))
+        
+        stats = client.sync_cache()
+        
+        assert stats["downloaded"] == 1
+        assert responses.calls[0].request.params["query"] == "updated:[2024-02-01T10:00:00.000Z TO *]"
+        assert cache.get(ENDPOINT, "TIB.GFZ", "10.5880/GFZ.1")["data"]["attributes"]["url"] == "https://example.org/new"
+    
+    @responses.activate
+    def test_full_sync_removes_deleted_dois(self, client, cache):
+        """Test that a full sync drops DOIs that no longer exist."""
+        cache.store(ENDPOINT, "TIB.GFZ", [_record("10.5880/GFZ.GONE", "https://example.org/gone")])
+        cache.mark_synced(ENDPOINT, "TIB.GFZ")
+        responses.add(responses.GET, DOIS_URL, json=_page([_record("10.5880/GFZ.1", "https://example.org/1")]))
+        
+        stats = client.sync_cache(full=True)
+        
+        assert stats == {"downloaded": 1, "removed": 1, "total": 1}
+        assert cache.get(ENDPOINT, "TIB.GFZ", "10.5880/GFZ.GONE") is None
+    
+    @responses.activate
+    def test_outdated_full_sync_triggers_full_sync(self, client, cache):
+        """Test that stale DOIs are dropped automatically once the last full sync is too old."""
+        cache.store(ENDPOINT, "TIB.GFZ", [_record("10.5880/GFZ.GONE", "https://example.org/gone")])
+        cache.mark_synced(ENDPOINT, "TIB.GFZ", full=True)
+        # Incremental syncs keep the time of the last full sync
+        cache.mark_synced(ENDPOINT, "TIB.GFZ")
+        responses.add(responses.GET, DOIS_URL, json=_page([_record("10.5880/GFZ.1", "https://example.org/1")]))
+        
+        stats = client.sync_cache()
+        assert stats["removed"] == 0
+        assert "query" in responses.calls[0].request.params
+        
+        expired = datetime.now(timezone.utc) - timedelta(days=DataCiteClient.FULL_SYNC_INTERVAL_DAYS + 1)
+        with patch.object(cache, "get_sync_state", return_value={
+            "last_updated": "2024-01-01T00:00:00.000Z",
+            "synced_at": datetime.now(timezone.utc).isoformat(),
+            "full_synced_at": expired.isoformat(),
+        }):
+            stats = client.sync_cache()
+        
+        assert "query" not in responses.calls[1].request.params
+        assert stats == {"downloaded": 1, "removed": 1, "total": 1}
+        assert cache.get_sync_state(ENDPOINT, "TIB.GFZ")["full_synced_at"] > expired.isoformat()
+    
+    def test_schema_upgrade_keeps_cached_dois(self, tmp_path):
+        """Test that a version 1 cache gains the full sync column and keeps its entries."""
+        import sqlite3
+        
+        path = tmp_path / "cache.sqlite3"
+        conn = sqlite3.connect(str(path))
+        conn.execute(
+            "CREATE TABLE dois (endpoint TEXT NOT NULL, client_id TEXT NOT NULL, doi TEXT NOT NULL, "
+            "updated TEXT, attributes TEXT NOT NULL, PRIMARY KEY (endpoint, client_id, doi))"
+        )
+        conn.execute(
+            "CREATE TABLE sync_state (endpoint TEXT NOT NULL, client_id TEXT NOT NULL, last_updated TEXT, "
+            "synced_at TEXT NOT NULL, PRIMARY KEY (endpoint, client_id))"
+        )
+        conn.execute(
+            "INSERT INTO sync_state VALUES (?, 'TIB.GFZ', '2024-01-01T00:00:00.000Z', '2024-01-02T00:00:00')",
+            (ENDPOINT,)
+        )
+        conn.execute("PRAGMA user_version=1")
+        conn.commit()
+        conn.close()
+        
+        with MetadataCache(path) as cache:
+            state = cache.get_sync_state(ENDPOINT, "TIB.GFZ")
+        
+        assert state["last_updated"] == "2024-01-01T00:00:00.000Z"
+        # Never fully synced since the upgrade: the next sync is a full one
+        assert state["full_synced_at"] is None
+    
+    @responses.activate
+    def test_fetch_all_serves_from_cache(self, client, cache):
+        """Test that fetch_all_* return cached rows after an incremental sync."""
+        cache.store(ENDPOINT, "TIB.GFZ", [
+            _record("10.5880/GFZ.1", "https://example.org/1"),
+            _record("10.5880/GFZ.2", "https://example.org/2"),
+        ])
+        cache.mark_synced(ENDPOINT, "TIB.GFZ", full=True)
+        # Nothing changed since the last sync
+        responses.add(responses.GET, DOIS_URL, json=_page([]))
+        
+        assert client.fetch_all_dois() == [
+            ("10.5880/GFZ.1", "https://example.org/1"),
+            ("10.5880/GFZ.2", "https://example.org/2"),
+        ]
+        creators = client.fetch_all_dois_with_creators()
+        assert creators[0][:2] == ("10.5880/GFZ.1", "Doe, Jane")
+        # One (empty) sync request per export instead of one request per page
+        assert len(responses.calls) == 2
+    
+    @responses.activate
+    def test_get_doi_metadata_uses_cache(self, client, cache):
+        """Test that cached DOIs are answered without a request."""
+        cache.store(ENDPOINT, "TIB.GFZ", [_record("10.5880/GFZ.1", "https://example.org/1")])
+        responses.add(
+            responses.GET,
+            f"{DOIS_URL}/10.5880/GFZ.2",
+            json={"data": _record("10.5880/GFZ.2", "https://example.org/2")}
+        )
+        
+        assert client.get_doi_metadata("10.5880/GFZ.1")["data"]["attributes"]["url"] == "https://example.org/1"
+        assert client.get_doi_metadata("10.5880/GFZ.2")["data"]["attributes"]["url"] == "https://example.org/2"
+        assert len(responses.calls) == 1
+    
+    @responses.activate
+    def test_successful_update_is_written_through(self, client, cache):
+        """Test that the record returned by a PUT replaces the cached one."""
+        cache.store(ENDPOINT, "TIB.GFZ", [_record("10.5880/GFZ.1", "https://example.org/old")])
+        responses.add(
+            responses.PUT,
+            f"{DOIS_URL}/10.5880/GFZ.1",
+            json={"data": _record("10.5880/GFZ.1", "https://example.org/new", updated="2024-06-01T00:00:00.000Z")}
+        )
+        
+        success, _ = client.update_doi_url("10.5880/GFZ.1", "https://example.org/new")
+        
+        assert success
+        cached = cache.get(ENDPOINT, "TIB.GFZ", "10.5880/GFZ.1")
+        assert cached["data"]["attributes"]["url"] == "https://example.org/new"
@@ -8,116 +8,16 @@ All patterns are based on actual edge cases encountered in production data.
 
 import pytest
 
+from src.utils.contributor_classifier import is_organization_name
+
 
 class TestNameTypeInferenceHelpers:
     """Test the helper functions used for nameType inference."""
     
     @pytest.fixture(autouse=True)
     def setup_helper_functions(self):
-        """Import the helper functions from datacite_client module context."""
-        # We need to access the nested functions within fetch_all_dois_with_contributors
-        # For testing, we recreate the logic here to test it in isolation
-        import re
-        
-        self.SUBSTRING_ORG_KEYWORDS = {
-            "universität", "université", "universidad", "universidade", "università", "university",
-            "universite", "institute", "institut", "instituto", "istituto",
-            "zentrum", "center", "centre", "centro", "forschung",
-            "laboratory", "laboratorium", "laboratorio", "laboratoire",
-            "department", "abteilung", "departamento",
-            "ministry", "ministerium", "ministère", "ministerio",
-            "foundation", "stiftung", "fondation", "fundación",
-            "gesellschaft", "association", "verband", "verein",
-            "organisation", "organization", "corporation", "company",
-            "consortium", "konsortium", "bibliothek", "library",
-            "krankenhaus", "hospital", "geosurvey", "helmholtz", "fraunhofer",
-            "landesamt", "regierungspräsidium", "geological survey",
-            "geodynamics", "geophysik", "geophysics", "geowissenschaften", "geosciences",
-            "erdbebenstation", "fachbereich", "observatory", "osservatorio",
-            "observatoire", "observatorium", "synchrotron", "röntgenstrahlungsquelle",
-            "meteorolog", "klimatolog", "hochschule", "zentralanstalt",
-            "géothermie", "geothermie", "geomanagement", "transregio",
-        }
-        
-        self.WORD_BOUNDARY_ORG_KEYWORDS = {
-            "college", "school", "faculty", "fakultät",
-            "agency", "agentur", "authority", "behörde",
-            "office", "bureau", "service", "dienst",
-            "commission", "kommission", "council", "board",
-            "gremium", "committee", "ausschuss",
-            "museum", "archive", "archiv", "klinik", "clinic", "division",
-            "firma", "gmbh", "ltd", "group", "gruppe", "network", "netzwerk",
-            "survey", "pool", "eth", "mit", "cnrs", "nasa", "noaa", "usgs",
-            "csic", "csiro", "rwth", "ipgp", "gipp", "gfz", "ucl",
-            "isterre", "globe", "norsar", "nve", "dmi", "smhi",
-            "arditi", "fccn", "fct", "fellowship", "grant", "fund", "award",
-            "staff", "team", "authorities", "isg", "platform",
-            "awi", "bmkg", "ingv", "ipma", "hbo", "zamg", "eseo", "afad",
-            "desy", "enbw", "ecw", "esg", "cnr", "esrf", "gvo", "petra", "imaa",
-            "crc", "radar", "project", "programme", "program", "sfb", "minas",
-            "caiag", "geopribor", "dekorp", "ilge", "tna",
-        }
-        
-        def _is_organization_name(name: str) -> bool:
-            """Check if a name contains organizational keywords, URLs, or email addresses."""
-            if not name:
-                return False
-            name_lower = name.lower()
-            
-            # First, detect "Person Name, email" or "Person Name (Affiliation)" patterns
-            if ',' in name:
-                parts = name.split(',', 1)
-                first_part = parts[0].strip()
-                second_part = parts[1].strip() if len(parts) > 1 else ""
-                
-                first_words = first_part.split()
-                if 1 <= len(first_words) <= 3:
-                    all_name_like = all(
-                        len(w) >= 1 and w[0].isupper() and 
-                        not any(kw in w.lower() for kw in ['university', 'institut', 'center', 'centre'])
-                        for w in first_words
-                    )
-                    if all_name_like:
-                        if '@' in second_part:
-                            return False
-                        second_words = second_part.split()
-                        if len(second_words) == 1 and len(second_part) <= 20:
-                            return False
-            
-            # Check for "Name (Affiliation)" pattern
-            if '(' in name and ')' in name:
-                before_paren = name.split('(')[0].strip()
-                if ',' in before_paren:
-                    parts = before_paren.split(',')
-                    if len(parts) == 2:
-                        p1, p2 = parts[0].strip(), parts[1].strip()
-                        if (1 <= len(p1.split()) <= 2 and 1 <= len(p2.split()) <= 2 and
-                            len(p1) <= 30 and len(p2) <= 20):
-                            return False
-            
-            # URLs are always organizational
-            if name_lower.startswith(('http://', 'https://', 'www.')):
-                return True
-            
-            # Email as the entire name
-            if '@' in name and '.' in name:
-                if re.match(r'^[\w.-]+@[\w.-]+\.[a-z]{2,}$', name_lower.strip()):
-                    return True
-            
-            # Substring keywords
-            for keyword in self.SUBSTRING_ORG_KEYWORDS:
-                if keyword in name_lower:
-                    return True
-            
-            # Word-boundary keywords
-            for keyword in self.WORD_BOUNDARY_ORG_KEYWORDS:
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, name_lower):
-                    return True
-            
-            return False
-        
-        self._is_organization_name = _is_organization_name
+        """Use the shared contributor classifier from src.utils.contributor_classifier."""
+        self._is_organization_name = is_organization_name
 
 
 class TestOrganizationalKeywords(TestNameTypeInferenceHelpers):
@@ -131,6 +131,94 @@ class TestFetchPendingDois:
             client.fetch_pending_dois()
 
 
+class TestIterPendingDois:
+    """Tests for SumarioPMDClient.iter_pending_dois()."""
+    
+    @patch('src.db.sumariopmd_client.pymysql.connect')
+    def test_streams_tuples_from_unbuffered_cursor(self, mock_connect):
+        """Test that rows are fetched in batches from a server-side cursor."""
+        from pymysql.cursors import SSCursor
+        
+        mock_connection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_connect.return_value = mock_connection
+        mock_connection.cursor.return_value = mock_cursor
+        mock_cursor.fetchmany.side_effect = [
+            [('10.5880/test.001', 'Test Title', 'Doe, John')],
+            [('10.5880/test.002', 'Another Title', 'Smith, Jane')],
+            [],
+        ]
+        
+        client = SumarioPMDClient(
+            host='localhost',
+            database='test-db',
+            username='test-user',
+            password='test-pass'
+        )
+        rows = client.iter_pending_dois()
+        
+        # Nothing is queried before iteration starts
+        mock_connect.assert_not_called()
+        assert list(rows) == [
+            ('10.5880/test.001', 'Test Title', 'Doe, John'),
+            ('10.5880/test.002', 'Another Title', 'Smith, Jane'),
+        ]
+        mock_connection.cursor.assert_called_once_with(SSCursor)
+        mock_cursor.fetchmany.assert_called_with(SumarioPMDClient.STREAM_BATCH_SIZE)
+    
+    @patch('src.db.sumariopmd_client.pymysql.connect')
+    def test_error_while_streaming_raises_database_error(self, mock_connect):
+        """Test that errors during iteration are raised as DatabaseError."""
+        import pymysql
+        
+        mock_connection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_connect.return_value = mock_connection
+        mock_connection.cursor.return_value = mock_cursor
+        mock_cursor.fetchmany.side_effect = [
+            [('10.5880/test.001', 'Test Title', 'Doe, John')],
+            pymysql.OperationalError(2013, "Lost connection"),
+        ]
+        
+        client = SumarioPMDClient(
+            host='localhost',
+            database='test-db',
+            username='test-user',
+            password='test-pass'
+        )
+        
+        with pytest.raises(DatabaseError, match="Failed to fetch pending DOIs"):
+            list(client.iter_pending_dois())
+        # Broken connection is not returned to the pool
+        mock_connection.close.assert_called_once()
+        assert client.get_pool_stats()["open"] == 0
+    
+    @patch('src.db.sumariopmd_client.pymysql.connect')
+    def test_abandoned_stream_closes_connection_not_cursor(self, mock_connect):
+        """Test that stopping early aborts the query instead of reading the remaining rows."""
+        mock_connection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_connect.return_value = mock_connection
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connection.close.side_effect = lambda: setattr(mock_connection, 'open', False)
+        mock_cursor.fetchmany.return_value = [('10.5880/test.001', 'Test Title', 'Doe, John')]
+        
+        client = SumarioPMDClient(
+            host='localhost',
+            database='test-db',
+            username='test-user',
+            password='test-pass'
+        )
+        rows = client.iter_pending_dois()
+        next(rows)
+        rows.close()
+        
+        # SSCursor.close() would drain the result set
+        mock_cursor.close.assert_not_called()
+        mock_connection.close.assert_called()
+        assert client.get_pool_stats()["open"] == 0
+
+
 class TestExportPendingDois:
     """Tests for export_pending_dois() function."""
     
@@ -240,6 +328,50 @@ class TestExportPendingDois:
             assert "Berechtigung" in str(exc_info.value) or "Permission" in str(exc_info.value).lower()
 
 
+class TestExportStreamAtomically:
+    """Tests for export_stream_atomically() with the pending export."""
+    
+    def test_replaces_file_on_success(self, tmp_path):
+        """Test that the file appears only after a complete export."""
+        from src.utils.csv_exporter import export_stream_atomically
+        output_path = str(tmp_path / "pending.csv")
+        
+        count = export_stream_atomically(
+            export_pending_dois,
+            iter([('10.5880/test.001', 'Test Title', 'Doe, John')]),
+            output_path
+        )
+        
+        assert count == 1
+        assert os.path.exists(output_path)
+        assert not os.path.exists(output_path + ".part")
+    
+    def test_empty_stream_creates_no_file(self, tmp_path):
+        """Test that an empty result does not create a CSV file."""
+        from src.utils.csv_exporter import export_stream_atomically
+        output_path = str(tmp_path / "pending.csv")
+        
+        assert export_stream_atomically(export_pending_dois, iter([]), output_path) == 0
+        assert os.listdir(tmp_path) == []
+    
+    def test_failing_stream_keeps_previous_file(self, tmp_path):
+        """Test that a stream failing midway leaves no partial file behind."""
+        from src.utils.csv_exporter import export_stream_atomically
+        output_path = tmp_path / "pending.csv"
+        output_path.write_text("previous export", encoding="utf-8")
+        
+        def rows():
+            yield ('10.5880/test.001', 'Test Title', 'Doe, John')
+            raise DatabaseError("Lost connection")
+        
+        # Stream errors are not disguised as file errors
+        with pytest.raises(DatabaseError):
+            export_stream_atomically(export_pending_dois, rows(), str(output_path))
+        
+        assert output_path.read_text(encoding="utf-8") == "previous export"
+        assert os.listdir(tmp_path) == ["pending.csv"]
+
+
 class TestPendingExportWorker:
     """Tests for PendingExportWorker class."""
     
@@ -262,7 +394,7 @@ class TestPendingExportWorker:
         assert worker.output_path == '/tmp/test.csv'
     
     @patch('src.workers.pending_export_worker.SumarioPMDClient')
-    @patch('src.workers.pending_export_worker.export_pending_dois')
+    @patch('src.workers.pending_export_worker.export_stream_atomically')
     def test_worker_emits_progress_signals(self, mock_export, mock_client_class):
         """Test that worker emits progress signals correctly."""
         from src.workers.pending_export_worker import PendingExportWorker
@@ -270,9 +402,10 @@ class TestPendingExportWorker:
         # Setup mock
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
-        mock_client.fetch_pending_dois.return_value = [
+        mock_client.iter_pending_dois.return_value = (row for row in [
             ('10.5880/test.001', 'Test Title', 'Doe, John')
-        ]
+        ])
+        mock_export.side_effect = lambda export_function, rows, path: len(list(rows))
         
         worker = PendingExportWorker(
             db_host='test-host',
@@ -298,7 +431,7 @@ class TestPendingExportWorker:
         assert len(progress_counts) > 0
     
     @patch('src.workers.pending_export_worker.SumarioPMDClient')
-    @patch('src.workers.pending_export_worker.export_pending_dois')
+    @patch('src.workers.pending_export_worker.export_stream_atomically')
     def test_worker_emits_finished_signal_on_success(self, mock_export, mock_client_class):
         """Test that worker emits finished signal with correct data on success."""
         from src.workers.pending_export_worker import PendingExportWorker
@@ -306,10 +439,11 @@ class TestPendingExportWorker:
         # Setup mock
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
-        mock_client.fetch_pending_dois.return_value = [
+        mock_client.iter_pending_dois.return_value = (row for row in [
             ('10.5880/test.001', 'Test Title', 'Doe, John'),
             ('10.5880/test.002', 'Test Title 2', 'Smith, Jane'),
-        ]
+        ])
+        mock_export.side_effect = lambda export_function, rows, path: len(list(rows))
         
         worker = PendingExportWorker(
             db_host='test-host',
@@ -330,6 +464,47 @@ class TestPendingExportWorker:
         assert len(finished_data) == 1
         assert finished_data[0][0] == '/tmp/test.csv'
         assert finished_data[0][1] == 2
+        mock_client.close_pool.assert_called_once()
+    
+    @patch('src.workers.pending_export_worker.SumarioPMDClient')
+    def test_worker_cancel_stops_stream(self, mock_client_class, tmp_path):
+        """Test that cancelling mid-stream reports the cancel, not an error, and closes the stream."""
+        from src.workers.pending_export_worker import PendingExportWorker
+        
+        stream_closed = []
+        
+        def stream():
+            try:
+                yield ('10.5880/test.001', 'Test Title', 'Doe, John')
+                worker.stop()
+                yield ('10.5880/test.002', 'Test Title 2', 'Smith, Jane')
+                yield ('10.5880/test.003', 'Test Title 3', 'Doe, Jane')
+            finally:
+                stream_closed.append(True)
+        
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+        mock_client.iter_pending_dois.return_value = stream()
+        output_path = tmp_path / 'pending.csv'
+        
+        worker = PendingExportWorker(
+            db_host='test-host',
+            db_name='test-db',
+            db_user='test-user',
+            db_password='test-pass',
+            output_path=str(output_path)
+        )
+        progress_messages = []
+        errors = []
+        worker.progress.connect(progress_messages.append)
+        worker.error.connect(errors.append)
+        
+        worker.run()
+        
+        assert progress_messages[-1] == "Export abgebrochen."
+        assert errors == []
+        assert stream_closed == [True]
+        assert list(tmp_path.iterdir()) == []
     
     @patch('src.workers.pending_export_worker.SumarioPMDClient')
     def test_worker_emits_error_signal_on_db_error(self, mock_client_class):
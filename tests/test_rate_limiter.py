@@ -0,0 +1,177 @@
+"""Tests for adaptive rate limiting of DataCite requests."""
+
+from datetime import datetime, timezone
+
+import pytest
+import responses
+
+from src.api.datacite_client import DataCiteClient
+from src.api.rate_limiter import AdaptiveRateLimiter, RateLimitedSession, parse_retry_after
+
+
+class FakeClock:
+    """Manually advanced clock; sleeping advances the time."""
+    
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+    
+    def __call__(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def limiter(clock):
+    return AdaptiveRateLimiter(max_rate=10.0, burst=2, clock=clock, sleep=clock.sleep)
+
+
+class TestParseRetryAfter:
+    """Test parsing of Retry-After header values."""
+    
+    def test_seconds(self):
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(" 1.5 ") == 1.5
+    
+    def test_http_date(self):
+        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        assert parse_retry_after("Mon, 01 Jan 2024 12:00:30 GMT", now=now) == 30.0
+    
+    def test_date_in_past_is_zero(self):
+        now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        assert parse_retry_after("Mon, 01 Jan 2024 11:00:00 GMT", now=now) == 0.0
+    
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid(self, value):
+        assert parse_retry_after(value) is None
+
+
+class TestAdaptiveRateLimiter:
+    """Test token bucket and AIMD behaviour."""
+    
+    def test_burst_then_spacing(self, limiter, clock):
+        """Test that requests beyond the burst are spaced at the current rate."""
+        waits = [limiter.acquire() for _ in range(4)]
+        
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1)
+        assert waits[3] == pytest.approx(0.1)
+    
+    def test_rate_limited_halves_rate_and_pauses(self, limiter, clock):
+        """Test multiplicative decrease and Retry-After pause."""
+        limiter.on_rate_limited(retry_after=5.0, fallback_delay=1.0)
+        
+        assert limiter.current_rate == pytest.approx(5.0)
+        assert limiter.acquire() == pytest.approx(5.0)
+        assert limiter.get_stats()["rate_limited"] == 1
+    
+    def test_requests_queued_during_pause_resume_spaced(self, limiter, clock):
+        """Test that threads waiting for a pause do not all fire when it ends."""
+        limiter.on_rate_limited(retry_after=5.0, fallback_delay=1.0)
+        
+        # Reserve three slots before any of them has slept
+        waits = []
+        sleep = limiter.sleep
+        limiter.sleep = lambda seconds: None
+        for _ in range(3):
+            waits.append(limiter.acquire())
+        limiter.sleep = sleep
+        
+        assert waits == pytest.approx([5.0, 5.2, 5.4])
+    
+    def test_fallback_delay_without_retry_after(self, limiter):
+        """Test that the fallback delay is used if the server sends no Retry-After."""
+        limiter.on_rate_limited(retry_after=None, fallback_delay=2.0)
+        assert limiter.acquire() == pytest.approx(2.0)
+    
+    def test_rate_never_below_minimum(self, limiter):
+        """Test that repeated 429s do not stop requests entirely."""
+        for _ in range(20):
+            limiter.on_rate_limited(retry_after=0.0, fallback_delay=0.0)
+        assert limiter.current_rate == AdaptiveRateLimiter.MIN_RATE
+    
+    def test_additive_increase_up_to_max(self, limiter):
+        """Test that successes slowly restore the maximum rate."""
+        limiter.on_rate_limited(retry_after=0.0, fallback_delay=0.0)
+        limiter.on_success()
+        assert limiter.current_rate == pytest.approx(5.0 + AdaptiveRateLimiter.INCREASE_STEP)
+        
+        for _ in range(100):
+            limiter.on_success()
+        assert limiter.current_rate == 10.0
+    
+    def test_low_quota_caps_rate(self, limiter):
+        """Test that X-RateLimit headers slow down before the quota is used up."""
+        limiter.update_from_headers({"X-RateLimit-Limit": "3000", "X-RateLimit-Remaining": "2500"})
+        assert limiter.current_rate == 10.0
+        
+        limiter.update_from_headers({"X-RateLimit-Limit": "3000", "X-RateLimit-Remaining": "150"})
+        assert limiter.current_rate == pytest.approx(5.0)
+        
+        limiter.update_from_headers({"X-RateLimit-Limit": "3000", "X-RateLimit-Remaining": "2999"})
+        assert limiter.current_rate == 10.0
+    
+    def test_exhausted_quota_waits_for_reset(self, limiter):
+        """Test that an exhausted quota pauses until X-RateLimit-Reset."""
+        limiter.update_from_headers({
+            "X-RateLimit-Limit": "3000",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": "30"
+        })
+        assert limiter.acquire() == pytest.approx(30.0)
+
+
+class TestRateLimitedSession:
+    """Test transparent retries after HTTP 429."""
+    
+    URL = "https://api.datacite.org/dois"
+    
+    @responses.activate
+    def test_retries_after_retry_after_delay(self, limiter, clock):
+        """Test that a 429 is retried after the server-provided delay."""
+        responses.add(responses.GET, self.URL, status=429, headers={"Retry-After": "7"})
+        responses.add(responses.GET, self.URL, json={"data": []}, status=200)
+        
+        session = RateLimitedSession(limiter, max_retries=3)
+        response = session.get(self.URL)
+        
+        assert response.status_code == 200
+        assert len(responses.calls) == 2
+        assert clock.sleeps == [pytest.approx(7.0)]
+    
+    @responses.activate
+    def test_returns_last_429_when_retries_exhausted(self, limiter, clock):
+        """Test that the caller gets the 429 after all retries failed."""
+        responses.add(responses.GET, self.URL, status=429)
+        
+        session = RateLimitedSession(limiter, max_retries=2)
+        response = session.get(self.URL)
+        
+        assert response.status_code == 429
+        assert len(responses.calls) == 3
+        # Exponential backoff without Retry-After: 1s, 2s
+        assert clock.sleeps[:2] == [pytest.approx(1.0), pytest.approx(2.0)]
+    
+    @responses.activate
+    def test_client_harvest_survives_rate_limit(self):
+        """Test that a harvest continues after a temporary 429."""
+        client = DataCiteClient("TIB.GFZ", "test_password")
+        client.rate_limiter.sleep = lambda seconds: None
+        responses.add(responses.GET, self.URL, status=429, headers={"Retry-After": "1"})
+        responses.add(
+            responses.GET,
+            self.URL,
+            json={"data": [{"id": "10.5880/GFZ.1", "attributes": {"url": "https://example.org/1"}}], "links": {}},
+            status=200
+        )
+        
+        assert client.fetch_all_dois() == [("10.5880/GFZ.1", "https://example.org/1")]
+        assert client.get_request_rate() < DataCiteClient.MAX_REQUESTS_PER_SECOND
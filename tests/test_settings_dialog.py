@@ -65,6 +65,14 @@ class TestSettingsDialogInit:
         assert settings_dialog.light_theme_radio is not None
         assert settings_dialog.dark_theme_radio is not None
     
+    def test_bulk_url_diff_checkbox_created(self, settings_dialog):
+        """Test that the DataCite bulk URL diff option exists."""
+        assert settings_dialog.bulk_url_diff_checkbox is not None
+    
+    def test_metadata_cache_checkbox_created(self, settings_dialog):
+        """Test that the local metadata cache option exists."""
+        assert settings_dialog.metadata_cache_checkbox is not None
+    
     def test_database_inputs_created(self, settings_dialog):
         """Test that database input fields are created."""
         assert settings_dialog.host_input is not None
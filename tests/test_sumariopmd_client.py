@@ -8,7 +8,9 @@ import pymysql
 
 from src.db.sumariopmd_client import (
     SumarioPMDClient,
-    ConnectionError
+    ConnectionError,
+    DatabaseError,
+    TransactionError
 )
 
 
@@ -29,6 +31,30 @@ def mock_connection():
     return connection, cursor
 
 
+def agent_row(order, lastname, firstname, orcid, role):
+    """Row as returned by the locking resourceagent/role/contactinfo query."""
+    return {
+        "order": order,
+        "name": f"{lastname}, {firstname}",
+        "firstname": firstname,
+        "lastname": lastname,
+        "identifier": orcid,
+        "identifiertype": "ORCID" if orcid else None,
+        "nametype": "Personal",
+        "role": role,
+        "contactinfo_order": None,
+    }
+
+
+def executemany_rows(cursor, statement):
+    """All parameter rows passed to executemany() for statements containing the given text."""
+    return [
+        row
+        for call in cursor.executemany.call_args_list if statement in call[0][0]
+        for row in call[0][1]
+    ]
+
+
 class TestClientInitialization:
     """Tests for SumarioPMDClient initialization."""
     
@@ -100,8 +126,42 @@ class TestConnectionManagement:
         with client.get_connection() as conn:
             assert conn == mock_connection
         
-        # Connection should be closed after context exit
+        # Connection is returned to the pool, not closed
+        mock_connection.close.assert_not_called()
+        
+        # Next use reuses the pooled connection
+        with client.get_connection() as conn:
+            assert conn == mock_connection
+        mock_pymysql_connect.assert_called_once()
+        
+        # Closing the pool closes idle connections
+        client.close_pool()
         mock_connection.close.assert_called_once()
+        
+        # A closed pool is only used again after an explicit reopen
+        with pytest.raises(ConnectionError):
+            with client.get_connection():
+                pass
+        client.reopen_pool()
+        with client.get_connection():
+            pass
+        assert mock_pymysql_connect.call_count == 2
+    
+    def test_get_connection_discards_broken_connection(self, mock_pymysql_connect):
+        """Test that connections failing with OperationalError are not reused."""
+        broken, fresh = Mock(), Mock()
+        mock_pymysql_connect.side_effect = [broken, fresh]
+        
+        client = SumarioPMDClient("host", "db", "user", "pass")
+        
+        with pytest.raises(pymysql.OperationalError):
+            with client.get_connection():
+                raise pymysql.OperationalError(2013, "Lost connection")
+        broken.close.assert_called_once()
+        
+        with client.get_connection() as conn:
+            assert conn == fresh
+        assert client.get_pool_stats()["created"] == 2
     
     def test_get_connection_failure(self, mock_pymysql_connect):
         """Test connection failure raises ConnectionError."""
@@ -197,6 +257,89 @@ class TestResourceLookup:
         
         with pytest.raises(DatabaseError, match="Failed to fetch resource_id"):
             client.get_resource_id_for_doi("10.5880/test.doi")
+    
+    def test_get_resource_id_is_cached(self, mock_pymysql_connect):
+        """Test that repeated lookups of a DOI only query the database once."""
+        mock_connection = Mock()
+        mock_cursor = Mock()
+        mock_cursor.fetchone.return_value = None
+        mock_connection.cursor.return_value.__enter__ = Mock(return_value=mock_cursor)
+        mock_connection.cursor.return_value.__exit__ = Mock(return_value=False)
+        mock_pymysql_connect.return_value = mock_connection
+        
+        client = SumarioPMDClient("host", "db", "user", "pass")
+        
+        assert client.get_resource_id_for_doi("10.5880/missing") is None
+        assert client.get_resource_id_for_doi("10.5880/MISSING") is None
+        mock_cursor.execute.assert_called_once()
+
+
+class TestResolveResourceIds:
+    """Tests for bulk DOI -> resource_id resolution."""
+    
+    @pytest.fixture
+    def cursor(self, mock_pymysql_connect):
+        mock_connection = Mock()
+        mock_cursor = Mock()
+        mock_connection.cursor.return_value.__enter__ = Mock(return_value=mock_cursor)
+        mock_connection.cursor.return_value.__exit__ = Mock(return_value=False)
+        mock_pymysql_connect.return_value = mock_connection
+        return mock_cursor
+    
+    def test_resolves_in_chunks(self, cursor):
+        """Test that DOIs are resolved with one IN query per chunk."""
+        cursor.fetchall.side_effect = [
+            [{"id": 1, "identifier": "10.5880/GFZ.A"}, {"id": 2, "identifier": "10.5880/GFZ.B"}],
+            [],
+        ]
+        client = SumarioPMDClient("host", "db", "user", "pass")
+        
+        result = client.get_resource_ids_for_dois(
+            ["10.5880/gfz.a", "10.5880/GFZ.B", "10.5880/GFZ.C", "10.5880/GFZ.B"],
+            chunk_size=2
+        )
+        
+        assert result == {"10.5880/gfz.a": 1, "10.5880/GFZ.B": 2, "10.5880/GFZ.C": None}
+        assert cursor.execute.call_count == 2
+        query, params = cursor.execute.call_args_list[0][0]
+        assert "IN (%s, %s)" in query
+        assert list(params) == ["10.5880/gfz.a", "10.5880/GFZ.B"]
+    
+    def test_duplicate_identifiers_keep_lowest_id(self, cursor):
+        """Test that the first row wins if a DOI exists twice."""
+        cursor.fetchall.return_value = [
+            {"id": 5, "identifier": "10.5880/GFZ.A"},
+            {"id": 9, "identifier": "10.5880/gfz.a"},
+        ]
+        client = SumarioPMDClient("host", "db", "user", "pass")
+        
+        assert client.get_resource_ids_for_dois(["10.5880/GFZ.A"]) == {"10.5880/GFZ.A": 5}
+    
+    def test_results_are_cached(self, cursor):
+        """Test that resolved and unknown DOIs are not queried again."""
+        cursor.fetchall.return_value = [{"id": 1, "identifier": "10.5880/GFZ.A"}]
+        client = SumarioPMDClient("host", "db", "user", "pass")
+        client.get_resource_ids_for_dois(["10.5880/GFZ.A", "10.5880/GFZ.X"])
+        
+        assert client.get_resource_ids_for_dois(["10.5880/GFZ.X"]) == {"10.5880/GFZ.X": None}
+        assert client.get_resource_id_for_doi("10.5880/GFZ.A") == 1
+        cursor.execute.assert_called_once()
+        
+        client.clear_resource_id_cache()
+        client.get_resource_ids_for_dois(["10.5880/GFZ.A"])
+        assert cursor.execute.call_count == 2
+    
+    def test_database_error(self, cursor):
+        """Test that query failures raise DatabaseError and cache nothing."""
+        cursor.execute.side_effect = pymysql.Error("Query failed")
+        client = SumarioPMDClient("host", "db", "user", "pass")
+        
+        with pytest.raises(DatabaseError, match="Failed to fetch resource_ids"):
+            client.get_resource_ids_for_dois(["10.5880/GFZ.A"])
+        
+        cursor.execute.side_effect = None
+        cursor.fetchall.return_value = []
+        assert client.get_resource_ids_for_dois(["10.5880/GFZ.A"]) == {"10.5880/GFZ.A": None}
 
 
 class TestFetchCreators:
@@ -310,8 +453,8 @@ class TestUpdateCreators:
         mock_connection = Mock()
         mock_cursor = Mock()
         mock_cursor.rowcount = 1
-        # DictCursor returns list of dicts!
-        mock_cursor.fetchall.return_value = [{"order": 1}]
+        # No creators stored yet
+        mock_cursor.fetchall.return_value = []
         mock_connection.cursor.return_value.__enter__ = Mock(return_value=mock_cursor)
         mock_connection.cursor.return_value.__exit__ = Mock(return_value=False)
         mock_pymysql_connect.return_value = mock_connection
@@ -331,12 +474,11 @@ class TestUpdateCreators:
         assert success is True
         
         # Verify INSERT was called with normalized ORCID (ID only)
-        insert_calls = [call for call in mock_cursor.execute.call_args_list 
-                       if 'INSERT INTO resourceagent' in str(call)]
-        assert len(insert_calls) > 0
+        insert_rows = executemany_rows(mock_cursor, 'INSERT INTO resourceagent')
+        assert len(insert_rows) > 0
         
         # Check that the ORCID value passed was the ID only (without URL)
-        insert_values = insert_calls[0][0][1]
+        insert_values = insert_rows[0]
         orcid_value = insert_values[5]  # 6th parameter is ORCID
         assert orcid_value == '0000-0001-2345-6789'
         assert 'https://' not in orcid_value
@@ -374,8 +516,13 @@ class TestUpdateCreators:
         mock_connection = Mock()
         mock_cursor = Mock()
         mock_cursor.rowcount = 1
-        # DictCursor returns list of dicts!
-        mock_cursor.fetchall.return_value = [{"order": 1}]
+        # One row per (resourceagent, role)
+        mock_cursor.fetchall.return_value = [
+            agent_row(1, 'Doe', 'John', '0000-0001-2345-6789', 'Creator'),
+            agent_row(2, 'Smith', 'Jane', None, 'Creator'),
+            agent_row(2, 'Smith', 'Jane', None, 'ContactPerson'),
+            agent_row(3, 'Miller', 'Max', None, 'DataCurator'),
+        ]
         mock_connection.cursor.return_value.__enter__ = Mock(return_value=mock_cursor)
         mock_connection.cursor.return_value.__exit__ = Mock(return_value=False)
         mock_pymysql_connect.return_value = mock_connection
@@ -386,16 +533,51 @@ class TestUpdateCreators:
             {'firstname': 'John', 'lastname': 'Doe', 'orcid': '0000-0001-2345-6789'}
         ]
         
-        client.update_creators_transactional(1429, creators)
+        success, _, _ = client.update_creators_transactional(1429, creators)
+        
+        assert success is True
+        # Only the Creator role of order 2 is removed; its ContactPerson role keeps the agent
+        assert executemany_rows(mock_cursor, 'DELETE FROM role') == [('Creator', 1429, 2)]
+        assert executemany_rows(mock_cursor, 'DELETE FROM resourceagent') == []
+        # Creator 1 is unchanged and contributor 3 is not touched
+        assert executemany_rows(mock_cursor, 'UPDATE resourceagent') == []
+        assert executemany_rows(mock_cursor, 'INSERT INTO') == []
+    
+    def test_update_creators_writes_only_changed_rows(self, mock_pymysql_connect):
+        """Test that a changed ORCID updates one row and new creators are batch-inserted."""
+        mock_connection = Mock()
+        mock_cursor = Mock()
+        mock_cursor.fetchall.return_value = [
+            agent_row(1, 'Doe', 'John', '0000-0001-2345-6789', 'Creator'),
+            agent_row(2, 'Smith', 'Jane', None, 'Creator'),
+        ]
+        mock_connection.cursor.return_value.__enter__ = Mock(return_value=mock_cursor)
+        mock_connection.cursor.return_value.__exit__ = Mock(return_value=False)
+        mock_pymysql_connect.return_value = mock_connection
+        
+        client = SumarioPMDClient("host", "db", "user", "pass")
         
-        # Verify DELETE queries include role='Creator' filter
-        delete_calls = [call for call in mock_cursor.execute.call_args_list 
-                       if 'DELETE FROM role' in str(call)]
-        assert len(delete_calls) > 0
+        creators = [
+            {'firstname': 'John', 'lastname': 'Doe', 'orcid': '0000-0001-2345-6789'},
+            {'firstname': 'Jane', 'lastname': 'Smith', 'orcid': 'https://orcid.org/0000-0002-3456-7890'},
+            {'firstname': 'Max', 'lastname': 'Miller', 'orcid': ''},
+            {'firstname': 'Eva', 'lastname': 'Meyer', 'orcid': ''},
+        ]
         
-        # Check that the DELETE query filters by role='Creator'
-        delete_query = delete_calls[0][0][0]
-        assert "role = 'Creator'" in delete_query
+        success, _, _ = client.update_creators_transactional(1429, creators)
+        
+        assert success is True
+        assert executemany_rows(mock_cursor, 'UPDATE resourceagent') == [
+            ('Smith, Jane', 'Jane', 'Smith', '0000-0002-3456-7890', 'ORCID', 'Personal', 1429, 2)
+        ]
+        assert [row[1] for row in executemany_rows(mock_cursor, 'INSERT INTO resourceagent')] == [3, 4]
+        assert executemany_rows(mock_cursor, 'INSERT INTO role') == [
+            ('Creator', 1429, 3), ('Creator', 1429, 4)
+        ]
+        assert executemany_rows(mock_cursor, 'DELETE FROM') == []
+        # The current rows are read once, all writes are batched
+        assert mock_cursor.execute.call_count == 1
+        assert 'FOR UPDATE' in mock_cursor.execute.call_args[0][0]
     
     def test_update_creators_missing_lastname(self, mock_pymysql_connect):
         """Test that creators without lastname are skipped."""
@@ -421,6 +603,110 @@ class TestUpdateCreators:
         assert "Missing lastname" in errors[0]
 
 
+def executed_statements(cursor):
+    """Plain SQL statements (without parameters) passed to execute()."""
+    return [call[0][0] for call in cursor.execute.call_args_list if len(call[0]) == 1]
+
+
+class TestBatchTransaction:
+    """Tests for several DOIs sharing one transaction with savepoints."""
+    
+    @pytest.fixture
+    def connection(self, mock_pymysql_connect):
+        connection = Mock()
+        cursor = Mock()
+        cursor.rowcount = 1
+        cursor.fetchall.return_value = []
+        cursor.fetchone.return_value = {"id": 1429}
+        connection.cursor.return_value.__enter__ = Mock(return_value=cursor)
+        connection.cursor.return_value.__exit__ = Mock(return_value=False)
+        mock_pymysql_connect.return_value = connection
+        return connection, cursor
+    
+    def test_dois_share_one_commit(self, connection):
+        """Test that every DOI gets a savepoint and the batch is committed once."""
+        mock_connection, mock_cursor = connection
+        client = SumarioPMDClient("host", "db", "user", "pass")
+        creators = [{'firstname': 'John', 'lastname': 'Doe', 'orcid': ''}]
+        
+        with client.batch_transaction() as batch:
+            assert batch.update_creators(1429, creators)[0] is True
+            assert batch.update_creators(1430, creators)[0] is True
+            mock_connection.commit.assert_not_called()
+        
+        mock_connection.begin.assert_called_once()
+        mock_connection.commit.assert_called_once()
+        mock_connection.rollback.assert_not_called()
+        assert executed_statements(mock_cursor) == [
+            "SAVEPOINT doi_1", "RELEASE SAVEPOINT doi_1",
+            "SAVEPOINT doi_2", "RELEASE SAVEPOINT doi_2",
+        ]
+        assert batch.updated == 2
+    
+    def test_failing_doi_rolls_back_to_its_savepoint(self, connection):
+        """Test that a failing DOI is rolled back on its own and the others are committed."""
+        mock_connection, mock_cursor = connection
+        
+        def execute(query, params=None):
+            if params == (1430,):
+                raise pymysql.Error("Lock wait timeout exceeded")
+        
+        mock_cursor.execute.side_effect = execute
+        client = SumarioPMDClient("host", "db", "user", "pass")
+        creators = [{'firstname': 'John', 'lastname': 'Doe', 'orcid': ''}]
+        
+        with client.batch_transaction() as batch:
+            first = batch.update_creators(1429, creators)
+            second = batch.update_creators(1430, creators)
+            third = batch.update_contributors(1431, [])
+        
+        assert first[0] is True
+        assert second[0] is False
+        assert "Lock wait timeout" in second[2][0]
+        assert third[0] is True
+        assert "ROLLBACK TO SAVEPOINT doi_2" in executed_statements(mock_cursor)
+        assert (batch.updated, batch.failed) == (2, 1)
+        mock_connection.commit.assert_called_once()
+        mock_connection.rollback.assert_not_called()
+    
+    def test_failed_savepoint_rollback_aborts_batch(self, connection):
+        """Test that the batch is rolled back completely if a savepoint cannot be restored."""
+        mock_connection, mock_cursor = connection
+        
+        def execute(query, params=None):
+            if params == (1430,):
+                raise pymysql.err.OperationalError(1213, "Deadlock found")
+            if query.startswith("ROLLBACK TO SAVEPOINT"):
+                raise pymysql.err.OperationalError(1305, "SAVEPOINT doi_2 does not exist")
+        
+        mock_cursor.execute.side_effect = execute
+        client = SumarioPMDClient("host", "db", "user", "pass")
+        creators = [{'firstname': 'John', 'lastname': 'Doe', 'orcid': ''}]
+        
+        with pytest.raises(TransactionError, match="aborted"):
+            with client.batch_transaction() as batch:
+                batch.update_creators(1429, creators)
+                batch.update_creators(1430, creators)
+        
+        with pytest.raises(TransactionError, match="aborted"):
+            batch.update_creators(1431, creators)
+        
+        mock_connection.commit.assert_not_called()
+        mock_connection.rollback.assert_called_once()
+    
+    def test_failed_commit_raises_transaction_error(self, connection):
+        """Test that a failing commit is reported for the whole batch."""
+        mock_connection, _ = connection
+        mock_connection.commit.side_effect = pymysql.Error("Commit failed")
+        client = SumarioPMDClient("host", "db", "user", "pass")
+        
+        with pytest.raises(TransactionError, match="no DOI of the batch was saved"):
+            with client.batch_transaction() as batch:
+                batch.update_publisher("10.5880/test.001", "GFZ Data Services")
+        
+        mock_connection.rollback.assert_called_once()
+
+
 class TestEdgeCases:
     """Tests for edge cases and special scenarios."""
     
@@ -445,9 +731,7 @@ class TestEdgeCases:
         assert success is True
         
         # Verify NULL was inserted for ORCID
-        insert_calls = [call for call in mock_cursor.execute.call_args_list 
-                       if 'INSERT INTO resourceagent' in str(call)]
-        insert_values = insert_calls[0][0][1]
+        insert_values = executemany_rows(mock_cursor, 'INSERT INTO resourceagent')[0]
         orcid_value = insert_values[5]  # ORCID parameter
         assert orcid_value is None
     
@@ -472,9 +756,7 @@ class TestEdgeCases:
         assert success is True
         
         # Verify name field contains only lastname (no comma)
-        insert_calls = [call for call in mock_cursor.execute.call_args_list 
-                       if 'INSERT INTO resourceagent' in str(call)]
-        insert_values = insert_calls[0][0][1]
+        insert_values = executemany_rows(mock_cursor, 'INSERT INTO resourceagent')[0]
         name_value = insert_values[2]  # name parameter
         assert name_value == 'Institution'
         assert ',' not in name_value
@@ -21,6 +21,35 @@ def mock_connection():
     return mock_conn, mock_cursor
 
 
+def agent_row(order, name, role, nametype="Personal", identifier=None, contactinfo=None):
+    """Row as returned by the locking resourceagent/role/contactinfo query."""
+    lastname, _, firstname = name.partition(", ")
+    email, website, position = contactinfo or (None, None, None)
+    return {
+        "order": order,
+        "name": name,
+        "firstname": firstname if nametype == "Personal" else None,
+        "lastname": lastname if nametype == "Personal" else None,
+        "identifier": identifier,
+        "identifiertype": "ORCID" if identifier else None,
+        "nametype": nametype,
+        "role": role,
+        "contactinfo_order": order if contactinfo else None,
+        "email": email,
+        "website": website,
+        "position": position,
+    }
+
+
+def executemany_rows(cursor, statement):
+    """All parameter rows passed to executemany() for statements containing the given text."""
+    return [
+        row
+        for call in cursor.executemany.call_args_list if statement in call[0][0]
+        for row in call[0][1]
+    ]
+
+
 @pytest.fixture
 def client():
     """Create a SumarioPMDClient instance without connecting."""
@@ -153,6 +182,68 @@ class TestFetchContactinfoForContributor:
         assert result is None
 
 
+class TestIterContactinfoForDois:
+    """Tests for iter_contactinfo_for_dois method."""
+    
+    def test_one_joined_query_per_chunk(self, client, mock_connection):
+        """Test that DOIs are fetched with one joined query per chunk."""
+        mock_conn, mock_cursor = mock_connection
+        mock_cursor.fetchall.side_effect = [
+            [{'doi': '10.5880/GFZ.A', 'lastname': 'Müller', 'firstname': 'Hans', 'name': 'Müller, Hans',
+              'email': 'hans@gfz.de', 'website': None, 'position': None}],
+            [{'doi': '10.5880/GFZ.C', 'lastname': None, 'firstname': None, 'name': 'GFZ',
+              'email': 'info@gfz.de', 'website': None, 'position': None}],
+        ]
+        
+        with patch.object(client, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__ = MagicMock(return_value=mock_conn)
+            mock_get_conn.return_value.__exit__ = MagicMock(return_value=False)
+            
+            rows = list(client.iter_contactinfo_for_dois(
+                ['10.5880/GFZ.A', '10.5880/GFZ.B', '10.5880/GFZ.A', '10.5880/GFZ.C'],
+                chunk_size=2
+            ))
+        
+        assert [row['doi'] for row in rows] == ['10.5880/GFZ.A', '10.5880/GFZ.C']
+        assert mock_cursor.execute.call_count == 2
+        query, params = mock_cursor.execute.call_args_list[0][0]
+        assert 'INNER JOIN contactinfo' in query
+        assert 'r.identifier IN (%s, %s)' in query
+        assert list(params) == ['10.5880/GFZ.A', '10.5880/GFZ.B']
+    
+    def test_no_dois_no_query(self, client):
+        """Test that an empty DOI list does not touch the database."""
+        with patch.object(client, 'get_connection') as mock_get_conn:
+            assert list(client.iter_contactinfo_for_dois([])) == []
+        mock_get_conn.assert_not_called()
+    
+    def test_failed_chunk_is_skipped(self, client, mock_connection, caplog):
+        """Test that a failing chunk is logged with its DOIs and the other chunks are still fetched."""
+        mock_conn, mock_cursor = mock_connection
+        mock_cursor.execute.side_effect = [pymysql.Error("Query failed"), None]
+        mock_cursor.fetchall.return_value = [
+            {'doi': '10.5880/GFZ.C', 'lastname': None, 'firstname': None, 'name': 'GFZ',
+             'email': 'info@gfz.de', 'website': None, 'position': None}
+        ]
+        
+        with patch.object(client, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__ = MagicMock(return_value=mock_conn)
+            mock_get_conn.return_value.__exit__ = MagicMock(return_value=False)
+            
+            rows = list(client.iter_contactinfo_for_dois(
+                ['10.5880/GFZ.A', '10.5880/GFZ.B', '10.5880/GFZ.C'],
+                chunk_size=2
+            ))
+        
+        assert [row['doi'] for row in rows] == ['10.5880/GFZ.C']
+        assert "10.5880/GFZ.A, 10.5880/GFZ.B" in caplog.text
+    
+    def test_connection_error_skips_chunk(self, client):
+        """Test that an unavailable connection does not abort the stream."""
+        with patch.object(client, 'get_connection', side_effect=DatabaseError("Database connection failed")):
+            assert list(client.iter_contactinfo_for_dois(['10.5880/GFZ.A'])) == []
+
+
 class TestUpdateContributorsTransactional:
     """Tests for update_contributors_transactional method."""
     
@@ -205,15 +296,6 @@ class TestUpdateContributorsTransactional:
         mock_cursor.fetchall.return_value = []  # No existing contributors
         mock_cursor.fetchone.return_value = {'max_order': 0}
         
-        # Capture the insert query arguments
-        insert_calls = []
-        original_execute = mock_cursor.execute
-        def capture_execute(query, args=None):
-            if 'INSERT INTO resourceagent' in query:
-                insert_calls.append(args)
-            return original_execute(query, args)
-        mock_cursor.execute = capture_execute
-        
         with patch.object(client, 'get_connection') as mock_get_conn:
             mock_get_conn.return_value.__enter__ = MagicMock(return_value=mock_conn)
             mock_get_conn.return_value.__exit__ = MagicMock(return_value=False)
@@ -230,8 +312,9 @@ class TestUpdateContributorsTransactional:
         
         assert success is True
         # Verify ORCID was normalized (check the 6th element of the tuple)
-        if insert_calls:
-            assert insert_calls[0][5] == '0000-0001-2345-6789'
+        insert_rows = executemany_rows(mock_cursor, 'INSERT INTO resourceagent')
+        assert insert_rows[0][5] == '0000-0001-2345-6789'
+        assert insert_rows[0][6] == 'ORCID'
     
     def test_update_contributors_multiple_roles(self, client, mock_connection):
         """Test that multiple roles create multiple role entries."""
@@ -240,15 +323,6 @@ class TestUpdateContributorsTransactional:
         mock_cursor.fetchall.return_value = []
         mock_cursor.fetchone.return_value = {'max_order': 0}
         
-        role_insert_count = 0
-        original_execute = mock_cursor.execute
-        def count_role_inserts(query, args=None):
-            nonlocal role_insert_count
-            if 'INSERT INTO role' in query:
-                role_insert_count += 1
-            return original_execute(query, args)
-        mock_cursor.execute = count_role_inserts
-        
         with patch.object(client, 'get_connection') as mock_get_conn:
             mock_get_conn.return_value.__enter__ = MagicMock(return_value=mock_conn)
             mock_get_conn.return_value.__exit__ = MagicMock(return_value=False)
@@ -262,8 +336,8 @@ class TestUpdateContributorsTransactional:
             
             client.update_contributors_transactional(123, contributors)
         
-        # Should have inserted 3 role entries
-        assert role_insert_count == 3
+        # Should have inserted 3 role entries in one batch
+        assert len(executemany_rows(mock_cursor, 'INSERT INTO role')) == 3
     
     def test_update_contributors_contactinfo_only_for_contactperson(self, client, mock_connection):
         """Test that contactinfo is only inserted for ContactPerson role."""
@@ -272,14 +346,6 @@ class TestUpdateContributorsTransactional:
         mock_cursor.fetchall.return_value = []
         mock_cursor.fetchone.return_value = {'max_order': 0}
         
-        contactinfo_inserts = []
-        original_execute = mock_cursor.execute
-        def capture_ci_inserts(query, args=None):
-            if 'INSERT INTO contactinfo' in query:
-                contactinfo_inserts.append(args)
-            return original_execute(query, args)
-        mock_cursor.execute = capture_ci_inserts
-        
         with patch.object(client, 'get_connection') as mock_get_conn:
             mock_get_conn.return_value.__enter__ = MagicMock(return_value=mock_conn)
             mock_get_conn.return_value.__exit__ = MagicMock(return_value=False)
@@ -300,6 +366,7 @@ class TestUpdateContributorsTransactional:
             client.update_contributors_transactional(123, contributors)
         
         # Should only have 1 contactinfo insert (for ContactPerson)
+        contactinfo_inserts = executemany_rows(mock_cursor, 'INSERT INTO contactinfo')
         assert len(contactinfo_inserts) == 1
         assert contactinfo_inserts[0][2] == 'contact@gfz.de'
     
@@ -314,7 +381,7 @@ class TestUpdateContributorsTransactional:
         def error_on_insert(query, args=None):
             if 'INSERT INTO resourceagent' in query:
                 raise pymysql.Error("Insert failed")
-        mock_cursor.execute = error_on_insert
+        mock_cursor.executemany.side_effect = error_on_insert
         
         with patch.object(client, 'get_connection') as mock_get_conn:
             mock_get_conn.return_value.__enter__ = MagicMock(return_value=mock_conn)
@@ -349,6 +416,80 @@ class TestUpdateContributorsTransactional:
         assert success is True
         assert len(errors) == 1
         assert "Missing lastname" in errors[0]
+    
+    def test_update_contributors_writes_only_differences(self, client, mock_connection):
+        """Test that matched entries are updated in place and only changed rows are written."""
+        mock_conn, mock_cursor = mock_connection
+        
+        mock_cursor.fetchall.return_value = [
+            agent_row(1, 'Doe, John', 'Creator'),
+            agent_row(2, 'Müller, Hans', 'ContactPerson', contactinfo=('old@gfz.de', None, None)),
+            agent_row(2, 'Müller, Hans', 'DataManager', contactinfo=('old@gfz.de', None, None)),
+            agent_row(3, 'GFZ Data Services', 'HostingInstitution', nametype='Organizational'),
+        ]
+        
+        with patch.object(client, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__ = MagicMock(return_value=mock_conn)
+            mock_get_conn.return_value.__exit__ = MagicMock(return_value=False)
+            
+            contributors = [
+                {
+                    'firstname': 'Hans',
+                    'lastname': 'Müller',
+                    'contributorTypes': 'ContactPerson, Researcher',
+                    'email': 'hans@gfz.de'
+                },
+                {
+                    'name': 'GFZ Data Services',
+                    'nametype': 'Organizational',
+                    'contributorTypes': 'HostingInstitution'
+                }
+            ]
+            
+            success, _, _ = client.update_contributors_transactional(123, contributors)
+        
+        assert success is True
+        # Names are unchanged, so no resourceagent row is rewritten
+        assert executemany_rows(mock_cursor, 'UPDATE resourceagent') == []
+        assert executemany_rows(mock_cursor, 'INSERT INTO resourceagent') == []
+        assert executemany_rows(mock_cursor, 'DELETE FROM role') == [('DataManager', 123, 2)]
+        assert executemany_rows(mock_cursor, 'INSERT INTO role') == [('Researcher', 123, 2)]
+        assert executemany_rows(mock_cursor, 'UPDATE contactinfo') == [('hans@gfz.de', None, None, 123, 2)]
+        mock_conn.commit.assert_called_once()
+    
+    def test_update_contributors_removes_surplus_and_appends(self, client, mock_connection):
+        """Test that surplus entries are deleted and new ones are appended after the highest order."""
+        mock_conn, mock_cursor = mock_connection
+        
+        mock_cursor.fetchall.return_value = [
+            agent_row(1, 'Doe, John', 'Creator'),
+            agent_row(1, 'Doe, John', 'ContactPerson', contactinfo=('doe@gfz.de', None, None)),
+            agent_row(2, 'Müller, Hans', 'Researcher'),
+            agent_row(3, 'Meyer, Eva', 'Editor'),
+        ]
+        
+        with patch.object(client, 'get_connection') as mock_get_conn:
+            mock_get_conn.return_value.__enter__ = MagicMock(return_value=mock_conn)
+            mock_get_conn.return_value.__exit__ = MagicMock(return_value=False)
+            
+            contributors = [
+                {'firstname': 'Max', 'lastname': 'Miller', 'contributorTypes': 'Researcher'},
+            ]
+            
+            success, _, _ = client.update_contributors_transactional(123, contributors)
+        
+        assert success is True
+        # Order 2 is reused for the new contributor
+        assert executemany_rows(mock_cursor, 'UPDATE resourceagent') == [
+            ('Miller, Max', 'Max', 'Miller', None, None, 'Personal', 123, 2)
+        ]
+        # Order 3 is surplus; order 1 keeps its Creator role but loses the contributor role
+        assert executemany_rows(mock_cursor, 'DELETE FROM resourceagent') == [(123, 3)]
+        assert sorted(executemany_rows(mock_cursor, 'DELETE FROM role')) == [
+            ('ContactPerson', 123, 1), ('Editor', 123, 3)
+        ]
+        assert executemany_rows(mock_cursor, 'DELETE FROM contactinfo') == [(123, 1)]
+        assert executemany_rows(mock_cursor, 'INSERT INTO') == []
 
 
 class TestUpsertContactinfo:
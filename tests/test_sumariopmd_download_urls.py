@@ -417,3 +417,93 @@ class TestUpdateFileEntry:
             assert 'filemimetype = %s' not in query
             # Check params: description, size, resource_id, filename
             assert list(params) == ['Updated description', 12345, 123, 'data.csv']
+
+
+class TestBulkFileMethods:
+    """Tests for bulk loading and batched updating of file entries."""
+    
+    @pytest.fixture
+    def client(self):
+        return SumarioPMDClient(
+            host="test.host",
+            database="test_db",
+            username="test_user",
+            password="test_pass"
+        )
+    
+    def test_fetch_files_for_dois_in_one_snapshot(self, client):
+        """Test that all chunks are read inside one transaction."""
+        with patch.object(client, 'get_connection') as mock_conn:
+            connection = mock_conn.return_value.__enter__.return_value
+            mock_cursor = MagicMock()
+            mock_cursor.fetchall.side_effect = [
+                [{'doi': '10.1594/GFZ.SDDB.1004', 'resource_id': 1, 'name': 'Data.csv',
+                  'url': 'https://old.org', 'description': None, 'filemimetype': 'text/csv', 'size': 10}],
+                [],
+            ]
+            connection.cursor.return_value.__enter__.return_value = mock_cursor
+            
+            files = client.fetch_files_for_dois(
+                ['10.1594/GFZ.SDDB.1004', '10.1594/GFZ.SDDB.1005', '10.1594/GFZ.SDDB.1006'],
+                chunk_size=2
+            )
+        
+        assert list(files) == [('10.1594/gfz.sddb.1004', 'data.csv')]
+        assert files[('10.1594/gfz.sddb.1004', 'data.csv')]['resource_id'] == 1
+        assert mock_cursor.execute.call_count == 2
+        assert 'r.identifier IN (%s, %s)' in mock_cursor.execute.call_args_list[0][0][0]
+        connection.begin.assert_called_once()
+        connection.commit.assert_called_once()
+    
+    def test_fetch_files_for_dois_database_error(self, client):
+        """Test handling of database errors during the bulk read."""
+        with patch.object(client, 'get_connection') as mock_conn:
+            mock_cursor = MagicMock()
+            mock_cursor.execute.side_effect = pymysql.Error("Query failed")
+            mock_conn.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+            
+            with pytest.raises(DatabaseError, match="Failed to fetch file entries"):
+                client.fetch_files_for_dois(['10.1594/GFZ.SDDB.1004'])
+    
+    def test_update_file_entries_uses_executemany(self, client):
+        """Test that batched updates run as one executemany in one transaction."""
+        with patch.object(client, 'get_connection') as mock_conn:
+            connection = mock_conn.return_value.__enter__.return_value
+            mock_cursor = MagicMock()
+            mock_cursor.rowcount = 2
+            connection.cursor.return_value.__enter__.return_value = mock_cursor
+            
+            changed = client.update_file_entries([
+                {'resource_id': 1, 'filename': 'data.csv', 'url': 'https://new.org'},
+                {'resource_id': 2, 'filename': 'readme.txt', 'size': 1024},
+            ])
+        
+        assert changed == 2
+        query, params = mock_cursor.executemany.call_args[0]
+        assert 'COALESCE(%s, url)' in query
+        assert params == [
+            ('https://new.org', None, None, None, 1, 'data.csv'),
+            (None, None, None, 1024, 2, 'readme.txt'),
+        ]
+        connection.begin.assert_called_once()
+        connection.commit.assert_called_once()
+    
+    def test_update_file_entries_rolls_back_on_error(self, client):
+        """Test that a failing batch is rolled back and raises DatabaseError."""
+        with patch.object(client, 'get_connection') as mock_conn:
+            connection = mock_conn.return_value.__enter__.return_value
+            mock_cursor = MagicMock()
+            mock_cursor.executemany.side_effect = pymysql.Error("Update failed")
+            connection.cursor.return_value.__enter__.return_value = mock_cursor
+            
+            with pytest.raises(DatabaseError, match="Failed to update file entries"):
+                client.update_file_entries([{'resource_id': 1, 'filename': 'data.csv', 'url': 'https://new.org'}])
+        
+        connection.rollback.assert_called_once()
+        connection.commit.assert_not_called()
+    
+    def test_update_file_entries_empty(self, client):
+        """Test that an empty batch does not touch the database."""
+        with patch.object(client, 'get_connection') as mock_conn:
+            assert client.update_file_entries([]) == 0
+        mock_conn.assert_not_called()
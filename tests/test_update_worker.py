@@ -79,6 +79,7 @@ class TestUpdateWorker:
         assert error_count == 0
         assert skipped_count == 0  # No skips - URLs are different
         assert len(error_list) == 0
+        mock_client.close.assert_called_once()
     
     def test_worker_run_with_errors(self, worker):
         """Test worker run with some failed updates."""
@@ -150,6 +151,8 @@ class TestUpdateWorker:
         # Check error was emitted
         assert len(error_signal) == 1
         assert "Netzwerkfehler" in error_signal[0]
+        # The HTTP session is released even though the run was aborted
+        mock_client.close.assert_called_once()
     
     def test_worker_stop(self, worker):
         """Test worker stop functionality."""
@@ -349,5 +352,102 @@ class TestUpdateWorker:
         
         # Verify update_doi_url WAS called (fallback behavior)
         assert mock_client.update_doi_url.call_count == 2
-
-
+    
+    def test_bulk_diff_uses_single_harvest(self, valid_csv_file):
+        """Test that bulk diff compares against one harvest instead of per-DOI metadata."""
+        worker = UpdateWorker(
+            username="test_user",
+            password="test_pass",
+            csv_path=valid_csv_file,
+            use_test_api=True,
+            bulk_diff=True
+        )
+        
+        mock_client = Mock()
+        # DataCite returns lowercase DOIs; DOI 1 unchanged, DOI 2 changed
+        mock_client.fetch_all_dois.return_value = [
+            ('10.5880/gfz.1.1.2021.001', 'https://example.org/doi1'),
+            ('10.5880/gfz.1.1.2021.002', 'https://old-url.org/doi2'),
+            ('10.5880/gfz.1.1.2021.999', 'https://example.org/other')
+        ]
+        mock_client.update_doi_url.return_value = (True, "Success")
+        
+        finished_signal = []
+        worker.finished.connect(lambda *args: finished_signal.append(args))
+        
+        with patch('src.workers.update_worker.DataCiteClient', return_value=mock_client):
+            worker.run()
+        
+        success_count, error_count, skipped_count, error_list, skipped_details = finished_signal[0]
+        assert success_count == 2
+        assert skipped_count == 1
+        assert error_count == 0
+        
+        mock_client.fetch_all_dois.assert_called_once()
+        mock_client.get_doi_metadata.assert_not_called()
+        mock_client.update_doi_url.assert_called_once_with(
+            '10.5880/GFZ.1.1.2021.002', 'https://example.org/doi2'
+        )
+    
+    def test_bulk_diff_updates_dois_missing_from_snapshot(self, valid_csv_file):
+        """Test that DOIs not contained in the harvest are updated anyway."""
+        worker = UpdateWorker("test_user", "test_pass", valid_csv_file, True, bulk_diff=True)
+        
+        mock_client = Mock()
+        mock_client.fetch_all_dois.return_value = []
+        mock_client.update_doi_url.return_value = (True, "Success")
+        
+        finished_signal = []
+        worker.finished.connect(lambda *args: finished_signal.append(args))
+        
+        with patch('src.workers.update_worker.DataCiteClient', return_value=mock_client):
+            worker.run()
+        
+        success_count, error_count, skipped_count, _, _ = finished_signal[0]
+        assert (success_count, error_count, skipped_count) == (2, 0, 0)
+        assert mock_client.update_doi_url.call_count == 2
+    
+    def test_bulk_diff_falls_back_on_api_error(self, valid_csv_file):
+        """Test fallback to per-DOI metadata if the harvest fails with an API error."""
+        from src.api.datacite_client import DataCiteAPIError
+        
+        worker = UpdateWorker("test_user", "test_pass", valid_csv_file, True, bulk_diff=True)
+        
+        mock_client = Mock()
+        mock_client.fetch_all_dois.side_effect = DataCiteAPIError("Zu viele Anfragen")
+        mock_client.get_doi_metadata.side_effect = [
+            {'data': {'attributes': {'url': 'https://example.org/doi1'}}},
+            {'data': {'attributes': {'url': 'https://old-url.org/doi2'}}}
+        ]
+        mock_client.update_doi_url.return_value = (True, "Success")
+        
+        finished_signal = []
+        worker.finished.connect(lambda *args: finished_signal.append(args))
+        
+        with patch('src.workers.update_worker.DataCiteClient', return_value=mock_client):
+            worker.run()
+        
+        success_count, error_count, skipped_count, _, _ = finished_signal[0]
+        assert (success_count, error_count, skipped_count) == (2, 0, 1)
+        assert mock_client.get_doi_metadata.call_count == 2
+        assert mock_client.update_doi_url.call_count == 1
+    
+    def test_bulk_diff_aborts_on_network_error(self, valid_csv_file):
+        """Test that a network error during the harvest aborts the update."""
+        worker = UpdateWorker("test_user", "test_pass", valid_csv_file, True, bulk_diff=True)
+        
+        mock_client = Mock()
+        mock_client.fetch_all_dois.side_effect = NetworkError("Verbindung fehlgeschlagen")
+        
+        error_signals = []
+        finished_signal = []
+        worker.error_occurred.connect(lambda msg: error_signals.append(msg))
+        worker.finished.connect(lambda *args: finished_signal.append(args))
+        
+        with patch('src.workers.update_worker.DataCiteClient', return_value=mock_client):
+            worker.run()
+        
+        assert len(error_signals) == 1
+        assert "aktuellen URLs" in error_signals[0]
+        assert finished_signal[0][:3] == (0, 0, 0)
+        mock_client.update_doi_url.assert_not_called()